@@ -1,7 +1,28 @@
 from django.apps import AppConfig
+import os
 import sys
 
 
+# Procesos que sirven la app y por lo tanto levantan el planificador (APScheduler).
+# uvicorn, daphne y hypercorn son los servidores ASGI que necesita el stream SSE.
+SERVIDORES = ('runserver', 'gunicorn', 'uwsgi', 'uvicorn', 'daphne', 'hypercorn')
+
+
+def es_servidor(argv):
+    """
+    True si `argv` corresponde a un servidor real. sys.argv[0] trae la ruta del
+    ejecutable (/usr/local/bin/uvicorn) o, con `python -m uvicorn`, la del
+    __main__.py del paquete; se compara su nombre además de cada argumento.
+    """
+    nombres = set(argv)
+    if argv:
+        ejecutable = os.path.basename(argv[0])
+        if ejecutable == '__main__.py':
+            ejecutable = os.path.basename(os.path.dirname(argv[0]))
+        nombres.add(ejecutable)
+    return any(servidor in nombres for servidor in SERVIDORES)
+
+
 class GestionAcademicaConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'gestion_academica'
@@ -21,7 +42,7 @@ class GestionAcademicaConfig(AppConfig):
             print(f"[GESTION_ACADEMICA] Error al cargar señales: {e}")
 
         # 2. Detectar si estamos corriendo el servidor real (no migraciones)
-        running_server = any(cmd in sys.argv for cmd in ['runserver', 'gunicorn', 'uwsgi'])
+        running_server = es_servidor(sys.argv)
 
         if running_server:
             try:
@@ -0,0 +1,86 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from gestion_academica.services.mantenimiento.asesor_indices import (
+    analizar_workload,
+    generar_migracion,
+    leer_workload,
+    workload_por_defecto,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Reproduce una carga de consultas con EXPLAIN, informa scans secuenciales y filtros "
+        "residuales y propone índices compuestos o parciales (opcionalmente como migración)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workload",
+            help="Archivo .jsonl (grabado con CAPTURAR_WORKLOAD), log de PostgreSQL o .sql. "
+                 "Sin este parámetro se usan los patrones de acceso del proyecto.",
+        )
+        parser.add_argument(
+            "--escribir-migracion",
+            action="store_true",
+            help="Escribe la migración con los índices sugeridos en lugar de solo mostrarla.",
+        )
+        parser.add_argument(
+            "--detalle",
+            action="store_true",
+            help="Muestra los hallazgos de cada consulta.",
+        )
+
+    def handle(self, *args, **options):
+        if options["workload"]:
+            try:
+                consultas = leer_workload(options["workload"])
+            except (OSError, ValueError) as e:
+                raise CommandError(f"No se pudo leer la carga: {e}")
+        else:
+            consultas = workload_por_defecto()
+
+        self.stdout.write(self.style.NOTICE(f"Analizando {len(consultas)} consultas..."))
+        reporte, sugerencias = analizar_workload(consultas)
+
+        errores = sum(1 for r in reporte if "error" in r)
+        secuenciales = sum(
+            1 for r in reporte for h in r.get("hallazgos", []) if h["nodo"] == "Seq Scan")
+        if options["detalle"]:
+            for r in reporte:
+                if r.get("hallazgos") or "error" in r:
+                    self.stdout.write(r["sql"][:200])
+                    for h in r.get("hallazgos", []):
+                        self.stdout.write(f"    {h['nodo']} en {h['tabla']}: {h['filtro']}")
+                    if "error" in r:
+                        self.stdout.write(f"    {r['error']}")
+
+        self.stdout.write(
+            f"Scans secuenciales: {secuenciales} - Consultas no explicables: {errores}")
+
+        if not sugerencias:
+            self.stdout.write(self.style.SUCCESS("No hay índices para sugerir ✅"))
+            return
+
+        self.stdout.write(self.style.WARNING("Índices sugeridos:"))
+        for s in sugerencias:
+            parcial = f" WHERE {' AND '.join(c + ' IS NULL' for c in s.columnas_nulas)}" if s.columnas_nulas else ""
+            self.stdout.write(
+                f"  {s.tabla} ({', '.join(s.columnas)}){parcial} - {s.consultas} consulta(s), {s.motivo}")
+
+        writer, indices = generar_migracion(sugerencias)
+        if writer is None:
+            return
+
+        self.stdout.write(self.style.NOTICE("Agregar también en Meta.indexes de cada modelo:"))
+        for modelo, indice in indices:
+            _, _, kwargs = indice.deconstruct()
+            argumentos = ", ".join(f"{k}={v!r}" for k, v in kwargs.items())
+            self.stdout.write(f"  {modelo.__name__}: models.Index({argumentos}),")
+
+        if options["escribir_migracion"]:
+            with open(writer.path, "w", encoding="utf-8") as archivo:
+                archivo.write(writer.as_string())
+            self.stdout.write(self.style.SUCCESS(f"Migración escrita en {writer.path} ✅"))
+        else:
+            self.stdout.write(writer.as_string())
@@ -0,0 +1,47 @@
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from gestion_academica.services.gestion_academica.importacion_plan import ErrorImportacion, leer_planilla
+from gestion_academica.services.gestion_usuarios.alta_masiva import ALIAS_COLUMNAS_DOCENTE, alta_masiva_docentes
+
+
+class Command(BaseCommand):
+    help = (
+        "Alta masiva de docentes (Usuario + rol Docente + Docente) desde un CSV o XLSX. "
+        "Las contraseñas de la columna 'password' se hashean en paralelo."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("archivo", help="Planilla .csv o .xlsx con una fila por docente")
+        parser.add_argument(
+            "--procesos", type=int, default=os.cpu_count() or 1,
+            help="Procesos para hashear contraseñas (por defecto, uno por CPU)")
+        parser.add_argument("--simular", action="store_true", help="Valida y reporta sin escribir nada")
+
+    def handle(self, *args, **options):
+        ruta = options["archivo"]
+        try:
+            with open(ruta, "rb") as archivo:
+                registros = leer_planilla(archivo, ruta, requerida="legajo", alias=ALIAS_COLUMNAS_DOCENTE)
+        except (OSError, ErrorImportacion) as e:
+            raise CommandError(str(e))
+
+        inicio = time.perf_counter()
+        resultado = alta_masiva_docentes(
+            registros, procesos=options["procesos"], confirmar=not options["simular"])
+
+        if not resultado.valido:
+            for error in resultado.errores:
+                self.stderr.write(f"  fila {error['fila']} [{error['campo']}]: {error['mensaje']}")
+            raise CommandError(f"{len(resultado.errores)} errores: no se creó ningún docente.")
+
+        for duplicado in resultado.duplicados:
+            self.stdout.write(self.style.WARNING(
+                f"  fila {duplicado['fila']}: ya existe un usuario con {duplicado['campo']} '{duplicado['valor']}'"))
+        accion = "se crearían" if resultado.simulacion else "creados"
+        self.stdout.write(self.style.SUCCESS(
+            f"{resultado.creados} docentes {accion} ({resultado.sin_contrasena} sin contraseña, "
+            f"{len({d['fila'] for d in resultado.duplicados})} filas duplicadas) "
+            f"en {time.perf_counter() - inicio:.2f} s ✅"))
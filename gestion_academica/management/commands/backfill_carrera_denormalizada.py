@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from gestion_academica.services.designaciones_docentes.carrera_denormalizada import (
+    sincronizar_carrera_denormalizada,
+)
+from gestion_academica.services.designaciones_docentes.docente_carrera import recalcular_docente_carrera
+
+
+class Command(BaseCommand):
+    help = ("Recalcula plan_de_estudio y carrera copiados en comisiones y designaciones, "
+            "y la pertenencia docente-carrera")
+
+    def handle(self, *args, **options):
+        comisiones, designaciones = sincronizar_carrera_denormalizada()
+        self.stdout.write(self.style.SUCCESS(
+            f"Comisiones corregidas: {comisiones} - Designaciones corregidas: {designaciones} ✅"))
+        recalcular_docente_carrera()
+        self.stdout.write(self.style.SUCCESS("Pertenencia docente-carrera recalculada ✅"))
@@ -0,0 +1,39 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from gestion_academica.services.estadisticas_reportes import snapshots
+
+
+class Command(BaseCommand):
+    help = "Reconstruye los snapshots de estadísticas de un rango de fechas a partir del historial de designaciones"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--desde", required=True, help="Fecha inicial (AAAA-MM-DD)")
+        parser.add_argument("--hasta", help="Fecha final (AAAA-MM-DD). Por defecto, ayer.")
+        parser.add_argument(
+            "--granularidad",
+            choices=["DIARIO", "CUATRIMESTRAL"],
+            default="CUATRIMESTRAL",
+            help="DIARIO genera una foto por día; CUATRIMESTRAL solo en las fechas de corte.",
+        )
+
+    def handle(self, *args, **options):
+        desde = parse_date(options["desde"])
+        hasta = parse_date(options["hasta"]) if options["hasta"] else timezone.localdate() - date.resolution
+        if desde is None or hasta is None:
+            raise CommandError("Las fechas deben tener el formato AAAA-MM-DD.")
+        if desde > hasta:
+            raise CommandError("--desde no puede ser posterior a --hasta.")
+
+        fechas = snapshots.fechas_de_corte(desde, hasta, options["granularidad"])
+        self.stdout.write(self.style.NOTICE(
+            f"Generando {len(fechas)} fechas ({options['granularidad']}) entre {desde} y {hasta}..."))
+
+        total = 0
+        for fecha in fechas:
+            total += snapshots.generar_snapshots(fecha, options["granularidad"])
+
+        self.stdout.write(self.style.SUCCESS(f"Snapshots escritos: {total} ✅"))
@@ -0,0 +1,78 @@
+import time
+import tracemalloc
+from io import BytesIO
+
+from django.core.management.base import BaseCommand
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Table
+
+from gestion_academica.services.estadisticas_reportes import pdf_reportes
+
+
+CAMPOS = ["asignatura", "docente", "dedicacion", "modalidad", "periodo", "anio", "estado_designacion"]
+
+
+def filas_sinteticas(cantidad):
+    for i in range(cantidad):
+        yield {
+            "asignatura": f"Asignatura de prueba número {i % 97}",
+            "docente": f"Apellido{i % 313} Nombre{i % 71}",
+            "dedicacion": ("SIMPLE", "SEMIEXCLUSIVA", "EXCLUSIVA")[i % 3],
+            "modalidad": ("Presencial", "Virtual")[i % 2],
+            "periodo": "CUATRIMESTRAL",
+            "anio": 2020 + i % 5,
+            "estado_designacion": "ACTIVA" if i % 4 else "INACTIVA",
+        }
+
+
+def pdf_anterior(destino, filas):
+    """Renderizado previo: un Paragraph por celda y una sola Table con todo."""
+    doc = SimpleDocTemplate(destino, pagesize=pdf_reportes.PAGINA, **pdf_reportes.MARGENES)
+    estilos = getSampleStyleSheet()
+    datos = [[pdf_reportes.ENCABEZADOS_REPORTE.get(c, c) for c in CAMPOS]]
+    for fila in filas:
+        datos.append([Paragraph(str(fila.get(c, "")), estilos["BodyText"]) for c in CAMPOS])
+    ancho = doc.width / len(CAMPOS)
+    tabla = Table(datos, colWidths=[ancho] * len(CAMPOS), repeatRows=1)
+    tabla.setStyle(pdf_reportes.ESTILO_TABLA)
+    doc.build([tabla])
+
+
+def pdf_por_bloques(destino, filas):
+    pdf_reportes.renderizar_pdf(destino, "Benchmark", CAMPOS, filas, logo_path=None)
+
+
+class Command(BaseCommand):
+    help = "Compara tiempo y memoria pico del renderizado PDF anterior contra el renderizado por bloques"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--filas", nargs="+", type=int, default=[500, 2000, 5000],
+            help="Cantidades de filas a probar.",
+        )
+        parser.add_argument(
+            "--solo-bloques", action="store_true",
+            help="No ejecuta el renderizado anterior (útil con muchas filas).",
+        )
+
+    def medir(self, renderizar, cantidad):
+        destino = BytesIO()
+        tracemalloc.start()
+        inicio = time.perf_counter()
+        renderizar(destino, filas_sinteticas(cantidad))
+        segundos = time.perf_counter() - inicio
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return segundos, pico / (1024 * 1024), len(destino.getvalue()) / 1024
+
+    def handle(self, *args, **options):
+        renderizadores = [("bloques", pdf_por_bloques)]
+        if not options["solo_bloques"]:
+            renderizadores.insert(0, ("anterior", pdf_anterior))
+
+        self.stdout.write(f"{'filas':>8} {'renderizador':>12} {'segundos':>10} {'pico MB':>10} {'PDF KB':>10}")
+        for cantidad in options["filas"]:
+            for nombre, renderizar in renderizadores:
+                segundos, pico, tamanio = self.medir(renderizar, cantidad)
+                self.stdout.write(
+                    f"{cantidad:>8} {nombre:>12} {segundos:>10.2f} {pico:>10.1f} {tamanio:>10.0f}")
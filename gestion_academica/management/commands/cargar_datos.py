@@ -1,38 +1,58 @@
+import time
+
 from django.core.management.base import BaseCommand
 from django.core.management import call_command
 
-class Command(BaseCommand):
-    help = 'Carga fixtures de gestión académica y gestión de usuarios en orden lógico'
-
-    def handle(self, *args, **kwargs):
-        try:
-            self.stdout.write(self.style.NOTICE("Cargando fixtures..."))
-
-            call_command('loaddata', 'gestion_academica/fixtures/data_gestion_academica_institutos.json')
-            self.stdout.write(self.style.SUCCESS("Datos iniciales de INSTITUTOS cargados ✅"))
-            
-            call_command('loaddata', 'gestion_academica/fixtures/data_gestion_academica_carreras.json')
-            self.stdout.write(self.style.SUCCESS("Datos iniciales de CARRERAS cargados ✅"))
-            
-            call_command('loaddata', 'gestion_academica/fixtures/data_gestion_academica_documentos.json')
-            self.stdout.write(self.style.SUCCESS("Datos iniciales de DOCUMENTOS cargados ✅"))
-
-            call_command('loaddata', 'gestion_academica/fixtures/data_gestion_academica_asignaturas.json')
-            self.stdout.write(self.style.SUCCESS("Datos iniciales de ASIGNATURAS cargados ✅"))
+from gestion_academica.services.estadisticas_reportes.cache_resultados import invalidar_estadisticas
+from gestion_academica.services.mantenimiento.carga_fixtures import cargar_fixtures
 
-            call_command('loaddata', 'gestion_academica/fixtures/data_gestion_academica_planesdeestudio.json')
-            self.stdout.write(self.style.SUCCESS("Datos iniciales de PLANES DE ESTUDIOS cargados ✅"))
+# (archivo, descripción) en orden lógico
+FIXTURES = [
+    ('gestion_academica/fixtures/data_gestion_academica_institutos.json', "INSTITUTOS"),
+    ('gestion_academica/fixtures/data_gestion_academica_carreras.json', "CARRERAS"),
+    ('gestion_academica/fixtures/data_gestion_academica_documentos.json', "DOCUMENTOS"),
+    ('gestion_academica/fixtures/data_gestion_academica_asignaturas.json', "ASIGNATURAS"),
+    ('gestion_academica/fixtures/data_gestion_academica_planesdeestudio.json', "PLANES DE ESTUDIOS"),
+    ('gestion_academica/fixtures/data_gestion_academica_planasignaturas.json', "PLANES DE ASIGNATURAS"),
+    ('gestion_academica/fixtures/data_gestion_academica_correlativas.json', "CORRELATIVAS"),
+    ('gestion_academica/fixtures/data_gestion_usuarios.json', "gestión de usuarios"),
+    ('gestion_academica/fixtures/m2_m3.json', "m2 y m3"),
+]
 
-            call_command('loaddata', 'gestion_academica/fixtures/data_gestion_academica_planasignaturas.json')
-            self.stdout.write(self.style.SUCCESS("Datos iniciales de PLANES DE ASIGNATURAS cargados ✅"))
 
-            call_command('loaddata', 'gestion_academica/fixtures/data_gestion_academica_correlativas.json')
-            self.stdout.write(self.style.SUCCESS("Datos iniciales de CORRELATIVAS cargados ✅"))
+class Command(BaseCommand):
+    help = 'Carga fixtures de gestión académica y gestión de usuarios en orden lógico'
 
-            call_command('loaddata', 'gestion_academica/fixtures/data_gestion_usuarios.json')
-            self.stdout.write(self.style.SUCCESS("Datos iniciales de gestión de usuarios cargados ✅"))
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify', action='store_true',
+            help='Chequea las restricciones (FK diferidas) y las filas cargadas antes de confirmar.')
+        parser.add_argument(
+            '--loaddata', action='store_true',
+            help='Usa loaddata objeto por objeto (más lento; dispara señales y save()).')
 
-            call_command('loaddata', 'gestion_academica/fixtures/m2_m3.json')
-            self.stdout.write(self.style.SUCCESS("Datos iniciales de m2 y m3 cargados ✅"))
+    def handle(self, *args, **options):
+        try:
+            self.stdout.write(self.style.NOTICE("Cargando fixtures..."))
+            inicio = time.perf_counter()
+
+            if options['loaddata']:
+                for ruta, descripcion in FIXTURES:
+                    call_command('loaddata', ruta)
+                    self.stdout.write(self.style.SUCCESS(f"Datos iniciales de {descripcion} cargados ✅"))
+            else:
+                resultado = cargar_fixtures([ruta for ruta, _ in FIXTURES], verificar=options['verify'])
+                for modelo, filas in resultado.filas.items():
+                    self.stdout.write(f"  {modelo}: {filas}")
+                self.stdout.write(self.style.SUCCESS(
+                    f"{resultado.total} filas de {len(FIXTURES)} fixtures cargadas"
+                    f"{' y verificadas' if options['verify'] else ''} ✅"))
+                # la carga masiva no dispara señales
+                invalidar_estadisticas()
+
+            # ni loaddata ni la carga masiva pasan por save(): completamos la
+            # carrera copiada en comisiones y designaciones
+            call_command('backfill_carrera_denormalizada')
+            self.stdout.write(f"Tiempo total: {time.perf_counter() - inicio:.2f} s")
         except Exception as e:
             self.stderr.write(self.style.ERROR(f"Error al cargar fixtures: {e}"))
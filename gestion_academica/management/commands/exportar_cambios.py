@@ -0,0 +1,57 @@
+import gzip
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from gestion_academica.services.estadisticas_reportes.feed_cambios import (
+    MODELOS_FEED,
+    lineas_feed,
+    marca_de_agua_actual,
+    parsear_marca,
+    parsear_modelos,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Exporta en NDJSON las altas, modificaciones y bajas desde una marca de agua "
+        "(feed de cambios para la sincronización con BI)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--salida", required=True, help="Archivo destino (.ndjson o .ndjson.gz)")
+        parser.add_argument("--desde", help="Marca de agua ISO 8601. Sin ella (ni --estado), foto completa.")
+        parser.add_argument(
+            "--estado",
+            help="Archivo JSON con la marca de agua: se lee si no se pasa --desde y "
+                 "se actualiza al terminar bien.",
+        )
+        parser.add_argument("--modelos", help=f"Separados por comas. Por defecto: {','.join(MODELOS_FEED)}")
+
+    def handle(self, *args, **options):
+        estado = Path(options["estado"]) if options["estado"] else None
+        desde_texto = options["desde"]
+        if desde_texto is None and estado is not None and estado.exists():
+            desde_texto = json.loads(estado.read_text()).get("hasta")
+
+        try:
+            desde = parsear_marca(desde_texto)
+            modelos = parsear_modelos(options["modelos"])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        hasta = marca_de_agua_actual()
+        salida = options["salida"]
+        abrir = gzip.open if salida.endswith(".gz") else open
+        lineas = 0
+        with abrir(salida, "wt", encoding="utf-8") as archivo:
+            for linea in lineas_feed(modelos, desde, hasta):
+                archivo.write(linea)
+                lineas += 1
+
+        if estado is not None:
+            estado.write_text(json.dumps({"hasta": hasta.isoformat()}))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{lineas - 1} cambios entre {desde or 'el inicio'} y {hasta.isoformat()} -> {salida} ✅"))
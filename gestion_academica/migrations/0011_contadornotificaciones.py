@@ -0,0 +1,27 @@
+# Generated by Django 5.2.7 on 2026-10-19 19:03
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gestion_academica', '0010_remove_docente_cantidad_materias'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContadorNotificaciones',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sin_leer', models.PositiveIntegerField(default=0)),
+                ('pospuestas', models.PositiveIntegerField(default=0)),
+                ('proximo_recordatorio', models.DateTimeField(blank=True, null=True)),
+                ('version', models.PositiveBigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('usuario', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='contador_notificaciones', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.7 on 2026-10-19 19:07
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gestion_academica', '0011_contadornotificaciones'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notificacion',
+            name='clave',
+            field=models.CharField(blank=True, max_length=64, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='usuarionotificacion',
+            name='fecha_emision',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        # las asignaciones existentes toman la fecha de su notificación
+        migrations.RunSQL(
+            sql="""
+                UPDATE gestion_academica_usuarionotificacion un
+                SET fecha_emision = n.fecha_creacion
+                FROM gestion_academica_notificacion n
+                WHERE n.id = un.notificacion_id;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='usuarionotificacion',
+            index=models.Index(fields=['usuario', 'eliminado', 'leida', '-fecha_emision'], name='idx_un_bandeja'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.7 on 2026-10-19 19:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gestion_academica', '0012_notificacion_clave_fecha_emision'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EstadisticaSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fecha', models.DateField()),
+                ('granularidad', models.CharField(choices=[('DIARIO', 'Diario'), ('CUATRIMESTRAL', 'Cuatrimestral')], default='DIARIO', max_length=15)),
+                ('total_docentes', models.PositiveIntegerField(default=0)),
+                ('total_designaciones', models.PositiveIntegerField(default=0)),
+                ('total_horas', models.PositiveIntegerField(default=0)),
+                ('asignaturas_plan', models.PositiveIntegerField(default=0)),
+                ('asignaturas_cubiertas', models.PositiveIntegerField(default=0)),
+                ('por_dedicacion', models.JSONField(blank=True, default=dict)),
+                ('por_modalidad', models.JSONField(blank=True, default=dict)),
+                ('generado_en', models.DateTimeField(auto_now=True)),
+                ('carrera', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='snapshots_estadisticas', to='gestion_academica.carrera')),
+            ],
+            options={
+                'verbose_name': 'Snapshot de Estadísticas',
+                'verbose_name_plural': 'Snapshots de Estadísticas',
+                'constraints': [models.UniqueConstraint(fields=('carrera', 'granularidad', 'fecha'), name='uq_snapshot_carrera_fecha')],
+            },
+        ),
+    ]
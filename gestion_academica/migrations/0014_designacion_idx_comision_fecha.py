@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-19 19:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gestion_academica', '0013_estadisticasnapshot'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='designacion',
+            index=models.Index(fields=['comision', '-fecha_inicio'], name='idx_designacion_comision_fecha'),
+        ),
+    ]
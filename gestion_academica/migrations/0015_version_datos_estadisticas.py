@@ -0,0 +1,26 @@
+# Generated by Django 5.2.7 on 2026-10-19 19:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gestion_academica', '0014_designacion_idx_comision_fecha'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VersionDatosEstadisticas',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('clave', models.CharField(max_length=50, unique=True)),
+                ('version', models.PositiveBigIntegerField(default=0)),
+                ('actualizado_en', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Versión de Datos de Estadísticas',
+                'verbose_name_plural': 'Versiones de Datos de Estadísticas',
+            },
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.7 on 2026-10-19 19:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gestion_academica', '0015_version_datos_estadisticas'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comision',
+            name='carrera',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='comisiones', to='gestion_academica.carrera'),
+        ),
+        migrations.AddField(
+            model_name='comision',
+            name='plan_de_estudio',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='comisiones', to='gestion_academica.plandeestudio'),
+        ),
+        migrations.AddField(
+            model_name='designacion',
+            name='carrera',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='designaciones', to='gestion_academica.carrera'),
+        ),
+        migrations.AddField(
+            model_name='designacion',
+            name='plan_de_estudio',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='designaciones', to='gestion_academica.plandeestudio'),
+        ),
+        migrations.RunSQL(
+            sql="""
+                UPDATE gestion_academica_comision c
+                SET plan_de_estudio_id = pa.plan_de_estudio_id,
+                    carrera_id = pe.carrera_id
+                FROM gestion_academica_planasignatura pa
+                JOIN gestion_academica_plandeestudio pe ON pe.id = pa.plan_de_estudio_id
+                WHERE pa.id = c.plan_asignatura_id;
+
+                UPDATE gestion_academica_designacion d
+                SET plan_de_estudio_id = c.plan_de_estudio_id,
+                    carrera_id = c.carrera_id
+                FROM gestion_academica_comision c
+                WHERE c.id = d.comision_id;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='comision',
+            index=models.Index(fields=['carrera', 'activo'], name='idx_comision_carrera_activo'),
+        ),
+        migrations.AddIndex(
+            model_name='designacion',
+            index=models.Index(fields=['carrera', 'activo', 'fecha_fin'], name='idx_designacion_carrera'),
+        ),
+    ]
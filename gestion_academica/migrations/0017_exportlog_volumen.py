@@ -0,0 +1,38 @@
+# Generated by Django 5.2.7 on 2026-10-19 19:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gestion_academica', '0016_carrera_denormalizada'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exportlog',
+            name='bytes_enviados',
+            field=models.PositiveBigIntegerField(blank=True, help_text='Tamaño del archivo enviado al cliente.', null=True),
+        ),
+        migrations.AddField(
+            model_name='exportlog',
+            name='bytes_sin_comprimir',
+            field=models.PositiveBigIntegerField(blank=True, help_text='Tamaño del contenido antes de comprimir.', null=True),
+        ),
+        migrations.AddField(
+            model_name='exportlog',
+            name='filas',
+            field=models.PositiveIntegerField(blank=True, help_text='Cantidad de filas exportadas.', null=True),
+        ),
+        migrations.AlterField(
+            model_name='exportlog',
+            name='formato',
+            field=models.CharField(choices=[('CSV', 'Archivo CSV'), ('XLSX', 'Archivo Excel'), ('PDF', 'Archivo PDF'), ('CSV_GZ', 'Archivo CSV comprimido (gzip)'), ('NDJSON', 'JSON delimitado por líneas'), ('NDJSON_GZ', 'JSON delimitado por líneas comprimido (gzip)')], help_text='Formato de exportación (CSV, XLSX, PDF).', max_length=10),
+        ),
+        migrations.AlterField(
+            model_name='exportlog',
+            name='tipo_reporte',
+            field=models.CharField(choices=[('DOCENTES_POR_DEDICACION', 'Docentes por dedicación'), ('DOCENTES_POR_MODALIDAD', 'Docentes por modalidad'), ('DOCENTES_DEDICACION_MODALIDAD', 'Docentes por dedicación y modalidad'), ('HORAS_POR_DOCENTE', 'Horas frente a alumnos por docente'), ('DESIGNACIONES_CARRERA', 'Designaciones por asignatura/carrera'), ('HISTORIAL_DOCENTE', 'Evolución histórica de designaciones de un docente')], help_text='Tipo de reporte exportado (ej: docentes por dedicación).', max_length=50),
+        ),
+    ]
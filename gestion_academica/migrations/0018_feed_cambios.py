@@ -0,0 +1,61 @@
+# Generated by Django 5.2.7 on 2026-10-19 19:28
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gestion_academica', '0017_exportlog_volumen'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RegistroEliminacion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('modelo', models.CharField(max_length=50)),
+                ('objeto_id', models.PositiveBigIntegerField()),
+                ('eliminado_en', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Registro de Eliminación',
+                'verbose_name_plural': 'Registros de Eliminación',
+            },
+        ),
+        migrations.AddField(
+            model_name='docente',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AlterField(
+            model_name='exportlog',
+            name='tipo_reporte',
+            field=models.CharField(choices=[('DOCENTES_POR_DEDICACION', 'Docentes por dedicación'), ('DOCENTES_POR_MODALIDAD', 'Docentes por modalidad'), ('DOCENTES_DEDICACION_MODALIDAD', 'Docentes por dedicación y modalidad'), ('HORAS_POR_DOCENTE', 'Horas frente a alumnos por docente'), ('DESIGNACIONES_CARRERA', 'Designaciones por asignatura/carrera'), ('HISTORIAL_DOCENTE', 'Evolución histórica de designaciones de un docente'), ('CAMBIOS', 'Cambios incrementales desde una marca de agua')], help_text='Tipo de reporte exportado (ej: docentes por dedicación).', max_length=50),
+        ),
+        migrations.AddIndex(
+            model_name='asignatura',
+            index=models.Index(fields=['updated_at', 'id'], name='idx_asignatura_updated'),
+        ),
+        migrations.AddIndex(
+            model_name='carrera',
+            index=models.Index(fields=['updated_at', 'id'], name='idx_carrera_updated'),
+        ),
+        migrations.AddIndex(
+            model_name='designacion',
+            index=models.Index(fields=['updated_at', 'id'], name='idx_designacion_updated'),
+        ),
+        migrations.AddIndex(
+            model_name='docente',
+            index=models.Index(fields=['updated_at', 'id'], name='idx_docente_updated'),
+        ),
+        migrations.AddIndex(
+            model_name='planasignatura',
+            index=models.Index(fields=['updated_at', 'id'], name='idx_plan_asignatura_updated'),
+        ),
+        migrations.AddIndex(
+            model_name='registroeliminacion',
+            index=models.Index(fields=['modelo', 'eliminado_en', 'id'], name='idx_eliminacion_modelo_fecha'),
+        ),
+    ]
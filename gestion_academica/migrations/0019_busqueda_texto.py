@@ -0,0 +1,144 @@
+# Generated by Django 5.2.7 on 2026-10-19 19:45
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+# Normalización de acentos: unaccent si la extensión está disponible (y se
+# puede crear); si no, translate() con las vocales acentuadas y la ñ.
+SQL_SIN_ACENTOS = r"""
+DO $bloque$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'unaccent') THEN
+        BEGIN
+            CREATE EXTENSION IF NOT EXISTS unaccent;
+        EXCEPTION WHEN insufficient_privilege THEN
+            RAISE NOTICE 'Sin permisos para crear unaccent: se usa translate().';
+        END;
+    END IF;
+
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'unaccent') THEN
+        CREATE OR REPLACE FUNCTION ma_sin_acentos(texto text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE
+        AS $f$ SELECT unaccent('unaccent'::regdictionary, coalesce(texto, '')) $f$;
+    ELSE
+        CREATE OR REPLACE FUNCTION ma_sin_acentos(texto text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE
+        AS $f$ SELECT translate(coalesce(texto, ''),
+                                'áéíóúüñÁÉÍÓÚÜÑàèìòùÀÈÌÒÙ',
+                                'aeiouunAEIOUUNaeiouAEIOU') $f$;
+    END IF;
+END
+$bloque$;
+
+-- lexemas en español (con raíz: "informáticos" encuentra "Informática") y
+-- en 'simple' (palabra completa, para las búsquedas por prefijo)
+CREATE OR REPLACE FUNCTION ma_vector(texto text, peso "char") RETURNS tsvector
+LANGUAGE sql IMMUTABLE PARALLEL SAFE
+AS $f$
+    SELECT setweight(to_tsvector('spanish', ma_sin_acentos(texto))
+                     || to_tsvector('simple', ma_sin_acentos(texto)), peso)
+$f$;
+"""
+
+# tabla -> (columnas que disparan el recálculo, expresión del vector)
+VECTORES = {
+    "gestion_academica_carrera": (
+        ["codigo", "nombre"],
+        "ma_vector(NEW.codigo, 'A') || ma_vector(NEW.nombre, 'A')",
+    ),
+    "gestion_academica_asignatura": (
+        ["codigo", "nombre"],
+        "ma_vector(NEW.codigo, 'A') || ma_vector(NEW.nombre, 'A')",
+    ),
+    "gestion_academica_documento": (
+        ["tipo", "emisor", "numero", "anio"],
+        "ma_vector(concat_ws(' ', NEW.numero, NEW.anio), 'A') || ma_vector(NEW.emisor, 'B') "
+        "|| ma_vector(NEW.tipo, 'C')",
+    ),
+    "gestion_academica_usuario": (
+        ["first_name", "last_name", "username", "legajo", "email"],
+        "ma_vector(NEW.last_name, 'A') || ma_vector(NEW.first_name, 'A') "
+        "|| ma_vector(NEW.legajo, 'B') || ma_vector(NEW.username, 'B') || ma_vector(NEW.email, 'C')",
+    ),
+}
+
+
+def _sql_triggers():
+    sentencias = [SQL_SIN_ACENTOS]
+    for tabla, (columnas, vector) in VECTORES.items():
+        sentencias.append(f"""
+            CREATE OR REPLACE FUNCTION {tabla}_busqueda() RETURNS trigger
+            LANGUAGE plpgsql AS $f$
+            BEGIN
+                NEW.busqueda := {vector};
+                RETURN NEW;
+            END
+            $f$;
+
+            CREATE TRIGGER {tabla}_busqueda
+            BEFORE INSERT OR UPDATE OF {", ".join(columnas)} ON {tabla}
+            FOR EACH ROW EXECUTE FUNCTION {tabla}_busqueda();
+
+            -- completar las filas existentes (el UPDATE dispara el trigger)
+            UPDATE {tabla} SET {columnas[0]} = {columnas[0]};
+        """)
+    return "\n".join(sentencias)
+
+
+def _sql_revertir():
+    sentencias = [
+        f"DROP TRIGGER IF EXISTS {tabla}_busqueda ON {tabla}; DROP FUNCTION IF EXISTS {tabla}_busqueda();"
+        for tabla in VECTORES
+    ]
+    sentencias.append('DROP FUNCTION IF EXISTS ma_vector(text, "char"); DROP FUNCTION IF EXISTS ma_sin_acentos(text);')
+    return "\n".join(sentencias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('gestion_academica', '0018_feed_cambios'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='asignatura',
+            name='busqueda',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='carrera',
+            name='busqueda',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='documento',
+            name='busqueda',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='usuario',
+            name='busqueda',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='asignatura',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['busqueda'], name='idx_asignatura_busqueda'),
+        ),
+        migrations.AddIndex(
+            model_name='carrera',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['busqueda'], name='idx_carrera_busqueda'),
+        ),
+        migrations.AddIndex(
+            model_name='documento',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['busqueda'], name='idx_documento_busqueda'),
+        ),
+        migrations.AddIndex(
+            model_name='usuario',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['busqueda'], name='idx_usuario_busqueda'),
+        ),
+        migrations.RunSQL(sql=_sql_triggers(), reverse_sql=_sql_revertir()),
+    ]
@@ -0,0 +1,47 @@
+from django.db import migrations
+
+
+# Índices de trigramas para el typeahead (services/gestion_academica/typeahead.py).
+# Las expresiones tienen que ser idénticas a EXPRESIONES_TYPEAHEAD. Si pg_trgm
+# no está disponible (o no hay permisos para crearla) no se crean y el
+# typeahead usa LIKE sin índice.
+SQL_TRIGRAMAS = r"""
+DO $bloque$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+        BEGIN
+            CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        EXCEPTION WHEN insufficient_privilege THEN
+            RAISE NOTICE 'Sin permisos para crear pg_trgm: el typeahead no tendrá índice.';
+        END;
+    END IF;
+
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm') THEN
+        CREATE INDEX IF NOT EXISTS idx_carrera_trgm ON gestion_academica_carrera
+            USING gin ((lower(ma_sin_acentos(codigo || ' ' || nombre))) gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_asignatura_trgm ON gestion_academica_asignatura
+            USING gin ((lower(ma_sin_acentos(codigo || ' ' || nombre))) gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_usuario_trgm ON gestion_academica_usuario
+            USING gin ((lower(ma_sin_acentos(last_name || ' ' || first_name || ' ' || legajo))) gin_trgm_ops);
+    END IF;
+END
+$bloque$;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gestion_academica', '0019_busqueda_texto'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=SQL_TRIGRAMAS,
+            reverse_sql="""
+                DROP INDEX IF EXISTS idx_carrera_trgm;
+                DROP INDEX IF EXISTS idx_asignatura_trgm;
+                DROP INDEX IF EXISTS idx_usuario_trgm;
+            """,
+        ),
+    ]
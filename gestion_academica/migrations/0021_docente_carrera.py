@@ -0,0 +1,47 @@
+# Generated by Django 5.2.7 on 2026-10-19 19:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# carga inicial (después la mantiene services/designaciones_docentes/docente_carrera.py)
+SQL_CARGA_INICIAL = """
+INSERT INTO gestion_academica_docentecarrera
+    (docente_id, carrera_id, activo, vigente_hasta,
+     primera_designacion, ultima_designacion, updated_at)
+SELECT docente_id, carrera_id,
+       bool_or(activo),
+       CASE WHEN bool_or(activo AND fecha_fin IS NULL) THEN NULL
+            ELSE max(fecha_fin) FILTER (WHERE activo) END,
+       min(fecha_inicio), max(fecha_inicio), now()
+FROM gestion_academica_designacion
+WHERE carrera_id IS NOT NULL
+GROUP BY docente_id, carrera_id;
+"""
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gestion_academica', '0020_typeahead_trigramas'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocenteCarrera',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('activo', models.BooleanField(default=False)),
+                ('vigente_hasta', models.DateTimeField(blank=True, null=True)),
+                ('primera_designacion', models.DateTimeField()),
+                ('ultima_designacion', models.DateTimeField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('carrera', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='docentes_carrera', to='gestion_academica.carrera')),
+                ('docente', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='carreras_docente', to='gestion_academica.docente')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['carrera', 'activo'], name='idx_docentecarrera_carrera')],
+                'constraints': [models.UniqueConstraint(fields=('docente', 'carrera'), name='uq_docente_carrera')],
+            },
+        ),
+        migrations.RunSQL(sql=SQL_CARGA_INICIAL, reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -10,6 +10,8 @@ Asignatura, PlanAsignatura y Correlativa.
 from django.db import models
 from django.core.exceptions import ValidationError
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 
 
 class Instituto(models.Model):
@@ -43,9 +45,19 @@ class Carrera(models.Model):
     instituto = models.ForeignKey(
         Instituto, on_delete=models.PROTECT, related_name="carreras")
 
+    # búsqueda de texto: lo mantiene un trigger de la base (migración 0019)
+    busqueda = SearchVectorField(null=True, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # feed de cambios incremental (exportar_cambios)
+            models.Index(fields=["updated_at", "id"], name="idx_carrera_updated"),
+            GinIndex(fields=["busqueda"], name="idx_carrera_busqueda"),
+        ]
+
     def __str__(self):
         return self.nombre
 
@@ -72,9 +84,19 @@ class Asignatura(models.Model):
     tipo_duracion = models.CharField(
         max_length=20, choices=TIPO_DURACION_CHOICES)
 
+    # búsqueda de texto: lo mantiene un trigger de la base (migración 0019)
+    busqueda = SearchVectorField(null=True, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # feed de cambios incremental (exportar_cambios)
+            models.Index(fields=["updated_at", "id"], name="idx_asignatura_updated"),
+            GinIndex(fields=["busqueda"], name="idx_asignatura_busqueda"),
+        ]
+
     def __str__(self):
         return self.nombre
 
@@ -95,6 +117,9 @@ class Documento(models.Model):
     # tambien se añade un atributo para el propio documento
     archivo = models.FileField(upload_to="documentos/", blank=True, null=True)
 
+    # búsqueda de texto: lo mantiene un trigger de la base (migración 0019)
+    busqueda = SearchVectorField(null=True, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -103,6 +128,9 @@ class Documento(models.Model):
                 fields=["tipo", "emisor", "numero", "anio"], name="uq_documento_identificador"
             )
         ]
+        indexes = [
+            GinIndex(fields=["busqueda"], name="idx_documento_busqueda"),
+        ]
         ordering = ["-anio", "emisor", "numero"]
 
     def __str__(self):
@@ -167,6 +195,8 @@ class PlanAsignatura(models.Model):
         ]
         indexes = [
             models.Index(fields=["plan_de_estudio", "asignatura"]),
+            # feed de cambios incremental (exportar_cambios)
+            models.Index(fields=["updated_at", "id"], name="idx_plan_asignatura_updated"),
         ]
 
     def save(self, *args, **kwargs):
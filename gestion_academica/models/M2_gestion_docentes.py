@@ -68,6 +68,15 @@ class Docente(models.Model):
         Dedicacion, on_delete=models.SET_NULL, null=True, blank=True, related_name="docentes")
     activo = models.BooleanField(default=True)
 
+    # también se toca cuando cambian los datos del Usuario (ver signals)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # feed de cambios incremental (exportar_cambios)
+            models.Index(fields=["updated_at", "id"], name="idx_docente_updated"),
+        ]
+
     def __str__(self):
         return f"{self.usuario.last_name} {self.usuario.first_name}"
 
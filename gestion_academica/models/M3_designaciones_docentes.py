@@ -3,7 +3,7 @@
 '''
 MODULO 3: DESIGNACIONES DOCENTES
 
-Incluye las entidades Desigacion, Comision y Cargo
+Incluye las entidades Desigacion, Comision, Cargo y DocenteCarrera
 '''
 
 from django.db import models
@@ -26,15 +26,37 @@ class Comision(models.Model):
     plan_asignatura = models.ForeignKey(
         "gestion_academica.PlanAsignatura", on_delete=models.CASCADE, related_name="comisiones")
 
+    # copias de plan_asignatura.plan_de_estudio(.carrera): evitan la cadena
+    # Comision -> PlanAsignatura -> PlanDeEstudio en los filtros por carrera.
+    # Las mantiene save() y, si cambia el plan o su carrera, las señales.
+    plan_de_estudio = models.ForeignKey(
+        "gestion_academica.PlanDeEstudio", on_delete=models.CASCADE, null=True, blank=True,
+        editable=False, related_name="comisiones")
+    carrera = models.ForeignKey(
+        "gestion_academica.Carrera", on_delete=models.PROTECT, null=True, blank=True,
+        editable=False, related_name="comisiones")
+
     class Meta:
         constraints = [
             models.UniqueConstraint(
                 fields=["plan_asignatura", "nombre"], name="uq_comision_asignatura_nombre")
         ]
+        indexes = [
+            models.Index(fields=["carrera", "activo"], name="idx_comision_carrera_activo"),
+        ]
 
     def __str__(self):
         return f"{self.plan_asignatura.asignatura.nombre} - {self.nombre}"
 
+    def sincronizar_carrera(self):
+        plan = self.plan_asignatura.plan_de_estudio
+        self.plan_de_estudio_id = plan.pk
+        self.carrera_id = plan.carrera_id
+
+    def save(self, *args, **kwargs):
+        self.sincronizar_carrera()
+        super().save(*args, **kwargs)
+
 
 class Cargo(models.Model):
     """Tabla catálogo para los cargos docentes (ej: Titular, Adjunto)."""
@@ -74,7 +96,13 @@ class Designacion(models.Model):
 
     observacion = models.TextField(blank=True, null=True)
 
-
+    # copias de comision.plan_de_estudio / comision.carrera (ver Comision)
+    plan_de_estudio = models.ForeignKey(
+        "gestion_academica.PlanDeEstudio", on_delete=models.CASCADE, null=True, blank=True,
+        editable=False, related_name="designaciones")
+    carrera = models.ForeignKey(
+        "gestion_academica.Carrera", on_delete=models.PROTECT, null=True, blank=True,
+        editable=False, related_name="designaciones")
 
     documento = models.ForeignKey("gestion_academica.Documento", on_delete=models.SET_NULL,
                                   null=True, blank=True, related_name="designaciones")
@@ -95,12 +123,30 @@ class Designacion(models.Model):
             models.UniqueConstraint(fields=[
                                     'docente', 'comision', 'fecha_inicio', 'fecha_fin'], name='uq_designacion_exact'),
         ]
+        indexes = [
+            # listados por comisión/carrera ordenados por fecha (reporte 5.2.3)
+            models.Index(fields=['comision', '-fecha_inicio'], name='idx_designacion_comision_fecha'),
+            # filtros por carrera de designaciones vigentes
+            models.Index(fields=['carrera', 'activo', 'fecha_fin'], name='idx_designacion_carrera'),
+            # feed de cambios incremental (exportar_cambios)
+            models.Index(fields=['updated_at', 'id'], name='idx_designacion_updated'),
+        ]
 
     def __str__(self):
         return f"{self.docente} en {self.comision}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instancia = super().from_db(db, field_names, values)
+        # para recalcular DocenteCarrera del docente anterior si se reasigna
+        instancia._docente_id_original = instancia.__dict__.get("docente_id")
+        return instancia
+
     def save(self, *args, **kwargs):
-        self.full_clean()
+        self.plan_de_estudio_id = self.comision.plan_de_estudio_id
+        self.carrera_id = self.comision.carrera_id
+        # los campos copiados no se validan: salen de la comisión ya validada
+        self.full_clean(exclude=["plan_de_estudio", "carrera"])
         super().save(*args, **kwargs)
 
     def clean(self):
@@ -118,3 +164,37 @@ class Designacion(models.Model):
             docente=self.docente, activo=True
         ).exclude(pk=self.pk)
         return designaciones_actuales.count() >= regimen.max_asignaturas
+
+
+class DocenteCarrera(models.Model):
+    """
+    Pertenencia materializada docente <-> carrera: una fila por cada carrera
+    en la que el docente tiene o tuvo designaciones. La mantienen las
+    señales de Designacion y las escrituras en bloque (ver
+    services/designaciones_docentes/docente_carrera.py); no se edita a mano.
+    """
+    docente = models.ForeignKey(
+        "gestion_academica.Docente", on_delete=models.CASCADE, related_name="carreras_docente")
+    carrera = models.ForeignKey(
+        "gestion_academica.Carrera", on_delete=models.CASCADE, related_name="docentes_carrera")
+
+    # True si tiene alguna designación activa en la carrera
+    activo = models.BooleanField(default=False)
+    # fecha_fin más lejana de las designaciones activas; NULL si alguna no tiene fin
+    vigente_hasta = models.DateTimeField(null=True, blank=True)
+    primera_designacion = models.DateTimeField()
+    ultima_designacion = models.DateTimeField()
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["docente", "carrera"], name="uq_docente_carrera"),
+        ]
+        indexes = [
+            # docentes de una carrera (DocenteViewSet.por_carrera, alcance del coordinador)
+            models.Index(fields=["carrera", "activo"], name="idx_docentecarrera_carrera"),
+        ]
+
+    def __str__(self):
+        return f"{self.docente} en {self.carrera}"
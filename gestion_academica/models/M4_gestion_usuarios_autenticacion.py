@@ -4,11 +4,14 @@
 MODULO 4: GESTIÓN DE USUARIOS Y AUTENTICACIÓN
 
 Incluye las entidades Usuario, Rol, RolUsuario, 
-Notificacion, UsuarioNotificacion, CarreraCoordinacion y Coordinador
+Notificacion, UsuarioNotificacion, ContadorNotificaciones,
+CarreraCoordinacion y Coordinador
 '''
 
 from django.db import models
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.utils import timezone
 from django.utils.crypto import get_random_string
 from .M1_gestion_academica import Carrera
@@ -21,6 +24,10 @@ class Usuario(AbstractUser):
     fecha_nacimiento = models.DateField(null=True, blank=True)
     celular = models.CharField(max_length=50, blank=True, null=True)
 
+    # búsqueda de texto (nombre, apellido, username, legajo, email): lo
+    # mantiene un trigger de la base (migración 0019)
+    busqueda = SearchVectorField(null=True, editable=False)
+
     # definicion de la relacion muchos a muchos a traves del modelo puente
     roles = models.ManyToManyField(
         "Rol", through="RolUsuario", related_name="usuarios")
@@ -29,6 +36,9 @@ class Usuario(AbstractUser):
         constraints = [
             models.UniqueConstraint(fields=['email'], name='uq_email_unico')
         ]
+        indexes = [
+            GinIndex(fields=["busqueda"], name="idx_usuario_busqueda"),
+        ]
 
     # campos requeridos al crear un superusuario
     REQUIRED_FIELDS = ["email", "first_name", "last_name"]
@@ -101,6 +111,8 @@ class Notificacion(models.Model):
     creado_por = models.ForeignKey("Usuario", on_delete=models.SET_NULL,
                                    null=True, blank=True, related_name="notificaciones_creadas")
     fecha_creacion = models.DateTimeField(auto_now_add=True)
+    # sha256 de la clave de deduplicación (ver services.gestion_usuarios.notificaciones)
+    clave = models.CharField(max_length=64, unique=True, null=True, blank=True)
 
     def __str__(self):
         return f"{self.titulo} ({self.fecha_creacion.date()})"
@@ -116,6 +128,9 @@ class UsuarioNotificacion(models.Model):
     fecha_recordatorio = models.DateTimeField(null=True, blank=True)
     eliminado = models.BooleanField(default=False)
     leida = models.BooleanField(default=False)
+    # Copia de la fecha de emisión (se renueva al reiterarse) para ordenar
+    # la bandeja desde el índice, sin join con Notificacion.
+    fecha_emision = models.DateTimeField(default=timezone.now)
 
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -124,6 +139,10 @@ class UsuarioNotificacion(models.Model):
             models.UniqueConstraint(
                 fields=["usuario", "notificacion"], name="uq_usuario_notificacion")
         ]
+        indexes = [
+            models.Index(fields=["usuario", "eliminado", "leida", "-fecha_emision"],
+                         name="idx_un_bandeja"),
+        ]
 
     def marcar_leida(self):
         if not self.leida:
@@ -132,6 +151,30 @@ class UsuarioNotificacion(models.Model):
             self.save()
 
 
+class ContadorNotificaciones(models.Model):
+    """
+    Contadores desnormalizados de la bandeja de un usuario.
+    Se mantienen en cada escritura (leer, posponer, archivar y emisión
+    desde las tareas) para que el badge del frontend no recorra
+    UsuarioNotificacion en cada consulta.
+    """
+    usuario = models.OneToOneField(
+        "Usuario", on_delete=models.CASCADE, related_name="contador_notificaciones")
+    # no leídas y no archivadas (incluye las pospuestas)
+    sin_leer = models.PositiveIntegerField(default=0)
+    # no leídas con un recordatorio todavía en el futuro
+    pospuestas = models.PositiveIntegerField(default=0)
+    # recordatorio más cercano: al vencer, los contadores se recalculan
+    proximo_recordatorio = models.DateTimeField(null=True, blank=True)
+    # se incrementa en cada cambio; se usa como ETag del resumen
+    version = models.PositiveBigIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.usuario} ({self.sin_leer} sin leer)"
+
+
 class CarreraCoordinacion(models.Model):
     """
     Modelo para registrar historia de coordinaciones de carrera.
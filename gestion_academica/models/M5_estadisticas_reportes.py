@@ -11,28 +11,36 @@ se reutilizan las de:
 - M3_designaciones_docentes: Designacion
 - M4_gestion_usuarios_autenticacion: Usuario, Coordinador, CarreraCoordinacion
 
-Este archivo define solo el modelo necesario para:
+Este archivo define solo los modelos necesarios para:
 - RF [5.3.0] Exportar Datos: registrar las exportaciones realizadas.
+- Series históricas: fotos agregadas por carrera (EstadisticaSnapshot).
+- Feed de cambios para BI: bajas registradas por señales (RegistroEliminacion).
 """
 
 from django.db import models
 from django.utils import timezone
 
+from .M1_gestion_academica import Carrera
 from .M4_gestion_usuarios_autenticacion import Usuario
 
 
 TIPO_REPORTE_CHOICES = [
     ("DOCENTES_POR_DEDICACION", "Docentes por dedicación"),
     ("DOCENTES_POR_MODALIDAD", "Docentes por modalidad"),
+    ("DOCENTES_DEDICACION_MODALIDAD", "Docentes por dedicación y modalidad"),
     ("HORAS_POR_DOCENTE", "Horas frente a alumnos por docente"),
     ("DESIGNACIONES_CARRERA", "Designaciones por asignatura/carrera"),
     ("HISTORIAL_DOCENTE", "Evolución histórica de designaciones de un docente"),
+    ("CAMBIOS", "Cambios incrementales desde una marca de agua"),
 ]
 
 FORMATO_REPORTE_CHOICES = [
     ("CSV", "Archivo CSV"),
     ("XLSX", "Archivo Excel"),
     ("PDF", "Archivo PDF"),
+    ("CSV_GZ", "Archivo CSV comprimido (gzip)"),
+    ("NDJSON", "JSON delimitado por líneas"),
+    ("NDJSON_GZ", "JSON delimitado por líneas comprimido (gzip)"),
 ]
 
 
@@ -45,11 +53,13 @@ class ExportLog(models.Model):
     Campos:
     - usuario: coordinador o usuario que pidió la exportación.
     - tipo_reporte: qué conjunto de datos se exportó.
-    - formato: CSV, XLSX, PDF.
+    - formato: CSV, XLSX, PDF, CSV_GZ, NDJSON, NDJSON_GZ.
     - filtros: JSON con los filtros aplicados (carrera, periodo, dedicación, etc.).
     - generado_en: fecha/hora de la exportación.
     - exito: si la exportación fue exitosa o no.
     - mensaje_error: detalle del error si falló.
+    - filas / bytes_sin_comprimir / bytes_enviados: volumen exportado
+      (en los formatos comprimidos, bytes_enviados es el tamaño gzip).
     """
 
     usuario = models.ForeignKey(
@@ -95,6 +105,24 @@ class ExportLog(models.Model):
         help_text="Detalle del error en caso de fallar la generación del archivo.",
     )
 
+    filas = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="Cantidad de filas exportadas.",
+    )
+
+    bytes_sin_comprimir = models.PositiveBigIntegerField(
+        null=True,
+        blank=True,
+        help_text="Tamaño del contenido antes de comprimir.",
+    )
+
+    bytes_enviados = models.PositiveBigIntegerField(
+        null=True,
+        blank=True,
+        help_text="Tamaño del archivo enviado al cliente.",
+    )
+
     class Meta:
         verbose_name = "Registro de Exportación de Estadísticas"
         verbose_name_plural = "Registros de Exportación de Estadísticas"
@@ -103,3 +131,113 @@ class ExportLog(models.Model):
     def __str__(self):
         estado = "OK" if self.exito else "ERROR"
         return f"[{estado}] {self.tipo_reporte} en {self.formato} - {self.generado_en:%Y-%m-%d %H:%M}"
+
+
+class EstadisticaSnapshot(models.Model):
+    """
+    Foto agregada de las estadísticas de una carrera a una fecha.
+
+    La escribe la tarea nocturna (granularidad DIARIO) y, en las fechas de
+    corte de cada cuatrimestre, también con granularidad CUATRIMESTRAL.
+    Las tendencias históricas se leen de acá con un solo rango sobre el
+    índice (carrera, granularidad, fecha), sin recorrer las designaciones.
+
+    Campos:
+    - total_docentes: docentes distintos con designación activa.
+    - total_designaciones / total_horas: designaciones activas y la suma de
+      horas semanales de sus asignaturas.
+    - asignaturas_plan / asignaturas_cubiertas: asignaturas de planes vigentes
+      y cuántas tienen al menos una designación activa (cobertura).
+    - por_dedicacion / por_modalidad: {nombre: cantidad de docentes}.
+    """
+
+    GRANULARIDAD_CHOICES = [
+        ("DIARIO", "Diario"),
+        ("CUATRIMESTRAL", "Cuatrimestral"),
+    ]
+
+    carrera = models.ForeignKey(
+        Carrera,
+        on_delete=models.CASCADE,
+        related_name="snapshots_estadisticas",
+    )
+    fecha = models.DateField()
+    granularidad = models.CharField(max_length=15, choices=GRANULARIDAD_CHOICES, default="DIARIO")
+
+    total_docentes = models.PositiveIntegerField(default=0)
+    total_designaciones = models.PositiveIntegerField(default=0)
+    total_horas = models.PositiveIntegerField(default=0)
+    asignaturas_plan = models.PositiveIntegerField(default=0)
+    asignaturas_cubiertas = models.PositiveIntegerField(default=0)
+
+    por_dedicacion = models.JSONField(default=dict, blank=True)
+    por_modalidad = models.JSONField(default=dict, blank=True)
+
+    generado_en = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Snapshot de Estadísticas"
+        verbose_name_plural = "Snapshots de Estadísticas"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["carrera", "granularidad", "fecha"], name="uq_snapshot_carrera_fecha")
+        ]
+
+    @property
+    def cobertura(self):
+        if not self.asignaturas_plan:
+            return None
+        return round(self.asignaturas_cubiertas * 100 / self.asignaturas_plan, 2)
+
+    def __str__(self):
+        return f"{self.carrera} - {self.granularidad} {self.fecha}"
+
+
+class VersionDatosEstadisticas(models.Model):
+    """
+    Contador de versión de los datos de los que dependen las estadísticas.
+
+    Las señales lo incrementan (al confirmarse la transacción) cada vez que
+    se escribe una Designacion, Docente, Comision, PlanAsignatura o
+    ParametrosRegimen. La versión forma parte de la clave del caché de
+    resultados, así que un cambio deja inaccesibles todas las entradas
+    anteriores sin tener que borrarlas. Se guarda en la base para que todos
+    los procesos vean el mismo valor.
+    """
+
+    clave = models.CharField(max_length=50, unique=True)
+    version = models.PositiveBigIntegerField(default=0)
+    actualizado_en = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Versión de Datos de Estadísticas"
+        verbose_name_plural = "Versiones de Datos de Estadísticas"
+
+    def __str__(self):
+        return f"{self.clave} v{self.version}"
+
+
+class RegistroEliminacion(models.Model):
+    """
+    Lápida de un registro borrado, para el feed de cambios incremental.
+
+    Una señal post_delete la crea por cada Designacion, Carrera,
+    PlanAsignatura, Asignatura o Docente eliminado; el feed la emite como
+    {"op": "delete"} si eliminado_en cae después de la marca de agua del
+    consumidor. Las lápidas viejas pueden purgarse una vez que todos los
+    consumidores sincronizaron más allá de esa fecha.
+    """
+
+    modelo = models.CharField(max_length=50)
+    objeto_id = models.PositiveBigIntegerField()
+    eliminado_en = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        verbose_name = "Registro de Eliminación"
+        verbose_name_plural = "Registros de Eliminación"
+        indexes = [
+            models.Index(fields=["modelo", "eliminado_en", "id"], name="idx_eliminacion_modelo_fecha"),
+        ]
+
+    def __str__(self):
+        return f"{self.modelo} #{self.objeto_id} ({self.eliminado_en})"
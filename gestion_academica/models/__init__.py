@@ -5,8 +5,8 @@ from .M1_gestion_academica import (
 
 from .M4_gestion_usuarios_autenticacion import (
     Usuario, Rol, RolUsuario,
-    Notificacion, UsuarioNotificacion, CarreraCoordinacion,
-    Coordinador
+    Notificacion, UsuarioNotificacion, ContadorNotificaciones,
+    CarreraCoordinacion, Coordinador
 )
 
 from .M2_gestion_docentes import (
@@ -15,5 +15,5 @@ from .M2_gestion_docentes import (
 )
 
 from .M3_designaciones_docentes import (
-    Comision, Cargo, Designacion
+    Comision, Cargo, Designacion, DocenteCarrera
 )
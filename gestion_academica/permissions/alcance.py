@@ -0,0 +1,120 @@
+'''
+Alcance (carreras visibles) de un usuario, compartido por los listados y
+los permisos sobre objetos.
+
+- El administrador (superusuario, staff o rol ADMINISTRADOR) ve todo.
+- El coordinador ve lo de las carreras que coordina activamente.
+- Cualquier otro usuario no ve nada.
+
+Las carreras se resuelven con una consulta y quedan cacheadas en el
+request (Alcance.de_request), así que un listado y el has_object_permission
+del mismo request no la repiten. Para cada modelo hay un único filtro por
+carrera_id: Comision y Designacion tienen la carrera copiada, PlanDeEstudio
+la tiene directa y PlanAsignatura está a un join. Por eso comprobar un
+objeto ya cargado no hace consultas (salvo un PlanAsignatura sin su plan
+cargado: una consulta por la pk del plan). Los docentes se resuelven por
+DocenteCarrera: un semi-join en los listados y una consulta por índice
+para un docente.
+'''
+
+from functools import cached_property
+
+from django.db.models import Q
+
+from gestion_academica.models import (
+    Carrera,
+    CarreraCoordinacion,
+    Comision,
+    Designacion,
+    Docente,
+    DocenteCarrera,
+    PlanAsignatura,
+    PlanDeEstudio,
+)
+
+
+# modelo -> ruta hasta el id de la carrera
+CAMPO_CARRERA = {
+    Carrera: "pk",
+    PlanDeEstudio: "carrera_id",
+    PlanAsignatura: "plan_de_estudio__carrera_id",
+    Comision: "carrera_id",
+    Designacion: "carrera_id",
+}
+
+
+class Alcance:
+    """Carreras que `usuario` puede ver o editar."""
+
+    def __init__(self, usuario):
+        self.usuario = usuario
+
+    @classmethod
+    def de_request(cls, request):
+        """El Alcance del usuario del request, calculado una vez por request."""
+        alcance = getattr(request, "_alcance", None)
+        if alcance is None or alcance.usuario is not request.user:
+            alcance = cls(request.user)
+            request._alcance = alcance
+        return alcance
+
+    @cached_property
+    def es_admin(self):
+        usuario = self.usuario
+        if not usuario.is_authenticated:
+            return False
+        return (usuario.is_superuser or usuario.is_staff
+                or usuario.roles.filter(nombre__iexact="ADMINISTRADOR").exists())
+
+    @cached_property
+    def carreras_ids(self):
+        """None si ve todas las carreras; si no, el conjunto de ids que coordina."""
+        if self.es_admin:
+            return None
+        if not self.usuario.is_authenticated:
+            return frozenset()
+        return frozenset(CarreraCoordinacion.objects.filter(
+            coordinador__usuario=self.usuario, coordinador__activo=True, activo=True,
+        ).values_list("carrera_id", flat=True))
+
+    def filtro(self, modelo):
+        """Q que deja solo las filas de `modelo` dentro del alcance."""
+        if self.carreras_ids is None:
+            return Q()
+        if modelo is Docente:
+            return Q(pk__in=DocenteCarrera.objects.filter(
+                carrera_id__in=self.carreras_ids).values("docente_id"))
+        return Q(**{f"{CAMPO_CARRERA[modelo]}__in": self.carreras_ids})
+
+    def filtrar(self, queryset):
+        """`queryset` acotado al alcance (vacío si no coordina ninguna carrera)."""
+        if self.carreras_ids is None:
+            return queryset
+        if not self.carreras_ids:
+            return queryset.none()
+        return queryset.filter(self.filtro(queryset.model))
+
+    def incluye_carrera(self, carrera_id):
+        return self.carreras_ids is None or carrera_id in self.carreras_ids
+
+    def _carrera_de(self, obj):
+        if isinstance(obj, Carrera):
+            return obj.pk
+        if not isinstance(obj, PlanAsignatura):
+            return obj.carrera_id
+        if PlanAsignatura.plan_de_estudio.is_cached(obj):
+            return obj.plan_de_estudio.carrera_id
+        return PlanDeEstudio.objects.filter(pk=obj.plan_de_estudio_id).values_list(
+            "carrera_id", flat=True).first()
+
+    def permite(self, obj):
+        """True si `obj` (Carrera, PlanDeEstudio, PlanAsignatura, Comision, Designacion o Docente) está en el alcance."""
+        if self.carreras_ids is None:
+            return True
+        if isinstance(obj, Docente):
+            return bool(self.carreras_ids) and DocenteCarrera.objects.filter(
+                docente_id=obj.pk, carrera_id__in=self.carreras_ids).exists()
+        if not self.carreras_ids or type(obj) not in CAMPO_CARRERA:
+            return False
+        carrera_id = self._carrera_de(obj)
+        return carrera_id is not None and carrera_id in self.carreras_ids
@@ -4,6 +4,11 @@ from django.utils import timezone
 from rest_framework import serializers
 from gestion_academica import models
 from gestion_academica.serializers.user_serializers.role_serializer import RoleSerializer
+from gestion_academica.services.designaciones_docentes.detalle_docente import (
+    INCLUDES_DETALLE_DOCENTE_DEFECTO,
+    designaciones_docente,
+)
+from gestion_academica.services.designaciones_docentes.docente_carrera import carreras_vigentes
 
 
 class CaracterSerializer(serializers.ModelSerializer):
@@ -148,39 +153,13 @@ class DocenteSerializer(serializers.ModelSerializer):
     
     def get_carreras(self, obj):
         """
-        Devuelve lista de carreras (id, nombre) relacionadas al docente
-        por las designaciones -> comision -> asignatura -> planes_de_estudio -> carrera.
+        Devuelve lista de carreras (id, nombre) en las que el docente tiene
+        designaciones activas y vigentes, desde DocenteCarrera (una consulta,
+        o ninguna si la vista hizo prefetch_carreras_vigentes()).
         """
         if not obj or not obj.pk:
             return []
-
-        from django.db.models import Q
-        from django.utils import timezone
-        hoy = timezone.now()
-        # obtenemos PlanDeEstudio relacionados con asignaturas que tienen comisiones con designaciones del docente
-        planes_qs = models.PlanDeEstudio.objects.filter(
-            # La ruta corregida:
-            Q(planasignatura__comisiones__designaciones__fecha_fin__isnull=True) |
-            Q(planasignatura__comisiones__designaciones__fecha_fin__gt=hoy),
-            planasignatura__comisiones__designaciones__docente=obj,
-            
-            # Solo de planes vigentes
-            esta_vigente=True,
-            
-            # Solo de designaciones activAS
-            planasignatura__comisiones__designaciones__activo=True,            
-            
-        ).distinct().select_related('carrera')
-
-        # convertir a lista de dicts con id/nombre de carrera (distinct)
-        carreras = []
-        seen = set()
-        for plan in planes_qs:
-            c = plan.carrera
-            if c and c.id not in seen:
-                seen.add(c.id)
-                carreras.append({"id": c.id, "nombre": c.nombre})
-        return carreras
+        return carreras_vigentes(obj)
 
     def update(self, instance, validated_data):
         '''Actualiza solo los campos permitidos'''
@@ -191,6 +170,13 @@ class DocenteSerializer(serializers.ModelSerializer):
 
 
 class DocenteDetalleSerializer(serializers.ModelSerializer):
+    """
+    Detalle compacto de un docente. Las designaciones vienen como ids contra
+    tablas de lookup (ver services/designaciones_docentes/detalle_docente.py).
+    El contexto acepta 'incluir' (historicas, tablas) y 'pagina'/'por_pagina'
+    para las históricas. Con el docente cargado con select_related y los
+    prefetch de la vista, el detalle hace una cantidad fija de consultas.
+    """
 
     usuario = UsuarioLiteSerializer(read_only=True)
 
@@ -232,49 +218,16 @@ class DocenteDetalleSerializer(serializers.ModelSerializer):
 
     def get_carreras(self, obj):
         """
-        Devuelve lista de carreras (id, nombre) relacionadas al docente
-        por las designaciones -> comision -> asignatura -> planes_de_estudio -> carrera.
+        Devuelve lista de carreras (id, nombre) en las que el docente tiene
+        designaciones activas y vigentes, desde DocenteCarrera (una consulta,
+        o ninguna si la vista hizo prefetch_carreras_vigentes()).
         """
         if not obj or not obj.pk:
             return []
-        from django.db.models import Q
-        from django.utils import timezone
-        hoy = timezone.now()
-        # obtenemos PlanDeEstudio relacionados con asignaturas que tienen comisiones con designaciones del docente
-        planes_qs = models.PlanDeEstudio.objects.filter(
-            # La ruta corregida:
-            Q(planasignatura__comisiones__designaciones__fecha_fin__isnull=True) |
-            Q(planasignatura__comisiones__designaciones__fecha_fin__gt=hoy),
-            planasignatura__comisiones__designaciones__docente=obj,
-            
-            # Solo de planes vigentes
-            esta_vigente=True,
-            
-            # Solo de designaciones activAS
-            planasignatura__comisiones__designaciones__activo=True,            
-            
-        ).distinct().select_related('carrera')
-
-        # convertir a lista de dicts con id/nombre de carrera (distinct)
-        carreras = []
-        seen = set()
-        for plan in planes_qs:
-            c = plan.carrera
-            if c and c.id not in seen:
-                seen.add(c.id)
-                carreras.append({"id": c.id, "nombre": c.nombre})
-        return carreras
+        return carreras_vigentes(obj)
 
     def get_designaciones(self, obj):
-        """Devuelve designaciones actuales e históricas del docente."""
-        from gestion_academica.serializers.M3_designaciones_docentes import DesignacionSerializer
-
-        designaciones_qs = models.Designacion.objects.filter(docente=obj)
-
-        actuales = designaciones_qs.filter(fecha_fin__isnull=True)
-        historicas = designaciones_qs.filter(fecha_fin__isnull=False)
-
-        return {
-            "actuales": DesignacionSerializer(actuales, many=True).data,
-            "historicas": DesignacionSerializer(historicas, many=True).data
-        }
+        """Devuelve designaciones actuales e históricas (paginadas) del docente."""
+        paginado = {k: self.context[k] for k in ("pagina", "por_pagina") if k in self.context}
+        return designaciones_docente(
+            obj.pk, self.context.get("incluir", INCLUDES_DETALLE_DOCENTE_DEFECTO), **paginado)
@@ -8,6 +8,7 @@ from gestion_academica import models
 from gestion_academica.serializers.M2_gestion_docentes import DocenteSerializer
 from django.db.models import Q
 from gestion_academica.serializers import PlanAsignaturaSerializer
+from gestion_academica.services.gestion_usuarios import notificaciones
 
 User = get_user_model()
 
@@ -365,8 +366,10 @@ class DesignacionSerializer(serializers.ModelSerializer):
             f"que excede su carga horaria máxima permitida. "
             f"Carga actual: {carga_total}hs / Límite: {limite_horas}hs."
         )
-        notif_obj, _ = models.Notificacion.objects.get_or_create(
-            titulo=titulo, mensaje=mensaje, tipo="ADVERTENCIA", creado_por=actor
+        # una notificación por docente: si cambió la carga se actualiza y se reitera
+        notif_obj, cambio = notificaciones.obtener_o_crear_notificacion(
+            titulo, mensaje, "ADVERTENCIA", creado_por=actor,
+            clave=f"carga_excedida:{docente.pk}",
         )
         carreras_del_docente = models.Carrera.objects.filter(
             planes__planasignatura__comisiones__designaciones__docente=docente
@@ -377,8 +380,8 @@ class DesignacionSerializer(serializers.ModelSerializer):
             activo=True
         ).distinct()
         for coord in coordinadores_a_notificar:
-            models.UsuarioNotificacion.objects.get_or_create(
-                usuario=coord.usuario, notificacion=notif_obj
+            notificaciones.asignar_notificacion(
+                coord.usuario, notif_obj, reiterar=False, forzar=cambio
             )
         return advertencia_msg
     
@@ -393,4 +396,17 @@ class DesignacionSerializer(serializers.ModelSerializer):
         if hasattr(self, 'advertencia_msg'):
             data['advertencia'] = self.advertencia_msg
         
-        return data
\ No newline at end of file
+        return data
+
+class RenovacionDesignacionesSerializer(serializers.Serializer):
+    """Parámetros de la renovación masiva de designaciones de una carrera."""
+    carrera_id = serializers.PrimaryKeyRelatedField(source="carrera", queryset=models.Carrera.objects.all())
+    fecha_inicio = serializers.DateTimeField()
+    fecha_fin = serializers.DateTimeField(required=False, allow_null=True)
+    simular = serializers.BooleanField(default=False, help_text="Sólo devuelve el diff, sin escribir.")
+
+    def validate(self, data):
+        fecha_fin = data.get("fecha_fin")
+        if fecha_fin and fecha_fin < data["fecha_inicio"]:
+            raise serializers.ValidationError({"fecha_fin": "La fecha de fin no puede ser anterior a la fecha de inicio."})
+        return data
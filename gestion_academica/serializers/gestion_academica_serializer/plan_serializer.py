@@ -165,6 +165,28 @@ class PlanDeEstudioCreateUpdateSerializer(serializers.ModelSerializer):
         return data
     
 
+class PlanDeEstudioClonarSerializer(serializers.ModelSerializer):
+    """Datos del plan nuevo al clonar uno existente (la carrera es la del original)."""
+    documento_id = serializers.PrimaryKeyRelatedField(
+        source="documento", queryset=Documento.objects.all(),
+        required=False, allow_null=True, write_only=True
+    )
+    incluir_comisiones = serializers.BooleanField(default=False, write_only=True)
+
+    class Meta:
+        model = PlanDeEstudio
+        fields = ["fecha_inicio", "esta_vigente", "documento_id", "incluir_comisiones"]
+
+    def validate(self, data):
+        documento = data.get("documento")
+        if documento and PlanDeEstudio.objects.filter(
+                carrera_id=self.instance.carrera_id, documento=documento).exists():
+            raise serializers.ValidationError(
+                "Ya existe un plan de estudios con esta resolución para la carrera."
+            )
+        return data
+
+
 class PlanDeEstudioVigenciaSerializer(serializers.ModelSerializer):
     class Meta:
         model = PlanDeEstudio
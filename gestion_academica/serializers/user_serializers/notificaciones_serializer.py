@@ -6,7 +6,7 @@ class UsuarioNotificacionSerializer(serializers.ModelSerializer):
     titulo = serializers.CharField(source='notificacion.titulo', read_only=True)
     mensaje = serializers.CharField(source='notificacion.mensaje', read_only=True)
     tipo = serializers.CharField(source='notificacion.tipo', read_only=True)
-    fecha_emision = serializers.DateTimeField(source='notificacion.fecha_creacion', read_only=True)
+    fecha_emision = serializers.DateTimeField(read_only=True)
     
     emitido_por = serializers.SerializerMethodField()
 
@@ -1,3 +1,5 @@
 from .gestion_academica import *
 from .designaciones_docentes import *
-from .estadisticas_reportes import *
\ No newline at end of file
+from .estadisticas_reportes import *
+from .gestion_usuarios import *
+from .mantenimiento import *
@@ -1 +1,5 @@
-from .gestion_comision import *
\ No newline at end of file
+from .gestion_comision import *
+from .carrera_denormalizada import *
+from .renovacion import *
+from .docente_carrera import *
+from .detalle_docente import *
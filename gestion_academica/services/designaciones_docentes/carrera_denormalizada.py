@@ -0,0 +1,122 @@
+# gestion_academica/services/designaciones_docentes/carrera_denormalizada.py
+
+'''
+Mantenimiento de las columnas plan_de_estudio / carrera copiadas en
+Comision y Designacion.
+
+save() las completa en cada alta o edición. Cuando cambia el origen
+(PlanAsignatura.plan_de_estudio o PlanDeEstudio.carrera), las señales
+llaman a las funciones de propagación de este módulo, que actualizan en
+bloque solo las filas desalineadas (y tocan updated_at de las
+designaciones, para que el feed de cambios las vea). sincronizar_carrera_denormalizada()
+recorre todo y es lo que usa el comando de backfill.
+
+Como DocenteCarrera se arma con la carrera copiada en Designacion, cada
+propagación recalcula además los docentes de las designaciones movidas.
+'''
+
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from gestion_academica.models import Comision, Designacion, PlanAsignatura, PlanDeEstudio
+
+from ..estadisticas_reportes.cache_resultados import invalidar_estadisticas
+from .docente_carrera import recalcular_docente_carrera
+
+
+def _desalineadas(plan_de_estudio_id, carrera_id):
+    # la negación de Django sobre columnas nullable incluye los NULL
+    # (equivale a IS DISTINCT FROM), y Q(campo=None) es IS NULL
+    return ~Q(plan_de_estudio_id=plan_de_estudio_id) | ~Q(carrera_id=carrera_id)
+
+
+def _actualizar_designaciones(designaciones, **valores):
+    """update() de las designaciones desalineadas y recálculo de DocenteCarrera de sus docentes."""
+    docentes_ids = set(designaciones.values_list("docente_id", flat=True))
+    if not docentes_ids:
+        return 0
+    total = designaciones.update(updated_at=timezone.now(), **valores)
+    recalcular_docente_carrera(docentes_ids)
+    return total
+
+
+def propagar_plan_asignatura(plan_asignatura):
+    """Reasigna plan y carrera de las comisiones (y sus designaciones) de un PlanAsignatura."""
+    plan_id = plan_asignatura.plan_de_estudio_id
+    carrera_id = (
+        PlanDeEstudio.objects.filter(pk=plan_id).values_list("carrera_id", flat=True).first()
+    )
+    with transaction.atomic():
+        comisiones = Comision.objects.filter(plan_asignatura=plan_asignatura).filter(
+            _desalineadas(plan_id, carrera_id))
+        total = comisiones.update(plan_de_estudio_id=plan_id, carrera_id=carrera_id)
+        total += _actualizar_designaciones(
+            Designacion.objects.filter(comision__plan_asignatura=plan_asignatura).filter(
+                _desalineadas(plan_id, carrera_id)),
+            plan_de_estudio_id=plan_id, carrera_id=carrera_id)
+    if total:
+        invalidar_estadisticas()
+    return total
+
+
+def propagar_plan_de_estudio(plan):
+    """Actualiza la carrera copiada si el plan cambió de carrera."""
+    filtro = ~Q(carrera_id=plan.carrera_id)
+    with transaction.atomic():
+        total = Comision.objects.filter(plan_de_estudio=plan).filter(filtro).update(
+            carrera_id=plan.carrera_id)
+        total += _actualizar_designaciones(
+            Designacion.objects.filter(plan_de_estudio=plan).filter(filtro), carrera_id=plan.carrera_id)
+    if total:
+        invalidar_estadisticas()
+    return total
+
+
+def propagar_comision(comision):
+    """Alinea las designaciones de una comisión que cambió de PlanAsignatura."""
+    with transaction.atomic():
+        total = _actualizar_designaciones(
+            Designacion.objects.filter(comision=comision).filter(
+                _desalineadas(comision.plan_de_estudio_id, comision.carrera_id)),
+            plan_de_estudio_id=comision.plan_de_estudio_id, carrera_id=comision.carrera_id)
+    if total:
+        invalidar_estadisticas()
+    return total
+
+
+def sincronizar_carrera_denormalizada():
+    """
+    Recalcula las copias en toda la base con dos UPDATE ... FROM que solo
+    tocan filas desalineadas. Devuelve (comisiones, designaciones) corregidas.
+    """
+    comision = Comision._meta.db_table
+    designacion = Designacion._meta.db_table
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"""
+            UPDATE {comision} c
+            SET plan_de_estudio_id = pa.plan_de_estudio_id,
+                carrera_id = pe.carrera_id
+            FROM {PlanAsignatura._meta.db_table} pa
+            JOIN {PlanDeEstudio._meta.db_table} pe ON pe.id = pa.plan_de_estudio_id
+            WHERE pa.id = c.plan_asignatura_id
+              AND (c.plan_de_estudio_id IS DISTINCT FROM pa.plan_de_estudio_id
+                   OR c.carrera_id IS DISTINCT FROM pe.carrera_id)
+        """)
+        comisiones = cursor.rowcount
+        cursor.execute(f"""
+            UPDATE {designacion} d
+            SET plan_de_estudio_id = c.plan_de_estudio_id,
+                carrera_id = c.carrera_id,
+                updated_at = now()
+            FROM {comision} c
+            WHERE c.id = d.comision_id
+              AND (d.plan_de_estudio_id IS DISTINCT FROM c.plan_de_estudio_id
+                   OR d.carrera_id IS DISTINCT FROM c.carrera_id)
+        """)
+        designaciones = cursor.rowcount
+        if designaciones:
+            recalcular_docente_carrera()
+    if comisiones or designaciones:
+        invalidar_estadisticas()
+    return comisiones, designaciones
@@ -0,0 +1,116 @@
+# gestion_academica/services/designaciones_docentes/detalle_docente.py
+
+'''
+Designaciones compactas para el detalle de un docente.
+
+Antes cada designación se serializaba con DesignacionSerializer completo:
+anidaba el DocenteSerializer del mismo docente (con sus consultas de
+carreras y materias por fila), la comisión y el cargo. Acá, como en el
+historial (estadisticas_reportes/historial.py), las filas salen de un
+values() con los nombres ya unidos y se devuelven con ids que se
+resuelven en tablas de lookup, donde cada nombre viaja una sola vez.
+
+- actuales: designaciones sin fecha de fin (una consulta).
+- historicas (por defecto): paginadas, las más recientes primero (un
+  count y una consulta por página). Siguen en la respuesta por defecto
+  porque el detalle siempre las devolvió; ahora como
+  {count, page, page_size, results} en vez de una lista completa.
+- tablas (por defecto): comisiones, asignaturas, carreras, cargos y
+  dedicaciones usadas por las filas devueltas. Sin consultas extra.
+
+Con ?include= se pide un subconjunto (p. ej. ?include=tablas omite las
+históricas).
+'''
+
+from django.db.models import F
+
+from gestion_academica.models import Designacion
+
+
+INCLUDES_DETALLE_DOCENTE = ("historicas", "tablas")
+INCLUDES_DETALLE_DOCENTE_DEFECTO = ("historicas", "tablas")
+POR_PAGINA_HISTORICAS = 20
+MAXIMO_POR_PAGINA_HISTORICAS = 100
+
+
+def _filas(queryset):
+    return list(queryset.values(
+        "id",
+        "fecha_inicio",
+        "fecha_fin",
+        "activo",
+        "tipo_designacion",
+        "observacion",
+        "comision_id",
+        "cargo_id",
+        "dedicacion_id",
+        "carrera_id",
+        comision_nombre=F("comision__nombre"),
+        comision_turno=F("comision__turno"),
+        asignatura_id=F("comision__plan_asignatura__asignatura_id"),
+        asignatura_nombre=F("comision__plan_asignatura__asignatura__nombre"),
+        carrera_nombre=F("carrera__nombre"),
+        cargo_nombre=F("cargo__nombre"),
+        dedicacion_nombre=F("dedicacion__nombre"),
+    ))
+
+
+def _codificar(filas, tablas):
+    """Filas con ids; los nombres se agregan a `tablas` (una vez por id)."""
+    resultado = []
+    for fila in filas:
+        tablas["comisiones"].setdefault(fila["comision_id"], {
+            "nombre": fila["comision_nombre"],
+            "turno": fila["comision_turno"],
+            "asignatura": fila["asignatura_id"],
+        })
+        tablas["asignaturas"].setdefault(fila["asignatura_id"], fila["asignatura_nombre"])
+        if fila["carrera_id"] is not None:
+            tablas["carreras"].setdefault(fila["carrera_id"], fila["carrera_nombre"])
+        tablas["cargos"].setdefault(fila["cargo_id"], fila["cargo_nombre"])
+        if fila["dedicacion_id"] is not None:
+            tablas["dedicaciones"].setdefault(fila["dedicacion_id"], fila["dedicacion_nombre"])
+        resultado.append({
+            "id": fila["id"],
+            "fecha_inicio": fila["fecha_inicio"],
+            "fecha_fin": fila["fecha_fin"],
+            "activo": fila["activo"],
+            "tipo_designacion": fila["tipo_designacion"],
+            "observacion": fila["observacion"],
+            "comision": fila["comision_id"],
+            "carrera": fila["carrera_id"],
+            "cargo": fila["cargo_id"],
+            "dedicacion": fila["dedicacion_id"],
+        })
+    return resultado
+
+
+def designaciones_docente(docente_id, incluir=INCLUDES_DETALLE_DOCENTE_DEFECTO,
+                          pagina=1, por_pagina=POR_PAGINA_HISTORICAS):
+    """
+    {"actuales": [...], "historicas": {...}, "tablas": {...}} del docente;
+    "historicas" y "tablas" solo si están en `incluir`.
+    """
+    tablas = {"comisiones": {}, "asignaturas": {}, "carreras": {}, "cargos": {}, "dedicaciones": {}}
+    designaciones = Designacion.objects.filter(docente_id=docente_id)
+
+    datos = {
+        "actuales": _codificar(
+            _filas(designaciones.filter(fecha_fin__isnull=True).order_by("-fecha_inicio", "-id")), tablas),
+    }
+
+    if "historicas" in incluir:
+        historicas = designaciones.filter(fecha_fin__isnull=False)
+        total = historicas.count()
+        desde = (pagina - 1) * por_pagina
+        filas = _filas(historicas.order_by("-fecha_fin", "-id")[desde:desde + por_pagina]) if desde < total else []
+        datos["historicas"] = {
+            "count": total,
+            "page": pagina,
+            "page_size": por_pagina,
+            "results": _codificar(filas, tablas),
+        }
+
+    if "tablas" in incluir:
+        datos["tablas"] = tablas
+    return datos
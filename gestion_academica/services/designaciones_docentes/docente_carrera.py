@@ -0,0 +1,95 @@
+# gestion_academica/services/designaciones_docentes/docente_carrera.py
+
+'''
+Mantenimiento de DocenteCarrera, la pertenencia docente <-> carrera.
+
+Antes, "docentes de una carrera" y "carreras de un docente" recorrían
+Designacion -> Comision -> PlanAsignatura -> Asignatura -> planes (M2M)
+con distinct(), y el join crecía con la cantidad de planes de cada
+asignatura. Ahora se leen de una tabla con una fila por par, usando la
+carrera copiada en Designacion.
+
+recalcular_docente_carrera(docentes_ids) rehace las filas de esos
+docentes con un INSERT ... SELECT ... ON CONFLICT agrupado y un DELETE de
+los pares que ya no tienen designaciones. Lo llaman las señales de
+Designacion (alta, edición, baja) y las escrituras en bloque
+(renovación, propagación de la carrera copiada). Sin docentes_ids
+recalcula toda la tabla (migración y comando de backfill).
+'''
+
+from django.db import connection, transaction
+from django.db.models import Prefetch, Q
+from django.utils import timezone
+
+from gestion_academica.models import Designacion, DocenteCarrera
+
+
+def _sentencias_recalculo(filtro_docentes):
+    designacion = Designacion._meta.db_table
+    docente_carrera = DocenteCarrera._meta.db_table
+    condicion = "AND docente_id = ANY(%s)" if filtro_docentes else ""
+    condicion_dc = "dc.docente_id = ANY(%s) AND" if filtro_docentes else ""
+    upsert = f"""
+        INSERT INTO {docente_carrera}
+            (docente_id, carrera_id, activo, vigente_hasta,
+             primera_designacion, ultima_designacion, updated_at)
+        SELECT docente_id, carrera_id,
+               bool_or(activo),
+               CASE WHEN bool_or(activo AND fecha_fin IS NULL) THEN NULL
+                    ELSE max(fecha_fin) FILTER (WHERE activo) END,
+               min(fecha_inicio), max(fecha_inicio), now()
+        FROM {designacion}
+        WHERE carrera_id IS NOT NULL {condicion}
+        GROUP BY docente_id, carrera_id
+        ON CONFLICT (docente_id, carrera_id) DO UPDATE SET
+            activo = EXCLUDED.activo,
+            vigente_hasta = EXCLUDED.vigente_hasta,
+            primera_designacion = EXCLUDED.primera_designacion,
+            ultima_designacion = EXCLUDED.ultima_designacion,
+            updated_at = EXCLUDED.updated_at
+    """
+    borrado = f"""
+        DELETE FROM {docente_carrera} dc
+        WHERE {condicion_dc} NOT EXISTS (
+            SELECT 1 FROM {designacion} d
+            WHERE d.docente_id = dc.docente_id AND d.carrera_id = dc.carrera_id
+        )
+    """
+    return upsert, borrado
+
+
+def recalcular_docente_carrera(docentes_ids=None):
+    """Rehace las filas de DocenteCarrera de `docentes_ids` (todas si es None)."""
+    if docentes_ids is not None:
+        docentes_ids = sorted({d for d in docentes_ids if d is not None})
+        if not docentes_ids:
+            return
+    parametros = [docentes_ids] if docentes_ids is not None else []
+    with transaction.atomic(), connection.cursor() as cursor:
+        for sentencia in _sentencias_recalculo(docentes_ids is not None):
+            cursor.execute(sentencia, parametros)
+
+
+def filtro_vigentes(prefijo=""):
+    """Pertenencias con alguna designación activa que no terminó."""
+    return Q(**{f"{prefijo}activo": True}) & (
+        Q(**{f"{prefijo}vigente_hasta__isnull": True}) | Q(**{f"{prefijo}vigente_hasta__gt": timezone.now()})
+    )
+
+
+def prefetch_carreras_vigentes():
+    """Prefetch de las carreras vigentes de cada docente en `carreras_vigentes`."""
+    return Prefetch(
+        "carreras_docente",
+        queryset=DocenteCarrera.objects.filter(filtro_vigentes()).select_related("carrera").order_by("carrera_id"),
+        to_attr="carreras_vigentes",
+    )
+
+
+def carreras_vigentes(docente):
+    """[{id, nombre}] de las carreras en que el docente tiene designaciones vigentes."""
+    pertenencias = getattr(docente, "carreras_vigentes", None)
+    if pertenencias is None:
+        pertenencias = docente.carreras_docente.filter(filtro_vigentes()).select_related(
+            "carrera").order_by("carrera_id")
+    return [{"id": p.carrera_id, "nombre": p.carrera.nombre} for p in pertenencias]
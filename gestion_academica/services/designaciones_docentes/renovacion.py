@@ -0,0 +1,246 @@
+# gestion_academica/services/designaciones_docentes/renovacion.py
+
+'''
+Renovación masiva de designaciones al cambiar de período (cuatrimestre).
+
+Renovar de a una con DesignacionViewSet.create repite, por fila, el
+escaneo de solapamientos, la búsqueda del régimen y el envío de
+notificaciones. Acá, para una carrera:
+- se toman sus designaciones activas con fecha_fin anterior al nuevo
+  período (las que vencen) en comisiones activas; si un docente tiene
+  varias vencidas en la misma comisión se renueva la más reciente y las
+  anteriores se desactivan junto con ella;
+- los solapamientos con el nuevo período, los regímenes y la carga de
+  cada docente se resuelven con una consulta cada uno;
+- la carga horaria se valida por docente sumando todas sus designaciones
+  del nuevo período (las renovadas y las que ya tenía);
+- se escribe con un bulk_create y un update en una transacción, y se
+  envía una sola notificación de resumen a cada coordinador de la carrera.
+
+Con confirmar=False no se escribe nada y se devuelve el diff.
+'''
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from gestion_academica import models
+from gestion_academica.services.estadisticas_reportes.cache_resultados import invalidar_estadisticas
+from gestion_academica.services.gestion_usuarios import notificaciones
+from .docente_carrera import recalcular_docente_carrera
+
+
+TAMANIO_LOTE = 500
+MOTIVO_EN_PERIODO = "Ya tiene una designación en el nuevo período."
+MOTIVO_REEMPLAZADA = "Reemplazada por una designación vencida más reciente de la misma comisión."
+
+
+@dataclass
+class ResultadoRenovacion:
+    renovadas: list = field(default_factory=list)  # diff: designaciones nuevas
+    omitidas: list = field(default_factory=list)
+    errores: list = field(default_factory=list)
+    advertencias: list = field(default_factory=list)
+    simulacion: bool = False
+    coordinadores_notificados: int = 0
+
+    @property
+    def valido(self):
+        return not self.errores
+
+    def resumen(self):
+        return {
+            "simulacion": self.simulacion,
+            "renovadas": self.renovadas,
+            "omitidas": self.omitidas,
+            "advertencias": self.advertencias,
+            "coordinadores_notificados": self.coordinadores_notificados,
+        }
+
+
+def horas_designacion(tipo_designacion, horas_teoria, horas_practica, horas_totales):
+    """Horas frente a alumnos que suma una designación según su tipo."""
+    if tipo_designacion == "TEORICO":
+        return horas_teoria
+    if tipo_designacion == "PRACTICO":
+        return horas_practica
+    if tipo_designacion == "TEORICO + PRACTICO":
+        return horas_totales
+    return 0
+
+
+def _en_periodo(fecha_inicio, fecha_fin):
+    """Designaciones activas que se superponen con [fecha_inicio, fecha_fin]."""
+    filtro = Q(activo=True) & (Q(fecha_fin__isnull=True) | Q(fecha_fin__gte=fecha_inicio))
+    if fecha_fin is not None:
+        filtro &= Q(fecha_inicio__lte=fecha_fin)
+    return filtro
+
+
+def _descripcion(designacion):
+    return {
+        "designacion_id": designacion.pk,
+        "docente_id": designacion.docente_id,
+        "docente": str(designacion.docente),
+        "comision_id": designacion.comision_id,
+        "comision": designacion.comision.nombre,
+        "asignatura": designacion.comision.plan_asignatura.asignatura.nombre,
+        "cargo": designacion.cargo.nombre,
+        "tipo_designacion": designacion.tipo_designacion,
+    }
+
+
+def renovar_designaciones(carrera, fecha_inicio, fecha_fin, actor=None, confirmar=True):
+    """
+    Renueva para [fecha_inicio, fecha_fin] las designaciones activas de
+    `carrera` que vencieron antes de fecha_inicio. Las originales quedan
+    inactivas. Si hay errores (docente sin modalidad o sin régimen) no se
+    escribe nada; exceder la carga horaria es una advertencia, como en el
+    alta individual.
+    """
+    resultado = ResultadoRenovacion(simulacion=not confirmar)
+    if fecha_fin is not None and fecha_fin < fecha_inicio:
+        resultado.errores.append({"campo": "fecha_fin",
+                                  "mensaje": "La fecha de fin no puede ser anterior a la fecha de inicio."})
+        return resultado
+
+    candidatas = list(
+        models.Designacion.objects.filter(
+            carrera=carrera, activo=True, comision__activo=True,
+            fecha_fin__isnull=False, fecha_fin__lt=fecha_inicio,
+        ).select_related(
+            "docente__usuario", "comision__plan_asignatura__asignatura", "cargo",
+        ).order_by("docente_id", "comision_id", "-fecha_fin")
+    )
+    if not candidatas:
+        return resultado
+
+    docentes_ids = {d.docente_id for d in candidatas}
+    # lo que cada docente ya tiene en el nuevo período (una sola consulta)
+    existentes = list(
+        models.Designacion.objects.filter(_en_periodo(fecha_inicio, fecha_fin), docente_id__in=docentes_ids)
+        .values_list("docente_id", "comision_id", "tipo_designacion",
+                     "comision__plan_asignatura__horas_teoria",
+                     "comision__plan_asignatura__horas_practica",
+                     "comision__plan_asignatura__horas_totales")
+    )
+    ocupadas = {(docente_id, comision_id) for docente_id, comision_id, *_ in existentes}
+    carga = defaultdict(int)
+    for docente_id, _, tipo, *horas in existentes:
+        carga[docente_id] += horas_designacion(tipo, *horas)
+
+    regimenes = {
+        (r.modalidad_id, r.dedicacion_id): r
+        for r in models.ParametrosRegimen.objects.filter(activo=True)
+    }
+
+    nuevas = []
+    reemplazadas = []
+    renovadas_claves = set()
+    limites = {}
+    for original in candidatas:
+        clave = (original.docente_id, original.comision_id)
+        if clave in renovadas_claves:
+            # varias vencidas para la misma comisión: se renueva la más reciente
+            # (viene primero) y las anteriores también quedan inactivas
+            reemplazadas.append(original)
+            resultado.omitidas.append({**_descripcion(original), "motivo": MOTIVO_REEMPLAZADA})
+            continue
+        if clave in ocupadas:
+            resultado.omitidas.append({**_descripcion(original), "motivo": MOTIVO_EN_PERIODO})
+            continue
+        ocupadas.add(clave)
+        renovadas_claves.add(clave)
+
+        regimen = regimenes.get((original.docente.modalidad_id, original.dedicacion_id))
+        if original.docente.modalidad_id is None or regimen is None:
+            resultado.errores.append({
+                **_descripcion(original),
+                "mensaje": "No existe un parámetro de régimen activo para la modalidad del docente "
+                           "y la dedicación de la designación.",
+            })
+            continue
+        limites[original.docente_id] = min(
+            limites.get(original.docente_id, regimen.horas_max_frente_alumnos), regimen.horas_max_frente_alumnos)
+
+        pa = original.comision.plan_asignatura
+        carga[original.docente_id] += horas_designacion(
+            original.tipo_designacion, pa.horas_teoria, pa.horas_practica, pa.horas_totales)
+        nuevas.append((original, models.Designacion(
+            fecha_inicio=fecha_inicio,
+            fecha_fin=fecha_fin,
+            tipo_designacion=original.tipo_designacion,
+            docente_id=original.docente_id,
+            comision_id=original.comision_id,
+            dedicacion_id=original.dedicacion_id,
+            cargo_id=original.cargo_id,
+            documento_id=original.documento_id,
+            observacion=original.observacion,
+            # bulk_create no pasa por save(): copiamos plan y carrera
+            plan_de_estudio_id=original.plan_de_estudio_id,
+            carrera_id=original.carrera_id,
+            creado_por=actor,
+        )))
+
+    for docente_id, limite in limites.items():
+        if carga[docente_id] > limite:
+            docente = next(o.docente for o, _ in nuevas if o.docente_id == docente_id)
+            resultado.advertencias.append({
+                "docente_id": docente_id,
+                "docente": str(docente),
+                "carga": carga[docente_id],
+                "limite": limite,
+                "mensaje": f"El docente {docente} supera la carga máxima permitida ({limite}hs) "
+                           f"según su régimen. Carga total en el período: {carga[docente_id]}hs.",
+            })
+
+    resultado.renovadas = [_descripcion(original) for original, _ in nuevas]
+    if not resultado.valido or not confirmar or not nuevas:
+        return resultado
+
+    with transaction.atomic():
+        creadas = models.Designacion.objects.bulk_create([n for _, n in nuevas], batch_size=TAMANIO_LOTE)
+        desactivar = [o.pk for o, _ in nuevas] + [o.pk for o in reemplazadas]
+        models.Designacion.objects.filter(pk__in=desactivar).update(activo=False, updated_at=timezone.now())
+        recalcular_docente_carrera({o.docente_id for o, _ in nuevas})
+        resultado.coordinadores_notificados = _notificar_coordinadores(carrera, fecha_inicio, resultado, actor)
+    for descripcion, creada in zip(resultado.renovadas, creadas):
+        descripcion["nueva_designacion_id"] = creada.pk
+
+    # bulk_create y update no disparan señales (DocenteCarrera se recalculó arriba)
+    invalidar_estadisticas()
+    return resultado
+
+
+def _notificar_coordinadores(carrera, fecha_inicio, resultado, actor):
+    """Una notificación de resumen por coordinador activo de la carrera."""
+    coordinadores = list(
+        models.Coordinador.objects.filter(
+            carreracoordinacion__carrera=carrera, carreracoordinacion__activo=True, activo=True,
+        ).select_related("usuario").distinct()
+    )
+    if not coordinadores:
+        return 0
+
+    mensaje = (
+        f"Se renovaron {len(resultado.renovadas)} designaciones de {carrera.nombre} "
+        f"a partir del {fecha_inicio:%d/%m/%Y}."
+    )
+    en_periodo = sum(1 for o in resultado.omitidas if o["motivo"] == MOTIVO_EN_PERIODO)
+    if en_periodo:
+        mensaje += f" Omitidas por ya tener designación en el período: {en_periodo}."
+    if resultado.advertencias:
+        mensaje += " Docentes que superan su carga horaria: " + ", ".join(
+            f"{a['docente']} ({a['carga']}hs / {a['limite']}hs)" for a in resultado.advertencias) + "."
+
+    tipo = "ADVERTENCIA" if resultado.advertencias else "INFO"
+    notificacion, cambio = notificaciones.obtener_o_crear_notificacion(
+        "Renovación de designaciones", mensaje, tipo, creado_por=actor,
+        clave=f"renovacion_designaciones:{carrera.pk}:{fecha_inicio:%Y-%m-%d}",
+    )
+    for coordinador in coordinadores:
+        notificaciones.asignar_notificacion(coordinador.usuario, notificacion, forzar=cambio)
+    return len(coordinadores)
@@ -1,4 +1,12 @@
 from .estadisticas import *
 from .reportes_exportacion import *
 from .permisos import *
-from .filtros import *
\ No newline at end of file
+from .filtros import *
+from .rollup import *
+from .snapshots import *
+from .designaciones_carrera import *
+from .historial import *
+from .dashboard import *
+from .cache_resultados import *
+from .pdf_reportes import *
+from .feed_cambios import *
@@ -0,0 +1,118 @@
+# gestion_academica/services/estadisticas_reportes/cache_resultados.py
+
+'''
+Caché de resultados de estadísticas con invalidación por versión.
+
+La clave de cada entrada es (nombre del reporte, conjunto de carreras,
+parámetros normalizados, versión de datos). La versión vive en la base
+(VersionDatosEstadisticas) y la incrementan las señales de los modelos de
+los que dependen los reportes; como forma parte de la clave, una entrada
+calculada con datos viejos nunca se vuelve a servir. Las operaciones
+masivas (queryset.update, bulk_create) no disparan señales: quien las use
+debe llamar a invalidar_estadisticas().
+'''
+
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+from gestion_academica.models.M5_estadisticas_reportes import VersionDatosEstadisticas
+
+
+CLAVE_VERSION = "estadisticas"
+CACHE_ESTADISTICAS_TIMEOUT = 60 * 60  # segundos; la versión se encarga de la frescura
+METRICAS_HITS = "estadisticas:cache:hits"
+METRICAS_MISSES = "estadisticas:cache:misses"
+
+# parámetros que no cambian el resultado (el alcance ya está en carreras_ids)
+PARAMETROS_IGNORADOS = {"carrera_id", "format"}
+
+
+def version_datos():
+    version = (
+        VersionDatosEstadisticas.objects.filter(clave=CLAVE_VERSION)
+        .values_list("version", flat=True)
+        .first()
+    )
+    return version or 0
+
+
+def _incrementar_version():
+    actualizadas = VersionDatosEstadisticas.objects.filter(clave=CLAVE_VERSION).update(
+        version=F("version") + 1
+    )
+    if not actualizadas:
+        fila, _ = VersionDatosEstadisticas.objects.get_or_create(clave=CLAVE_VERSION)
+        VersionDatosEstadisticas.objects.filter(pk=fila.pk).update(version=F("version") + 1)
+
+
+def invalidar_estadisticas():
+    """
+    Incrementa la versión de datos cuando se confirma la transacción en
+    curso. Si se incrementara antes, una lectura concurrente podría guardar
+    bajo la versión nueva un resultado calculado con los datos viejos.
+    """
+    transaction.on_commit(_incrementar_version)
+
+
+def normalizar_params(params):
+    """QueryDict/dict -> dict ordenado, sin vacíos ni parámetros de alcance."""
+    normalizados = {}
+    for nombre in sorted(params.keys()):
+        if nombre in PARAMETROS_IGNORADOS:
+            continue
+        valores = params.getlist(nombre) if hasattr(params, "getlist") else [params[nombre]]
+        valores = sorted(str(v).strip() for v in valores if str(v).strip())
+        if valores:
+            normalizados[nombre] = valores[0] if len(valores) == 1 else valores
+    return normalizados
+
+
+def clave_resultado(nombre, carreras_ids, params, version):
+    firma = json.dumps(
+        {"carreras": sorted(carreras_ids), "params": params, "version": version},
+        sort_keys=True,
+        default=str,
+    )
+    return f"estadisticas:{nombre}:" + hashlib.sha1(firma.encode("utf-8")).hexdigest()
+
+
+def _contar(clave):
+    try:
+        cache.incr(clave)
+    except ValueError:
+        # la clave no existe todavía (o expiró)
+        cache.add(clave, 0, timeout=None)
+        cache.incr(clave)
+
+
+def resultado_cacheado(nombre, carreras_ids, params, calcular):
+    """
+    Devuelve (resultado, desde_cache). `calcular` es un callable sin
+    argumentos que produce el resultado cuando no está en caché.
+    """
+    clave = clave_resultado(nombre, carreras_ids, normalizar_params(params), version_datos())
+    resultado = cache.get(clave)
+    if resultado is not None:
+        _contar(METRICAS_HITS)
+        return resultado, True
+
+    _contar(METRICAS_MISSES)
+    resultado = calcular()
+    cache.set(clave, resultado, CACHE_ESTADISTICAS_TIMEOUT)
+    return resultado, False
+
+
+def metricas_cache():
+    hits = cache.get(METRICAS_HITS, 0)
+    misses = cache.get(METRICAS_MISSES, 0)
+    total = hits + misses
+    return {
+        "version_datos": version_datos(),
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": round(hits / total, 4) if total else None,
+    }
@@ -0,0 +1,199 @@
+# gestion_academica/services/estadisticas_reportes/dashboard.py
+
+'''
+Tablero de estadísticas del coordinador en una sola consulta.
+
+El conjunto base de designaciones del alcance (carreras del usuario y
+filtros) se arma una única vez como CTE materializada, filtrando por la
+carrera copiada en la designación y con las horas de PlanAsignatura, y
+todos los widgets se derivan de ahí. PostgreSQL devuelve el tablero
+completo como un único JSON (json_build_object), que se cachea por
+(alcance, filtros, versión de datos).
+'''
+
+import json
+
+from django.db import connection
+
+from gestion_academica.models import (
+    Asignatura,
+    Comision,
+    Dedicacion,
+    Designacion,
+    Docente,
+    Modalidad,
+    ParametrosRegimen,
+    PlanAsignatura,
+    Usuario,
+)
+
+from .cache_resultados import resultado_cacheado
+from .designaciones_carrera import rango_anio
+from .rollup import condicion_designacion_activa
+
+
+DASHBOARD_DESIGNACIONES_RECIENTES = 10
+
+
+def _sql_dashboard(condiciones):
+    return f"""
+        WITH base AS MATERIALIZED (
+            SELECT
+                d.id,
+                d.docente_id,
+                d.fecha_inicio,
+                pa.id               AS plan_asignatura_id,
+                pa.horas_semanales  AS horas,
+                d.carrera_id,
+                a.nombre            AS asignatura,
+                a.tipo_duracion     AS periodo,
+                doc.dedicacion_id,
+                doc.modalidad_id,
+                c.activo            AS comision_activa
+            FROM {Designacion._meta.db_table} d
+            JOIN {Comision._meta.db_table} c ON c.id = d.comision_id
+            JOIN {PlanAsignatura._meta.db_table} pa ON pa.id = c.plan_asignatura_id
+            JOIN {Asignatura._meta.db_table} a ON a.id = pa.asignatura_id
+            JOIN {Docente._meta.db_table} doc ON doc.id = d.docente_id
+            WHERE {" AND ".join(condiciones)}
+        ),
+        por_docente AS (
+            SELECT docente_id,
+                   SUM(horas) AS horas,
+                   COUNT(DISTINCT plan_asignatura_id) AS asignaturas
+            FROM base
+            GROUP BY docente_id
+        )
+        SELECT json_build_object(
+            'resumen', (
+                SELECT json_build_object(
+                    'total_docentes', COUNT(DISTINCT docente_id),
+                    'total_designaciones', COUNT(*),
+                    'total_horas', COALESCE(SUM(horas), 0),
+                    'asignaturas_cubiertas', COUNT(DISTINCT plan_asignatura_id)
+                )
+                FROM base
+            ),
+            'por_dedicacion', (
+                SELECT COALESCE(json_agg(json_build_object(
+                    'dedicacion', ded.nombre, 'total_docentes', t.total
+                ) ORDER BY ded.nombre), '[]'::json)
+                FROM (
+                    SELECT dedicacion_id, COUNT(DISTINCT docente_id) AS total
+                    FROM base WHERE dedicacion_id IS NOT NULL GROUP BY dedicacion_id
+                ) t
+                JOIN {Dedicacion._meta.db_table} ded ON ded.id = t.dedicacion_id
+            ),
+            'por_modalidad', (
+                SELECT COALESCE(json_agg(json_build_object(
+                    'modalidad', moda.nombre, 'total_docentes', t.total
+                ) ORDER BY moda.nombre), '[]'::json)
+                FROM (
+                    SELECT modalidad_id, COUNT(DISTINCT docente_id) AS total
+                    FROM base WHERE modalidad_id IS NOT NULL GROUP BY modalidad_id
+                ) t
+                JOIN {Modalidad._meta.db_table} moda ON moda.id = t.modalidad_id
+            ),
+            'horas_por_docente', (
+                SELECT COALESCE(json_agg(json_build_object(
+                    'docente_id', pd.docente_id,
+                    'docente', u.last_name || ' ' || u.first_name,
+                    'dedicacion', COALESCE(ded.nombre, '-'),
+                    'modalidad', COALESCE(moda.nombre, '-'),
+                    'total_horas_frente_alumnos', pd.horas,
+                    'asignaturas', pd.asignaturas,
+                    'estado_carga', CASE
+                        WHEN pr.id IS NULL THEN 'SIN_REGIMEN'
+                        WHEN pd.horas < pr.horas_min_frente_alumnos THEN 'INSUFICIENTE'
+                        WHEN pd.horas > pr.horas_max_frente_alumnos THEN 'EXCEDIDO'
+                        ELSE 'DENTRO_DEL_REGIMEN'
+                    END
+                ) ORDER BY pd.horas DESC, pd.docente_id), '[]'::json)
+                FROM por_docente pd
+                JOIN {Docente._meta.db_table} doc ON doc.id = pd.docente_id
+                JOIN {Usuario._meta.db_table} u ON u.id = doc.usuario_id
+                LEFT JOIN {Dedicacion._meta.db_table} ded ON ded.id = doc.dedicacion_id
+                LEFT JOIN {Modalidad._meta.db_table} moda ON moda.id = doc.modalidad_id
+                LEFT JOIN {ParametrosRegimen._meta.db_table} pr
+                       ON pr.dedicacion_id = doc.dedicacion_id
+                      AND pr.modalidad_id = doc.modalidad_id
+                      AND pr.activo
+            ),
+            'designaciones_recientes', (
+                SELECT COALESCE(json_agg(json_build_object(
+                    'id', r.id,
+                    'asignatura', r.asignatura,
+                    'docente', u.last_name || ' ' || u.first_name,
+                    'periodo', r.periodo,
+                    'anio', EXTRACT(YEAR FROM r.fecha_inicio)::int,
+                    'estado_comision', CASE WHEN r.comision_activa THEN 'ACTIVA' ELSE 'INACTIVA' END
+                ) ORDER BY r.fecha_inicio DESC, r.id DESC), '[]'::json)
+                FROM (
+                    SELECT * FROM base ORDER BY fecha_inicio DESC, id DESC LIMIT %s
+                ) r
+                JOIN {Docente._meta.db_table} doc ON doc.id = r.docente_id
+                JOIN {Usuario._meta.db_table} u ON u.id = doc.usuario_id
+            )
+        )
+    """
+
+
+def _filtros_dashboard(params):
+    """Normaliza los filtros admitidos; valores inválidos -> ValueError."""
+    filtros = {}
+    for nombre in ("dedicacion_id", "modalidad_id", "anio"):
+        valor = params.get(nombre)
+        if valor:
+            filtros[nombre] = int(valor)
+    return filtros
+
+
+def calcular_dashboard(carreras_ids, filtros):
+    """
+    Ejecuta la consulta del tablero. Sin 'anio' usa las designaciones
+    vigentes (mismo criterio que el rollup); con 'anio' las que estuvieron activas en
+    algún momento de ese año (rango semiabierto, apto para índices). En ambos
+    casos solo cuentan las designaciones con activo, como en horas por docente:
+    una designación dada de baja no suma aunque su fecha de fin no haya llegado.
+    """
+    condiciones = ["d.carrera_id = ANY(%s)", "d.activo"]
+    params = [list(carreras_ids)]
+
+    if "anio" in filtros:
+        inicio, fin = rango_anio(filtros["anio"])
+        condiciones.append("d.fecha_inicio < %s AND (d.fecha_fin IS NULL OR d.fecha_fin >= %s)")
+        params += [fin, inicio]
+    else:
+        condicion, params_activa = condicion_designacion_activa()
+        condiciones.append(condicion)
+        params += params_activa
+    if "dedicacion_id" in filtros:
+        condiciones.append("doc.dedicacion_id = %s")
+        params.append(filtros["dedicacion_id"])
+    if "modalidad_id" in filtros:
+        condiciones.append("doc.modalidad_id = %s")
+        params.append(filtros["modalidad_id"])
+
+    params.append(DASHBOARD_DESIGNACIONES_RECIENTES)
+    with connection.cursor() as cursor:
+        cursor.execute(_sql_dashboard(condiciones), params)
+        (resultado,) = cursor.fetchone()
+
+    # psycopg2 decodifica el json; agregamos porcentajes sobre el total del widget
+    if isinstance(resultado, str):
+        resultado = json.loads(resultado)
+    for widget in ("por_dedicacion", "por_modalidad"):
+        total = sum(f["total_docentes"] for f in resultado[widget])
+        for fila in resultado[widget]:
+            fila["porcentaje"] = round(fila["total_docentes"] * 100 / total, 2) if total else 0
+    return resultado
+
+
+def obtener_dashboard(carreras_ids, params):
+    """
+    Devuelve (datos, desde_cache). Lanza ValueError si algún filtro no es numérico.
+    """
+    filtros = _filtros_dashboard(params)
+    return resultado_cacheado(
+        "dashboard", carreras_ids, filtros, lambda: calcular_dashboard(carreras_ids, filtros)
+    )
@@ -0,0 +1,120 @@
+# gestion_academica/services/estadisticas_reportes/designaciones_carrera.py
+
+'''
+Consulta del reporte 5.2.3 (designaciones por carrera).
+
+Los filtros de fecha son rangos semiabiertos [inicio, fin) sobre
+fecha_inicio, así el índice de la columna se puede usar (a diferencia de
+fecha_inicio__year, que envuelve la columna en EXTRACT). El resultado es
+una proyección values(): no se instancian modelos ni relaciones.
+'''
+
+from datetime import date, datetime, time, timedelta
+
+from django.db.models import F, Value
+from django.db.models.functions import Concat
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from gestion_academica.models import Designacion
+
+
+CAMPOS_DESIGNACION_CARRERA = [
+    "asignatura",
+    "docente",
+    "dedicacion",
+    "modalidad",
+    "periodo",
+    "anio",
+    "estado_comision",
+]
+
+
+class FiltroDesignacionInvalido(ValueError):
+    """Parámetro de filtro con formato incorrecto."""
+
+
+def _inicio_del_dia(fecha):
+    return timezone.make_aware(datetime.combine(fecha, time.min))
+
+
+def rango_anio(anio):
+    """[1 de enero de anio, 1 de enero de anio + 1)"""
+    return _inicio_del_dia(date(anio, 1, 1)), _inicio_del_dia(date(anio + 1, 1, 1))
+
+
+def designaciones_carrera_values(carreras_ids, params):
+    """
+    Devuelve un queryset values() con las columnas del reporte, filtrado
+    según los query params (asignatura_id, tipo_duracion, anio, desde,
+    hasta, estado). Lanza FiltroDesignacionInvalido si alguno no es válido.
+    No aplica orden: lo define la paginación.
+    """
+    qs = Designacion.objects.filter(carrera_id__in=carreras_ids)
+
+    asignatura_id = params.get("asignatura_id")
+    if asignatura_id:
+        qs = qs.filter(comision__plan_asignatura__asignatura_id=asignatura_id)
+
+    tipo_duracion = params.get("tipo_duracion")
+    if tipo_duracion:
+        qs = qs.filter(comision__plan_asignatura__asignatura__tipo_duracion=tipo_duracion)
+
+    anio = params.get("anio")
+    if anio:
+        try:
+            inicio, fin = rango_anio(int(anio))
+        except ValueError:
+            raise FiltroDesignacionInvalido("El parámetro 'anio' debe ser numérico.")
+        qs = qs.filter(fecha_inicio__gte=inicio, fecha_inicio__lt=fin)
+
+    for nombre in ("desde", "hasta"):
+        valor = params.get(nombre)
+        if not valor:
+            continue
+        try:
+            # None si no tiene el formato, ValueError si la fecha no existe (2024-02-30)
+            fecha = parse_date(valor)
+        except ValueError:
+            fecha = None
+        if fecha is None:
+            raise FiltroDesignacionInvalido(f"El parámetro '{nombre}' debe tener el formato AAAA-MM-DD.")
+        if nombre == "desde":
+            qs = qs.filter(fecha_inicio__gte=_inicio_del_dia(fecha))
+        else:
+            # 'hasta' es inclusivo: < comienzo del día siguiente
+            qs = qs.filter(fecha_inicio__lt=_inicio_del_dia(fecha + timedelta(days=1)))
+
+    estado_comision = params.get("estado")
+    if estado_comision:
+        if estado_comision.upper() == "ACTIVA":
+            qs = qs.filter(comision__activo=True)
+        elif estado_comision.upper() == "INACTIVA":
+            qs = qs.filter(comision__activo=False)
+
+    return qs.values(
+        "id",
+        "fecha_inicio",
+        asignatura=F("comision__plan_asignatura__asignatura__nombre"),
+        docente_nombre=Concat(
+            F("docente__usuario__last_name"), Value(" "), F("docente__usuario__first_name")
+        ),
+        dedicacion_nombre=F("dedicacion__nombre"),
+        modalidad_nombre=F("docente__modalidad__nombre"),
+        periodo=F("comision__plan_asignatura__asignatura__tipo_duracion"),
+        comision_activa=F("comision__activo"),
+    )
+
+
+def formatear_designacion_carrera(fila):
+    """Fila values() -> formato de salida del reporte (mismo que la versión anterior)."""
+    return {
+        "id": fila["id"],
+        "asignatura": fila["asignatura"],
+        "docente": fila["docente_nombre"],
+        "dedicacion": fila["dedicacion_nombre"],
+        "modalidad": fila["modalidad_nombre"],
+        "periodo": fila["periodo"],
+        "anio": fila["fecha_inicio"].year,
+        "estado_comision": "ACTIVA" if fila["comision_activa"] else "INACTIVA",
+    }
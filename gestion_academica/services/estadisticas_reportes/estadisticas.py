@@ -5,6 +5,7 @@ from gestion_academica.models.M1_gestion_academica import Carrera
 from gestion_academica.models.M2_gestion_docentes import Docente, ParametrosRegimen
 from gestion_academica.models.M3_designaciones_docentes import Designacion
 from gestion_academica.models.M4_gestion_usuarios_autenticacion import Coordinador, Rol
+from gestion_academica.permissions.alcance import Alcance
 
 Usuario = get_user_model()
 
@@ -14,10 +15,8 @@ Usuario = get_user_model()
 # --------------------------
 
 def es_admin(usuario: Usuario) -> bool:
-    if getattr(usuario, "is_superuser", False):
-        return True
-    # si usás rol "Administrador"
-    return usuario.roles.filter(nombre__iexact="Administrador").exists()
+    # mismo criterio que los listados (superusuario, staff o rol Administrador)
+    return Alcance(usuario).es_admin
 
 
 def get_carrera_del_coordinador(usuario: Usuario) -> Carrera | None:
@@ -76,7 +75,7 @@ def docentes_por_dedicacion_qs(usuario: Usuario, carrera_id_param: str | None):
 
     if carrera is not None:
         qs = qs.filter(
-            designaciones__comision__asignatura__planes_de_estudio__carrera=carrera,
+            designaciones__carrera=carrera,
             designaciones__fecha_fin__isnull=True
         )
 
@@ -99,7 +98,7 @@ def docentes_por_modalidad_qs(usuario: Usuario, carrera_id_param: str | None):
 
     if carrera is not None:
         qs = qs.filter(
-            designaciones__comision__asignatura__planes_de_estudio__carrera=carrera,
+            designaciones__carrera=carrera,
             designaciones__fecha_fin__isnull=True
         )
 
@@ -129,7 +128,7 @@ def horas_por_docente_qs(
 
     if carrera is not None:
         qs = qs.filter(
-            comision__asignatura__planes_de_estudio__carrera=carrera
+            carrera=carrera
         )
 
     if dedicacion_nombre:
@@ -200,7 +199,7 @@ def designaciones_carrera_qs(usuario: Usuario, carrera_id_param: str | None):
 
     if carrera is not None:
         qs = qs.filter(
-            comision__asignatura__planes_de_estudio__carrera=carrera
+            carrera=carrera
         )
 
     return qs.order_by("-fecha_inicio")
@@ -240,13 +239,13 @@ def historial_docente_qs(
         # coordinador: si no pide todas, filtramos por su carrera; 
         if carrera is not None and not incluir_todas_carreras:
             qs = qs.filter(
-                comision__asignatura__planes_de_estudio__carrera=carrera
+                carrera=carrera
             )
     else:
         # admin: si se pasa carrera_id, filtramos; si no, ve todo
         if carrera is not None:
             qs = qs.filter(
-                comision__asignatura__planes_de_estudio__carrera=carrera
+                carrera=carrera
             )
 
     return qs
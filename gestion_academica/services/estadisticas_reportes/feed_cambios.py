@@ -0,0 +1,146 @@
+# gestion_academica/services/estadisticas_reportes/feed_cambios.py
+
+'''
+Feed de cambios incremental para la sincronización con BI.
+
+En lugar de descargar todo cada noche, el consumidor pide lo que cambió
+desde su marca de agua (el "hasta" de la corrida anterior):
+- altas y modificaciones: filas con updated_at en [desde, hasta), leídas
+  por el índice (updated_at, id) de cada modelo;
+- bajas: lápidas (RegistroEliminacion) que las señales crean en cada
+  post_delete, con eliminado_en en el mismo intervalo.
+
+"hasta" se toma con un margen hacia atrás (MARGEN_CONFIRMACION): updated_at
+se asigna al guardar, antes del commit, y una transacción que todavía no
+confirmó no debe quedar del lado ya sincronizado. Las operaciones
+masivas (queryset.update) sobre estos modelos deben asignar updated_at a mano.
+
+El costo de cada corrida es proporcional al volumen de cambios, no al
+tamaño de las tablas. Sin "desde" se emite una foto completa (sin lápidas).
+'''
+
+import json
+from datetime import timedelta
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from gestion_academica.models import Asignatura, Carrera, Designacion, Docente, PlanAsignatura
+from gestion_academica.models.M5_estadisticas_reportes import RegistroEliminacion
+
+
+MARGEN_CONFIRMACION = timedelta(seconds=30)
+
+# nombre en el feed -> (modelo, campos, campos anotados)
+MODELOS_FEED = {
+    "carrera": (
+        Carrera,
+        ["id", "codigo", "nombre", "nivel", "esta_vigente", "instituto_id", "updated_at"],
+        {},
+    ),
+    "asignatura": (
+        Asignatura,
+        ["id", "codigo", "nombre", "activo", "cuatrimestre", "tipo_asignatura",
+         "tipo_duracion", "updated_at"],
+        {},
+    ),
+    "plan_asignatura": (
+        PlanAsignatura,
+        ["id", "plan_de_estudio_id", "asignatura_id", "anio", "horas_teoria",
+         "horas_practica", "horas_semanales", "horas_totales", "updated_at"],
+        {"carrera_id": F("plan_de_estudio__carrera_id")},
+    ),
+    "docente": (
+        Docente,
+        ["id", "usuario_id", "modalidad_id", "caracter_id", "dedicacion_id", "activo", "updated_at"],
+        {
+            "legajo": F("usuario__legajo"),
+            "first_name": F("usuario__first_name"),
+            "last_name": F("usuario__last_name"),
+            "email": F("usuario__email"),
+        },
+    ),
+    "designacion": (
+        Designacion,
+        ["id", "docente_id", "comision_id", "carrera_id", "plan_de_estudio_id", "cargo_id",
+         "dedicacion_id", "tipo_designacion", "fecha_inicio", "fecha_fin", "activo", "updated_at"],
+        {},
+    ),
+}
+
+# clave de RegistroEliminacion.modelo para cada clase
+NOMBRES_FEED = {modelo: nombre for nombre, (modelo, _, _) in MODELOS_FEED.items()}
+
+
+def marca_de_agua_actual():
+    """Límite superior (excluido) de la corrida que empieza ahora."""
+    return timezone.now() - MARGEN_CONFIRMACION
+
+
+def parsear_marca(valor):
+    """ISO 8601 -> datetime aware. None si no vino; ValueError si es inválido."""
+    if not valor:
+        return None
+    marca = parse_datetime(valor)
+    if marca is None:
+        raise ValueError(f"Marca de agua inválida: {valor!r}. Use ISO 8601.")
+    if timezone.is_naive(marca):
+        marca = timezone.make_aware(marca)
+    return marca
+
+
+def parsear_modelos(valor):
+    """'designacion,docente' -> lista validada; vacío = todos."""
+    if not valor:
+        return list(MODELOS_FEED)
+    modelos = [m.strip() for m in valor.split(",") if m.strip()]
+    desconocidos = [m for m in modelos if m not in MODELOS_FEED]
+    if desconocidos:
+        raise ValueError(
+            f"Modelos desconocidos: {', '.join(desconocidos)}. "
+            f"Use: {', '.join(MODELOS_FEED)}."
+        )
+    return modelos
+
+
+def registrar_eliminacion(instancia):
+    """Lápida para una instancia borrada de un modelo del feed (llamada desde signals)."""
+    nombre = NOMBRES_FEED.get(type(instancia))
+    if nombre is not None:
+        RegistroEliminacion.objects.create(modelo=nombre, objeto_id=instancia.pk)
+
+
+def cambios(modelos, desde, hasta):
+    """
+    Genera los cambios de `modelos` en [desde, hasta): primero las filas
+    insertadas o modificadas (op "upsert") en orden de updated_at y luego
+    las bajas (op "delete") de cada modelo.
+    """
+    for nombre in modelos:
+        modelo, campos, anotados = MODELOS_FEED[nombre]
+        qs = modelo.objects.filter(updated_at__lt=hasta)
+        if desde is not None:
+            qs = qs.filter(updated_at__gte=desde)
+        filas = qs.order_by("updated_at", "id").values(*campos, **anotados)
+        for fila in filas.iterator(chunk_size=2000):
+            yield {"op": "upsert", "modelo": nombre, "id": fila["id"], "datos": fila}
+
+        if desde is None:
+            continue
+        lapidas = RegistroEliminacion.objects.filter(
+            modelo=nombre, eliminado_en__gte=desde, eliminado_en__lt=hasta,
+        ).order_by("eliminado_en", "id").values_list("objeto_id", "eliminado_en")
+        for objeto_id, eliminado_en in lapidas.iterator(chunk_size=2000):
+            yield {"op": "delete", "modelo": nombre, "id": objeto_id, "eliminado_en": eliminado_en}
+
+
+def lineas_feed(modelos, desde, hasta):
+    """
+    NDJSON del feed. La última línea ({"op": "fin", "hasta": ...}) trae la
+    próxima marca de agua y confirma que la descarga llegó completa.
+    """
+    for cambio in cambios(modelos, desde, hasta):
+        yield json.dumps(cambio, cls=DjangoJSONEncoder, ensure_ascii=False) + "\n"
+    yield json.dumps({"op": "fin", "desde": desde, "hasta": hasta}, cls=DjangoJSONEncoder) + "\n"
@@ -10,9 +10,7 @@ def aplicar_filtros_generales(queryset, request):
     modalidad_id = request.query_params.get("modalidad_id")
 
     if carrera_id:
-        queryset = queryset.filter(
-            comision__asignatura__plan_asignatura__plan_de_estudio__carrera_id=carrera_id
-        )
+        queryset = queryset.filter(carrera_id=carrera_id)
     if dedicacion_id:
         queryset = queryset.filter(dedicacion_id=dedicacion_id)
     if modalidad_id:
@@ -40,7 +38,7 @@ def aplicar_filtros_designaciones(queryset, request):
     # Periodo cuatrimestral o anual
     if periodo:
         queryset = queryset.filter(
-            comision__asignatura__tipo_duracion=periodo
+            comision__plan_asignatura__asignatura__tipo_duracion=periodo
         )
 
     if fecha_inicio:
@@ -0,0 +1,121 @@
+# gestion_academica/services/estadisticas_reportes/historial.py
+
+'''
+Línea de tiempo compacta del historial de un docente (reporte 5.2.4).
+
+En lugar de devolver cada designación con sus textos repetidos, se
+fusionan las designaciones contiguas o superpuestas de una misma
+(asignatura, cargo, dedicación) en tramos, con una sola pasada sobre las
+filas ordenadas por fecha_inicio. Los nombres viajan una sola vez en
+tablas de lookup indexadas por id.
+'''
+
+from datetime import timedelta
+
+from django.db.models import F
+
+from gestion_academica.models import Designacion
+
+
+# Dos designaciones se consideran contiguas si la segunda empieza a lo
+# sumo un día después de que terminó la primera.
+TOLERANCIA_CONTIGUIDAD = timedelta(days=1)
+
+
+def filas_historial(docente_id):
+    """Todas las designaciones del docente como values(), ordenadas para el barrido."""
+    return list(
+        Designacion.objects.filter(docente_id=docente_id).values(
+            "id",
+            "fecha_inicio",
+            "fecha_fin",
+            "observacion",
+            "cargo_id",
+            "dedicacion_id",
+            "carrera_id",
+            asignatura_id=F("comision__plan_asignatura__asignatura_id"),
+            asignatura_nombre=F("comision__plan_asignatura__asignatura__nombre"),
+            periodo=F("comision__plan_asignatura__asignatura__tipo_duracion"),
+            carrera_nombre=F("carrera__nombre"),
+            cargo_nombre=F("cargo__nombre"),
+            dedicacion_nombre=F("dedicacion__nombre"),
+            comision_activa=F("comision__activo"),
+        ).order_by("fecha_inicio", "id")
+    )
+
+
+def _fin_mayor(a, b):
+    """None representa una designación abierta (sin fecha de fin)."""
+    if a is None or b is None:
+        return None
+    return max(a, b)
+
+
+def construir_timeline(filas):
+    """
+    Recibe filas ordenadas por fecha_inicio y devuelve (tramos, tablas).
+
+    Cada tramo: {asignatura, cargo, dedicacion, carreras, desde, hasta,
+    designaciones}, donde asignatura/cargo/dedicacion/carreras son ids que
+    se resuelven con `tablas`. hasta=None indica un tramo todavía abierto.
+    """
+    tablas = {"asignaturas": {}, "carreras": {}, "cargos": {}, "dedicaciones": {}}
+    tramos = []
+    ultimo_tramo = {}  # (asignatura, cargo, dedicacion) -> tramo vigente en el barrido
+
+    for fila in filas:
+        tablas["asignaturas"].setdefault(
+            fila["asignatura_id"], {"nombre": fila["asignatura_nombre"], "periodo": fila["periodo"]})
+        if fila["carrera_id"] is not None:
+            tablas["carreras"].setdefault(fila["carrera_id"], fila["carrera_nombre"])
+        tablas["cargos"].setdefault(fila["cargo_id"], fila["cargo_nombre"])
+        if fila["dedicacion_id"] is not None:
+            tablas["dedicaciones"].setdefault(fila["dedicacion_id"], fila["dedicacion_nombre"])
+
+        clave = (fila["asignatura_id"], fila["cargo_id"], fila["dedicacion_id"])
+        tramo = ultimo_tramo.get(clave)
+
+        # como las filas vienen ordenadas por inicio, alcanza con mirar el
+        # último tramo de la clave: si sigue abierto o termina después de
+        # (inicio - tolerancia), la fila lo extiende
+        if tramo is not None and (
+            tramo["hasta"] is None
+            or fila["fecha_inicio"] <= tramo["hasta"] + TOLERANCIA_CONTIGUIDAD
+        ):
+            tramo["hasta"] = _fin_mayor(tramo["hasta"], fila["fecha_fin"])
+            tramo["designaciones"] += 1
+            if fila["carrera_id"] is not None and fila["carrera_id"] not in tramo["carreras"]:
+                tramo["carreras"].append(fila["carrera_id"])
+            continue
+
+        tramo = {
+            "asignatura": fila["asignatura_id"],
+            "cargo": fila["cargo_id"],
+            "dedicacion": fila["dedicacion_id"],
+            "carreras": [fila["carrera_id"]] if fila["carrera_id"] is not None else [],
+            "desde": fila["fecha_inicio"],
+            "hasta": fila["fecha_fin"],
+            "designaciones": 1,
+        }
+        ultimo_tramo[clave] = tramo
+        tramos.append(tramo)
+
+    return tramos, tablas
+
+
+def expandir_filas(filas):
+    """Filas crudas con ids codificados contra las mismas tablas de lookup."""
+    return [
+        {
+            "id": fila["id"],
+            "asignatura": fila["asignatura_id"],
+            "carrera": fila["carrera_id"],
+            "cargo": fila["cargo_id"],
+            "dedicacion": fila["dedicacion_id"],
+            "fecha_inicio": fila["fecha_inicio"],
+            "fecha_fin": fila["fecha_fin"],
+            "estado_comision": "ACTIVA" if fila["comision_activa"] else "INACTIVA",
+            "observaciones": fila["observacion"],
+        }
+        for fila in filas
+    ]
@@ -0,0 +1,189 @@
+# gestion_academica/services/estadisticas_reportes/pdf_reportes.py
+
+'''
+Renderizado de reportes PDF por bloques.
+
+En lugar de una única Table con un Paragraph por celda:
+- los anchos de columna se miden una vez (stringWidth) sobre una muestra
+  de filas: las columnas angostas conservan su ancho natural y las anchas
+  se reparten el resto;
+- las celdas son strings planos salvo las que realmente exceden el ancho
+  de su columna, que pasan a Paragraph para ajustar línea;
+- la tabla se parte en bloques de una página (con su encabezado) que se
+  generan a medida que reportlab los consume, así en memoria hay un solo
+  bloque de flowables a la vez;
+- el PDF se escribe en un archivo temporal (en memoria hasta cierto
+  tamaño) que la vista devuelve con FileResponse por partes.
+'''
+
+from itertools import chain, islice
+from tempfile import SpooledTemporaryFile
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.platypus import Image, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+
+LOGO_UNTDF = "gestion_academica/static/gestion_academica/logo_untdf.png"
+
+ENCABEZADOS_REPORTE = {
+    "asignatura": "Asignatura",
+    "docente": "Docente",
+    "dedicacion": "Dedicación",
+    "modalidad": "Modalidad",
+    "periodo": "Período",
+    "anio": "Año",
+    "estado_designacion": "Estado de la designación",
+    "total_docentes": "Total Docentes",
+    "porcentaje": "Porcentaje",
+    "total_horas_frente_alumnos": "Horas Frente Alumnos",
+    "asignaturas": "Asignaturas",
+    "estado_carga": "Estado de Carga",
+}
+
+PAGINA = landscape(A4)
+MARGENES = {"leftMargin": 40, "rightMargin": 40, "topMargin": 50, "bottomMargin": 30}
+FUENTE, FUENTE_NEGRITA = "Helvetica", "Helvetica-Bold"
+TAM_FUENTE, TAM_ENCABEZADO = 8, 9
+RELLENO_CELDA = 12  # padding izquierdo + derecho por defecto de Table
+ALTO_FILA = TAM_FUENTE * 1.2 + 6  # leading + padding superior e inferior
+FILAS_MUESTRA = 200
+PDF_EN_MEMORIA_MAX = 8 * 1024 * 1024  # bytes; más allá el temporal va a disco
+
+ESTILO_TABLA = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#5A5A5A")),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+    ("FONTNAME", (0, 0), (-1, 0), FUENTE_NEGRITA),
+    ("FONTSIZE", (0, 0), (-1, 0), TAM_ENCABEZADO),
+
+    ("BACKGROUND", (0, 1), (-1, -1), colors.HexColor("#F1F1D4")),
+    ("FONTNAME", (0, 1), (-1, -1), FUENTE),
+    ("FONTSIZE", (0, 1), (-1, -1), TAM_FUENTE),
+
+    ("GRID", (0, 0), (-1, -1), 0.25, colors.black),
+    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+])
+
+
+class FlowablesPerezosos(list):
+    """
+    Lista de flowables que se completa desde un generador a medida que
+    SimpleDocTemplate.build() la consume (build solo mira el frente de la
+    lista, le quita elementos y vuelve a insertar los restos partidos).
+    """
+
+    def __init__(self, iniciales, generador, reserva=2):
+        super().__init__(iniciales)
+        self._generador = generador
+        self._reserva = reserva
+
+    def _rellenar(self):
+        while self._generador is not None and super().__len__() < self._reserva:
+            try:
+                self.append(next(self._generador))
+            except StopIteration:
+                self._generador = None
+
+    def __len__(self):
+        self._rellenar()
+        return super().__len__()
+
+    def __getitem__(self, indice):
+        self._rellenar()
+        return super().__getitem__(indice)
+
+    def __delitem__(self, indice):
+        self._rellenar()
+        super().__delitem__(indice)
+
+
+def medir_columnas(fieldnames, encabezados, muestra, ancho_disponible):
+    """Ancho de cada columna a partir del encabezado y una muestra de filas."""
+    naturales = []
+    for campo, titulo in zip(fieldnames, encabezados):
+        ancho = stringWidth(titulo, FUENTE_NEGRITA, TAM_ENCABEZADO)
+        for fila in muestra:
+            ancho = max(ancho, stringWidth(str(fila.get(campo, "")), FUENTE, TAM_FUENTE))
+        naturales.append(ancho + RELLENO_CELDA)
+
+    total = sum(naturales)
+    if total <= ancho_disponible:
+        # todo entra: se reparte el sobrante en proporción
+        return [n * ancho_disponible / total for n in naturales]
+
+    # las columnas angostas conservan su ancho natural; las anchas se
+    # reparten el resto
+    cuota = ancho_disponible / len(naturales)
+    fijas = {i for i, n in enumerate(naturales) if n <= cuota}
+    resto = ancho_disponible - sum(naturales[i] for i in fijas)
+    anchas = sum(n for i, n in enumerate(naturales) if i not in fijas)
+    return [n if i in fijas else n * resto / anchas for i, n in enumerate(naturales)]
+
+
+def _celda(valor, ancho, estilo):
+    texto = "" if valor is None else str(valor)
+    if stringWidth(texto, FUENTE, TAM_FUENTE) > ancho - RELLENO_CELDA:
+        return Paragraph(escape(texto), estilo)
+    return texto
+
+
+def _bloques(filas, fieldnames, encabezados, anchos, filas_por_bloque, estilo):
+    bloque = [encabezados]
+    for fila in filas:
+        bloque.append([
+            _celda(fila.get(campo, ""), ancho, estilo)
+            for campo, ancho in zip(fieldnames, anchos)
+        ])
+        if len(bloque) > filas_por_bloque:
+            yield _tabla(bloque, anchos)
+            bloque = [encabezados]
+    if len(bloque) > 1:
+        yield _tabla(bloque, anchos)
+
+
+def _tabla(bloque, anchos):
+    tabla = Table(bloque, colWidths=anchos, repeatRows=1)
+    tabla.setStyle(ESTILO_TABLA)
+    return tabla
+
+
+def renderizar_pdf(destino, titulo, fieldnames, filas, logo_path=LOGO_UNTDF):
+    """
+    Escribe en `destino` (archivo o file-like) el PDF de `filas` (iterable
+    de dicts, se recorre una sola vez).
+    """
+    doc = SimpleDocTemplate(destino, pagesize=PAGINA, pageCompression=1, **MARGENES)
+    estilos = getSampleStyleSheet()
+    estilo_celda = estilos["BodyText"].clone("celda", fontName=FUENTE, fontSize=TAM_FUENTE, leading=TAM_FUENTE * 1.2)
+
+    iniciales = []
+    if logo_path:
+        try:
+            iniciales.append(Image(logo_path, width=120, height=60))
+        except Exception:
+            pass
+    iniciales.append(Spacer(1, 12))
+    iniciales.append(Paragraph(f"<b>Reporte: {titulo}</b>", estilos["Title"]))
+    iniciales.append(Spacer(1, 20))
+
+    filas = iter(filas)
+    muestra = list(islice(filas, FILAS_MUESTRA))
+    encabezados = [ENCABEZADOS_REPORTE.get(c, c) for c in fieldnames]
+    anchos = medir_columnas(fieldnames, encabezados, muestra, doc.width)
+    filas_por_bloque = max(1, int((doc.height - ALTO_FILA) // ALTO_FILA))
+
+    bloques = _bloques(
+        chain(muestra, filas), fieldnames, encabezados, anchos, filas_por_bloque, estilo_celda)
+    doc.build(FlowablesPerezosos(iniciales, bloques))
+
+
+def pdf_temporal(titulo, fieldnames, filas):
+    """Renderiza a un SpooledTemporaryFile posicionado al inicio."""
+    archivo = SpooledTemporaryFile(max_size=PDF_EN_MEMORIA_MAX)
+    renderizar_pdf(archivo, titulo, fieldnames, filas)
+    archivo.seek(0)
+    return archivo
@@ -1,65 +1,58 @@
 # gestion_academica/services/estadisticas_reportes/permisos.py
 
 from rest_framework.exceptions import PermissionDenied
-from gestion_academica.models import CarreraCoordinacion, Carrera
+from gestion_academica.models import Carrera
+from gestion_academica.permissions.alcance import Alcance
 
 
-def obtener_carreras_para_estadisticas(user, carrera_id_param=None):
+def _carrera_id(carrera_id_param):
+    try:
+        return int(carrera_id_param)
+    except (TypeError, ValueError):
+        raise PermissionDenied("El identificador de carrera es inválido.")
+
+
+def obtener_carreras_para_estadisticas(user, carrera_id_param=None, alcance=None):
     """
     Regla de negocio:
     - Solo usuarios coordinadores pueden acceder.
     - Solo pueden ver estadísticas de las carreras que coordinan (CarreraCoordinacion.activo=True).
     - Si se pasa carrera_id, se valida que pertenezca a ese coordinador.
     - Si no se pasa carrera_id, se devuelven TODAS las carreras que coordina.
+
+    Quién es administrador y qué carreras coordina lo decide Alcance, igual
+    que en los listados; las vistas pasan Alcance.de_request(request) para
+    reutilizar lo ya resuelto en el request.
     """
 
     if not user.is_authenticated:
         raise PermissionDenied("Debe iniciar sesión para acceder a las estadísticas.")
-    
-    # --- PERMISOS DE ADMINISTRADOR ---
-    # Verificamos si es superusuario O si tiene el rol "Administrador" asignado
-    es_admin = user.is_superuser or user.roles.filter(nombre="Administrador").exists()
 
-    if es_admin:
-        # Si pidió una carrera específica
+    if alcance is None:
+        alcance = Alcance(user)
+
+    # --- PERMISOS DE ADMINISTRADOR ---
+    if alcance.es_admin:
+        # Si pidió una carrera específica, para filtros rápidos basta con devolver el ID
         if carrera_id_param is not None:
-            try:
-                carrera_id = int(carrera_id_param)
-                # Opcional: Podrías verificar si la carrera existe en BD, 
-                # pero para filtros rápidos basta con devolver el ID.
-                return [carrera_id]
-            except (TypeError, ValueError):
-                raise PermissionDenied("El identificador de carrera es inválido.")
-        
+            return [_carrera_id(carrera_id_param)]
+
         # Si NO pidió carrera específica ("Todas"), el Admin ve TODAS las vigentes
-        # Retornamos una lista de IDs de todas las carreras activas
         return list(Carrera.objects.filter(esta_vigente=True).values_list('id', flat=True))
 
     if not hasattr(user, "coordinador"):
         raise PermissionDenied("Solo los coordinadores de carrera pueden acceder a este módulo.")
 
-    qs = CarreraCoordinacion.objects.filter(
-        coordinador=user.coordinador,
-        activo=True
-    ).select_related("carrera")
-
-    if not qs.exists():
+    if not alcance.carreras_ids:
         raise PermissionDenied("No tiene carreras asignadas como coordinador.")
 
-    carreras_ids = [cc.carrera_id for cc in qs]
-
-
     if carrera_id_param is not None:
-        try:
-            carrera_id = int(carrera_id_param)
-        except (TypeError, ValueError):
-            raise PermissionDenied("El identificador de carrera es inválido.")
-
-        if carrera_id not in carreras_ids:
+        carrera_id = _carrera_id(carrera_id_param)
+        if not alcance.incluye_carrera(carrera_id):
             raise PermissionDenied(
                 "No tiene permisos para visualizar las estadísticas de esta carrera."
             )
         return [carrera_id]
 
     # Si no se pasó carrera_id → todas las carreras que coordina
-    return carreras_ids
+    return sorted(alcance.carreras_ids)
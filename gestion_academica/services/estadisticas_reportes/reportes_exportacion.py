@@ -1,7 +1,9 @@
 import csv
 import io
+import json
+import zlib
 from openpyxl import Workbook
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 
 from gestion_academica.models.M5_estadisticas_reportes import ExportLog
 from django.contrib.auth import get_user_model
@@ -85,3 +87,143 @@ def generar_excel(nombre_archivo, campos, rows, usuario: Usuario, tipo_reporte,
             mensaje_error=str(e),
         )
         raise e
+
+
+# ================================================================
+# Exportación en streaming (CSV, CSV.GZ, NDJSON, NDJSON.GZ)
+# ================================================================
+#
+# Las filas se serializan y, si corresponde, se comprimen con zlib a
+# medida que se recorren, en bloques de TAMANIO_BLOQUE: ni el archivo ni
+# las filas se arman completos en memoria. El ExportLog se escribe al
+# terminar el stream (o al cortarse), con los bytes realmente enviados.
+
+TAMANIO_BLOQUE = 64 * 1024  # bytes sin comprimir por bloque
+NIVEL_GZIP = 6
+
+FORMATOS_STREAMING = {
+    # formato pedido -> (formato ExportLog, extensión, content type, gzip)
+    "csv": ("CSV", "csv", "text/csv; charset=utf-8", False),
+    "csv.gz": ("CSV_GZ", "csv.gz", "application/gzip", True),
+    "ndjson": ("NDJSON", "ndjson", "application/x-ndjson", False),
+    "ndjson.gz": ("NDJSON_GZ", "ndjson.gz", "application/gzip", True),
+}
+
+
+def registrar_exportacion(usuario, tipo_reporte, formato, filtros, exito=True, mensaje_error=None, **volumen):
+    """Crea el ExportLog. `volumen`: filas, bytes_sin_comprimir, bytes_enviados."""
+    return ExportLog.objects.create(
+        usuario=usuario if getattr(usuario, "is_authenticated", False) else None,
+        tipo_reporte=tipo_reporte,
+        formato=formato,
+        filtros=filtros,
+        exito=exito,
+        mensaje_error=mensaje_error,
+        **volumen,
+    )
+
+
+class _LineaCSV:
+    """Destino mínimo para csv.writer: devuelve la línea escrita."""
+
+    def write(self, valor):
+        return valor
+
+
+def lineas_csv(campos, rows):
+    writer = csv.writer(_LineaCSV())
+    yield writer.writerow(campos)
+    for row in rows:
+        yield writer.writerow([row.get(c, "") for c in campos])
+
+
+def lineas_ndjson(campos, rows):
+    for row in rows:
+        yield json.dumps({c: row.get(c) for c in campos}, ensure_ascii=False, default=str) + "\n"
+
+
+class ExportacionStreaming:
+    """
+    Iterable de bytes para StreamingHttpResponse. Agrupa las líneas en
+    bloques, las comprime si el formato lo pide y, al terminar, registra
+    la exportación con filas y bytes (sin comprimir y enviados).
+    """
+
+    def __init__(self, lineas, comprimir, usuario, tipo_reporte, formato_log, filtros, encabezados=0):
+        self.lineas = lineas
+        self.encabezados = encabezados
+        self.comprimir = comprimir
+        self.usuario = usuario
+        self.tipo_reporte = tipo_reporte
+        self.formato_log = formato_log
+        self.filtros = filtros
+        self.filas = 0
+        self.bytes_sin_comprimir = 0
+        self.bytes_enviados = 0
+
+    def _bloques(self):
+        bloque, tamanio = [], 0
+        for linea in self.lineas:
+            datos = linea.encode("utf-8")
+            self.filas += 1
+            bloque.append(datos)
+            tamanio += len(datos)
+            if tamanio >= TAMANIO_BLOQUE:
+                yield b"".join(bloque)
+                bloque, tamanio = [], 0
+        if bloque:
+            yield b"".join(bloque)
+
+    def _salida(self):
+        # wbits 16 + MAX_WBITS: formato gzip (cabecera y CRC) en lugar de zlib
+        compresor = zlib.compressobj(NIVEL_GZIP, zlib.DEFLATED, 16 + zlib.MAX_WBITS) if self.comprimir else None
+        for bloque in self._bloques():
+            self.bytes_sin_comprimir += len(bloque)
+            salida = compresor.compress(bloque) if compresor else bloque
+            if salida:
+                yield salida
+        if compresor:
+            yield compresor.flush()
+
+    def __iter__(self):
+        exito, error = False, None
+        try:
+            for salida in self._salida():
+                self.bytes_enviados += len(salida)
+                yield salida
+            exito = True
+        except GeneratorExit:
+            error = "Descarga interrumpida por el cliente."
+            raise
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            registrar_exportacion(
+                self.usuario, self.tipo_reporte, self.formato_log, self.filtros,
+                exito=exito, mensaje_error=error,
+                filas=max(self.filas - self.encabezados, 0), bytes_sin_comprimir=self.bytes_sin_comprimir,
+                bytes_enviados=self.bytes_enviados,
+            )
+
+
+def respuesta_lineas(lineas, formato, nombre_archivo, usuario, tipo_reporte, filtros, encabezados=0):
+    """
+    StreamingHttpResponse para líneas ya serializadas en uno de los
+    FORMATOS_STREAMING. `encabezados`: líneas que no cuentan como filas.
+    """
+    formato_log, extension, content_type, comprimir = FORMATOS_STREAMING[formato]
+    exportacion = ExportacionStreaming(
+        lineas, comprimir, usuario, tipo_reporte, formato_log, filtros, encabezados=encabezados)
+    resp = StreamingHttpResponse(exportacion, content_type=content_type)
+    resp["Content-Disposition"] = f'attachment; filename="{nombre_archivo}.{extension}"'
+    return resp
+
+
+def respuesta_streaming(formato, nombre_archivo, campos, rows, usuario, tipo_reporte, filtros):
+    if formato.startswith("csv"):
+        lineas, encabezados = lineas_csv(campos, rows), 1
+    else:
+        lineas, encabezados = lineas_ndjson(campos, rows), 0
+    return respuesta_lineas(
+        lineas, formato, nombre_archivo, usuario, tipo_reporte, filtros, encabezados=encabezados)
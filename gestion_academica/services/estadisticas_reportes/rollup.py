@@ -0,0 +1,163 @@
+# gestion_academica/services/estadisticas_reportes/rollup.py
+
+'''
+Motor de estadísticas de docentes en una sola consulta.
+
+Con GROUPING SETS se obtienen en un único recorrido de las designaciones
+activas el total, los conteos por dedicación, por modalidad, el cruce
+dedicación x modalidad y el detalle por carrera. Las vistas de dedicación,
+modalidad, el cruce y la exportación "rebanan" este resultado sin volver
+a consultar la base.
+'''
+
+from datetime import datetime, time, timedelta
+
+from django.db import connection
+from django.utils import timezone
+
+from gestion_academica.models import (
+    Dedicacion,
+    Designacion,
+    Docente,
+    Modalidad,
+)
+
+from .cache_resultados import resultado_cacheado
+
+
+DIMENSIONES = ("dedicacion", "modalidad")
+
+
+def limite_fecha_corte(fecha_corte):
+    """Primer instante del día siguiente: la foto refleja el estado al cierre de la fecha."""
+    return timezone.make_aware(datetime.combine(fecha_corte + timedelta(days=1), time.min))
+
+
+def condicion_designacion_activa(fecha_corte=None, alias="d"):
+    """
+    SQL (y parámetros) para "designación activa". Sin fecha es el estado
+    actual (fecha_fin nula, igual que las vistas en vivo); con fecha se
+    reconstruye el estado histórico a partir de fecha_inicio / fecha_fin.
+    """
+    if fecha_corte is None:
+        return f"{alias}.fecha_fin IS NULL", []
+    limite = limite_fecha_corte(fecha_corte)
+    return (
+        f"{alias}.fecha_inicio < %s AND ({alias}.fecha_fin IS NULL OR {alias}.fecha_fin >= %s)",
+        [limite, limite],
+    )
+
+
+def _sql_rollup(condicion_activa):
+    return f"""
+        SELECT
+            GROUPING(ded.nombre)     AS g_dedicacion,
+            GROUPING(moda.nombre)    AS g_modalidad,
+            GROUPING(d.carrera_id)   AS g_carrera,
+            ded.nombre               AS dedicacion,
+            moda.nombre              AS modalidad,
+            d.carrera_id             AS carrera_id,
+            COUNT(DISTINCT d.docente_id) AS total_docentes
+        FROM {Designacion._meta.db_table} d
+        JOIN {Docente._meta.db_table} doc ON doc.id = d.docente_id
+        LEFT JOIN {Dedicacion._meta.db_table} ded ON ded.id = doc.dedicacion_id
+        LEFT JOIN {Modalidad._meta.db_table} moda ON moda.id = doc.modalidad_id
+        WHERE {condicion_activa}
+          AND d.carrera_id = ANY(%s)
+        GROUP BY GROUPING SETS (
+            (),
+            (ded.nombre),
+            (moda.nombre),
+            (ded.nombre, moda.nombre),
+            (ded.nombre, moda.nombre, d.carrera_id)
+        )
+    """
+
+
+def calcular_rollup_docentes(carreras_ids, fecha_corte=None):
+    """
+    Ejecuta el rollup para las carreras indicadas (al día de hoy o al
+    cierre de `fecha_corte`) y devuelve un dict:
+    {
+        "total_docentes": int,
+        "por_dedicacion": {nombre|None: cantidad},
+        "por_modalidad": {nombre|None: cantidad},
+        "dedicacion_modalidad": [{dedicacion, modalidad, total_docentes}],
+        "detalle_carrera": [{carrera_id, dedicacion, modalidad, total_docentes}],
+    }
+    Los conteos son de docentes distintos: un docente con varias
+    designaciones cuenta una vez en cada grupo.
+    """
+    resultado = {
+        "total_docentes": 0,
+        "por_dedicacion": {},
+        "por_modalidad": {},
+        "dedicacion_modalidad": [],
+        "detalle_carrera": [],
+    }
+    if not carreras_ids:
+        return resultado
+
+    condicion, params = condicion_designacion_activa(fecha_corte)
+    with connection.cursor() as cursor:
+        cursor.execute(_sql_rollup(condicion), [*params, list(carreras_ids)])
+        filas = cursor.fetchall()
+
+    for g_ded, g_mod, g_car, dedicacion, modalidad, carrera_id, total in filas:
+        if g_ded and g_mod:
+            resultado["total_docentes"] = total
+        elif g_mod:
+            resultado["por_dedicacion"][dedicacion] = total
+        elif g_ded:
+            resultado["por_modalidad"][modalidad] = total
+        elif g_car:
+            resultado["dedicacion_modalidad"].append({
+                "dedicacion": dedicacion, "modalidad": modalidad, "total_docentes": total,
+            })
+        else:
+            resultado["detalle_carrera"].append({
+                "carrera_id": carrera_id, "dedicacion": dedicacion,
+                "modalidad": modalidad, "total_docentes": total,
+            })
+
+    resultado["dedicacion_modalidad"].sort(key=lambda f: (f["dedicacion"] or "", f["modalidad"] or ""))
+    resultado["detalle_carrera"].sort(
+        key=lambda f: (f["carrera_id"], f["dedicacion"] or "", f["modalidad"] or ""))
+    return resultado
+
+
+def rollup_docentes_cacheado(carreras_ids):
+    """Rollup del estado actual a través del caché versionado de resultados."""
+    rollup, _ = resultado_cacheado(
+        "rollup_docentes", carreras_ids, {}, lambda: calcular_rollup_docentes(carreras_ids)
+    )
+    return rollup
+
+
+def rebanar_rollup(rollup, dimension):
+    """
+    Devuelve (total_docentes, data) para una dimensión ("dedicacion" o
+    "modalidad"), con el mismo formato que las vistas 5.2.0 / 5.2.1:
+    se omiten los docentes sin valor en la dimensión y el porcentaje se
+    calcula sobre los que sí lo tienen (cada docente tiene un solo valor,
+    así que los grupos son disjuntos y se pueden sumar).
+    """
+    if dimension not in DIMENSIONES:
+        raise ValueError(f"Dimensión inválida: {dimension}")
+
+    grupos = {
+        nombre: cantidad
+        for nombre, cantidad in rollup[f"por_{dimension}"].items()
+        if nombre is not None
+    }
+    total = sum(grupos.values())
+
+    data = [
+        {
+            dimension: nombre,
+            "total_docentes": cantidad,
+            "porcentaje": round(cantidad * 100 / total, 2),
+        }
+        for nombre, cantidad in sorted(grupos.items())
+    ]
+    return total, data
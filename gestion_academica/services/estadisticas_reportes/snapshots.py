@@ -0,0 +1,171 @@
+# gestion_academica/services/estadisticas_reportes/snapshots.py
+
+'''
+Fotos agregadas de estadísticas por carrera (EstadisticaSnapshot).
+
+generar_snapshots() calcula el estado de todas las carreras a una fecha
+con dos consultas (rollup de docentes + horas/cobertura) y lo guarda con
+un upsert. La serie histórica se lee luego con obtener_tendencia().
+'''
+
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.db import connection
+from django.db.models import Count
+
+from gestion_academica.models import (
+    Carrera,
+    Comision,
+    Designacion,
+    PlanAsignatura,
+    PlanDeEstudio,
+)
+from gestion_academica.models.M5_estadisticas_reportes import EstadisticaSnapshot
+
+from .rollup import calcular_rollup_docentes, condicion_designacion_activa
+
+
+# Fechas (mes, día) en que se toma la foto CUATRIMESTRAL: mitad de cada
+# cuatrimestre, cuando las designaciones del período ya están cargadas.
+CORTES_CUATRIMESTRE = ((5, 15), (10, 15))
+
+CAMPOS_SNAPSHOT = [
+    "total_docentes",
+    "total_designaciones",
+    "total_horas",
+    "asignaturas_plan",
+    "asignaturas_cubiertas",
+    "por_dedicacion",
+    "por_modalidad",
+]
+
+
+def es_corte_cuatrimestral(fecha):
+    return (fecha.month, fecha.day) in CORTES_CUATRIMESTRE
+
+
+def fechas_de_corte(desde, hasta, granularidad):
+    """Fechas a fotografiar en el rango [desde, hasta] según la granularidad."""
+    if granularidad == "DIARIO":
+        return [desde + timedelta(days=i) for i in range((hasta - desde).days + 1)]
+    return [
+        date(anio, mes, dia)
+        for anio in range(desde.year, hasta.year + 1)
+        for mes, dia in CORTES_CUATRIMESTRE
+        if desde <= date(anio, mes, dia) <= hasta
+    ]
+
+
+def _horas_y_cobertura(carreras_ids, fecha):
+    """
+    Por carrera: designaciones activas, suma de horas semanales y cantidad
+    de asignaturas de planes vigentes con al menos una designación activa.
+    """
+    condicion, params = condicion_designacion_activa(fecha)
+    sql = f"""
+        SELECT
+            d.carrera_id,
+            COUNT(d.id),
+            COALESCE(SUM(pa.horas_semanales), 0),
+            COUNT(DISTINCT pa.id) FILTER (WHERE pe.esta_vigente)
+        FROM {Designacion._meta.db_table} d
+        JOIN {Comision._meta.db_table} c ON c.id = d.comision_id
+        JOIN {PlanAsignatura._meta.db_table} pa ON pa.id = c.plan_asignatura_id
+        JOIN {PlanDeEstudio._meta.db_table} pe ON pe.id = d.plan_de_estudio_id
+        WHERE {condicion}
+          AND d.carrera_id = ANY(%s)
+        GROUP BY d.carrera_id
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [*params, list(carreras_ids)])
+        return {fila[0]: fila[1:] for fila in cursor.fetchall()}
+
+
+def generar_snapshots(fecha, granularidad="DIARIO", carreras_ids=None):
+    """
+    Calcula y guarda (upsert) la foto de cada carrera a la fecha indicada.
+    Devuelve la cantidad de snapshots escritos.
+    """
+    if carreras_ids is None:
+        carreras_ids = list(Carrera.objects.values_list("id", flat=True))
+    if not carreras_ids:
+        return 0
+
+    rollup = calcular_rollup_docentes(carreras_ids, fecha_corte=fecha)
+    horas = _horas_y_cobertura(carreras_ids, fecha)
+    asignaturas_plan = dict(
+        PlanAsignatura.objects.filter(
+            plan_de_estudio__esta_vigente=True,
+            plan_de_estudio__carrera_id__in=carreras_ids,
+        ).values_list("plan_de_estudio__carrera_id").annotate(total=Count("id"))
+    )
+
+    # el detalle (dedicación, modalidad, carrera) es disjunto por docente:
+    # sumando se obtienen los totales por carrera y por dimensión
+    por_carrera = defaultdict(lambda: {"total": 0, "dedicacion": defaultdict(int), "modalidad": defaultdict(int)})
+    for fila in rollup["detalle_carrera"]:
+        acumulado = por_carrera[fila["carrera_id"]]
+        acumulado["total"] += fila["total_docentes"]
+        if fila["dedicacion"] is not None:
+            acumulado["dedicacion"][fila["dedicacion"]] += fila["total_docentes"]
+        if fila["modalidad"] is not None:
+            acumulado["modalidad"][fila["modalidad"]] += fila["total_docentes"]
+
+    snapshots = []
+    for carrera_id in carreras_ids:
+        acumulado = por_carrera.get(carrera_id)
+        designaciones, total_horas, cubiertas = horas.get(carrera_id, (0, 0, 0))
+        snapshots.append(EstadisticaSnapshot(
+            carrera_id=carrera_id,
+            fecha=fecha,
+            granularidad=granularidad,
+            total_docentes=acumulado["total"] if acumulado else 0,
+            total_designaciones=designaciones,
+            total_horas=total_horas,
+            asignaturas_plan=asignaturas_plan.get(carrera_id, 0),
+            asignaturas_cubiertas=cubiertas,
+            por_dedicacion=dict(acumulado["dedicacion"]) if acumulado else {},
+            por_modalidad=dict(acumulado["modalidad"]) if acumulado else {},
+        ))
+
+    EstadisticaSnapshot.objects.bulk_create(
+        snapshots,
+        update_conflicts=True,
+        unique_fields=["carrera", "granularidad", "fecha"],
+        update_fields=CAMPOS_SNAPSHOT + ["generado_en"],
+    )
+    return len(snapshots)
+
+
+def obtener_tendencia(carreras_ids, granularidad, desde=None, hasta=None):
+    """
+    Serie histórica por carrera, leída de los snapshots con un único rango
+    sobre el índice (carrera, granularidad, fecha).
+    """
+    qs = EstadisticaSnapshot.objects.filter(
+        carrera_id__in=carreras_ids,
+        granularidad=granularidad,
+    )
+    if desde:
+        qs = qs.filter(fecha__gte=desde)
+    if hasta:
+        qs = qs.filter(fecha__lte=hasta)
+
+    series = defaultdict(list)
+    for snap in qs.order_by("carrera_id", "fecha"):
+        series[snap.carrera_id].append({
+            "fecha": snap.fecha,
+            "total_docentes": snap.total_docentes,
+            "total_designaciones": snap.total_designaciones,
+            "total_horas": snap.total_horas,
+            "cobertura": snap.cobertura,
+            "por_dedicacion": snap.por_dedicacion,
+            "por_modalidad": snap.por_modalidad,
+        })
+
+    nombres = dict(Carrera.objects.filter(id__in=series.keys()).values_list("id", "nombre"))
+    return [
+        {"carrera_id": carrera_id, "carrera": nombres.get(carrera_id), "serie": serie}
+        for carrera_id, serie in series.items()
+    ]
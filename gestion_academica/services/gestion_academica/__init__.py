@@ -3,4 +3,8 @@ from .carreras import *
 from .asignaturas import *
 from .plan_de_estudio import *
 from .documentos import *
-from .plan_asignatura  import *
\ No newline at end of file
+from .plan_asignatura  import *
+from .importacion_plan import *
+
+from .busqueda import *
+from .typeahead import *
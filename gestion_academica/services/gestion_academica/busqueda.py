@@ -0,0 +1,103 @@
+# gestion_academica/services/gestion_academica/busqueda.py
+
+'''
+Búsqueda de texto unificada sobre asignaturas, carreras, planes de estudio
+(por su documento) y docentes.
+
+Cada tabla tiene una columna `busqueda` (tsvector con índice GIN) que
+mantiene un trigger de la base en cada INSERT/UPDATE, así que también la
+cubren bulk_create, la carga masiva de fixtures y los INSERT ... SELECT.
+El vector junta lexemas en español (con raíz) y en 'simple' (palabras
+completas) sobre el texto sin acentos (ver migración 0019). La consulta
+hace lo mismo: la frase en español OR cada palabra como prefijo, de modo
+que "informatica", "informáticos" e "inform" encuentran "Informática".
+'''
+
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, Func, TextField, Value
+
+from gestion_academica import models
+
+
+TIPOS_BUSQUEDA = ("asignatura", "carrera", "plan", "docente")
+LIMITE_BUSQUEDA = 10
+LIMITE_MAXIMO_BUSQUEDA = 50
+
+
+def _sin_acentos(texto):
+    return Func(Value(texto), function="ma_sin_acentos", output_field=TextField())
+
+
+def consulta_texto(texto):
+    """
+    Devuelve el SearchQuery para `texto` o None si no tiene palabras.
+    Se usa con el lookup `busqueda=consulta` (operador @@).
+    """
+    palabras = re.findall(r"\w+", texto or "")
+    if not palabras:
+        return None
+    prefijos = " & ".join(f"{palabra}:*" for palabra in palabras)
+    return (
+        SearchQuery(_sin_acentos(" ".join(palabras)), config="spanish", search_type="plain")
+        | SearchQuery(_sin_acentos(prefijos), config="simple", search_type="raw")
+    )
+
+
+def filtrar_por_texto(queryset, texto, campo="busqueda"):
+    """Filtra `queryset` por `texto` y lo ordena por relevancia."""
+    consulta = consulta_texto(texto)
+    if consulta is None:
+        return queryset
+    return queryset.filter(**{campo: consulta}).annotate(
+        rango=SearchRank(F(campo), consulta)
+    ).order_by("-rango", "pk")
+
+
+def _resultados_asignaturas(texto, limite):
+    for asignatura in filtrar_por_texto(models.Asignatura.objects.filter(activo=True), texto)[:limite]:
+        yield {"tipo": "asignatura", "id": asignatura.pk, "titulo": asignatura.nombre,
+               "detalle": asignatura.codigo, "rango": asignatura.rango}
+
+
+def _resultados_carreras(texto, limite):
+    for carrera in filtrar_por_texto(models.Carrera.objects.all(), texto)[:limite]:
+        yield {"tipo": "carrera", "id": carrera.pk, "titulo": carrera.nombre,
+               "detalle": carrera.codigo, "rango": carrera.rango}
+
+
+def _resultados_planes(texto, limite):
+    planes = filtrar_por_texto(
+        models.PlanDeEstudio.objects.select_related("documento", "carrera"), texto, "documento__busqueda")
+    for plan in planes[:limite]:
+        yield {"tipo": "plan", "id": plan.pk, "titulo": str(plan.documento),
+               "detalle": plan.carrera.nombre if plan.carrera else None, "rango": plan.rango}
+
+
+def _resultados_docentes(texto, limite):
+    usuarios = filtrar_por_texto(models.Usuario.objects.filter(docente__isnull=False), texto)
+    for usuario in usuarios[:limite]:
+        # /api/docentes/<usuario_id>/
+        yield {"tipo": "docente", "id": usuario.pk, "titulo": f"{usuario.last_name}, {usuario.first_name}",
+               "detalle": usuario.legajo, "rango": usuario.rango}
+
+
+BUSCADORES = {
+    "asignatura": _resultados_asignaturas,
+    "carrera": _resultados_carreras,
+    "plan": _resultados_planes,
+    "docente": _resultados_docentes,
+}
+
+
+def buscar(texto, tipos=TIPOS_BUSQUEDA, limite=LIMITE_BUSQUEDA):
+    """
+    Hasta `limite` resultados de cada tipo pedido (una consulta por tipo
+    sobre su índice GIN), todos juntos ordenados por relevancia.
+    """
+    if consulta_texto(texto) is None:
+        return []
+    resultados = [r for tipo in tipos for r in BUSCADORES[tipo](texto, limite)]
+    resultados.sort(key=lambda r: r["rango"], reverse=True)
+    return resultados
@@ -0,0 +1,346 @@
+# gestion_academica/services/gestion_academica/importacion_plan.py
+
+'''
+Importación de un plan de estudio completo desde una planilla (XLSX o CSV).
+
+Una fila por asignatura, con columnas:
+    codigo, nombre, tipo_asignatura, tipo_duracion, cuatrimestre, anio,
+    horas_teoria, horas_practica, horas_semanales, correlativas
+donde `correlativas` son códigos separados por ";" o ",". Las asignaturas
+que ya existen (por código) se reutilizan tal cual; para ellas alcanza con
+codigo, anio, horas y correlativas.
+
+Todo el plan se valida en memoria antes de escribir (con tres consultas
+para lo que ya existe): datos de cada fila, códigos duplicados, asignaturas
+ya asociadas al plan, correlativas inexistentes, la regla de mismo año y
+cuatrimestre y los ciclos (incluyendo las correlativas ya cargadas). Si
+hay errores no se escribe nada y se devuelve el reporte por fila; si no,
+se escribe con un bulk_create por modelo en una transacción.
+'''
+
+import csv
+import io
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from openpyxl import load_workbook
+
+from gestion_academica import models
+from gestion_academica.services.estadisticas_reportes.cache_resultados import invalidar_estadisticas
+
+
+COLUMNAS_ENTERAS = ("cuatrimestre", "anio", "horas_teoria", "horas_practica", "horas_semanales")
+ALIAS_COLUMNAS = {"año": "anio", "código": "codigo", "correlativa": "correlativas"}
+TIPOS_ASIGNATURA = {c for c, _ in models.Asignatura.TIPO_ASIGNATURA_CHOICES}
+TIPOS_DURACION = {c for c, _ in models.Asignatura.TIPO_DURACION_CHOICES}
+
+
+class ErrorImportacion(Exception):
+    """El archivo no se pudo leer (formato, encabezados)."""
+
+
+@dataclass
+class FilaPlan:
+    fila: int  # número de fila en la planilla (la 1 es el encabezado)
+    codigo: str
+    datos: dict
+    correlativas: list = field(default_factory=list)
+
+
+@dataclass
+class ResultadoImportacion:
+    errores: list = field(default_factory=list)
+    asignaturas_creadas: int = 0
+    plan_asignaturas_creadas: int = 0
+    correlativas_creadas: int = 0
+
+    def error(self, fila, campo, mensaje):
+        self.errores.append({"fila": fila, "campo": campo, "mensaje": mensaje})
+
+    @property
+    def valido(self):
+        return not self.errores
+
+    def resumen(self):
+        return {
+            "asignaturas_creadas": self.asignaturas_creadas,
+            "plan_asignaturas_creadas": self.plan_asignaturas_creadas,
+            "correlativas_creadas": self.correlativas_creadas,
+        }
+
+
+# ----------------------------------------------------------------
+# Lectura
+# ----------------------------------------------------------------
+
+def _normalizar_encabezado(valor, alias):
+    nombre = str(valor or "").strip().lower().replace(" ", "_")
+    return alias.get(nombre, nombre)
+
+
+def leer_planilla(archivo, nombre, requerida="codigo", alias=ALIAS_COLUMNAS):
+    """
+    Devuelve una lista de (número de fila, dict columna -> texto) a partir
+    de un XLSX o CSV; las filas vacías se omiten. Los encabezados se pasan
+    a minúsculas y se traducen con `alias`; la columna `requerida` debe estar.
+    """
+    if nombre.lower().endswith(".xlsx"):
+        try:
+            libro = load_workbook(io.BytesIO(archivo.read()), read_only=True, data_only=True)
+            filas = list(libro.active.iter_rows(values_only=True))
+            libro.close()
+        except Exception:
+            raise ErrorImportacion("No se pudo leer el archivo XLSX.")
+    elif nombre.lower().endswith(".csv"):
+        try:
+            texto = archivo.read().decode("utf-8-sig")
+            # el separador es el que más aparece en el encabezado (Excel en
+            # español exporta con ";")
+            encabezado = texto.split("\n", 1)[0]
+            separador = max(",;\t", key=encabezado.count)
+            filas = list(csv.reader(io.StringIO(texto), delimiter=separador))
+        except (UnicodeDecodeError, csv.Error):
+            raise ErrorImportacion("No se pudo leer el archivo CSV (se espera UTF-8).")
+    else:
+        raise ErrorImportacion("Formato no soportado. Use un archivo .xlsx o .csv.")
+
+    filas = iter(filas)
+    encabezados = [_normalizar_encabezado(v, alias) for v in next(filas, [])]
+    if requerida not in encabezados:
+        raise ErrorImportacion(f"La planilla debe tener una columna '{requerida}'.")
+
+    registros = []
+    for numero, valores in enumerate(filas, start=2):
+        if not any(v not in (None, "") for v in valores):
+            continue
+        registros.append((numero, {
+            columna: "" if valor is None else str(valor).strip()
+            for columna, valor in zip(encabezados, valores)
+        }))
+    return registros
+
+
+# ----------------------------------------------------------------
+# Validación en memoria
+# ----------------------------------------------------------------
+
+def _entero(texto, resultado, fila, columna):
+    if texto in ("", None):
+        return None
+    try:
+        valor = int(float(texto))  # las celdas numéricas de Excel llegan como "4.0"
+    except ValueError:
+        resultado.error(fila, columna, "Debe ser un número entero.")
+        return None
+    if valor < 0:
+        resultado.error(fila, columna, "No puede ser negativo.")
+        return None
+    return valor
+
+
+def _parsear_filas(registros, resultado):
+    filas, vistas = [], {}
+    for numero, registro in registros:
+        codigo = registro.get("codigo", "")
+        if not codigo:
+            resultado.error(numero, "codigo", "Campo obligatorio.")
+            continue
+        if codigo in vistas:
+            resultado.error(numero, "codigo", f"Código repetido (ya aparece en la fila {vistas[codigo]}).")
+            continue
+        vistas[codigo] = numero
+
+        datos = {
+            "nombre": registro.get("nombre", ""),
+            "tipo_asignatura": registro.get("tipo_asignatura", "").upper(),
+            "tipo_duracion": registro.get("tipo_duracion", "").upper(),
+        }
+        for columna in COLUMNAS_ENTERAS:
+            datos[columna] = _entero(registro.get(columna, ""), resultado, numero, columna)
+        if datos["anio"] is None and not registro.get("anio"):
+            datos["anio"] = 1
+
+        correlativas = [
+            c.strip() for c in registro.get("correlativas", "").replace(";", ",").split(",") if c.strip()
+        ]
+        filas.append(FilaPlan(numero, codigo, datos, correlativas))
+    return filas
+
+
+def _validar_asignaturas(filas, existentes, resultado):
+    """Datos obligatorios de las asignaturas nuevas; las existentes deben estar activas."""
+    for fila in filas:
+        asignatura = existentes.get(fila.codigo)
+        if asignatura is not None:
+            if not asignatura.activo:
+                resultado.error(fila.fila, "codigo",
+                                "No se puede asociar una asignatura inactiva al plan de estudio.")
+            continue
+        if not fila.datos["nombre"]:
+            resultado.error(fila.fila, "nombre", "Obligatorio para una asignatura nueva.")
+        if fila.datos["tipo_asignatura"] not in TIPOS_ASIGNATURA:
+            resultado.error(fila.fila, "tipo_asignatura", f"Use {' o '.join(sorted(TIPOS_ASIGNATURA))}.")
+        if fila.datos["tipo_duracion"] not in TIPOS_DURACION:
+            resultado.error(fila.fila, "tipo_duracion", f"Use {' o '.join(sorted(TIPOS_DURACION))}.")
+        if fila.datos["cuatrimestre"] is None:
+            resultado.error(fila.fila, "cuatrimestre", "Obligatorio para una asignatura nueva.")
+
+
+def _buscar_ciclo(grafo):
+    """Devuelve un ciclo (lista de códigos) del grafo código -> requeridas, o None."""
+    BLANCO, GRIS, NEGRO = 0, 1, 2
+    color = dict.fromkeys(grafo, BLANCO)
+
+    for inicio in grafo:
+        if color[inicio] != BLANCO:
+            continue
+        camino, pila = [], [(inicio, iter(grafo[inicio]))]
+        color[inicio] = GRIS
+        camino.append(inicio)
+        while pila:
+            nodo, vecinos = pila[-1]
+            siguiente = next(vecinos, None)
+            if siguiente is None:
+                pila.pop()
+                camino.pop()
+                color[nodo] = NEGRO
+            elif color.get(siguiente, NEGRO) == GRIS:
+                return camino[camino.index(siguiente):] + [siguiente]
+            elif color.get(siguiente) == BLANCO:
+                color[siguiente] = GRIS
+                camino.append(siguiente)
+                pila.append((siguiente, iter(grafo[siguiente])))
+    return None
+
+
+def _validar_correlativas(filas, en_plan, correlativas_plan, cuatrimestres, resultado):
+    """
+    en_plan: código -> (anio, cuatrimestre) de lo que ya está en el plan.
+    correlativas_plan: [(código, código requerido)] ya cargadas.
+    cuatrimestres: código -> cuatrimestre de las filas del archivo.
+    """
+    ubicacion = dict(en_plan)
+    for fila in filas:
+        ubicacion[fila.codigo] = (fila.datos["anio"], cuatrimestres.get(fila.codigo))
+
+    grafo = {codigo: set() for codigo in ubicacion}
+    for origen, requerida in correlativas_plan:
+        grafo.setdefault(origen, set()).add(requerida)
+
+    fila_de = {}
+    for fila in filas:
+        fila_de[fila.codigo] = fila.fila
+        for requerida in fila.correlativas:
+            if requerida == fila.codigo:
+                resultado.error(fila.fila, "correlativas", "Una asignatura no puede ser correlativa de sí misma.")
+            elif requerida not in ubicacion:
+                resultado.error(fila.fila, "correlativas",
+                                f"'{requerida}' no está en la planilla ni en el plan de estudio.")
+            elif ubicacion[requerida] == ubicacion[fila.codigo]:
+                resultado.error(fila.fila, "correlativas",
+                                f"'{requerida}': no se pueden establecer correlativas entre asignaturas "
+                                "del mismo año y cuatrimestre.")
+            else:
+                grafo[fila.codigo].add(requerida)
+
+    # un ciclo por vez: se informa, se corta una arista y se sigue buscando.
+    # Los ciclos que ya estaban en el plan no son culpa de la planilla.
+    while (ciclo := _buscar_ciclo(grafo)) is not None:
+        origen = next((c for c in ciclo if c in fila_de), None)
+        if origen is not None:
+            resultado.error(fila_de[origen], "correlativas",
+                            f"Correlatividad circular: {' -> '.join(ciclo)}.")
+        grafo[ciclo[0]].discard(ciclo[1])
+
+
+# ----------------------------------------------------------------
+# Importación
+# ----------------------------------------------------------------
+
+def importar_plan(plan, registros):
+    """
+    `registros`: salida de leer_planilla(). Valida y, si no hay errores, crea asignaturas, PlanAsignatura y
+    correlativas del plan. Devuelve un ResultadoImportacion.
+    """
+    resultado = ResultadoImportacion()
+    filas = _parsear_filas(registros, resultado)
+    if not filas and not resultado.errores:
+        resultado.error(None, None, "La planilla no tiene filas.")
+    codigos = [f.codigo for f in filas]
+
+    # lo que ya existe, en tres consultas
+    existentes = {a.codigo: a for a in models.Asignatura.objects.filter(codigo__in=codigos)}
+    en_plan = {
+        pa["asignatura__codigo"]: (pa["anio"], pa["asignatura__cuatrimestre"])
+        for pa in models.PlanAsignatura.objects.filter(plan_de_estudio=plan).values(
+            "anio", "asignatura__codigo", "asignatura__cuatrimestre")
+    }
+    correlativas_plan = list(
+        models.Correlativa.objects.filter(plan_asignatura__plan_de_estudio=plan).values_list(
+            "plan_asignatura__asignatura__codigo", "correlativa_requerida__asignatura__codigo")
+    )
+
+    for fila in filas:
+        if fila.codigo in en_plan:
+            resultado.error(fila.fila, "codigo", "Esta asignatura ya está asociada a este plan.")
+    _validar_asignaturas(filas, existentes, resultado)
+
+    cuatrimestres = {
+        f.codigo: existentes[f.codigo].cuatrimestre if f.codigo in existentes else f.datos["cuatrimestre"]
+        for f in filas
+    }
+    _validar_correlativas(filas, en_plan, correlativas_plan, cuatrimestres, resultado)
+
+    if not resultado.valido:
+        resultado.errores.sort(key=lambda e: (e["fila"] is not None, e["fila"] or 0))
+        return resultado
+
+    with transaction.atomic():
+        nuevas = models.Asignatura.objects.bulk_create([
+            models.Asignatura(
+                codigo=f.codigo,
+                nombre=f.datos["nombre"],
+                tipo_asignatura=f.datos["tipo_asignatura"],
+                tipo_duracion=f.datos["tipo_duracion"],
+                cuatrimestre=f.datos["cuatrimestre"],
+            )
+            for f in filas if f.codigo not in existentes
+        ])
+        asignaturas = {**existentes, **{a.codigo: a for a in nuevas}}
+
+        plan_asignaturas = models.PlanAsignatura.objects.bulk_create([
+            models.PlanAsignatura(
+                plan_de_estudio=plan,
+                asignatura=asignaturas[f.codigo],
+                anio=f.datos["anio"],
+                horas_teoria=f.datos["horas_teoria"] or 0,
+                horas_practica=f.datos["horas_practica"] or 0,
+                horas_semanales=f.datos["horas_semanales"] or 0,
+                # bulk_create no pasa por save()
+                horas_totales=(f.datos["horas_teoria"] or 0) + (f.datos["horas_practica"] or 0),
+            )
+            for f in filas
+        ])
+        por_codigo = {pa.asignatura.codigo: pa.pk for pa in plan_asignaturas}
+        faltantes = {r for f in filas for r in f.correlativas if r not in por_codigo}
+        if faltantes:
+            por_codigo.update(
+                models.PlanAsignatura.objects.filter(
+                    plan_de_estudio=plan, asignatura__codigo__in=faltantes
+                ).values_list("asignatura__codigo", "id")
+            )
+
+        correlativas = models.Correlativa.objects.bulk_create([
+            models.Correlativa(
+                plan_asignatura_id=por_codigo[f.codigo],
+                correlativa_requerida_id=por_codigo[requerida],
+            )
+            for f in filas for requerida in dict.fromkeys(f.correlativas)
+        ])
+
+    # bulk_create no dispara señales
+    invalidar_estadisticas()
+    resultado.asignaturas_creadas = len(nuevas)
+    resultado.plan_asignaturas_creadas = len(plan_asignaturas)
+    resultado.correlativas_creadas = len(correlativas)
+    return resultado
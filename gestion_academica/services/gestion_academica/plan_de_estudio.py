@@ -3,8 +3,11 @@
 from rest_framework.exceptions import ValidationError, NotFound
 from gestion_academica import models
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection, transaction
 from django.shortcuts import get_object_or_404
 
+from gestion_academica.services.estadisticas_reportes.cache_resultados import invalidar_estadisticas
+
 
 def listar_planes():
     return models.PlanDeEstudio.objects.select_related("carrera", "documento").prefetch_related("asignaturas")
@@ -88,6 +91,77 @@ def cambiar_vigencia(pk, nueva_vigencia: bool):
     plan.save(update_fields=["esta_vigente", "updated_at"])
     return plan
 
+def clonar_plan(pk, data, usuario):
+    """
+    Crea un plan nuevo para la misma carrera copiando las asignaturas del
+    plan `pk` (año y horas), sus correlativas y, si data["incluir_comisiones"],
+    las comisiones activas. Cada tabla se copia con un único
+    INSERT ... SELECT: las filas nuevas se emparejan con las originales por
+    asignatura (única dentro de un plan). Si el nuevo plan es vigente se
+    desactivan los demás de la carrera.
+    Devuelve (plan, {"asignaturas": n, "correlativas": n, "comisiones": n}).
+    """
+    original = obtener_plan(pk)
+    incluir_comisiones = data.pop("incluir_comisiones", False)
+    esta_vigente = data.get("esta_vigente", True)
+
+    plan_asignatura = models.PlanAsignatura._meta.db_table
+    correlativa = models.Correlativa._meta.db_table
+    comision = models.Comision._meta.db_table
+    copiadas = {"asignaturas": 0, "correlativas": 0, "comisiones": 0}
+
+    with transaction.atomic():
+        if original.carrera_id and esta_vigente:
+            _desactivar_planes_anteriores(original.carrera_id)
+        plan = models.PlanDeEstudio.objects.create(
+            carrera_id=original.carrera_id, creado_por=usuario, **data)
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"""
+                INSERT INTO {plan_asignatura}
+                    (plan_de_estudio_id, asignatura_id, anio, horas_teoria, horas_practica,
+                     horas_semanales, horas_totales, created_at, updated_at)
+                SELECT %s, asignatura_id, anio, horas_teoria, horas_practica,
+                       horas_semanales, horas_totales, now(), now()
+                FROM {plan_asignatura}
+                WHERE plan_de_estudio_id = %s
+            """, [plan.id, original.id])
+            copiadas["asignaturas"] = cursor.rowcount
+
+            # (original -> nuevo) de cada extremo de la correlativa
+            cursor.execute(f"""
+                INSERT INTO {correlativa} (plan_asignatura_id, correlativa_requerida_id)
+                SELECT nuevo_origen.id, nuevo_requerida.id
+                FROM {correlativa} c
+                JOIN {plan_asignatura} origen ON origen.id = c.plan_asignatura_id
+                JOIN {plan_asignatura} requerida ON requerida.id = c.correlativa_requerida_id
+                JOIN {plan_asignatura} nuevo_origen
+                  ON nuevo_origen.plan_de_estudio_id = %s AND nuevo_origen.asignatura_id = origen.asignatura_id
+                JOIN {plan_asignatura} nuevo_requerida
+                  ON nuevo_requerida.plan_de_estudio_id = %s AND nuevo_requerida.asignatura_id = requerida.asignatura_id
+                WHERE origen.plan_de_estudio_id = %s
+            """, [plan.id, plan.id, original.id])
+            copiadas["correlativas"] = cursor.rowcount
+
+            if incluir_comisiones:
+                # las copias de plan y carrera se completan acá: el INSERT no pasa por save()
+                cursor.execute(f"""
+                    INSERT INTO {comision}
+                        (nombre, turno, promocionable, activo, plan_asignatura_id, plan_de_estudio_id, carrera_id)
+                    SELECT c.nombre, c.turno, c.promocionable, c.activo, nuevo.id, %s, %s
+                    FROM {comision} c
+                    JOIN {plan_asignatura} origen ON origen.id = c.plan_asignatura_id
+                    JOIN {plan_asignatura} nuevo
+                      ON nuevo.plan_de_estudio_id = %s AND nuevo.asignatura_id = origen.asignatura_id
+                    WHERE origen.plan_de_estudio_id = %s AND c.activo
+                """, [plan.id, plan.carrera_id, plan.id, original.id])
+                copiadas["comisiones"] = cursor.rowcount
+
+    # los INSERT directos no disparan señales
+    invalidar_estadisticas()
+    return plan, copiadas
+
+
 def eliminar_plan(pk):
     plan = obtener_plan(pk)
     if plan.asignaturas.exists():
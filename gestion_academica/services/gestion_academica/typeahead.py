@@ -0,0 +1,119 @@
+# gestion_academica/services/gestion_academica/typeahead.py
+
+'''
+Typeahead para los selectores del frontend (docente en la designación,
+asignatura en el plan, carrera en el coordinador): devuelve los primeros
+N pares {id, label} para un prefijo o una búsqueda aproximada, en lugar
+de bajar el listado completo y filtrar en el cliente.
+
+Se busca sobre una etiqueta normalizada (minúsculas, sin acentos) con un
+índice GIN de trigramas (migración 0020):
+- coincidencia por subcadena (LIKE '%x%', que el índice resuelve), con
+  las que empiezan por el texto primero;
+- si pg_trgm está instalada, también por similitud de palabras (<%), que
+  tolera errores de tipeo ("matematca" -> "Matemática").
+Sin pg_trgm se usa solo LIKE, sin índice.
+
+Los resultados respetan el Alcance del usuario (permissions/alcance.py):
+el administrador ve todo y el coordinador solo lo de sus carreras activas.
+'''
+
+import unicodedata
+from functools import lru_cache
+
+from django.db import connection
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
+
+from gestion_academica import models
+
+
+LIMITE_TYPEAHEAD = 10
+LIMITE_MAXIMO_TYPEAHEAD = 50
+
+# tipo -> expresión de la etiqueta normalizada (idéntica a la del índice)
+EXPRESIONES_TYPEAHEAD = {
+    "carrera": "lower(ma_sin_acentos(gestion_academica_carrera.codigo || ' ' || gestion_academica_carrera.nombre))",
+    "asignatura": "lower(ma_sin_acentos(gestion_academica_asignatura.codigo || ' ' || gestion_academica_asignatura.nombre))",
+    "docente": (
+        "lower(ma_sin_acentos(gestion_academica_usuario.last_name || ' ' || "
+        "gestion_academica_usuario.first_name || ' ' || gestion_academica_usuario.legajo))"
+    ),
+}
+TIPOS_TYPEAHEAD = tuple(EXPRESIONES_TYPEAHEAD)
+
+
+@lru_cache(maxsize=None)
+def trigramas_disponibles():
+    """True si pg_trgm está instalada en la base (se consulta una vez por proceso)."""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+def normalizar(texto):
+    """Minúsculas y sin acentos, como ma_sin_acentos() en la base."""
+    descompuesto = unicodedata.normalize("NFKD", texto.strip().lower())
+    return "".join(c for c in descompuesto if not unicodedata.combining(c))
+
+
+def _base(tipo, carreras_ids):
+    if tipo == "carrera":
+        qs = models.Carrera.objects.all()
+        if carreras_ids is not None:
+            qs = qs.filter(pk__in=carreras_ids)
+        return qs, "pk", ("codigo", "nombre")
+
+    if tipo == "asignatura":
+        qs = models.Asignatura.objects.filter(activo=True)
+        if carreras_ids is not None:
+            qs = qs.filter(pk__in=models.PlanAsignatura.objects.filter(
+                plan_de_estudio__carrera_id__in=carreras_ids).values("asignatura_id"))
+        return qs, "pk", ("codigo", "nombre")
+
+    # docentes: se busca sobre Usuario (índice) y se devuelve el id del Docente
+    qs = models.Usuario.objects.filter(docente__activo=True)
+    if carreras_ids is not None:
+        qs = qs.filter(pk__in=models.DocenteCarrera.objects.filter(
+            carrera_id__in=carreras_ids).values("docente__usuario_id"))
+    return qs, "docente__id", ("last_name", "first_name", "legajo")
+
+
+def _etiqueta(tipo, fila):
+    if tipo == "docente":
+        apellido, nombre, legajo = fila
+        return f"{apellido}, {nombre} ({legajo})"
+    codigo, nombre = fila
+    return f"{codigo} - {nombre}"
+
+
+def sugerir(tipo, texto, alcance, limite=LIMITE_TYPEAHEAD, carrera_id=None):
+    """
+    Devuelve hasta `limite` {"id", "label"} de `tipo` para `texto`.
+    Con carrera_id se acota a esa carrera (dentro del alcance).
+    """
+    consulta = normalizar(texto)
+    if not consulta:
+        return []
+
+    carreras_ids = alcance.carreras_ids
+    if carrera_id is not None:
+        carreras_ids = {carrera_id} if alcance.incluye_carrera(carrera_id) else set()
+    if carreras_ids is not None and not carreras_ids:
+        return []
+
+    qs, campo_id, campos = _base(tipo, carreras_ids)
+    expresion = EXPRESIONES_TYPEAHEAD[tipo]
+    patron = consulta.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    coincide = Q(RawSQL(f"{expresion} LIKE %s", [f"%{patron}%"], output_field=BooleanField()))
+    orden = ["-al_inicio"]
+    qs = qs.annotate(al_inicio=RawSQL(f"{expresion} LIKE %s", [f"{patron}%"], output_field=BooleanField()))
+    if trigramas_disponibles():
+        coincide |= Q(RawSQL(f"%s <%% {expresion}", [consulta], output_field=BooleanField()))
+        qs = qs.annotate(similitud=RawSQL(
+            f"word_similarity(%s, {expresion})", [consulta], output_field=FloatField()))
+        orden.append("-similitud")
+
+    filas = qs.filter(coincide).order_by(*orden, *campos).values_list(campo_id, *campos)[:limite]
+    return [{"id": fila[0], "label": _etiqueta(tipo, fila[1:])} for fila in filas]
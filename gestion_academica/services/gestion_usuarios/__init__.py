@@ -0,0 +1,2 @@
+from .notificaciones import *
+from .alta_masiva import *
@@ -0,0 +1,258 @@
+# gestion_academica/services/gestion_usuarios/alta_masiva.py
+
+'''
+Alta masiva de docentes desde una planilla (CSV o XLSX).
+
+Una fila por docente, con columnas:
+    legajo, first_name (o nombre), last_name (o apellido), email,
+    username, celular, fecha_nacimiento, modalidad, caracter, dedicacion,
+    password
+Sólo legajo, nombre, apellido y email son obligatorias; username toma el
+legajo si falta y los catálogos se buscan por nombre (sin distinguir
+mayúsculas).
+
+El alta por UsuarioSerializer hace, por usuario, un hash PBKDF2 completo
+(create_user), roles.set y Docente.objects.create. Acá:
+- todo se valida en memoria con una consulta por tabla: datos de la fila,
+  repetidos dentro del archivo (error) y legajo/email/username que ya
+  existen en la base (se informan como duplicados y se saltean);
+- las contraseñas informadas se hashean en un pool de procesos (el hash
+  es CPU puro y el GIL no deja paralelizarlo con hilos). Sin contraseña se
+  guarda una inutilizable: el docente la define con el código de
+  recuperación (auth/recuperar/solicitar-codigo/);
+- se escribe con un bulk_create por modelo (Usuario, RolUsuario, Docente)
+  en una transacción.
+
+bulk_create no dispara señales: al final se invalida el caché de
+estadísticas.
+'''
+
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.db.models.functions import Lower
+
+from gestion_academica import models
+from gestion_academica.services.estadisticas_reportes.cache_resultados import invalidar_estadisticas
+
+
+ALIAS_COLUMNAS_DOCENTE = {
+    "nombre": "first_name",
+    "apellido": "last_name",
+    "usuario": "username",
+    "correo": "email",
+    "contraseña": "password",
+    "carácter": "caracter",
+    "dedicación": "dedicacion",
+}
+COLUMNAS_OBLIGATORIAS = ("legajo", "first_name", "last_name", "email")
+CATALOGOS = {
+    "modalidad": models.Modalidad,
+    "caracter": models.Caracter,
+    "dedicacion": models.Dedicacion,
+}
+PATRON_EMAIL = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+TAMANIO_LOTE = 500
+HASHES_POR_TAREA = 16  # contraseñas que recibe cada proceso por envío
+
+
+@dataclass
+class FilaDocente:
+    fila: int
+    usuario: dict
+    catalogos: dict
+    password: str = ""
+
+
+@dataclass
+class ResultadoAltaMasiva:
+    errores: list = field(default_factory=list)
+    duplicados: list = field(default_factory=list)
+    creados: int = 0  # en simulación, los que se crearían
+    sin_contrasena: int = 0
+    simulacion: bool = False
+
+    def error(self, fila, campo, mensaje):
+        self.errores.append({"fila": fila, "campo": campo, "mensaje": mensaje})
+
+    def duplicado(self, fila, campo, valor):
+        self.duplicados.append({"fila": fila, "campo": campo, "valor": valor})
+
+    @property
+    def valido(self):
+        return not self.errores
+
+    def resumen(self):
+        return {
+            "creados": self.creados,
+            "sin_contrasena": self.sin_contrasena,
+            "duplicados": self.duplicados,
+            "simulacion": self.simulacion,
+        }
+
+
+# ----------------------------------------------------------------
+# Validación en memoria
+# ----------------------------------------------------------------
+
+def _fecha(texto, resultado, fila):
+    if not texto:
+        return None
+    try:
+        # las celdas de fecha de Excel llegan como "1980-05-01 00:00:00"
+        return date.fromisoformat(texto[:10])
+    except ValueError:
+        resultado.error(fila, "fecha_nacimiento", "Fecha inválida (se espera AAAA-MM-DD).")
+        return None
+
+
+def _parsear_filas(registros, catalogos, resultado):
+    filas = []
+    for numero, datos in registros:
+        errores_previos = len(resultado.errores)
+        for columna in COLUMNAS_OBLIGATORIAS:
+            if not datos.get(columna):
+                resultado.error(numero, columna, "Campo obligatorio.")
+
+        email = datos.get("email", "").lower()
+        if email and not PATRON_EMAIL.match(email):
+            resultado.error(numero, "email", "Email inválido.")
+
+        elegidos = {}
+        for columna in CATALOGOS:
+            nombre = datos.get(columna, "")
+            if not nombre:
+                continue
+            if nombre.lower() not in catalogos[columna]:
+                resultado.error(numero, columna, f"No existe la {columna} '{nombre}'.")
+                continue
+            elegidos[f"{columna}_id"] = catalogos[columna][nombre.lower()]
+
+        usuario = {
+            "legajo": datos.get("legajo", ""),
+            "username": datos.get("username") or datos.get("legajo", ""),
+            "first_name": datos.get("first_name", ""),
+            "last_name": datos.get("last_name", ""),
+            "email": email,
+            "celular": datos.get("celular") or None,
+            "fecha_nacimiento": _fecha(datos.get("fecha_nacimiento", ""), resultado, numero),
+        }
+        if len(resultado.errores) == errores_previos:
+            filas.append(FilaDocente(numero, usuario, elegidos, datos.get("password", "")))
+    return filas
+
+
+def _descartar_repetidos(filas, resultado):
+    """Legajo, email o username repetidos dentro del mismo archivo son error."""
+    vistos = {"legajo": {}, "email": {}, "username": {}}
+    for fila in filas:
+        for campo, primeras in vistos.items():
+            valor = fila.usuario[campo].lower()
+            if valor in primeras:
+                resultado.error(fila.fila, campo, f"Repetido en la fila {primeras[valor]}.")
+            else:
+                primeras[valor] = fila.fila
+
+
+def _descartar_existentes(filas, resultado):
+    """Los docentes que ya están en la base se informan y no se crean."""
+    legajos = {f.usuario["legajo"] for f in filas}
+    emails = {f.usuario["email"] for f in filas}
+    usernames = {f.usuario["username"] for f in filas}
+    existentes = {
+        "legajo": set(models.Usuario.objects.filter(legajo__in=legajos).values_list("legajo", flat=True)),
+        "email": set(models.Usuario.objects.annotate(email_min=Lower("email"))
+                     .filter(email_min__in=emails).values_list("email_min", flat=True)),
+        "username": set(models.Usuario.objects.filter(username__in=usernames).values_list("username", flat=True)),
+    }
+    nuevas = []
+    for fila in filas:
+        repetidos = [c for c, valores in existentes.items() if fila.usuario[c] in valores]
+        for campo in repetidos:
+            resultado.duplicado(fila.fila, campo, fila.usuario[campo])
+        if not repetidos:
+            nuevas.append(fila)
+    return nuevas
+
+
+# ----------------------------------------------------------------
+# Hash de contraseñas
+# ----------------------------------------------------------------
+
+def _hashear_lote(passwords):
+    return [make_password(p) for p in passwords]
+
+
+def hashear_contrasenas(passwords, procesos=1):
+    """
+    Devuelve los hashes de `passwords` en el mismo orden. Con procesos > 1
+    reparte el trabajo en un ProcessPoolExecutor; las vacías quedan como
+    contraseña inutilizable (sin costo de hash).
+    """
+    indices = [i for i, p in enumerate(passwords) if p]
+    hashes = [make_password(None) for _ in passwords]
+    claras = [passwords[i] for i in indices]
+    if procesos > 1 and len(claras) > 1:
+        lotes = [claras[i:i + HASHES_POR_TAREA] for i in range(0, len(claras), HASHES_POR_TAREA)]
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            calculados = [h for lote in pool.map(_hashear_lote, lotes) for h in lote]
+    else:
+        calculados = _hashear_lote(claras)
+    for i, hash_ in zip(indices, calculados):
+        hashes[i] = hash_
+    return hashes
+
+
+# ----------------------------------------------------------------
+# Alta
+# ----------------------------------------------------------------
+
+def alta_masiva_docentes(registros, procesos=1, confirmar=True):
+    """
+    Da de alta los docentes de `registros` (lista de (fila, dict) como la
+    que devuelve leer_planilla). Si hay errores no escribe nada; con
+    confirmar=False sólo valida (simulación).
+    """
+    resultado = ResultadoAltaMasiva(simulacion=not confirmar)
+    catalogos = {
+        columna: {nombre.lower(): pk for pk, nombre in modelo.objects.values_list("id", "nombre")}
+        for columna, modelo in CATALOGOS.items()
+    }
+    filas = _parsear_filas(registros, catalogos, resultado)
+    _descartar_repetidos(filas, resultado)
+    if not resultado.valido:
+        return resultado
+    filas = _descartar_existentes(filas, resultado)
+    resultado.sin_contrasena = sum(1 for f in filas if not f.password)
+    if not confirmar:
+        resultado.creados = len(filas)
+        return resultado
+    if not filas:
+        return resultado
+
+    hashes = hashear_contrasenas([f.password for f in filas], procesos)
+    rol_docente, _ = models.Rol.objects.get_or_create(
+        nombre__iexact="Docente", defaults={"nombre": "Docente"})
+
+    with transaction.atomic():
+        usuarios = models.Usuario.objects.bulk_create(
+            [models.Usuario(password=h, is_active=True, **f.usuario) for f, h in zip(filas, hashes)],
+            batch_size=TAMANIO_LOTE,
+        )
+        models.RolUsuario.objects.bulk_create(
+            [models.RolUsuario(usuario=u, rol=rol_docente) for u in usuarios],
+            batch_size=TAMANIO_LOTE,
+        )
+        models.Docente.objects.bulk_create(
+            [models.Docente(usuario=u, **f.catalogos) for u, f in zip(usuarios, filas)],
+            batch_size=TAMANIO_LOTE,
+        )
+
+    # bulk_create no dispara señales
+    invalidar_estadisticas()
+    resultado.creados = len(usuarios)
+    return resultado
@@ -0,0 +1,343 @@
+# gestion_academica/services/gestion_usuarios/notificaciones.py
+
+import hashlib
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, DateTimeField, F, Min, Q, Value
+from django.db.models.functions import Coalesce, Greatest, Least
+from django.utils import timezone
+
+from gestion_academica import models
+from .tiempo_real import publicar_evento_notificacion
+
+
+DIAS_POSPOSICION = 7
+DIAS_RETENCION_LEIDAS = 90
+TAMANIO_LOTE_RETENCION = 1000
+
+
+# --------------------------
+# Contadores de la bandeja
+# --------------------------
+
+def _estado_notificacion(usuario_notificacion, ahora):
+    """
+    Devuelve (sin_leer, pospuesta) para una UsuarioNotificacion:
+    - sin_leer: no fue leída ni archivada.
+    - pospuesta: sin_leer y con un recordatorio todavía en el futuro.
+    """
+    sin_leer = not usuario_notificacion.leida and not usuario_notificacion.eliminado
+    pospuesta = (
+        sin_leer
+        and usuario_notificacion.fecha_recordatorio is not None
+        and usuario_notificacion.fecha_recordatorio > ahora
+    )
+    return sin_leer, pospuesta
+
+
+def recalcular_contador_notificaciones(usuario_id):
+    """
+    Recalcula desde cero los contadores de un usuario (una sola consulta agregada).
+    Se usa al crear el contador y cuando vence el recordatorio más cercano.
+    """
+    ahora = timezone.now()
+    pospuesta = Q(fecha_recordatorio__gt=ahora)
+    valores = models.UsuarioNotificacion.objects.filter(
+        usuario_id=usuario_id,
+        leida=False,
+        eliminado=False,
+    ).aggregate(
+        sin_leer=Count("id"),
+        pospuestas=Count("id", filter=pospuesta),
+        proximo_recordatorio=Min("fecha_recordatorio", filter=pospuesta),
+    )
+
+    actualizados = models.ContadorNotificaciones.objects.filter(usuario_id=usuario_id).update(
+        version=F("version") + 1, updated_at=ahora, **valores
+    )
+    if not actualizados:
+        try:
+            with transaction.atomic():
+                models.ContadorNotificaciones.objects.create(
+                    usuario_id=usuario_id, version=1, **valores
+                )
+        except IntegrityError:
+            # otro proceso lo creó en paralelo: aplicamos los valores sobre ese
+            models.ContadorNotificaciones.objects.filter(usuario_id=usuario_id).update(
+                version=F("version") + 1, updated_at=ahora, **valores
+            )
+
+    return models.ContadorNotificaciones.objects.get(usuario_id=usuario_id)
+
+
+def actualizar_contador_notificaciones(usuario_id, sin_leer=0, pospuestas=0, recordatorio=None):
+    """
+    Aplica un delta a los contadores con un único UPDATE.
+    Si el contador no existe o su recordatorio más cercano ya venció,
+    se recalcula completo en lugar de aplicar el delta.
+    """
+    if not sin_leer and not pospuestas and recordatorio is None:
+        return
+
+    ahora = timezone.now()
+    cambios = {
+        "sin_leer": Greatest(F("sin_leer") + sin_leer, 0),
+        "pospuestas": Greatest(F("pospuestas") + pospuestas, 0),
+        "version": F("version") + 1,
+        "updated_at": ahora,
+    }
+    if recordatorio is not None:
+        nuevo = Value(recordatorio, output_field=DateTimeField())
+        cambios["proximo_recordatorio"] = Least(Coalesce("proximo_recordatorio", nuevo), nuevo)
+
+    actualizados = models.ContadorNotificaciones.objects.filter(
+        Q(proximo_recordatorio__isnull=True) | Q(proximo_recordatorio__gt=ahora),
+        usuario_id=usuario_id,
+    ).update(**cambios)
+
+    if not actualizados:
+        recalcular_contador_notificaciones(usuario_id)
+
+
+def _registrar_transicion(usuario_notificacion, antes, ahora):
+    """Traduce el cambio de estado de una UsuarioNotificacion en deltas del contador."""
+    despues = _estado_notificacion(usuario_notificacion, ahora)
+    actualizar_contador_notificaciones(
+        usuario_notificacion.usuario_id,
+        sin_leer=int(despues[0]) - int(antes[0]),
+        pospuestas=int(despues[1]) - int(antes[1]),
+        recordatorio=usuario_notificacion.fecha_recordatorio if despues[1] else None,
+    )
+
+
+def obtener_contador_notificaciones(usuario):
+    """
+    Devuelve el contador del usuario en O(1).
+    Solo se recalcula si no existe o si venció un recordatorio
+    (la notificación pospuesta vuelve a estar visible).
+    """
+    contador = models.ContadorNotificaciones.objects.filter(usuario=usuario).first()
+    if contador is None:
+        return recalcular_contador_notificaciones(usuario.pk)
+    if contador.proximo_recordatorio and contador.proximo_recordatorio <= timezone.now():
+        return recalcular_contador_notificaciones(usuario.pk)
+    return contador
+
+
+# --------------------------
+# Emisión (tareas y serializers)
+# --------------------------
+
+def clave_notificacion(*partes):
+    """Hash estable de las partes que identifican una notificación."""
+    return hashlib.sha256("|".join(str(p) for p in partes).encode("utf-8")).hexdigest()
+
+
+def obtener_o_crear_notificacion(titulo, mensaje, tipo, creado_por=None, clave=None):
+    """
+    Busca la notificación por su clave (índice único) en lugar de comparar
+    el texto completo. Devuelve (notificacion, cambio) donde cambio indica
+    que se creó o que se actualizó su contenido.
+
+    - Sin clave: se deduplica por contenido exacto (tipo, título, mensaje, autor).
+    - Con clave (ej. "vencimientos:<usuario_id>"): hay una sola fila por
+      concepto y el mensaje, que incluye conteos variables, se actualiza en
+      el lugar en vez de crear una fila nueva en cada ejecución.
+    """
+    creado_por_id = creado_por.pk if creado_por else None
+    if clave is None:
+        clave = clave_notificacion(tipo, titulo, mensaje, creado_por_id)
+    else:
+        clave = clave_notificacion(clave)
+
+    notificacion, creada = models.Notificacion.objects.get_or_create(
+        clave=clave,
+        defaults={"titulo": titulo, "mensaje": mensaje, "tipo": tipo, "creado_por": creado_por},
+    )
+    if creada:
+        return notificacion, True
+    if notificacion.titulo == titulo and notificacion.mensaje == mensaje:
+        return notificacion, False
+
+    notificacion.titulo = titulo
+    notificacion.mensaje = mensaje
+    notificacion.creado_por = creado_por
+    notificacion.save(update_fields=["titulo", "mensaje", "creado_por"])
+    return notificacion, True
+
+
+def asignar_notificacion(usuario, notificacion, reiterar=True, forzar=False):
+    """
+    Asigna una notificación a un usuario manteniendo su contador.
+
+    Devuelve (usuario_notificacion, resultado) donde resultado es:
+    - "CREADA": es nueva para el usuario.
+    - "REACTIVADA": ya existía, no fue revisada ni pospuesta y se reitera.
+      Con forzar=True (cambió el contenido) se reactiva aunque ya la haya
+      leído o archivado; solo se respeta un recordatorio pendiente.
+    - "SIN_CAMBIOS": el usuario ya la leyó, archivó o pidió recordarla más tarde
+      (o reiterar=False).
+
+    En CREADA y REACTIVADA se publica el evento para los clientes SSE.
+    """
+    un, creada = models.UsuarioNotificacion.objects.get_or_create(
+        usuario=usuario,
+        notificacion=notificacion,
+    )
+    if creada:
+        actualizar_contador_notificaciones(usuario.pk, sin_leer=1)
+        publicar_evento_notificacion(un, "CREADA")
+        return un, "CREADA"
+
+    ahora = timezone.now()
+    if not reiterar and not forzar:
+        return un, "SIN_CAMBIOS"
+    if (un.leida or un.eliminado) and not forzar:
+        return un, "SIN_CAMBIOS"
+    if un.fecha_recordatorio and un.fecha_recordatorio > ahora:
+        return un, "SIN_CAMBIOS"
+
+    antes = _estado_notificacion(un, ahora)
+    un.leida = False
+    un.fecha_leida = None
+    un.eliminado = False
+    un.fecha_recordatorio = None
+    un.fecha_emision = ahora
+    un.save(update_fields=["leida", "fecha_leida", "eliminado", "fecha_recordatorio", "fecha_emision"])
+    _registrar_transicion(un, antes, ahora)
+    publicar_evento_notificacion(un, "REACTIVADA")
+    return un, "REACTIVADA"
+
+
+# --------------------------
+# Acciones del usuario sobre su bandeja
+# --------------------------
+
+def marcar_notificacion_leida(usuario_notificacion):
+    if usuario_notificacion.leida:
+        return usuario_notificacion
+
+    ahora = timezone.now()
+    antes = _estado_notificacion(usuario_notificacion, ahora)
+    usuario_notificacion.leida = True
+    usuario_notificacion.fecha_leida = ahora
+    usuario_notificacion.save(update_fields=["leida", "fecha_leida"])
+    _registrar_transicion(usuario_notificacion, antes, ahora)
+    return usuario_notificacion
+
+
+def posponer_notificacion(usuario_notificacion, dias=DIAS_POSPOSICION):
+    ahora = timezone.now()
+    antes = _estado_notificacion(usuario_notificacion, ahora)
+    usuario_notificacion.fecha_recordatorio = ahora + timedelta(days=dias)
+    usuario_notificacion.save(update_fields=["fecha_recordatorio"])
+    _registrar_transicion(usuario_notificacion, antes, ahora)
+    return usuario_notificacion
+
+
+def archivar_notificacion(usuario_notificacion):
+    ahora = timezone.now()
+    antes = _estado_notificacion(usuario_notificacion, ahora)
+    usuario_notificacion.eliminado = True
+    usuario_notificacion.save(update_fields=["eliminado"])
+    _registrar_transicion(usuario_notificacion, antes, ahora)
+    return usuario_notificacion
+
+
+# --------------------------
+# Acciones masivas (un único UPDATE filtrado)
+# --------------------------
+
+def _bandeja_visible(usuario, ahora):
+    """Lo que el usuario ve en la bandeja: no archivadas y sin recordatorio pendiente."""
+    return models.UsuarioNotificacion.objects.filter(
+        Q(fecha_recordatorio__isnull=True) | Q(fecha_recordatorio__lte=ahora),
+        usuario=usuario,
+        eliminado=False,
+    )
+
+
+def marcar_todas_leidas(usuario):
+    """
+    Marca como leídas todas las notificaciones visibles sin leer.
+    Ninguna de ellas está pospuesta, así que el contador se ajusta con un delta exacto.
+    """
+    ahora = timezone.now()
+    with transaction.atomic():
+        actualizadas = _bandeja_visible(usuario, ahora).filter(leida=False).update(
+            leida=True, fecha_leida=ahora
+        )
+        actualizar_contador_notificaciones(usuario.pk, sin_leer=-actualizadas)
+    return actualizadas
+
+
+def archivar_todas(usuario, solo_leidas=False):
+    """
+    Archiva las notificaciones visibles (o solo las ya leídas).
+    El UPDATE no informa cuántas estaban sin leer: se recalcula el contador.
+    """
+    ahora = timezone.now()
+    queryset = _bandeja_visible(usuario, ahora)
+    if solo_leidas:
+        queryset = queryset.filter(leida=True)
+    with transaction.atomic():
+        actualizadas = queryset.update(eliminado=True)
+        if actualizadas and not solo_leidas:
+            recalcular_contador_notificaciones(usuario.pk)
+    return actualizadas
+
+
+def posponer_varias(usuario, ids, dias=DIAS_POSPOSICION):
+    """Pospone un conjunto de notificaciones del usuario (ids de UsuarioNotificacion)."""
+    ahora = timezone.now()
+    with transaction.atomic():
+        actualizadas = models.UsuarioNotificacion.objects.filter(
+            usuario=usuario,
+            id__in=ids,
+            eliminado=False,
+        ).update(fecha_recordatorio=ahora + timedelta(days=dias))
+        if actualizadas:
+            recalcular_contador_notificaciones(usuario.pk)
+    return actualizadas
+
+
+# --------------------------
+# Retención (tarea nocturna)
+# --------------------------
+
+def archivar_notificaciones_antiguas(dias=DIAS_RETENCION_LEIDAS, lote=TAMANIO_LOTE_RETENCION):
+    """
+    Archiva por lotes las notificaciones leídas hace más de `dias` días.
+    Cada lote es un UPDATE corto por id para no bloquear la tabla; las leídas
+    no cuentan en el contador, así que no hay que ajustarlo.
+    """
+    limite = timezone.now() - timedelta(days=dias)
+    total = 0
+    while True:
+        ids = list(
+            models.UsuarioNotificacion.objects.filter(
+                leida=True, eliminado=False, fecha_leida__lt=limite
+            ).values_list("id", flat=True)[:lote]
+        )
+        if not ids:
+            break
+        total += models.UsuarioNotificacion.objects.filter(id__in=ids).update(eliminado=True)
+    return total
+
+
+def eliminar_notificaciones_huerfanas(dias=DIAS_RETENCION_LEIDAS, lote=TAMANIO_LOTE_RETENCION):
+    """Borra por lotes las Notificacion antiguas que ya no tienen destinatarios."""
+    limite = timezone.now() - timedelta(days=dias)
+    total = 0
+    while True:
+        ids = list(
+            models.Notificacion.objects.filter(
+                fecha_creacion__lt=limite, destinatarios__isnull=True
+            ).values_list("id", flat=True)[:lote]
+        )
+        if not ids:
+            break
+        borradas, _ = models.Notificacion.objects.filter(id__in=ids).delete()
+        total += borradas
+    return total
@@ -0,0 +1,126 @@
+# gestion_academica/services/gestion_usuarios/tiempo_real.py
+
+'''
+Canal de notificaciones en tiempo real.
+
+Las notificaciones nuevas o reactivadas se publican con pg_notify al
+asignarse (tareas programadas y DesignacionSerializer). Cada proceso
+ASGI mantiene UNA sola conexión en LISTEN, en un hilo propio, que
+reparte los eventos a las colas asyncio de los clientes SSE conectados.
+'''
+
+import json
+import select
+import threading
+import time
+import asyncio
+
+from django.db import connection, connections
+
+
+CANAL_NOTIFICACIONES = "notificaciones_usuario"
+TAMANIO_COLA_CLIENTE = 100
+
+
+def publicar_evento_notificacion(usuario_notificacion, evento):
+    """
+    Publica el evento en el canal de PostgreSQL. NOTIFY es transaccional:
+    si la escritura se revierte, el evento no llega a los clientes.
+    """
+    notificacion = usuario_notificacion.notificacion
+    payload = {
+        "evento": evento,
+        "usuario_id": usuario_notificacion.usuario_id,
+        "id": usuario_notificacion.pk,
+        "titulo": notificacion.titulo,
+        "tipo": notificacion.tipo,
+        "fecha_emision": usuario_notificacion.fecha_emision.isoformat(),
+    }
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_notify(%s, %s)", [CANAL_NOTIFICACIONES, json.dumps(payload)])
+
+
+class OyenteNotificaciones:
+    """
+    Listener único por proceso. Se inicia con la primera suscripción y
+    despacha cada NOTIFY a las colas de los clientes del usuario destino.
+    """
+
+    def __init__(self, alias="default"):
+        self.alias = alias
+        self._suscriptores = {}  # usuario_id -> set((loop, cola))
+        self._lock = threading.Lock()
+        self._hilo = None
+
+    # --- suscripciones (desde el event loop de ASGI) ---
+
+    def suscribir(self, usuario_id, iniciar=True):
+        cola = asyncio.Queue(maxsize=TAMANIO_COLA_CLIENTE)
+        entrada = (asyncio.get_running_loop(), cola)
+        with self._lock:
+            self._suscriptores.setdefault(usuario_id, set()).add(entrada)
+        if iniciar:
+            self._iniciar()
+        return cola
+
+    def desuscribir(self, usuario_id, cola):
+        with self._lock:
+            entradas = self._suscriptores.get(usuario_id, set())
+            entradas.difference_update({e for e in entradas if e[1] is cola})
+            if not entradas:
+                self._suscriptores.pop(usuario_id, None)
+
+    # --- hilo de escucha ---
+
+    def _iniciar(self):
+        with self._lock:
+            if self._hilo is not None and self._hilo.is_alive():
+                return
+            self._hilo = threading.Thread(
+                target=self._escuchar, name="oyente-notificaciones", daemon=True)
+            self._hilo.start()
+
+    def _conectar(self):
+        wrapper = connections[self.alias]
+        conexion = wrapper.get_new_connection(wrapper.get_connection_params())
+        conexion.autocommit = True
+        with conexion.cursor() as cursor:
+            cursor.execute(f"LISTEN {CANAL_NOTIFICACIONES};")
+        return conexion
+
+    def _escuchar(self):
+        espera = 1
+        while True:
+            try:
+                conexion = self._conectar()
+                espera = 1
+                while True:
+                    listos, _, _ = select.select([conexion], [], [], 30)
+                    if not listos:
+                        continue
+                    conexion.poll()
+                    while conexion.notifies:
+                        self._despachar(conexion.notifies.pop(0).payload)
+            except Exception as e:
+                print(f"[NOTIFICACIONES] Listener desconectado ({e}), reintentando en {espera}s")
+                time.sleep(espera)
+                espera = min(espera * 2, 60)
+
+    def _despachar(self, payload):
+        try:
+            evento = json.loads(payload)
+        except ValueError:
+            return
+        with self._lock:
+            entradas = list(self._suscriptores.get(evento.get("usuario_id"), ()))
+        for loop, cola in entradas:
+            loop.call_soon_threadsafe(_encolar, cola, evento)
+
+
+def _encolar(cola, evento):
+    # un cliente lento no debe acumular memoria: se descartan los eventos sobrantes
+    if not cola.full():
+        cola.put_nowait(evento)
+
+
+oyente_notificaciones = OyenteNotificaciones()
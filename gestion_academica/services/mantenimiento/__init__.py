@@ -0,0 +1,2 @@
+from .asesor_indices import *
+from .carga_fixtures import *
@@ -0,0 +1,335 @@
+# gestion_academica/services/mantenimiento/asesor_indices.py
+
+'''
+Asesor de índices a partir de una carga de consultas (workload).
+
+Cada consulta se pasa por EXPLAIN (FORMAT JSON) con enable_seqscan=off:
+así, en una base chica (desarrollo, tests), un Seq Scan que sobrevive
+significa que no hay ningún índice utilizable, y un Index Scan con
+"Filter" significa que el índice cubre solo parte del predicado. De los
+predicados se extraen las columnas (igualdad, booleanas, rango, IS NULL)
+y se propone un índice compuesto, parcial si hay condiciones IS NULL,
+salvo que uno existente ya lo cubra como prefijo.
+
+La carga puede venir de:
+- un archivo JSONL ({"sql", "params"}) grabado con RegistradorWorkload,
+  por ejemplo corriendo los tests con CAPTURAR_WORKLOAD=/ruta.jsonl;
+- un log de PostgreSQL (líneas "statement: ...") o un .sql separado por ";";
+- las consultas de referencia de workload_por_defecto().
+Las sentencias con parámetros $1..$n sin valores se explican con
+GENERIC_PLAN (PostgreSQL 16+).
+'''
+
+import json
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.apps import apps
+from django.db import DatabaseError, connection, models, transaction
+from django.db.migrations import AddIndex, Migration
+from django.db.migrations.loader import MigrationLoader
+from django.db.migrations.writer import MigrationWriter
+from django.utils import timezone
+
+
+APP_LABEL = "gestion_academica"
+SENTENCIAS_ANALIZABLES = ("select", "with", "update", "delete")
+
+
+@dataclass
+class SugerenciaIndice:
+    tabla: str
+    columnas: list
+    columnas_nulas: list = field(default_factory=list)
+    consultas: int = 0
+    motivo: str = ""
+
+    @property
+    def clave(self):
+        return (self.tabla, tuple(self.columnas), tuple(self.columnas_nulas))
+
+
+# ----------------------------------------------------------------
+# Captura y lectura de la carga
+# ----------------------------------------------------------------
+
+class RegistradorWorkload:
+    """execute_wrapper que agrega cada consulta ejecutada a un archivo JSONL."""
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+
+    def __call__(self, execute, sql, params, many, context):
+        if not many and sql.lstrip().lower().startswith(SENTENCIAS_ANALIZABLES):
+            with open(self.ruta, "a", encoding="utf-8") as archivo:
+                archivo.write(json.dumps(
+                    {"sql": sql, "params": list(params) if params else None}, default=str) + "\n")
+        return execute(sql, params, many, context)
+
+
+def leer_workload(ruta):
+    """Devuelve [(sql, params|None)] según el formato del archivo."""
+    with open(ruta, encoding="utf-8") as archivo:
+        contenido = archivo.read()
+
+    if ruta.endswith(".jsonl"):
+        consultas = []
+        for linea in contenido.splitlines():
+            if linea.strip():
+                fila = json.loads(linea)
+                consultas.append((fila["sql"], fila.get("params")))
+        return consultas
+
+    if "statement: " in contenido:
+        # log de PostgreSQL: la sentencia sigue a "statement: " y las
+        # líneas de continuación empiezan con un tab
+        sentencias, actual = [], None
+        for linea in contenido.splitlines():
+            if "statement: " in linea:
+                if actual:
+                    sentencias.append(actual)
+                actual = linea.split("statement: ", 1)[1]
+            elif actual is not None and linea.startswith(("\t", " ")):
+                actual += "\n" + linea.strip()
+            elif actual is not None:
+                sentencias.append(actual)
+                actual = None
+        if actual:
+            sentencias.append(actual)
+    else:
+        sentencias = re.split(r";\s*\n", contenido)
+
+    return [(s.strip().rstrip(";"), None) for s in sentencias if s.strip()]
+
+
+def workload_por_defecto():
+    """Patrones de acceso de las vistas, servicios y tareas del proyecto."""
+    from gestion_academica import models as m
+
+    ahora = timezone.now()
+    querysets = [
+        m.Designacion.objects.filter(docente_id=1, activo=True),
+        m.Designacion.objects.filter(comision_id=1, activo=True),
+        m.Designacion.objects.filter(carrera_id__in=[1], fecha_fin__isnull=True),
+        m.Designacion.objects.filter(fecha_fin__gte=ahora, fecha_fin__lte=ahora + timedelta(days=30)),
+        m.PlanDeEstudio.objects.filter(carrera_id=1, esta_vigente=True),
+        m.CarreraCoordinacion.objects.filter(coordinador_id=1, activo=True),
+        m.CarreraCoordinacion.objects.filter(carrera_id=1, activo=True),
+        m.Comision.objects.filter(carrera_id=1, activo=True),
+        m.UsuarioNotificacion.objects.filter(usuario_id=1, eliminado=False, leida=False),
+    ]
+    return [qs.query.sql_with_params() for qs in querysets]
+
+
+# ----------------------------------------------------------------
+# EXPLAIN y extracción de columnas
+# ----------------------------------------------------------------
+
+def explicar(sql, params=None):
+    """Plan JSON de la consulta, o None si no se pudo explicar."""
+    opciones = "FORMAT JSON"
+    if params is None and re.search(r"\$\d+", sql):
+        if connection.pg_version < 160000:
+            return None
+        opciones += ", GENERIC_PLAN"
+    if params is None:
+        # sin parámetros, los % literales no son placeholders: se escapan y
+        # se pasa una lista vacía para que el driver haga el reemplazo %% -> %
+        sql = sql.replace("%", "%%")
+    try:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute(f"EXPLAIN ({opciones}) {sql}", params or [])
+            plan = cursor.fetchone()[0]
+    except DatabaseError:
+        return None
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def _nodos(plan):
+    yield plan
+    for hijo in plan.get("Plans", []):
+        yield from _nodos(hijo)
+
+
+def _patron_columna(columna):
+    # admite columnas calificadas (d.activo) o entre comillas
+    return rf'(?<![\w."])(?:"?\w+"?\.)?"?{re.escape(columna)}"?(?![\w"])'
+
+
+def clasificar_columnas(expresion, columnas_tabla, booleanas):
+    """
+    Devuelve (igualdad, booleanas, rango, nulas) con las columnas de la
+    tabla que aparecen en la expresión, en orden de aparición.
+    """
+    resultado = {"igualdad": [], "booleanas": [], "rango": [], "nulas": []}
+    if not expresion:
+        return resultado
+    apariciones = []
+    for columna in columnas_tabla:
+        patron = _patron_columna(columna)
+        for coincidencia in re.finditer(patron, expresion):
+            resto = expresion[coincidencia.end():].lstrip()
+            if resto.startswith("IS NULL"):
+                tipo = "nulas"
+            elif re.match(r"=\s", resto) or resto.startswith("= ANY"):
+                tipo = "igualdad"
+            elif re.match(r"(<=|>=|<|>)\s", resto):
+                tipo = "rango"
+            elif columna in booleanas:
+                tipo = "booleanas"
+            else:
+                continue
+            apariciones.append((coincidencia.start(), tipo, columna))
+    for _, tipo, columna in sorted(apariciones):
+        if columna not in resultado[tipo]:
+            resultado[tipo].append(columna)
+    return resultado
+
+
+# ----------------------------------------------------------------
+# Análisis
+# ----------------------------------------------------------------
+
+def _modelos_por_tabla():
+    return {modelo._meta.db_table: modelo for modelo in apps.get_models()}
+
+
+def _columnas(modelo):
+    columnas = [f.column for f in modelo._meta.concrete_fields]
+    booleanas = {f.column for f in modelo._meta.concrete_fields if isinstance(f, models.BooleanField)}
+    return columnas, booleanas
+
+
+def indices_existentes(tabla):
+    with connection.cursor() as cursor:
+        restricciones = connection.introspection.get_constraints(cursor, tabla)
+    return [r["columns"] for r in restricciones.values() if r["index"] or r["unique"] or r["primary_key"]]
+
+
+def _cubierto(columnas, existentes):
+    return any(list(indice[: len(columnas)]) == list(columnas) for indice in existentes)
+
+
+def analizar_workload(consultas):
+    """
+    Explica cada consulta y devuelve (reporte, sugerencias). El reporte es
+    una lista de dicts por consulta con sus scans secuenciales y filtros
+    residuales; las sugerencias, índices no cubiertos ordenados por la
+    cantidad de consultas que los usarían.
+    """
+    por_tabla = _modelos_por_tabla()
+    existentes = {}
+    sugerencias = OrderedDict()
+    reporte = []
+
+    for sql, params in consultas:
+        if not sql.lstrip().lower().startswith(SENTENCIAS_ANALIZABLES):
+            continue
+        plan = explicar(sql, params)
+        if plan is None:
+            reporte.append({"sql": sql, "error": "no se pudo explicar"})
+            continue
+
+        hallazgos = []
+        for nodo in _nodos(plan):
+            tabla = nodo.get("Relation Name")
+            modelo = por_tabla.get(tabla)
+            filtro = nodo.get("Filter")
+            if modelo is None or not filtro:
+                continue
+            tipo_nodo = nodo["Node Type"]
+            if tipo_nodo == "Seq Scan":
+                motivo = "scan secuencial"
+                condicion_indice = None
+            elif tipo_nodo in ("Index Scan", "Index Only Scan", "Bitmap Heap Scan"):
+                indices = [nodo.get("Index Name")] if "Index Name" in nodo else [
+                    h["Index Name"] for h in _nodos(nodo) if "Index Name" in h]
+                motivo = f"filtro residual sobre {', '.join(indices)}"
+                condicion_indice = nodo.get("Index Cond") or nodo.get("Recheck Cond")
+            else:
+                continue
+
+            columnas_tabla, booleanas = _columnas(modelo)
+            columnas = clasificar_columnas(
+                " AND ".join(filter(None, [condicion_indice, filtro])), columnas_tabla, booleanas)
+            campos = columnas["igualdad"] + columnas["booleanas"] + columnas["rango"]
+            hallazgos.append({"tabla": tabla, "nodo": tipo_nodo, "filtro": filtro})
+            # una igualdad sobre la PK ya devuelve a lo sumo una fila
+            if not campos or modelo._meta.pk.column in columnas["igualdad"]:
+                continue
+
+            if tabla not in existentes:
+                existentes[tabla] = indices_existentes(tabla)
+            nulas = [c for c in columnas["nulas"] if c not in campos]
+            if not nulas and _cubierto(campos, existentes[tabla]):
+                continue
+
+            sugerencia = SugerenciaIndice(tabla, campos, nulas, motivo=motivo)
+            sugerencias.setdefault(sugerencia.clave, sugerencia).consultas += 1
+
+        reporte.append({"sql": sql, "hallazgos": hallazgos})
+
+    ordenadas = sorted(sugerencias.values(), key=lambda s: -s.consultas)
+    return reporte, ordenadas
+
+
+# ----------------------------------------------------------------
+# Migración
+# ----------------------------------------------------------------
+
+def _nombre_indice(modelo, campos, usados):
+    base = "idx_" + modelo._meta.model_name[:10] + "_" + "_".join(c[:4] for c in campos)
+    base = base[:28]
+    nombre, n = base, 1
+    while nombre in usados:
+        nombre = f"{base[:26]}_{n}"
+        n += 1
+    usados.add(nombre)
+    return nombre
+
+
+def indice_para(sugerencia, usados):
+    """SugerenciaIndice -> (modelo, models.Index) con nombres de campo de Django."""
+    modelo = _modelos_por_tabla()[sugerencia.tabla]
+    por_columna = {f.column: f.name for f in modelo._meta.concrete_fields}
+    campos = [por_columna[c] for c in sugerencia.columnas]
+    condicion = None
+    if sugerencia.columnas_nulas:
+        condicion = models.Q(**{f"{por_columna[c]}__isnull": True for c in sugerencia.columnas_nulas})
+    nombres_existentes = {i.name for i in modelo._meta.indexes}
+    indice = models.Index(
+        fields=campos, name=_nombre_indice(modelo, campos, usados | nombres_existentes), condition=condicion)
+    return modelo, indice
+
+
+def generar_migracion(sugerencias):
+    """
+    Arma la migración con un AddIndex por sugerencia de este app. Devuelve
+    (MigrationWriter, [(modelo, índice)]) o (None, []) si no hay nada que
+    agregar. Los índices deben copiarse también en Meta.indexes de cada
+    modelo para que makemigrations no los quite.
+    """
+    loader = MigrationLoader(None, ignore_no_migrations=True)
+    hojas = loader.graph.leaf_nodes(APP_LABEL)
+    usados = set()
+    indices = []
+    for sugerencia in sugerencias:
+        modelo, indice = indice_para(sugerencia, usados)
+        if modelo._meta.app_label == APP_LABEL:
+            indices.append((modelo, indice))
+    if not indices:
+        return None, []
+
+    ultima = hojas[0][1] if hojas else None
+    numero = int(ultima.split("_")[0]) + 1 if ultima else 1
+    migracion = Migration(f"{numero:04d}_indices_sugeridos", APP_LABEL)
+    migracion.dependencies = [hojas[0]] if hojas else []
+    migracion.operations = [
+        AddIndex(model_name=modelo._meta.model_name, index=indice) for modelo, indice in indices
+    ]
+    return MigrationWriter(migracion), indices
@@ -0,0 +1,242 @@
+# gestion_academica/services/mantenimiento/carga_fixtures.py
+
+'''
+Carga masiva de fixtures JSON (reemplazo de loaddata en cargar_datos).
+
+loaddata deserializa cada objeto y lo guarda de a uno (un INSERT o
+UPDATE+INSERT por fila, con señales). Acá:
+- el archivo se lee de a bloques y los objetos del arreglo se decodifican
+  uno por uno (raw_decode), sin cargar el JSON completo en memoria;
+- las FK se asignan por columna (campo_id); las claves naturales se
+  resuelven una vez y quedan en un diccionario;
+- las filas se insertan por modelo en lotes con un INSERT de varias filas
+  en modo raw (como loaddata: sin pre_save, así se respetan created_at y
+  updated_at del fixture) y ON CONFLICT (pk) DO UPDATE, que equivale al
+  "actualizar o crear" de loaddata;
+- todo corre en una transacción: las FK de PostgreSQL son diferidas, así
+  que el orden de los modelos dentro de la carga no importa;
+- al final se reinician las secuencias de los modelos cargados.
+
+No se disparan señales: quien use la carga debe correr los backfills que
+necesite (carrera copiada, versión de estadísticas).
+'''
+
+import json
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from django.apps import apps
+from django.core.management.color import no_style
+from django.db import connection, models, transaction
+from django.db.models.constants import OnConflict
+from django.utils import timezone
+
+
+TAMANIO_LECTURA = 64 * 1024  # caracteres leídos por bloque del archivo
+TAMANIO_LOTE = 2000  # filas por INSERT
+
+
+class ErrorFixture(Exception):
+    """Fixture con formato inválido o referencias que no se pueden resolver."""
+
+
+@dataclass
+class ResultadoCarga:
+    filas: dict = field(default_factory=lambda: defaultdict(int))
+    segundos: float = 0.0
+
+    @property
+    def total(self):
+        return sum(self.filas.values())
+
+
+# ----------------------------------------------------------------
+# Lectura incremental
+# ----------------------------------------------------------------
+
+def _saltar_separadores(buffer, pos):
+    while pos < len(buffer) and (buffer[pos].isspace() or buffer[pos] == ","):
+        pos += 1
+    return pos
+
+
+def leer_objetos(ruta, tamanio_lectura=TAMANIO_LECTURA):
+    """Genera los objetos del arreglo JSON de `ruta` sin leerlo completo."""
+    decoder = json.JSONDecoder()
+    with open(ruta, encoding="utf-8") as archivo:
+        buffer, pos, fin_archivo = "", 0, False
+
+        def completar():
+            nonlocal buffer, pos, fin_archivo
+            bloque = archivo.read(tamanio_lectura)
+            fin_archivo = not bloque
+            buffer, pos = buffer[pos:] + bloque, 0
+
+        completar()
+        pos = _saltar_separadores(buffer, pos)
+        if buffer[pos:pos + 1] != "[":
+            raise ErrorFixture(f"{ruta}: se esperaba un arreglo JSON.")
+        pos += 1
+
+        while True:
+            pos = _saltar_separadores(buffer, pos)
+            if pos >= len(buffer):
+                if fin_archivo:
+                    raise ErrorFixture(f"{ruta}: el arreglo no está cerrado.")
+                completar()
+                continue
+            if buffer[pos] == "]":
+                return
+            try:
+                objeto, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # objeto cortado al final del bloque: leer más y reintentar
+                if fin_archivo:
+                    raise ErrorFixture(f"{ruta}: JSON inválido cerca de la posición {pos}.")
+                completar()
+                continue
+            if not isinstance(objeto, dict) or "model" not in objeto:
+                raise ErrorFixture(f"{ruta}: cada elemento debe ser un objeto con 'model'.")
+            yield objeto
+
+
+# ----------------------------------------------------------------
+# Conversión a instancias
+# ----------------------------------------------------------------
+
+class CargadorFixtures:
+    """Acumula filas por modelo y las inserta por lotes."""
+
+    def __init__(self, tamanio_lote=TAMANIO_LOTE):
+        self.tamanio_lote = tamanio_lote
+        self.pendientes = defaultdict(list)  # modelo -> instancias
+        self.m2m = defaultdict(list)  # (modelo, campo) -> [(pk, [pks])]
+        self.claves_naturales = {}  # (modelo, clave) -> pk
+        self.pks = defaultdict(set)  # modelo -> pks cargados
+        self.resultado = ResultadoCarga()
+        self.ahora = timezone.now()
+
+    def _pk_relacionado(self, campo, valor):
+        if valor is None:
+            return None
+        if not isinstance(valor, (list, tuple)):
+            return campo.target_field.to_python(valor)
+        relacionado = campo.remote_field.model
+        clave = (relacionado, tuple(valor))
+        if clave not in self.claves_naturales:
+            try:
+                self.claves_naturales[clave] = relacionado._default_manager.get_by_natural_key(*valor).pk
+            except (AttributeError, relacionado.DoesNotExist):
+                raise ErrorFixture(f"No se pudo resolver la clave natural {valor} de {relacionado.__name__}.")
+        return self.claves_naturales[clave]
+
+    def agregar(self, objeto):
+        try:
+            modelo = apps.get_model(objeto["model"])
+        except (LookupError, ValueError):
+            raise ErrorFixture(f"Modelo desconocido: {objeto['model']}.")
+        if objeto.get("pk") is None:
+            raise ErrorFixture(f"{objeto['model']}: la carga masiva requiere 'pk' en cada objeto.")
+
+        opts = modelo._meta
+        valores = {opts.pk.attname: opts.pk.to_python(objeto["pk"])}
+        for nombre, valor in objeto.get("fields", {}).items():
+            campo = opts.get_field(nombre)
+            if campo.many_to_many:
+                self.m2m[(modelo, campo)].append(
+                    (valores[opts.pk.attname], [self._pk_relacionado(campo, v) for v in valor]))
+            elif campo.is_relation:
+                valores[campo.attname] = self._pk_relacionado(campo, valor)
+            else:
+                valores[campo.attname] = campo.to_python(valor)
+
+        instancia = modelo(**valores)
+        # en modo raw no corre pre_save: completamos los auto_now ausentes
+        for campo in opts.concrete_fields:
+            if isinstance(campo, models.DateTimeField) and (campo.auto_now or campo.auto_now_add):
+                if getattr(instancia, campo.attname) is None:
+                    setattr(instancia, campo.attname, self.ahora)
+
+        self.pks[modelo].add(instancia.pk)
+        self.pendientes[modelo].append(instancia)
+        if len(self.pendientes[modelo]) >= self.tamanio_lote:
+            self._insertar(modelo)
+
+    def _insertar(self, modelo):
+        lote = self.pendientes.pop(modelo, [])
+        if not lote:
+            return
+        opts = modelo._meta
+        campos = [f for f in opts.concrete_fields if not f.generated]
+        actualizables = [f for f in campos if not f.primary_key]
+        # equivalente a bulk_create(update_conflicts=True) pero en modo raw
+        modelo._base_manager._insert(
+            lote,
+            fields=campos,
+            raw=True,
+            on_conflict=OnConflict.UPDATE if actualizables else OnConflict.IGNORE,
+            update_fields=actualizables or None,
+            unique_fields=[opts.pk] if actualizables else None,
+        )
+        self.resultado.filas[opts.label] += len(lote)
+
+    def _insertar_m2m(self):
+        for (modelo, campo), filas in self.m2m.items():
+            intermedia = campo.remote_field.through
+            if not intermedia._meta.auto_created:
+                raise ErrorFixture(
+                    f"{modelo.__name__}.{campo.name} usa un modelo intermedio: cárguelo como filas propias.")
+            origen = campo.m2m_field_name() + "_id"
+            destino = campo.m2m_reverse_field_name() + "_id"
+            intermedia._base_manager.filter(**{f"{origen}__in": [pk for pk, _ in filas]}).delete()
+            intermedia._base_manager.bulk_create(
+                [intermedia(**{origen: pk, destino: rel}) for pk, relacionados in filas for rel in relacionados],
+                batch_size=self.tamanio_lote,
+            )
+            self.resultado.filas[intermedia._meta.label] += sum(len(r) for _, r in filas)
+
+    def finalizar(self):
+        for modelo in list(self.pendientes):
+            self._insertar(modelo)
+        self._insertar_m2m()
+        sentencias = connection.ops.sequence_reset_sql(no_style(), list(self.pks))
+        with connection.cursor() as cursor:
+            for sql in sentencias:
+                cursor.execute(sql)
+
+
+def verificar_carga(pks):
+    """
+    Fuerza el chequeo de las FK diferidas (error con tabla y clave si
+    alguna no existe) y confirma que cada fila cargada está en la base.
+    Devuelve {modelo: filas faltantes}.
+    """
+    connection.check_constraints()
+    faltantes = {}
+    for modelo, ids in pks.items():
+        encontrados = modelo._base_manager.filter(pk__in=ids).count()
+        if encontrados != len(ids):
+            faltantes[modelo._meta.label] = len(ids) - encontrados
+    return faltantes
+
+
+def cargar_fixtures(rutas, verificar=False, tamanio_lote=TAMANIO_LOTE):
+    """
+    Carga los fixtures `rutas` en una sola transacción. Con verificar=True
+    chequea las restricciones antes de confirmar y lanza ErrorFixture si
+    algo no cierra (la transacción se revierte).
+    """
+    inicio = time.perf_counter()
+    cargador = CargadorFixtures(tamanio_lote)
+    with transaction.atomic():
+        for ruta in rutas:
+            for objeto in leer_objetos(ruta):
+                cargador.agregar(objeto)
+        cargador.finalizar()
+        if verificar:
+            faltantes = verificar_carga(cargador.pks)
+            if faltantes:
+                raise ErrorFixture(f"Filas sin cargar: {faltantes}.")
+    cargador.resultado.segundos = time.perf_counter() - inicio
+    return cargador.resultado
@@ -1,8 +1,29 @@
-from django.db.models.signals import post_migrate
+import os
+
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_migrate, post_save
 from django.dispatch import receiver
+from django.utils import timezone
 
 from gestion_academica import models
 from gestion_academica.constants import ROLES_PREDETERMINADOS
+from gestion_academica.services.estadisticas_reportes.cache_resultados import invalidar_estadisticas
+from gestion_academica.services.estadisticas_reportes.feed_cambios import NOMBRES_FEED, registrar_eliminacion
+from gestion_academica.services.designaciones_docentes import carrera_denormalizada
+from gestion_academica.services.designaciones_docentes.docente_carrera import recalcular_docente_carrera
+from gestion_academica.services.mantenimiento.asesor_indices import RegistradorWorkload
+
+
+# Modelos cuyas escrituras cambian el resultado de algún reporte estadístico
+MODELOS_ESTADISTICAS = (
+    models.Designacion,
+    models.Docente,
+    models.Comision,
+    models.PlanAsignatura,
+    models.ParametrosRegimen,
+    models.Dedicacion,
+    models.Modalidad,
+)
 
 
 @receiver(post_migrate)
@@ -18,3 +39,95 @@ def crear_roles_predeterminados(sender, **kwargs):
             nombre=rol_data["nombre"],
             defaults={"descripcion": rol_data.get("descripcion", "")}
         )
+
+
+def invalidar_cache_estadisticas(sender, **kwargs):
+    """
+    Incrementa la versión de datos de las estadísticas ante cualquier
+    escritura de un modelo del que dependen. Las operaciones masivas
+    (update, bulk_create) deben llamar a invalidar_estadisticas() a mano.
+    """
+    invalidar_estadisticas()
+
+
+# Conectado modelo por modelo: un post_delete sin sender haría que Django
+# deje de usar el borrado rápido (fast delete) en todos los modelos.
+for modelo in MODELOS_ESTADISTICAS:
+    post_save.connect(invalidar_cache_estadisticas, sender=modelo)
+    post_delete.connect(invalidar_cache_estadisticas, sender=modelo)
+
+
+@receiver(post_save, sender=models.Usuario)
+def invalidar_cache_por_nombre_docente(sender, instance, update_fields=None, **kwargs):
+    """Los reportes muestran el nombre del docente; el login (last_login) no cuenta."""
+    if update_fields is not None and not {"first_name", "last_name"} & set(update_fields):
+        return
+    if hasattr(instance, "docente"):
+        invalidar_estadisticas()
+
+
+# --- feed de cambios para BI ---
+
+def registrar_lapida_feed(sender, instance, **kwargs):
+    """Lápida para las bajas de Designacion, Carrera, PlanAsignatura, Asignatura y Docente."""
+    registrar_eliminacion(instance)
+
+
+for modelo in NOMBRES_FEED:
+    post_delete.connect(registrar_lapida_feed, sender=modelo)
+
+
+@receiver(post_save, sender=models.Usuario)
+def marcar_docente_modificado(sender, instance, created, update_fields=None, **kwargs):
+    """El feed de docentes incluye legajo, nombre y email del Usuario."""
+    if created or (update_fields is not None
+                   and not {"legajo", "first_name", "last_name", "email"} & set(update_fields)):
+        return
+    models.Docente.objects.filter(usuario=instance).update(updated_at=timezone.now())
+
+
+# --- carrera / plan copiados en Comision y Designacion ---
+
+@receiver(post_save, sender=models.PlanAsignatura)
+def propagar_carrera_plan_asignatura(sender, instance, created, **kwargs):
+    if not created:
+        carrera_denormalizada.propagar_plan_asignatura(instance)
+
+
+@receiver(post_save, sender=models.PlanDeEstudio)
+def propagar_carrera_plan_de_estudio(sender, instance, created, **kwargs):
+    if not created:
+        carrera_denormalizada.propagar_plan_de_estudio(instance)
+
+
+@receiver(post_save, sender=models.Comision)
+def propagar_carrera_comision(sender, instance, created, **kwargs):
+    if not created:
+        carrera_denormalizada.propagar_comision(instance)
+
+
+# --- pertenencia docente <-> carrera (DocenteCarrera) ---
+
+@receiver(post_save, sender=models.Designacion)
+def actualizar_docente_carrera(sender, instance, **kwargs):
+    """Recalcula las carreras del docente (y del anterior, si la designación cambió de docente)."""
+    recalcular_docente_carrera({instance.docente_id, getattr(instance, "_docente_id_original", None)})
+    instance._docente_id_original = instance.docente_id
+
+
+@receiver(post_delete, sender=models.Designacion)
+def actualizar_docente_carrera_baja(sender, instance, **kwargs):
+    recalcular_docente_carrera([instance.docente_id])
+
+
+# --- captura de la carga de consultas para advise_indexes ---
+
+@receiver(connection_created)
+def capturar_workload(sender, connection, **kwargs):
+    """
+    Con CAPTURAR_WORKLOAD=/ruta.jsonl (por ejemplo al correr los tests)
+    cada consulta se agrega al archivo para luego pasarla por advise_indexes.
+    """
+    ruta = os.environ.get("CAPTURAR_WORKLOAD")
+    if ruta and not any(isinstance(w, RegistradorWorkload) for w in connection.execute_wrappers):
+        connection.execute_wrappers.append(RegistradorWorkload(ruta))
@@ -0,0 +1,18 @@
+from django.utils import timezone
+from gestion_academica.services.gestion_usuarios import notificaciones
+
+# --- RETENCIÓN DE NOTIFICACIONES ---
+
+def depurar_notificaciones():
+    """
+    Archiva las notificaciones leídas hace más de 90 días y elimina
+    las Notificacion antiguas que quedaron sin destinatarios.
+    Trabaja por lotes para no mantener bloqueos largos.
+    """
+    print(f"[{timezone.now()}] Ejecutando tarea: depurar_notificaciones...")
+
+    archivadas = notificaciones.archivar_notificaciones_antiguas()
+    eliminadas = notificaciones.eliminar_notificaciones_huerfanas()
+
+    print(f"Notificaciones archivadas: {archivadas}. Notificaciones huérfanas eliminadas: {eliminadas}.")
+    print(f"[{timezone.now()}] Tarea 'depurar_notificaciones' completada.")
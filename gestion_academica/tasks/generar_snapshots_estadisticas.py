@@ -0,0 +1,23 @@
+from datetime import timedelta
+from django.utils import timezone
+from gestion_academica.services.estadisticas_reportes import snapshots
+
+# --- SNAPSHOTS DE ESTADÍSTICAS ---
+
+def generar_snapshots_estadisticas():
+    """
+    Guarda la foto del día anterior (ya cerrado) de cada carrera.
+    Si esa fecha es un corte de cuatrimestre, guarda también la
+    foto CUATRIMESTRAL que usan las tendencias de largo plazo.
+    """
+    print(f"[{timezone.now()}] Ejecutando tarea: generar_snapshots_estadisticas...")
+    fecha = timezone.localdate() - timedelta(days=1)
+
+    escritos = snapshots.generar_snapshots(fecha, "DIARIO")
+    print(f"Snapshots diarios del {fecha}: {escritos}")
+
+    if snapshots.es_corte_cuatrimestral(fecha):
+        escritos = snapshots.generar_snapshots(fecha, "CUATRIMESTRAL")
+        print(f"Snapshots cuatrimestrales del {fecha}: {escritos}")
+
+    print(f"[{timezone.now()}] Tarea 'generar_snapshots_estadisticas' completada.")
@@ -1,5 +1,6 @@
 from django.utils import timezone
 from gestion_academica import models
+from gestion_academica.services.gestion_usuarios import notificaciones
 from django.db.models import Q
 
 # --- NOTIFICAR MATERIAS SIN RESPONSABLE ---
@@ -32,7 +33,7 @@ def notificar_materias_sin_responsable():
     asignaturas_con_responsable_ids = models.Designacion.objects.filter(
         Q(fecha_fin__isnull=True) | # (A) Es permanente
         Q(fecha_fin__gt=hoy)        # (B) O vence en el futuro (gt='greather than')
-    ).values_list('comision__asignatura__pk', flat=True).distinct()
+    ).values_list('comision__plan_asignatura__asignatura_id', flat=True).distinct()
 
     # Excluimos para encontrar las que NO tienen responsable
     asignaturas_sin_responsable = asignaturas_en_planes_vigentes.exclude(
@@ -88,32 +89,23 @@ def notificar_materias_sin_responsable():
                 "Revísalas aquí."
             )
 
-            # Creamos la Notificación
-            notif_obj, _ = models.Notificacion.objects.get_or_create(
-                titulo=titulo,
-                mensaje=mensaje,
-                tipo="ADVERTENCIA"
+            # Una sola Notificación por carrera: el mensaje (con el conteo)
+            # se actualiza en el lugar en lugar de crear una fila por noche
+            notif_obj, cambio = notificaciones.obtener_o_crear_notificacion(
+                titulo, mensaje, "ADVERTENCIA",
+                clave=f"sin_responsable:{carrera.pk}",
             )
 
-            # Creamos la UsuarioNotificacion (la asignación)
-            un, created = models.UsuarioNotificacion.objects.get_or_create(
-                usuario=coordinador.usuario,
-                notificacion=notif_obj
+            # Creamos la UsuarioNotificacion (la asignación) y mantenemos
+            # el contador de la bandeja. Maneja las reiteraciones y
+            # recordatorios (Paso 7 y 8)
+            un, resultado = notificaciones.asignar_notificacion(
+                coordinador.usuario, notif_obj, forzar=cambio
             )
 
-            # Manejamos las reiteraciones y recordatorios (Paso 7 y 8)
-            if created:
+            if resultado == "CREADA":
                 print(f"Notificación de materias sin responsable creada para {coordinador.usuario.username}")
-            elif un.leida or un.eliminado:
-                continue # El usuario ya la marcó como revisada
-            elif un.fecha_recordatorio and un.fecha_recordatorio > hoy:
-                continue # El usuario pidió "recordar más tarde"
-            else:
-                # Reactivamos la notificación para que se reitere
-                un.leida = False
-                un.eliminado = False
-                un.fecha_recordatorio = None
-                un.save()
+            elif resultado == "REACTIVADA":
                 print(f"Notificación de materias sin responsable reactivada para {coordinador.usuario.username}")
 
     print(f"[{timezone.now()}] Tarea 'notificar_materias_sin_responsable' completada.")
\ No newline at end of file
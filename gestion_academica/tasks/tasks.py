@@ -2,6 +2,8 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from django_apscheduler.jobstores import DjangoJobStore
 from .notificar_vencimientos_designaciones import notificar_vencimientos_designaciones
 from .notificar_materias_sin_responsable import notificar_materias_sin_responsable
+from .depurar_notificaciones import depurar_notificaciones
+from .generar_snapshots_estadisticas import generar_snapshots_estadisticas
 
 # --- 1. CONFIGURACIÓN DEL PLANIFICADOR (SCHEDULER) ---
 
@@ -34,6 +36,28 @@ def iniciar_planificador_vencimientos():
         jobstore='default',
         replace_existing=True,
     )
+    # --- RETENCIÓN DE NOTIFICACIONES ---
+    # Después de las tareas que emiten: 4:00 AM
+    scheduler.add_job(
+        depurar_notificaciones,
+        trigger='cron',
+        hour='4',
+        minute='0',
+        id='depurar_notificaciones',
+        jobstore='default',
+        replace_existing=True,
+    )
+    # --- SNAPSHOTS DE ESTADÍSTICAS ---
+    # Foto del día anterior: 1:00 AM
+    scheduler.add_job(
+        generar_snapshots_estadisticas,
+        trigger='cron',
+        hour='1',
+        minute='0',
+        id='generar_snapshots_estadisticas',
+        jobstore='default',
+        replace_existing=True,
+    )
     
     try:
         scheduler.start()
@@ -0,0 +1,48 @@
+# gestion_academica/tests/datos.py
+
+'''
+Datos de prueba compartidos por los módulos de tests: carreras con su
+cadena plan -> asignatura -> comisión, docentes y designaciones. Cada
+módulo arma con esto solo lo que necesita.
+'''
+
+from datetime import date, timedelta
+
+from django.utils import timezone
+
+from gestion_academica import models
+
+
+def crear_carreras(*codigos):
+    """
+    {codigo: Comision}. Cada carrera tiene un plan con una asignatura de 4
+    horas semanales y una comisión; la carrera queda en comision.carrera.
+    """
+    instituto = models.Instituto.objects.create(codigo="IDEI", nombre="Instituto")
+    comisiones = {}
+    for codigo in codigos:
+        carrera = models.Carrera.objects.create(
+            codigo=codigo, nombre=f"Carrera {codigo}", nivel="GRADO", instituto=instituto)
+        plan = models.PlanDeEstudio.objects.create(fecha_inicio=date(2020, 1, 1), carrera=carrera)
+        asignatura = models.Asignatura.objects.create(
+            codigo=f"A-{codigo}", nombre=f"Asignatura {codigo}",
+            tipo_asignatura="OBLIGATORIA", tipo_duracion="CUATRIMESTRAL")
+        plan_asig = models.PlanAsignatura.objects.create(
+            plan_de_estudio=plan, asignatura=asignatura, horas_semanales=4)
+        comisiones[codigo] = models.Comision.objects.create(
+            nombre="A", turno="MATUTINO", plan_asignatura=plan_asig)
+    return comisiones
+
+
+def crear_docente(username, **campos):
+    """Docente con su Usuario; `campos` van al Docente (dedicacion, modalidad...)."""
+    usuario = models.Usuario.objects.create(
+        username=username, legajo=username.upper(), email=f"{username}@example.com")
+    return models.Docente.objects.create(usuario=usuario, **campos)
+
+
+def designar(docente, comision, cargo, **campos):
+    """Designación teórica que empezó hace 30 días (sin fin, salvo que se indique)."""
+    campos.setdefault("fecha_inicio", timezone.now() - timedelta(days=30))
+    return models.Designacion.objects.create(
+        docente=docente, comision=comision, cargo=cargo, tipo_designacion="TEORICO", **campos)
@@ -0,0 +1,123 @@
+# gestion_academica/tests/tests_designaciones.py
+
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from gestion_academica import models
+from gestion_academica.tests import datos
+from gestion_academica.services.designaciones_docentes.renovacion import (
+    MOTIVO_REEMPLAZADA,
+    renovar_designaciones,
+)
+
+
+class CarreraDenormalizadaTests(TestCase):
+
+    def setUp(self):
+        cargo = models.Cargo.objects.create(nombre="Titular")
+        self.comisiones = datos.crear_carreras("LS", "TU")
+        self.carreras = {codigo: comision.carrera for codigo, comision in self.comisiones.items()}
+        docente = datos.crear_docente("d1")
+        self.designacion = datos.designar(docente, self.comisiones["LS"], cargo)
+        datos.designar(docente, self.comisiones["TU"], cargo)
+
+    def test_save_y_propagacion(self):
+        designacion = models.Designacion.objects.get(pk=self.designacion.pk)
+        self.assertEqual(designacion.carrera_id, self.carreras["LS"].pk)
+        self.assertEqual(designacion.plan_de_estudio_id, self.comisiones["LS"].plan_de_estudio_id)
+
+        # el plan de LS pasa a la carrera TU: comisiones y designaciones lo siguen
+        plan = self.comisiones["LS"].plan_asignatura.plan_de_estudio
+        plan.carrera = self.carreras["TU"]
+        plan.save()
+        designacion.refresh_from_db()
+        self.assertEqual(designacion.carrera_id, self.carreras["TU"].pk)
+        self.assertEqual(
+            models.Comision.objects.get(pk=self.comisiones["LS"].pk).carrera_id, self.carreras["TU"].pk)
+
+    def test_backfill_corrige_desalineadas(self):
+        models.Designacion.objects.update(carrera=None, plan_de_estudio=None)
+        call_command("backfill_carrera_denormalizada", stdout=StringIO())
+        self.assertFalse(models.Designacion.objects.filter(carrera__isnull=True).exists())
+        self.assertEqual(
+            models.Designacion.objects.filter(carrera=self.carreras["TU"]).count(), 1)
+
+
+class RenovacionDesignacionesTests(TestCase):
+
+    def setUp(self):
+        self.cargo = models.Cargo.objects.create(nombre="Titular")
+        self.comisiones = datos.crear_carreras("LS")
+        self.carrera = self.comisiones["LS"].carrera
+        self.inicio = timezone.now() + timedelta(days=10)
+        self.fin = self.inicio + timedelta(days=120)
+        presencial = models.Modalidad.objects.create(nombre="Presencial")
+        self.exclusiva = models.Dedicacion.objects.create(nombre="EXCLUSIVA")
+        models.ParametrosRegimen.objects.create(
+            modalidad=presencial, dedicacion=self.exclusiva, horas_max_frente_alumnos=2,
+            horas_min_frente_alumnos=0, horas_max_anual=100, horas_min_anual=0, max_asignaturas=3)
+        models.PlanAsignatura.objects.filter(comisiones=self.comisiones["LS"]).update(horas_teoria=3)
+
+        # vencen las dos designaciones; solo la de d2 tiene dedicación (y por lo tanto régimen)
+        vencida = timezone.now() - timedelta(days=1)
+        self.sin_dedicacion = datos.crear_docente("d1", modalidad=presencial)
+        self.con_dedicacion = datos.crear_docente("d2", modalidad=presencial)
+        datos.designar(self.sin_dedicacion, self.comisiones["LS"], self.cargo, fecha_fin=vencida)
+        datos.designar(self.con_dedicacion, self.comisiones["LS"], self.cargo,
+                       fecha_fin=vencida, dedicacion=self.exclusiva)
+
+        usuario = models.Usuario.objects.create(username="coord", legajo="C1", email="coord@example.com")
+        coordinador = models.Coordinador.objects.create(usuario=usuario)
+        models.CarreraCoordinacion.objects.create(carrera=self.carrera, coordinador=coordinador)
+        self.coordinador = usuario
+
+    def test_simulacion_errores_y_renovacion(self):
+        total = models.Designacion.objects.count()
+        # d1 no tiene dedicación en la designación: no hay régimen y no se escribe nada
+        resultado = renovar_designaciones(self.carrera, self.inicio, self.fin)
+        self.assertEqual([e["docente_id"] for e in resultado.errores], [self.sin_dedicacion.pk])
+        self.assertEqual(models.Designacion.objects.count(), total)
+
+        models.Designacion.objects.filter(docente=self.sin_dedicacion).update(dedicacion=self.exclusiva)
+        resultado = renovar_designaciones(self.carrera, self.inicio, self.fin, confirmar=False)
+        self.assertEqual(len(resultado.renovadas), 2)
+        self.assertEqual(models.Designacion.objects.count(), total)
+
+        client = APIClient()
+        client.force_authenticate(user=models.Usuario.objects.create(
+            username="admin", legajo="ADM", email="admin@example.com", is_superuser=True))
+        respuesta = client.post("/api/designaciones-docentes/renovar/", {
+            "carrera_id": self.carrera.pk, "fecha_inicio": self.inicio.isoformat(),
+            "fecha_fin": self.fin.isoformat()}, format="json")
+        self.assertEqual(respuesta.status_code, 201, respuesta.data)
+        self.assertEqual(respuesta.data["coordinadores_notificados"], 1)
+        # 3hs teóricas contra un límite de 2hs, en conjunto por docente
+        self.assertEqual({a["docente_id"] for a in respuesta.data["advertencias"]},
+                         {self.sin_dedicacion.pk, self.con_dedicacion.pk})
+
+        nuevas = models.Designacion.objects.filter(carrera=self.carrera, activo=True)
+        self.assertEqual(nuevas.count(), 2)
+        self.assertTrue(all(d.fecha_inicio == self.inicio and d.plan_de_estudio_id for d in nuevas))
+        self.assertEqual(models.UsuarioNotificacion.objects.filter(usuario=self.coordinador).count(), 1)
+
+        # las vencidas ya quedaron inactivas: no hay nada más para renovar
+        self.assertEqual(renovar_designaciones(self.carrera, self.inicio, self.fin).renovadas, [])
+
+    def test_vencidas_repetidas_de_una_comision(self):
+        models.Designacion.objects.filter(docente=self.sin_dedicacion).update(dedicacion=self.exclusiva)
+        anterior = datos.designar(
+            self.con_dedicacion, self.comisiones["LS"], self.cargo, dedicacion=self.exclusiva,
+            fecha_inicio=timezone.now() - timedelta(days=200), fecha_fin=timezone.now() - timedelta(days=100))
+
+        resultado = renovar_designaciones(self.carrera, self.inicio, self.fin)
+        self.assertEqual(len(resultado.renovadas), 2)
+        self.assertEqual([(o["designacion_id"], o["motivo"]) for o in resultado.omitidas], [(anterior.pk, MOTIVO_REEMPLAZADA)])
+        # la anterior también queda inactiva: la próxima renovación no la vuelve a tomar
+        anterior.refresh_from_db()
+        self.assertFalse(anterior.activo)
+        self.assertEqual(renovar_designaciones(self.carrera, self.inicio, self.fin).omitidas, [])
@@ -0,0 +1,134 @@
+# gestion_academica/tests/tests_docentes.py
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from gestion_academica import models
+from gestion_academica.tests import datos
+
+
+class DatosDocentesMixin:
+    """Carreras LS y TU con una comisión cada una y docentes designados en ellas."""
+
+    def crear_carreras(self):
+        self.cargo = models.Cargo.objects.create(nombre="Titular")
+        self.comisiones = datos.crear_carreras("LS", "TU")
+        self.carrera_ls = self.comisiones["LS"].carrera
+        self.carrera_tu = self.comisiones["TU"].carrera
+
+    def crear_docente(self, username, carreras, finalizada=False):
+        docente = datos.crear_docente(username)
+        for codigo in carreras:
+            datos.designar(docente, self.comisiones[codigo], self.cargo,
+                           fecha_fin=timezone.now() - timedelta(days=1) if finalizada else None,
+                           activo=not finalizada)
+        return docente
+
+    def cliente_admin(self):
+        admin = models.Usuario.objects.create(
+            username="admin", legajo="ADM", email="admin@example.com", is_superuser=True)
+        client = APIClient()
+        client.force_authenticate(admin)
+        return client
+
+
+class DocenteCarreraTests(DatosDocentesMixin, TestCase):
+
+    def setUp(self):
+        self.crear_carreras()
+        self.doc_ambas = self.crear_docente("d1", ["LS", "TU"])
+        self.doc_tu = self.crear_docente("d2", ["TU"])
+        self.crear_docente("d3", ["TU"], finalizada=True)
+
+    def pertenencias(self):
+        return {
+            (p.docente.usuario.username, p.carrera.codigo): p.activo
+            for p in models.DocenteCarrera.objects.select_related("docente__usuario", "carrera")
+        }
+
+    def test_se_mantiene_con_las_designaciones(self):
+        self.assertEqual(self.pertenencias(), {
+            ("d1", "LS"): True, ("d1", "TU"): True, ("d2", "TU"): True, ("d3", "TU"): False,
+        })
+
+        designacion = models.Designacion.objects.get(docente=self.doc_ambas, carrera=self.carrera_tu)
+        designacion.activo = False
+        designacion.save()
+        self.assertFalse(self.pertenencias()[("d1", "TU")])
+        designacion.delete()
+        self.assertNotIn(("d1", "TU"), self.pertenencias())
+
+        # el plan de TU pasa a LS: las designaciones copiadas y la pertenencia se mueven
+        plan_tu = self.comisiones["TU"].plan_asignatura.plan_de_estudio
+        plan_tu.carrera = self.carrera_ls
+        plan_tu.save()
+        self.assertEqual(self.pertenencias(), {
+            ("d1", "LS"): True, ("d2", "LS"): True, ("d3", "LS"): False,
+        })
+
+    def test_docentes_por_carrera(self):
+        client = self.cliente_admin()
+
+        respuesta = client.get(f"/api/docentes/carrera/{self.carrera_tu.pk}/")
+        self.assertEqual(respuesta.status_code, 200)
+        resultados = respuesta.data["results"] if isinstance(respuesta.data, dict) else respuesta.data
+        self.assertEqual(len(resultados), 3)
+
+        respuesta = client.get(f"/api/docentes/carrera/{self.carrera_tu.pk}/", {"vigentes": "true"})
+        resultados = respuesta.data["results"] if isinstance(respuesta.data, dict) else respuesta.data
+        self.assertEqual({d["id"] for d in resultados}, {self.doc_ambas.pk, self.doc_tu.pk})
+        carreras = next(d["carreras"] for d in resultados if d["id"] == self.doc_ambas.pk)
+        self.assertEqual([c["id"] for c in carreras], sorted([self.carrera_ls.pk, self.carrera_tu.pk]))
+
+
+class DocenteDetalleCompactoTests(DatosDocentesMixin, TestCase):
+
+    def setUp(self):
+        self.crear_carreras()
+        self.doc_ambas = self.crear_docente("d1", ["LS", "TU"])
+        self.doc_ls = self.crear_docente("d2", ["LS"])
+        self.client = self.cliente_admin()
+
+    def detalle(self, docente, **params):
+        respuesta = self.client.get(f"/api/docentes/{docente.usuario_id}/", params)
+        self.assertEqual(respuesta.status_code, 200, respuesta.data)
+        return respuesta.data
+
+    def crear_historicas(self, docente, cantidad):
+        for dias in (400, 300, 200)[:cantidad]:
+            datos.designar(docente, self.comisiones["LS"], self.cargo,
+                     fecha_inicio=timezone.now() - timedelta(days=dias),
+                     fecha_fin=timezone.now() - timedelta(days=dias - 30), activo=False)
+
+    def test_ids_contra_tablas_e_historicas_paginadas(self):
+        self.crear_historicas(self.doc_ambas, 3)
+
+        designaciones = self.detalle(self.doc_ambas)["designaciones"]
+        self.assertEqual(len(designaciones["actuales"]), 2)
+        self.assertEqual(designaciones["tablas"]["cargos"], {self.cargo.pk: "Titular"})
+        self.assertEqual(set(designaciones["tablas"]["carreras"]), {self.carrera_ls.pk, self.carrera_tu.pk})
+        self.assertIsInstance(designaciones["actuales"][0]["comision"], int)
+        # las históricas siguen en la respuesta por defecto, paginadas
+        self.assertEqual(designaciones["historicas"]["count"], 3)
+        self.assertEqual(len(designaciones["historicas"]["results"]), 3)
+
+        historicas = self.detalle(self.doc_ambas, include="historicas", page=2, page_size=2)["designaciones"]
+        self.assertNotIn("tablas", historicas)
+        self.assertEqual(historicas["historicas"]["count"], 3)
+        self.assertEqual(len(historicas["historicas"]["results"]), 1)
+
+        self.assertNotIn("historicas", self.detalle(self.doc_ambas, include="tablas")["designaciones"])
+
+        respuesta = self.client.get(f"/api/docentes/{self.doc_ambas.usuario_id}/", {"include": "todo"})
+        self.assertEqual(respuesta.status_code, 400)
+
+    def test_cantidad_fija_de_consultas(self):
+        self.crear_historicas(self.doc_ls, 1)
+        self.crear_historicas(self.doc_ambas, 3)
+        # docente, roles, carreras, materias, actuales, count y página de históricas
+        for docente in (self.doc_ls, self.doc_ambas):
+            with self.assertNumQueries(7):
+                self.detalle(docente)
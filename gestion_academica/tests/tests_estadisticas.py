@@ -0,0 +1,384 @@
+# gestion_academica/tests/tests_estadisticas.py
+
+import gzip
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from gestion_academica import models
+from gestion_academica.tests import datos
+from gestion_academica.models.M5_estadisticas_reportes import EstadisticaSnapshot, ExportLog
+from gestion_academica.services.estadisticas_reportes.rollup import (
+    calcular_rollup_docentes,
+    rebanar_rollup,
+)
+from gestion_academica.services.estadisticas_reportes.snapshots import generar_snapshots
+from gestion_academica.services.estadisticas_reportes.historial import construir_timeline
+from gestion_academica.services.estadisticas_reportes.cache_resultados import version_datos
+from gestion_academica.services.estadisticas_reportes.dashboard import calcular_dashboard
+
+
+class DatosEstadisticasMixin:
+    """
+    Dos carreras con un plan cada una y docentes con distintas dedicaciones
+    y modalidades. Un docente enseña en ambas carreras.
+
+    Es el conjunto de las pruebas de estadísticas (rollup, snapshots,
+    dashboard, reportes), armado con tests/datos.py como el de los demás
+    módulos.
+    """
+
+    def crear_datos(self):
+        self.simple = models.Dedicacion.objects.create(nombre="SIMPLE")
+        self.exclusiva = models.Dedicacion.objects.create(nombre="EXCLUSIVA")
+        self.presencial = models.Modalidad.objects.create(nombre="Presencial")
+        self.virtual = models.Modalidad.objects.create(nombre="Virtual")
+        self.cargo = models.Cargo.objects.create(nombre="Titular")
+
+        self.comisiones = datos.crear_carreras("LS", "TU")
+        self.carrera_ls = self.comisiones["LS"].carrera
+        self.carrera_tu = self.comisiones["TU"].carrera
+
+        self.doc_ambas = self.crear_docente("d1", self.simple, self.presencial, ["LS", "TU"])
+        self.doc_ls = self.crear_docente("d2", self.exclusiva, self.presencial, ["LS"])
+        self.doc_tu = self.crear_docente("d3", self.simple, self.virtual, ["TU"])
+        # designación finalizada: no cuenta
+        self.crear_docente("d4", self.exclusiva, self.virtual, ["TU"], finalizada=True)
+
+    def crear_docente(self, username, dedicacion, modalidad, carreras, finalizada=False):
+        docente = datos.crear_docente(username, dedicacion=dedicacion, modalidad=modalidad)
+        inicio = timezone.now() - timedelta(days=30)
+        for codigo in carreras:
+            datos.designar(
+                docente, self.comisiones[codigo], self.cargo, fecha_inicio=inicio,
+                fecha_fin=timezone.now() - timedelta(days=1) if finalizada else None,
+                activo=not finalizada,
+            )
+        return docente
+
+
+class RollupDocentesTests(DatosEstadisticasMixin, TestCase):
+
+    def setUp(self):
+        self.crear_datos()
+        self.admin = models.Usuario.objects.create(
+            username="admin", legajo="ADM", email="admin@example.com", is_superuser=True)
+
+    def test_rollup_en_una_consulta(self):
+        with self.assertNumQueries(1):
+            rollup = calcular_rollup_docentes([self.carrera_ls.pk, self.carrera_tu.pk])
+
+        self.assertEqual(rollup["total_docentes"], 3)
+        self.assertEqual(rollup["por_dedicacion"], {"SIMPLE": 2, "EXCLUSIVA": 1})
+        self.assertEqual(rollup["por_modalidad"], {"Presencial": 2, "Virtual": 1})
+        # el docente que enseña en ambas carreras aparece en el detalle de cada una
+        detalle_simple_presencial = [
+            f for f in rollup["detalle_carrera"]
+            if f["dedicacion"] == "SIMPLE" and f["modalidad"] == "Presencial"
+        ]
+        self.assertEqual(len(detalle_simple_presencial), 2)
+
+        total, data = rebanar_rollup(rollup, "dedicacion")
+        self.assertEqual(total, 3)
+        self.assertEqual(data[0], {"dedicacion": "EXCLUSIVA", "total_docentes": 1, "porcentaje": 33.33})
+
+    def test_crosstab_y_vistas_existentes(self):
+        client = APIClient()
+        client.force_authenticate(user=self.admin)
+
+        respuesta = client.get("/api/estadisticas/docentes/crosstab/", {"carrera_id": self.carrera_tu.pk})
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(respuesta.data["total_docentes"], 2)
+        self.assertEqual(len(respuesta.data["dedicacion_modalidad"]), 2)
+
+        respuesta = client.get("/api/estadisticas/docentes/modalidad/", {"carrera_id": self.carrera_ls.pk})
+        self.assertEqual(respuesta.data["total_docentes"], 2)
+        self.assertEqual(respuesta.data["data"], [
+            {"modalidad": "Presencial", "total_docentes": 2, "porcentaje": 100.0},
+        ])
+
+
+class SnapshotsEstadisticasTests(DatosEstadisticasMixin, TestCase):
+
+    def setUp(self):
+        self.crear_datos()
+        self.admin = models.Usuario.objects.create(
+            username="admin", legajo="ADM", email="admin@example.com", is_superuser=True)
+
+    def test_snapshot_reconstruye_estado_historico(self):
+        hace_diez = timezone.localdate() - timedelta(days=10)
+        hace_sesenta = timezone.localdate() - timedelta(days=60)
+        generar_snapshots(hace_diez)
+        generar_snapshots(hace_sesenta)
+        # regenerar la misma fecha actualiza en lugar de duplicar
+        generar_snapshots(hace_diez)
+
+        snap_tu = EstadisticaSnapshot.objects.get(carrera=self.carrera_tu, fecha=hace_diez)
+        # la designación finalizada ayer seguía activa hace diez días
+        self.assertEqual(snap_tu.total_docentes, 3)
+        self.assertEqual(snap_tu.por_dedicacion, {"SIMPLE": 2, "EXCLUSIVA": 1})
+        self.assertEqual(snap_tu.total_horas, 12)
+        self.assertEqual(snap_tu.cobertura, 100.0)
+        self.assertEqual(EstadisticaSnapshot.objects.filter(fecha=hace_diez).count(), 2)
+        self.assertEqual(
+            EstadisticaSnapshot.objects.get(carrera=self.carrera_tu, fecha=hace_sesenta).total_docentes, 0)
+
+    def test_tendencias_lee_la_serie(self):
+        for dias in (20, 10):
+            generar_snapshots(timezone.localdate() - timedelta(days=dias))
+
+        client = APIClient()
+        client.force_authenticate(user=self.admin)
+        respuesta = client.get("/api/estadisticas/tendencias/", {
+            "carrera_id": self.carrera_ls.pk, "granularidad": "DIARIO",
+        })
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(len(respuesta.data["carreras"]), 1)
+        serie = respuesta.data["carreras"][0]["serie"]
+        self.assertEqual([p["total_docentes"] for p in serie], [2, 2])
+        self.assertLess(serie[0]["fecha"], serie[1]["fecha"])
+
+        for desde in ("2024-13-01x", "2024-02-30"):
+            respuesta = client.get("/api/estadisticas/tendencias/", {"desde": desde})
+            self.assertEqual(respuesta.status_code, 400, desde)
+
+
+class DesignacionesPorCarreraTests(DatosEstadisticasMixin, TestCase):
+
+    def setUp(self):
+        self.crear_datos()
+        self.admin = models.Usuario.objects.create(
+            username="admin", legajo="ADM", email="admin@example.com", is_superuser=True)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def test_paginacion_por_cursor(self):
+        url = "/api/estadisticas/designaciones/"
+        respuesta = self.client.get(url, {"carrera_id": self.carrera_tu.pk, "page_size": 2})
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(len(respuesta.data["results"]), 2)
+        self.assertIsNotNone(respuesta.data["next"])
+
+        siguiente = self.client.get(respuesta.data["next"])
+        ids = [f["id"] for f in respuesta.data["results"] + siguiente.data["results"]]
+        self.assertEqual(len(ids), 3)
+        self.assertEqual(len(set(ids)), 3)
+        self.assertIsNone(siguiente.data["next"])
+
+    def test_filtro_anio_por_rango(self):
+        anio = models.Designacion.objects.first().fecha_inicio.year
+        url = "/api/estadisticas/designaciones/"
+        respuesta = self.client.get(url, {"carrera_id": self.carrera_ls.pk, "anio": anio})
+        self.assertEqual(len(respuesta.data["results"]), 2)
+
+        respuesta = self.client.get(url, {"carrera_id": self.carrera_ls.pk, "anio": anio + 1})
+        self.assertEqual(respuesta.status_code, 404)
+
+        respuesta = self.client.get(url, {"carrera_id": self.carrera_ls.pk, "anio": "x"})
+        self.assertEqual(respuesta.status_code, 400)
+
+        respuesta = self.client.get(url, {"carrera_id": self.carrera_ls.pk, "desde": "2024-02-30"})
+        self.assertEqual(respuesta.status_code, 400)
+
+    def test_exportacion_pdf_por_bloques(self):
+        respuesta = self.client.get("/api/estadisticas/exportar/", {
+            "tipo": "DESIGNACIONES", "formato": "pdf", "carrera_id": self.carrera_tu.pk})
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(respuesta["Content-Type"], "application/pdf")
+        self.assertTrue(b"".join(respuesta.streaming_content).startswith(b"%PDF"))
+
+    def test_exportacion_csv_gzip_en_streaming(self):
+        respuesta = self.client.get("/api/estadisticas/exportar/", {
+            "tipo": "DESIGNACIONES", "formato": "csv.gz", "carrera_id": self.carrera_tu.pk})
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(respuesta["Content-Type"], "application/gzip")
+        comprimido = b"".join(respuesta.streaming_content)
+        lineas = gzip.decompress(comprimido).decode("utf-8").splitlines()
+        self.assertEqual(lineas[0].split(",")[0], "asignatura")
+        self.assertEqual(len(lineas), 4)
+
+        log = ExportLog.objects.get()
+        self.assertEqual((log.formato, log.tipo_reporte, log.filas), ("CSV_GZ", "DESIGNACIONES_CARRERA", 3))
+        self.assertEqual(log.bytes_enviados, len(comprimido))
+        self.assertGreater(log.bytes_sin_comprimir, 0)
+        self.assertTrue(log.exito)
+
+
+class TimelineHistorialTests(SimpleTestCase):
+    """Barrido del motor de línea de tiempo sobre filas sintéticas."""
+
+    def _fila(self, id, asignatura, inicio, fin, cargo=1, dedicacion=1, carrera=10):
+        return {
+            "id": id, "fecha_inicio": inicio, "fecha_fin": fin, "observacion": None,
+            "cargo_id": cargo, "dedicacion_id": dedicacion,
+            "asignatura_id": asignatura, "asignatura_nombre": f"Asig {asignatura}",
+            "periodo": "CUATRIMESTRAL", "carrera_id": carrera, "carrera_nombre": f"Carrera {carrera}",
+            "cargo_nombre": "Titular", "dedicacion_nombre": "SIMPLE", "comision_activa": True,
+        }
+
+    def test_fusiona_contiguas_y_superpuestas(self):
+        d = lambda anio, mes, dia: datetime(anio, mes, dia, tzinfo=dt_timezone.utc)
+        filas = [
+            self._fila(1, 100, d(2018, 3, 1), d(2018, 7, 31)),
+            self._fila(2, 200, d(2018, 3, 1), None),
+            # contigua (empieza al día siguiente) y en otra carrera
+            self._fila(3, 100, d(2018, 8, 1), d(2018, 12, 15), carrera=11),
+            # superpuesta con la anterior
+            self._fila(4, 100, d(2018, 12, 1), d(2019, 7, 31)),
+            # hueco de más de un día: nuevo tramo
+            self._fila(5, 100, d(2020, 3, 1), None),
+            # mismo período pero otro cargo: tramo independiente
+            self._fila(6, 100, d(2020, 3, 1), d(2020, 7, 31), cargo=2),
+        ]
+
+        tramos, tablas = construir_timeline(filas)
+
+        self.assertEqual(len(tramos), 4)
+        primero = tramos[0]
+        self.assertEqual((primero["desde"], primero["hasta"]), (d(2018, 3, 1), d(2019, 7, 31)))
+        self.assertEqual(primero["designaciones"], 3)
+        self.assertEqual(primero["carreras"], [10, 11])
+        self.assertIsNone(tramos[1]["hasta"])
+        self.assertEqual(set(tablas["asignaturas"]), {100, 200})
+        self.assertEqual(tablas["carreras"], {10: "Carrera 10", 11: "Carrera 11"})
+
+
+class HistorialDocenteTests(DatosEstadisticasMixin, TestCase):
+
+    def test_historial_con_tablas_y_expansion(self):
+        self.crear_datos()
+        admin = models.Usuario.objects.create(
+            username="admin", legajo="ADM", email="admin@example.com", is_superuser=True)
+        client = APIClient()
+        client.force_authenticate(user=admin)
+
+        url = f"/api/estadisticas/docente/{self.doc_ambas.pk}/historial/"
+        respuesta = client.get(url, {"carrera_id": self.carrera_ls.pk})
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(len(respuesta.data["tramos"]), 1)
+        self.assertNotIn("designaciones", respuesta.data)
+
+        respuesta = client.get(url, {"carrera_id": self.carrera_ls.pk, "ver_todas_carreras": "1", "expandir": "1"})
+        self.assertEqual(len(respuesta.data["tramos"]), 2)
+        self.assertEqual(len(respuesta.data["designaciones"]), 2)
+
+        url = f"/api/estadisticas/docente/{self.doc_tu.pk}/historial/"
+        respuesta = client.get(url, {"carrera_id": self.carrera_ls.pk})
+        self.assertEqual(respuesta.status_code, 403)
+
+    def test_sin_designaciones_no_revela_nada_fuera_del_alcance(self):
+        self.crear_datos()
+        sin_designaciones = datos.crear_docente("d5")
+        url = f"/api/estadisticas/docente/{sin_designaciones.pk}/historial/"
+
+        usuario = models.Usuario.objects.create(username="coord", legajo="C1", email="coord@example.com")
+        coordinador = models.Coordinador.objects.create(usuario=usuario)
+        models.CarreraCoordinacion.objects.create(carrera=self.carrera_ls, coordinador=coordinador)
+        client = APIClient()
+        client.force_authenticate(user=usuario)
+        # igual que un docente de otra carrera
+        self.assertEqual(client.get(url).status_code, 403)
+
+        client.force_authenticate(user=models.Usuario.objects.create(
+            username="admin", legajo="ADM", email="admin@example.com", is_superuser=True))
+        self.assertEqual(client.get(url).status_code, 404)
+
+
+class DashboardEstadisticasTests(DatosEstadisticasMixin, TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.crear_datos()
+        models.ParametrosRegimen.objects.create(
+            dedicacion=self.simple, modalidad=self.presencial,
+            horas_min_frente_alumnos=2, horas_max_frente_alumnos=6,
+            horas_min_anual=0, horas_max_anual=300, max_asignaturas=5)
+
+    def test_tablero_en_una_consulta(self):
+        with self.assertNumQueries(1):
+            data = calcular_dashboard([self.carrera_ls.pk, self.carrera_tu.pk], {})
+
+        self.assertEqual(data["resumen"]["total_docentes"], 3)
+        self.assertEqual(data["resumen"]["total_designaciones"], 4)
+        self.assertEqual(data["resumen"]["total_horas"], 16)
+        self.assertEqual(
+            {f["dedicacion"]: f["total_docentes"] for f in data["por_dedicacion"]},
+            {"SIMPLE": 2, "EXCLUSIVA": 1},
+        )
+        estados = {f["docente_id"]: f["estado_carga"] for f in data["horas_por_docente"]}
+        # d1 dicta 8 horas con un régimen de 2 a 6
+        self.assertEqual(estados[self.doc_ambas.pk], "EXCEDIDO")
+        self.assertEqual(estados[self.doc_tu.pk], "SIN_REGIMEN")
+        self.assertEqual(len(data["designaciones_recientes"]), 4)
+
+    def test_designacion_dada_de_baja_no_cuenta(self):
+        # activo=False con fecha de fin futura o sin fecha: fuera del tablero
+        docente = self.crear_docente("d5", self.simple, self.presencial, ["LS"])
+        docente.designaciones.update(activo=False)
+        datos.designar(docente, self.comisiones["LS"], self.cargo,
+                       fecha_fin=timezone.now() + timedelta(days=60), activo=False)
+        carreras = [self.carrera_ls.pk, self.carrera_tu.pk]
+
+        data = calcular_dashboard(carreras, {})
+        self.assertEqual(data["resumen"]["total_docentes"], 3)
+        self.assertEqual(data["resumen"]["total_designaciones"], 4)
+
+        data = calcular_dashboard(carreras, {"anio": timezone.now().year})
+        self.assertNotIn(docente.pk, {f["docente_id"] for f in data["horas_por_docente"]})
+
+    def test_endpoint_cachea_por_alcance_y_filtros(self):
+        admin = models.Usuario.objects.create(
+            username="admin", legajo="ADM", email="admin@example.com", is_superuser=True)
+        client = APIClient()
+        client.force_authenticate(user=admin)
+        url = "/api/estadisticas/dashboard/"
+
+        respuesta = client.get(url, {"carrera_id": self.carrera_tu.pk})
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(respuesta["X-Cache"], "MISS")
+        self.assertEqual(respuesta.data["resumen"]["total_docentes"], 2)
+
+        respuesta = client.get(url, {"carrera_id": self.carrera_tu.pk})
+        self.assertEqual(respuesta["X-Cache"], "HIT")
+
+        respuesta = client.get(url, {"carrera_id": self.carrera_tu.pk, "modalidad_id": self.virtual.pk})
+        self.assertEqual(respuesta["X-Cache"], "MISS")
+        self.assertEqual(respuesta.data["resumen"]["total_docentes"], 1)
+
+        respuesta = client.get(url, {"anio": "x"})
+        self.assertEqual(respuesta.status_code, 400)
+
+    def test_escritura_invalida_el_cache(self):
+        admin = models.Usuario.objects.create(
+            username="admin", legajo="ADM", email="admin@example.com", is_superuser=True)
+        client = APIClient()
+        client.force_authenticate(user=admin)
+        url = "/api/estadisticas/docentes/dedicacion/"
+
+        client.get(url, {"carrera_id": self.carrera_ls.pk})
+        respuesta = client.get(url, {"carrera_id": self.carrera_ls.pk})
+        self.assertEqual(respuesta.data["total_docentes"], 2)
+
+        # la versión se incrementa al confirmarse la transacción
+        with self.captureOnCommitCallbacks(execute=True):
+            self.crear_docente("d5", self.simple, self.virtual, ["LS"])
+
+        respuesta = client.get(url, {"carrera_id": self.carrera_ls.pk})
+        self.assertEqual(respuesta.data["total_docentes"], 3)
+
+        metricas = client.get("/api/estadisticas/cache/").data
+        self.assertEqual((metricas["hits"], metricas["misses"]), (1, 2))
+        self.assertGreater(metricas["version_datos"], 0)
+
+    def test_solo_invalidan_los_modelos_de_estadisticas(self):
+        version = version_datos()
+        with self.captureOnCommitCallbacks(execute=True):
+            models.Rol.objects.create(nombre="Invitado").delete()
+        self.assertEqual(version_datos(), version)
+        # sin receptores genéricos el resto de los modelos conserva el borrado rápido
+        self.assertFalse(post_save.has_listeners(models.Rol))
+        self.assertTrue(post_delete.has_listeners(models.Designacion))
@@ -0,0 +1,83 @@
+# gestion_academica/tests/tests_feed_cambios.py
+
+import json
+from datetime import timedelta
+from unittest import mock
+
+from django.db.models.signals import post_delete
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from gestion_academica import models
+from gestion_academica.tests import datos
+from gestion_academica.models.M5_estadisticas_reportes import ExportLog
+from gestion_academica.services.estadisticas_reportes.feed_cambios import MODELOS_FEED, NOMBRES_FEED, cambios
+
+
+class FeedCambiosTests(TestCase):
+
+    def setUp(self):
+        comision = datos.crear_carreras("LS")["LS"]
+        self.asignatura = comision.plan_asignatura.asignatura
+        cargo = models.Cargo.objects.create(nombre="Titular")
+
+        self.docentes = {}
+        self.designaciones = {}
+        for username in ("d1", "d2"):
+            self.docentes[username] = datos.crear_docente(username)
+            self.designaciones[username] = datos.designar(self.docentes[username], comision, cargo)
+        self.desde = timezone.now()
+
+    def test_upserts_y_lapidas_desde_la_marca(self):
+        designacion = self.designaciones["d1"]
+        designacion.observacion = "renovada"
+        designacion.save()
+        borrada_id = self.designaciones["d2"].pk
+        models.Designacion.objects.filter(pk=borrada_id).delete()
+        usuario = self.docentes["d2"].usuario
+        usuario.last_name = "Nuevo"
+        usuario.save(update_fields=["last_name"])
+
+        feed = list(cambios(list(MODELOS_FEED), self.desde, timezone.now() + timedelta(seconds=1)))
+        resumen = {(c["op"], c["modelo"], c["id"]) for c in feed}
+        self.assertEqual(resumen, {
+            ("upsert", "docente", self.docentes["d2"].pk),
+            ("upsert", "designacion", designacion.pk),
+            ("delete", "designacion", borrada_id),
+        })
+        docente = next(c for c in feed if c["modelo"] == "docente")
+        self.assertEqual(docente["datos"]["last_name"], "Nuevo")
+
+        # nada cambió después de la corrida
+        self.assertEqual(list(cambios(["designacion"], timezone.now() + timedelta(seconds=1),
+                                      timezone.now() + timedelta(seconds=2))), [])
+
+    def test_lapidas_solo_para_los_modelos_del_feed(self):
+        for modelo in NOMBRES_FEED:
+            self.assertTrue(post_delete.has_listeners(modelo), modelo)
+        # el resto de los modelos conserva el borrado rápido de Django
+        for modelo in (models.Notificacion, models.UsuarioNotificacion, models.Rol):
+            self.assertFalse(post_delete.has_listeners(modelo), modelo)
+
+    def test_endpoint_ndjson_con_marca_de_agua(self):
+        admin = models.Usuario.objects.create(
+            username="admin", legajo="ADM", email="admin@example.com", is_superuser=True)
+        client = APIClient()
+        client.force_authenticate(user=admin)
+        self.asignatura.save()
+
+        with mock.patch(
+            "gestion_academica.services.estadisticas_reportes.feed_cambios.MARGEN_CONFIRMACION",
+            timedelta(0),
+        ):
+            respuesta = client.get("/api/estadisticas/cambios/", {
+                "desde": self.desde.isoformat(), "modelos": "asignatura,carrera"})
+        self.assertEqual(respuesta.status_code, 200)
+        lineas = [json.loads(l) for l in b"".join(respuesta.streaming_content).splitlines()]
+        self.assertEqual([(l["op"], l.get("modelo")) for l in lineas], [("upsert", "asignatura"), ("fin", None)])
+        self.assertEqual(lineas[-1]["hasta"][:19], respuesta["X-Marca-Agua"][:19])
+        self.assertEqual(ExportLog.objects.get(tipo_reporte="CAMBIOS").filas, 1)
+
+        respuesta = client.get("/api/estadisticas/cambios/", {"desde": "ayer"})
+        self.assertEqual(respuesta.status_code, 400)
@@ -0,0 +1,253 @@
+# gestion_academica/tests/tests_gestion_academica.py
+
+from datetime import date
+from io import BytesIO
+
+from django.contrib.auth.hashers import check_password
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from openpyxl import Workbook
+from rest_framework.test import APIClient
+
+from gestion_academica import models
+from gestion_academica.services.gestion_usuarios.alta_masiva import alta_masiva_docentes
+
+
+class DatosPlanMixin:
+
+    def crear_plan(self):
+        instituto = models.Instituto.objects.create(codigo="IDEI", nombre="Instituto")
+        self.carrera = models.Carrera.objects.create(
+            codigo="LS", nombre="Sistemas", nivel="GRADO", instituto=instituto)
+        self.plan = models.PlanDeEstudio.objects.create(fecha_inicio=date(2024, 1, 1), carrera=self.carrera)
+        self.existente = models.Asignatura.objects.create(
+            codigo="MAT1", nombre="Matemática I", cuatrimestre=1,
+            tipo_asignatura="OBLIGATORIA", tipo_duracion="CUATRIMESTRAL")
+        self.admin = models.Usuario.objects.create(
+            username="admin", legajo="ADM", email="admin@example.com", is_superuser=True)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+
+class ImportacionPlanTests(DatosPlanMixin, TestCase):
+
+    ENCABEZADO = "codigo;nombre;tipo_asignatura;tipo_duracion;cuatrimestre;año;horas_teoria;horas_practica;horas_semanales;correlativas\n"
+
+    def setUp(self):
+        self.crear_plan()
+        self.url = f"/api/planes/{self.plan.pk}/importar/"
+
+    def subir(self, contenido, nombre="plan.csv"):
+        archivo = SimpleUploadedFile(nombre, contenido.encode("utf-8") if isinstance(contenido, str) else contenido)
+        return self.client.post(self.url, {"archivo": archivo}, format="multipart")
+
+    def test_importa_plan_completo_desde_csv(self):
+        respuesta = self.subir(
+            self.ENCABEZADO
+            + "MAT1;;;;;1;3;3;6;\n"
+            + "PRG1;Programación I;OBLIGATORIA;CUATRIMESTRAL;1;1;4;4;8;\n"
+            + "MAT2;Matemática II;OBLIGATORIA;CUATRIMESTRAL;2;1;3;3;6;MAT1\n"
+            + "PRG2;Programación II;OBLIGATORIA;CUATRIMESTRAL;1;2;4;4;8;PRG1,MAT2\n"
+        )
+        self.assertEqual(respuesta.status_code, 201, respuesta.data)
+        self.assertEqual(respuesta.data["data"], {
+            "asignaturas_creadas": 3, "plan_asignaturas_creadas": 4, "correlativas_creadas": 3})
+
+        prg2 = models.PlanAsignatura.objects.get(plan_de_estudio=self.plan, asignatura__codigo="PRG2")
+        self.assertEqual((prg2.anio, prg2.horas_totales), (2, 8))
+        self.assertEqual(
+            set(prg2.correlativas_requeridas.values_list("correlativa_requerida__asignatura__codigo", flat=True)),
+            {"PRG1", "MAT2"},
+        )
+
+    def test_reporte_por_fila_sin_escribir_nada(self):
+        models.PlanAsignatura.objects.create(plan_de_estudio=self.plan, asignatura=self.existente)
+        respuesta = self.subir(
+            self.ENCABEZADO
+            + "MAT1;;;;;1;3;3;6;\n"  # 2: ya está en el plan
+            + "A;Asig A;OBLIGATORIA;CUATRIMESTRAL;1;2;2;2;4;B\n"
+            + "B;Asig B;OBLIGATORIA;CUATRIMESTRAL;2;2;2;2;4;A\n"  # 4: ciclo A -> B -> A
+            + "C;Asig C;OBLIGATORIA;CUATRIMESTRAL;1;2;x;2;4;A,ZZZ\n"  # 5: mismo año y cuatrimestre, inexistente, horas
+            + "A;Repetida;OBLIGATORIA;CUATRIMESTRAL;1;1;2;2;4;\n"  # 6: código repetido
+        )
+        self.assertEqual(respuesta.status_code, 400)
+        errores = {(e["fila"], e["campo"]) for e in respuesta.data["errors"]}
+        self.assertIn((2, "codigo"), errores)
+        self.assertIn((5, "horas_teoria"), errores)
+        self.assertIn((6, "codigo"), errores)
+        mensajes = " ".join(e["mensaje"] for e in respuesta.data["errors"])
+        self.assertIn("circular", mensajes)
+        self.assertIn("mismo año y cuatrimestre", mensajes)
+        self.assertIn("'ZZZ'", mensajes)
+
+        self.assertFalse(models.Asignatura.objects.filter(codigo__in=["A", "B", "C"]).exists())
+        self.assertEqual(models.PlanAsignatura.objects.filter(plan_de_estudio=self.plan).count(), 1)
+
+    def test_importa_xlsx(self):
+        libro = Workbook()
+        hoja = libro.active
+        hoja.append(["Codigo", "Nombre", "Tipo Asignatura", "Tipo Duracion", "Cuatrimestre", "Anio",
+                     "Horas Teoria", "Horas Practica", "Horas Semanales", "Correlativas"])
+        hoja.append(["FIS1", "Física I", "obligatoria", "anual", 1, 1, 2, 2, 4, None])
+        hoja.append(["FIS2", "Física II", "obligatoria", "anual", 1, 2, 2, 2, 4, "FIS1"])
+        salida = BytesIO()
+        libro.save(salida)
+
+        respuesta = self.subir(salida.getvalue(), "plan.xlsx")
+        self.assertEqual(respuesta.status_code, 201, respuesta.data)
+        self.assertEqual(respuesta.data["data"]["correlativas_creadas"], 1)
+
+        respuesta = self.subir("x", "plan.ods")
+        self.assertEqual(respuesta.status_code, 400)
+
+
+class AltaMasivaDocentesTests(DatosPlanMixin, TestCase):
+
+    ENCABEZADO = "legajo,nombre,apellido,email,dedicacion,password\n"
+
+    def setUp(self):
+        self.crear_plan()
+        models.Dedicacion.objects.create(nombre="SIMPLE")
+
+    def test_alta_por_api_informa_duplicados(self):
+        archivo = SimpleUploadedFile("docentes.csv", (
+            self.ENCABEZADO
+            + "D1,Ana,Pérez,ana@example.com,simple,secreta\n"
+            + "D2,Luis,Gómez,ADMIN@example.com,,\n"  # email ya registrado
+            + "ADM,Otro,Admin,otro@example.com,,\n"  # legajo ya registrado
+        ).encode("utf-8"))
+        respuesta = self.client.post("/api/docentes/alta-masiva/", {"archivo": archivo}, format="multipart")
+
+        self.assertEqual(respuesta.status_code, 201, respuesta.data)
+        self.assertEqual(respuesta.data["data"]["creados"], 1)
+        self.assertEqual({(d["fila"], d["campo"]) for d in respuesta.data["data"]["duplicados"]},
+                         {(3, "email"), (4, "legajo")})
+
+        docente = models.Docente.objects.select_related("usuario", "dedicacion").get(usuario__legajo="D1")
+        self.assertEqual((docente.usuario.username, docente.dedicacion.nombre), ("D1", "SIMPLE"))
+        self.assertTrue(docente.usuario.roles.filter(nombre="Docente").exists())
+        # por la API no se hashea: el docente define la contraseña con el código de recuperación
+        self.assertFalse(docente.usuario.has_usable_password())
+
+    def test_errores_no_escriben_y_contrasenas_en_paralelo(self):
+        resultado = alta_masiva_docentes([
+            (2, {"legajo": "D1", "first_name": "Ana", "last_name": "Pérez", "email": "ana@example.com"}),
+            (3, {"legajo": "d1", "first_name": "Ana", "last_name": "Pérez", "email": "mal"}),
+        ])
+        self.assertEqual({(e["fila"], e["campo"]) for e in resultado.errores}, {(3, "email")})
+        self.assertFalse(models.Usuario.objects.filter(legajo="D1").exists())
+
+        resultado = alta_masiva_docentes([
+            (2, {"legajo": "D1", "first_name": "Ana", "last_name": "P", "email": "a@example.com", "password": "uno"}),
+            (3, {"legajo": "D2", "first_name": "Luis", "last_name": "G", "email": "l@example.com", "password": "dos"}),
+        ], procesos=2)
+        self.assertEqual(resultado.creados, 2)
+        self.assertTrue(check_password("dos", models.Usuario.objects.get(legajo="D2").password))
+
+
+class ClonarPlanTests(DatosPlanMixin, TestCase):
+
+    def setUp(self):
+        self.crear_plan()
+        segunda = models.Asignatura.objects.create(
+            codigo="MAT2", nombre="Matemática II", cuatrimestre=2,
+            tipo_asignatura="OBLIGATORIA", tipo_duracion="CUATRIMESTRAL")
+        mat1 = models.PlanAsignatura.objects.create(
+            plan_de_estudio=self.plan, asignatura=self.existente, anio=1, horas_teoria=3, horas_practica=2)
+        mat2 = models.PlanAsignatura.objects.create(plan_de_estudio=self.plan, asignatura=segunda, anio=1)
+        models.Correlativa.objects.create(plan_asignatura=mat2, correlativa_requerida=mat1)
+        models.Comision.objects.create(nombre="A", turno="MATUTINO", plan_asignatura=mat1)
+        models.Comision.objects.create(nombre="B", turno="MATUTINO", plan_asignatura=mat1, activo=False)
+
+    def test_clona_asignaturas_correlativas_y_comisiones(self):
+        respuesta = self.client.post(f"/api/planes/{self.plan.pk}/clonar/", {
+            "fecha_inicio": "2026-03-01", "incluir_comisiones": True}, format="json")
+        self.assertEqual(respuesta.status_code, 201, respuesta.data)
+        self.assertEqual(respuesta.data["data"]["copiadas"],
+                         {"asignaturas": 2, "correlativas": 1, "comisiones": 1})
+
+        nuevo = models.PlanDeEstudio.objects.get(pk=respuesta.data["data"]["id"])
+        self.assertEqual((nuevo.carrera_id, nuevo.esta_vigente), (self.carrera.id, True))
+        self.plan.refresh_from_db()
+        self.assertFalse(self.plan.esta_vigente)
+
+        correlativa = models.Correlativa.objects.get(plan_asignatura__plan_de_estudio=nuevo)
+        self.assertEqual(correlativa.correlativa_requerida.plan_de_estudio_id, nuevo.id)
+        self.assertEqual(correlativa.correlativa_requerida.horas_totales, 5)
+        comision = models.Comision.objects.get(plan_asignatura__plan_de_estudio=nuevo)
+        self.assertEqual((comision.nombre, comision.plan_de_estudio_id, comision.carrera_id),
+                         ("A", nuevo.id, self.carrera.id))
+
+
+class BusquedaTextoTests(DatosPlanMixin, TestCase):
+
+    def setUp(self):
+        self.crear_plan()
+        self.informatica = models.Carrera.objects.create(
+            codigo="LI", nombre="Licenciatura en Informática", nivel="GRADO", instituto=self.carrera.instituto)
+        self.programacion = models.Asignatura.objects.create(
+            codigo="PRG1", nombre="Programación I", tipo_asignatura="OBLIGATORIA", tipo_duracion="CUATRIMESTRAL")
+        usuario = models.Usuario.objects.create(
+            username="jperez", legajo="D100", email="jperez@example.com", first_name="José", last_name="Pérez")
+        models.Docente.objects.create(usuario=usuario)
+        self.plan.documento = models.Documento.objects.create(
+            tipo="RESOLUCION", emisor="Consejo Superior", numero="1234", anio=2024)
+        self.plan.save()
+
+    def buscar(self, q, **params):
+        respuesta = self.client.get("/api/busqueda/", {"q": q, **params})
+        self.assertEqual(respuesta.status_code, 200, respuesta.data)
+        return [(r["tipo"], r["titulo"]) for r in respuesta.data["data"]]
+
+    def test_sin_acentos_raices_y_prefijos(self):
+        self.assertEqual(self.buscar("informatica"), [("carrera", "Licenciatura en Informática")])
+        self.assertEqual(self.buscar("INFORMÁTICOS"), [("carrera", "Licenciatura en Informática")])
+        self.assertEqual(self.buscar("progra", tipos="asignatura"), [("asignatura", "Programación I")])
+        self.assertEqual(self.buscar("jose perez"), [("docente", "Pérez, José")])
+        self.assertEqual([t for t, _ in self.buscar("1234 consejo")], ["plan"])
+
+        # el vector se mantiene al escribir
+        models.Asignatura.objects.filter(pk=self.programacion.pk).update(nombre="Algoritmos")
+        self.assertEqual(self.buscar("programacion"), [])
+        self.assertEqual(self.client.get("/api/busqueda/", {"q": "x", "tipos": "otro"}).status_code, 400)
+
+    def test_busqueda_de_usuarios(self):
+        respuesta = self.client.get("/api/usuarios/", {"search": "perez"})
+        self.assertEqual(respuesta.status_code, 200)
+        resultados = respuesta.data["results"] if isinstance(respuesta.data, dict) else respuesta.data
+        self.assertEqual([u["username"] for u in resultados], ["jperez"])
+
+
+class TypeaheadTests(DatosPlanMixin, TestCase):
+
+    def setUp(self):
+        self.crear_plan()
+        self.otra_carrera = models.Carrera.objects.create(
+            codigo="LI", nombre="Licenciatura en Informática", nivel="GRADO", instituto=self.carrera.instituto)
+        otro_plan = models.PlanDeEstudio.objects.create(
+            carrera=self.otra_carrera, fecha_inicio=self.plan.fecha_inicio)
+        self.analisis = models.Asignatura.objects.create(
+            codigo="MAT2", nombre="Análisis Matemático", tipo_asignatura="OBLIGATORIA", tipo_duracion="CUATRIMESTRAL")
+        models.PlanAsignatura.objects.create(plan_de_estudio=otro_plan, asignatura=self.analisis, anio=1)
+
+    def sugerencias(self, tipo, q, **params):
+        respuesta = self.client.get(f"/api/typeahead/{tipo}/", {"q": q, **params})
+        self.assertEqual(respuesta.status_code, 200, respuesta.data)
+        return [s["label"] for s in respuesta.data]
+
+    def test_prefijo_primero_y_sin_acentos(self):
+        self.assertEqual(self.sugerencias("asignatura", "mat"), ["MAT1 - Matemática I", "MAT2 - Análisis Matemático"])
+        self.assertEqual(self.sugerencias("asignatura", "ANALISIS"), ["MAT2 - Análisis Matemático"])
+        self.assertEqual(self.sugerencias("asignatura", "mat", limite=1), ["MAT1 - Matemática I"])
+        self.assertEqual(self.sugerencias("carrera", "inform"), ["LI - Licenciatura en Informática"])
+        self.assertEqual(self.client.get("/api/typeahead/otro/", {"q": "x"}).status_code, 404)
+
+    def test_coordinador_solo_ve_sus_carreras(self):
+        usuario = models.Usuario.objects.create(username="coord", legajo="C1", email="coord@example.com")
+        coordinador = models.Coordinador.objects.create(usuario=usuario)
+        models.CarreraCoordinacion.objects.create(carrera=self.otra_carrera, coordinador=coordinador)
+        self.client.force_authenticate(usuario)
+
+        self.assertEqual(self.sugerencias("asignatura", "mat"), ["MAT2 - Análisis Matemático"])
+        self.assertEqual(self.sugerencias("carrera", "licenciatura"), ["LI - Licenciatura en Informática"])
+        self.assertEqual(self.sugerencias("asignatura", "mat", carrera_id=self.carrera.pk), [])
@@ -0,0 +1,106 @@
+# gestion_academica/tests/tests_mantenimiento.py
+
+import json
+import os
+import tempfile
+
+from django.db import IntegrityError
+from django.test import TestCase
+
+from gestion_academica import models
+
+from gestion_academica.services.mantenimiento.asesor_indices import (
+    analizar_workload,
+    clasificar_columnas,
+    explicar,
+    generar_migracion,
+    workload_por_defecto,
+)
+from gestion_academica.services.mantenimiento.carga_fixtures import (
+    ErrorFixture,
+    cargar_fixtures,
+    leer_objetos,
+)
+
+
+class AsesorIndicesTests(TestCase):
+
+    def test_clasifica_columnas_del_filtro(self):
+        columnas = clasificar_columnas(
+            "((d.carrera_id = ANY ('{1}'::bigint[])) AND activo AND (fecha_fin IS NULL) "
+            "AND (fecha_inicio < '2024-01-01'))",
+            ["id", "carrera_id", "activo", "fecha_fin", "fecha_inicio"],
+            {"activo"},
+        )
+        self.assertEqual(columnas, {
+            "igualdad": ["carrera_id"],
+            "booleanas": ["activo"],
+            "rango": ["fecha_inicio"],
+            "nulas": ["fecha_fin"],
+        })
+
+    def test_explica_sql_con_porcentajes_literales(self):
+        # sentencias del log o de un .sql: los % son operadores, no placeholders
+        self.assertIsNotNone(explicar("SELECT 7 % 2"))
+        self.assertIsNotNone(explicar("SELECT nombre FROM gestion_academica_carrera WHERE nombre LIKE 'Lic%'"))
+        self.assertIsNotNone(explicar("SELECT nombre FROM gestion_academica_carrera WHERE id = %s", [1]))
+
+    def test_workload_por_defecto_sugiere_compuestos(self):
+        _, sugerencias = analizar_workload(workload_por_defecto())
+        sugeridos = {(s.tabla, tuple(s.columnas)) for s in sugerencias}
+        self.assertIn(("gestion_academica_designacion", ("docente_id", "activo")), sugeridos)
+        # (carrera, activo, fecha_fin) ya existe en Designacion
+        self.assertNotIn(("gestion_academica_designacion", ("carrera_id",)), sugeridos)
+
+        writer, indices = generar_migracion(sugerencias)
+        self.assertEqual(len(writer.migration.operations), len(indices))
+        self.assertIn("AddIndex", writer.as_string())
+
+
+class CargaFixturesTests(TestCase):
+
+    def escribir(self, objetos):
+        archivo = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8")
+        json.dump(objetos, archivo, indent=1)
+        archivo.close()
+        self.addCleanup(os.unlink, archivo.name)
+        return archivo.name
+
+    def test_lectura_incremental_por_bloques(self):
+        objetos = [{"model": "gestion_academica.instituto", "pk": i, "fields": {"nombre": "x" * 50}}
+                   for i in range(1, 40)]
+        # bloques más chicos que un objeto: cada uno se completa con lecturas sucesivas
+        self.assertEqual(list(leer_objetos(self.escribir(objetos), tamanio_lectura=16)), objetos)
+
+    def test_carga_y_actualiza_como_loaddata(self):
+        ruta = self.escribir([
+            {"model": "gestion_academica.instituto", "pk": 7,
+             "fields": {"codigo": "IDEI", "nombre": "Instituto", "created_at": "2025-01-01T00:00:00Z",
+                        "updated_at": "2025-01-01T00:00:00Z"}},
+            {"model": "gestion_academica.carrera", "pk": 3,
+             "fields": {"codigo": "LS", "nombre": "Sistemas", "nivel": "GRADO", "instituto": 7}},
+        ])
+        resultado = cargar_fixtures([ruta], verificar=True)
+        self.assertEqual(resultado.total, 2)
+        instituto = models.Instituto.objects.get(pk=7)
+        # modo raw: se respetan los timestamps del fixture
+        self.assertEqual(instituto.updated_at.year, 2025)
+        self.assertEqual(models.Carrera.objects.get(pk=3).instituto, instituto)
+        # secuencias reiniciadas: el próximo alta no choca con los pks cargados
+        self.assertGreater(models.Instituto.objects.create(codigo="ICSE", nombre="Otro").pk, 7)
+
+        # una segunda carga actualiza en lugar de duplicar
+        cargar_fixtures([ruta])
+        self.assertEqual(models.Carrera.objects.filter(codigo="LS").count(), 1)
+
+    def test_verificacion_detecta_fk_inexistente(self):
+        ruta = self.escribir([
+            {"model": "gestion_academica.carrera", "pk": 1,
+             "fields": {"codigo": "LS", "nombre": "Sistemas", "nivel": "GRADO", "instituto": 999}},
+        ])
+        with self.assertRaises(IntegrityError):
+            cargar_fixtures([ruta], verificar=True)
+        self.assertFalse(models.Carrera.objects.exists())
+
+        with self.assertRaises(ErrorFixture):
+            cargar_fixtures([self.escribir([{"model": "gestion_academica.carrera", "fields": {}}])])
@@ -0,0 +1,218 @@
+# gestion_academica/tests/tests_notificaciones.py
+
+import asyncio
+import json
+from datetime import timedelta
+
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from gestion_academica import models
+from gestion_academica.apps import es_servidor
+from gestion_academica.services.gestion_usuarios import notificaciones
+from gestion_academica.services.gestion_usuarios.tiempo_real import OyenteNotificaciones
+
+
+class ContadorNotificacionesTests(TestCase):
+    """
+    Verifica que el contador desnormalizado de la bandeja se mantenga
+    consistente con las acciones de leer, posponer y archivar.
+    """
+
+    def setUp(self):
+        self.usuario = models.Usuario.objects.create(
+            username="coord1", legajo="C100", email="coord1@example.com")
+        self.notif_a = models.Notificacion.objects.create(
+            titulo="A", mensaje="Mensaje A", tipo="INFO")
+        self.notif_b = models.Notificacion.objects.create(
+            titulo="B", mensaje="Mensaje B", tipo="INFO")
+
+    def _contador(self):
+        return notificaciones.obtener_contador_notificaciones(self.usuario)
+
+    def test_asignar_incrementa_y_no_duplica(self):
+        notificaciones.asignar_notificacion(self.usuario, self.notif_a)
+        notificaciones.asignar_notificacion(self.usuario, self.notif_b)
+        _, resultado = notificaciones.asignar_notificacion(self.usuario, self.notif_a)
+
+        self.assertEqual(resultado, "REACTIVADA")
+        self.assertEqual(self._contador().sin_leer, 2)
+
+    def test_leer_posponer_archivar(self):
+        un_a, _ = notificaciones.asignar_notificacion(self.usuario, self.notif_a)
+        un_b, _ = notificaciones.asignar_notificacion(self.usuario, self.notif_b)
+
+        notificaciones.marcar_notificacion_leida(un_a)
+        notificaciones.posponer_notificacion(un_b)
+        contador = self._contador()
+        self.assertEqual((contador.sin_leer, contador.pospuestas), (1, 1))
+
+        notificaciones.archivar_notificacion(un_b)
+        contador = self._contador()
+        self.assertEqual((contador.sin_leer, contador.pospuestas), (0, 0))
+
+    def test_recordatorio_vencido_recalcula(self):
+        un_a, _ = notificaciones.asignar_notificacion(self.usuario, self.notif_a)
+        notificaciones.posponer_notificacion(un_a)
+        self.assertEqual(self._contador().pospuestas, 1)
+
+        # simulamos que pasó el plazo del recordatorio
+        vencido = timezone.now() - timedelta(minutes=1)
+        models.UsuarioNotificacion.objects.filter(pk=un_a.pk).update(fecha_recordatorio=vencido)
+        models.ContadorNotificaciones.objects.filter(usuario=self.usuario).update(
+            proximo_recordatorio=vencido)
+
+        contador = self._contador()
+        self.assertEqual((contador.sin_leer, contador.pospuestas), (1, 0))
+
+    def test_resumen_responde_304_si_no_hubo_cambios(self):
+        un_a, _ = notificaciones.asignar_notificacion(self.usuario, self.notif_a)
+        client = APIClient()
+        client.force_authenticate(user=self.usuario)
+
+        respuesta = client.get("/api/mis-notificaciones/resumen/")
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(respuesta.data["no_leidas"], 1)
+
+        etag = respuesta["ETag"]
+        respuesta = client.get("/api/mis-notificaciones/resumen/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(respuesta.status_code, 304)
+
+        client.patch(f"/api/mis-notificaciones/{un_a.pk}/leer/")
+        respuesta = client.get("/api/mis-notificaciones/resumen/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(respuesta.data["no_leidas"], 0)
+
+
+class OyenteNotificacionesTests(TestCase):
+    """
+    El listener reparte cada NOTIFY solo a las colas del usuario destino.
+    """
+
+    def test_despacho_por_usuario(self):
+        oyente = OyenteNotificaciones()
+
+        async def escenario():
+            cola_a = oyente.suscribir(1, iniciar=False)
+            cola_b = oyente.suscribir(2, iniciar=False)
+            oyente._despachar(json.dumps({"usuario_id": 1, "id": 10, "evento": "CREADA"}))
+            evento = await asyncio.wait_for(cola_a.get(), timeout=1)
+            oyente.desuscribir(1, cola_a)
+            return evento, cola_b.qsize()
+
+        evento, pendientes_b = asyncio.run(escenario())
+        self.assertEqual(evento["id"], 10)
+        self.assertEqual(pendientes_b, 0)
+        self.assertNotIn(1, oyente._suscriptores)
+
+    def test_stream_requiere_token(self):
+        respuesta = self.client.get("/api/notificaciones/stream/")
+        self.assertEqual(respuesta.status_code, 401)
+
+
+class DeteccionServidorTests(SimpleTestCase):
+    """
+    El planificador de tareas nocturnas arranca también bajo los servidores
+    ASGI que usa el stream.
+    """
+
+    def test_servidores_asgi_y_wsgi(self):
+        self.assertTrue(es_servidor(["/usr/local/bin/uvicorn", "proyecto.asgi:application"]))
+        self.assertTrue(es_servidor(["/usr/lib/python3/site-packages/uvicorn/__main__.py", "proyecto.asgi:application"]))
+        self.assertTrue(es_servidor(["/usr/local/bin/gunicorn", "proyecto.wsgi"]))
+        self.assertTrue(es_servidor(["manage.py", "runserver"]))
+        self.assertFalse(es_servidor(["manage.py", "migrate"]))
+
+
+class AccionesMasivasTests(TestCase):
+    """
+    Las acciones masivas devuelven la cantidad afectada y dejan el contador
+    igual al que daría un recálculo completo.
+    """
+
+    def setUp(self):
+        self.usuario = models.Usuario.objects.create(
+            username="coord2", legajo="C200", email="coord2@example.com")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.usuario)
+        self.uns = [
+            notificaciones.asignar_notificacion(
+                self.usuario,
+                models.Notificacion.objects.create(titulo=f"N{i}", mensaje="M", tipo="INFO"),
+            )[0]
+            for i in range(3)
+        ]
+
+    def _contador(self):
+        contador = notificaciones.obtener_contador_notificaciones(self.usuario)
+        return contador.sin_leer, contador.pospuestas
+
+    def _recalculado(self):
+        contador = notificaciones.recalcular_contador_notificaciones(self.usuario.pk)
+        return contador.sin_leer, contador.pospuestas
+
+    def test_posponer_leer_y_archivar_todas(self):
+        respuesta = self.client.patch(
+            "/api/mis-notificaciones/posponer-varias/", {"ids": [self.uns[0].pk]}, format="json")
+        self.assertEqual(respuesta.data["actualizadas"], 1)
+        self.assertEqual(self._contador(), (3, 1))
+
+        # la pospuesta no está visible: no se marca como leída
+        respuesta = self.client.patch("/api/mis-notificaciones/leer-todas/")
+        self.assertEqual(respuesta.data["actualizadas"], 2)
+        self.assertEqual(self._contador(), (1, 1))
+
+        respuesta = self.client.patch("/api/mis-notificaciones/archivar-todas/")
+        self.assertEqual(respuesta.data["actualizadas"], 2)
+        self.assertEqual(self._contador(), self._recalculado())
+
+    def test_posponer_varias_valida_ids(self):
+        respuesta = self.client.patch(
+            "/api/mis-notificaciones/posponer-varias/", {"ids": "x"}, format="json")
+        self.assertEqual(respuesta.status_code, 400)
+
+
+class DeduplicacionYRetencionTests(TestCase):
+    """
+    Las tareas nocturnas reutilizan la misma Notificacion por clave y la
+    retención archiva las leídas antiguas.
+    """
+
+    def setUp(self):
+        self.usuario = models.Usuario.objects.create(
+            username="coord3", legajo="C300", email="coord3@example.com")
+
+    def _emitir(self, conteo):
+        notif, cambio = notificaciones.obtener_o_crear_notificacion(
+            "Vencimiento de Designaciones", f"Tiene {conteo} designaciones", "ALERTA",
+            clave=f"vencimientos:{self.usuario.pk}",
+        )
+        return notificaciones.asignar_notificacion(self.usuario, notif, forzar=cambio)
+
+    def test_misma_clave_actualiza_y_reitera(self):
+        un, resultado = self._emitir(2)
+        self.assertEqual(resultado, "CREADA")
+        notificaciones.marcar_notificacion_leida(un)
+
+        # mismo contenido: ya la leyó, no se reitera
+        _, resultado = self._emitir(2)
+        self.assertEqual(resultado, "SIN_CAMBIOS")
+
+        # cambió el conteo: misma fila, mensaje nuevo y vuelve a la bandeja
+        un_nueva, resultado = self._emitir(3)
+        self.assertEqual(resultado, "REACTIVADA")
+        self.assertEqual(un_nueva.pk, un.pk)
+        self.assertEqual(models.Notificacion.objects.count(), 1)
+        self.assertEqual(models.Notificacion.objects.get().mensaje, "Tiene 3 designaciones")
+        self.assertEqual(notificaciones.obtener_contador_notificaciones(self.usuario).sin_leer, 1)
+
+    def test_retencion_archiva_leidas_antiguas(self):
+        un, _ = self._emitir(1)
+        notificaciones.marcar_notificacion_leida(un)
+        models.UsuarioNotificacion.objects.filter(pk=un.pk).update(
+            fecha_leida=timezone.now() - timedelta(days=notificaciones.DIAS_RETENCION_LEIDAS + 1))
+
+        self.assertEqual(notificaciones.archivar_notificaciones_antiguas(lote=1), 1)
+        un.refresh_from_db()
+        self.assertTrue(un.eliminado)
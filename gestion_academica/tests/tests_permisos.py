@@ -0,0 +1,77 @@
+# gestion_academica/tests/tests_permisos.py
+
+from django.test import TestCase
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.test import APIClient
+
+from gestion_academica import models
+from gestion_academica.tests import datos
+from gestion_academica.permissions.alcance import Alcance
+from gestion_academica.services.estadisticas_reportes.permisos import obtener_carreras_para_estadisticas
+
+
+class AlcanceTests(TestCase):
+    """Un coordinador de LS y un docente designado en LS y en TU."""
+
+    def setUp(self):
+        cargo = models.Cargo.objects.create(nombre="Titular")
+        docente = datos.crear_docente("d1")
+        self.comisiones = datos.crear_carreras("LS", "TU")
+        for comision in self.comisiones.values():
+            datos.designar(docente, comision, cargo)
+        self.carrera_ls = self.comisiones["LS"].carrera
+        self.carrera_tu = self.comisiones["TU"].carrera
+
+        usuario = models.Usuario.objects.create(username="coord", legajo="C1", email="coord@example.com")
+        coordinador = models.Coordinador.objects.create(usuario=usuario)
+        models.CarreraCoordinacion.objects.create(carrera=self.carrera_ls, coordinador=coordinador)
+        self.coordinador = usuario
+
+    def test_un_filtro_por_modelo_y_permisos_sin_consultas(self):
+        alcance = Alcance(self.coordinador)
+        with self.assertNumQueries(3):  # rol, carreras del coordinador y listado
+            designaciones = list(alcance.filtrar(models.Designacion.objects.all()))
+        self.assertEqual({d.carrera_id for d in designaciones}, {self.carrera_ls.pk})
+
+        comision_tu = self.comisiones["TU"]
+        with self.assertNumQueries(0):
+            self.assertTrue(all(alcance.permite(d) for d in designaciones))
+            self.assertTrue(alcance.permite(self.carrera_ls))
+            self.assertFalse(alcance.permite(comision_tu))
+            self.assertFalse(alcance.permite(comision_tu.plan_asignatura))  # plan ya cargado
+        plan_asignatura = models.PlanAsignatura.objects.get(comisiones=self.comisiones["LS"])
+        with self.assertNumQueries(1):
+            self.assertTrue(alcance.permite(plan_asignatura))
+
+        for modelo in (models.Carrera, models.PlanDeEstudio, models.PlanAsignatura, models.Comision):
+            self.assertEqual(alcance.filtrar(modelo.objects.all()).count(), 1, modelo)
+        self.assertIsNone(Alcance(models.Usuario(is_superuser=True)).carreras_ids)
+
+    def test_designaciones_de_otra_carrera_no_se_ven(self):
+        client = APIClient()
+        client.force_authenticate(self.coordinador)
+        respuesta = client.get("/api/designaciones-docentes/")
+        self.assertEqual(respuesta.status_code, 200)
+        resultados = respuesta.data["results"] if isinstance(respuesta.data, dict) else respuesta.data
+        self.assertEqual({d["id"] for d in resultados},
+                         set(models.Designacion.objects.filter(carrera=self.carrera_ls).values_list("pk", flat=True)))
+
+        ajena = models.Designacion.objects.filter(carrera=self.carrera_tu).first()
+        self.assertEqual(client.get(f"/api/designaciones-docentes/{ajena.pk}/").status_code, 404)
+
+    def test_estadisticas_usan_el_mismo_alcance(self):
+        alcance = Alcance(self.coordinador)
+        self.assertEqual(obtener_carreras_para_estadisticas(self.coordinador, alcance=alcance),
+                         [self.carrera_ls.pk])
+        with self.assertNumQueries(0):  # rol y carreras ya resueltos
+            self.assertEqual(
+                obtener_carreras_para_estadisticas(self.coordinador, self.carrera_ls.pk, alcance=alcance),
+                [self.carrera_ls.pk])
+            with self.assertRaises(PermissionDenied):
+                obtener_carreras_para_estadisticas(self.coordinador, self.carrera_tu.pk, alcance=alcance)
+
+        # staff es administrador también en estadísticas, como en los listados
+        staff = models.Usuario.objects.create(
+            username="staff", legajo="ST", email="staff@example.com", is_staff=True)
+        self.assertEqual(set(obtener_carreras_para_estadisticas(staff)),
+                         {self.carrera_ls.pk, self.carrera_tu.pk})
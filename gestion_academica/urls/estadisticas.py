@@ -3,22 +3,32 @@ from django.urls import path
 from gestion_academica.views.estadisticas_reportes_views.estadisticas import (
     DocentesPorDedicacionAPIView,
     DocentesPorModalidadAPIView,
+    DocentesCrosstabAPIView,
     HorasPorDocenteAPIView,
     DesignacionesPorCarreraAPIView,
     HistorialDocenteAPIView,
+    TendenciasEstadisticasAPIView,
+    DashboardEstadisticasAPIView,
+    MetricasCacheEstadisticasAPIView,
 )
 from gestion_academica.views.estadisticas_reportes_views.reportes import (
     ExportarEstadisticasAPIView,
+    FeedCambiosAPIView,
 )
 
 urlpatterns = [
     path("estadisticas/docentes/dedicacion/", DocentesPorDedicacionAPIView.as_view()),
     path("estadisticas/docentes/modalidad/", DocentesPorModalidadAPIView.as_view()),
+    path("estadisticas/docentes/crosstab/", DocentesCrosstabAPIView.as_view()),
     path("estadisticas/docentes/horas/", HorasPorDocenteAPIView.as_view()),
     path("estadisticas/designaciones/", DesignacionesPorCarreraAPIView.as_view()),
     path(
         "estadisticas/docente/<int:docente_id>/historial/",
         HistorialDocenteAPIView.as_view(),
     ),
+    path("estadisticas/tendencias/", TendenciasEstadisticasAPIView.as_view()),
+    path("estadisticas/dashboard/", DashboardEstadisticasAPIView.as_view()),
+    path("estadisticas/cache/", MetricasCacheEstadisticasAPIView.as_view()),
     path("estadisticas/exportar/", ExportarEstadisticasAPIView.as_view()),
+    path("estadisticas/cambios/", FeedCambiosAPIView.as_view()),
 ]
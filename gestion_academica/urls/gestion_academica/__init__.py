@@ -1,4 +1,5 @@
 from django.urls import path, include
+from gestion_academica.views.gestion_academica_views.busqueda import BusquedaView, TypeaheadView
 
 urlpatterns = [
     path('institutos/', include('gestion_academica.urls.gestion_academica.institutos')),
@@ -7,4 +8,6 @@ urlpatterns = [
     path('planes/', include('gestion_academica.urls.gestion_academica.planes')),
     path('plan-asignatura/', include('gestion_academica.urls.gestion_academica.plan_asignatura')),
     path('documentos/', include('gestion_academica.urls.gestion_academica.documentos')),
+    path('busqueda/', BusquedaView.as_view(), name="busqueda"),
+    path('typeahead/<str:tipo>/', TypeaheadView.as_view(), name="typeahead"),
 ]
\ No newline at end of file
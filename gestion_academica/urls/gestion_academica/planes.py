@@ -6,6 +6,8 @@ urlpatterns = [
     path('', planes.PlanDeEstudioListCreateView.as_view(), name="plan-list-create"),
     path('<int:pk>/', planes.PlanDeEstudioDetailView.as_view(), name="plan-detail"),
     path("<int:pk>/vigencia/", planes.PlanDeEstudioVigenciaView.as_view(), name="plan-vigencia"),
+    path("<int:pk>/importar/", planes.PlanDeEstudioImportarView.as_view(), name="plan-importar"),
+    path("<int:pk>/clonar/", planes.PlanDeEstudioClonarView.as_view(), name="plan-clonar"),
     path("correlativas/", planes.ListarCorrelativasDeAsignaturaView.as_view(), name="listar-correlativas"),
     path("asignar-correlativa/", planes.AsignarCorrelativaView.as_view(), name="asignar-correlativa"),
     path("correlativas/<int:pk>/", planes.EliminarCorrelativaView.as_view(), name="eliminar-correlativa"),
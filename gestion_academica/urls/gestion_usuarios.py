@@ -14,7 +14,8 @@ from gestion_academica.views import (
     CoordinadorViewSet,
 
     # Notificaciones
-    MisNotificacionesViewSet
+    MisNotificacionesViewSet,
+    stream_notificaciones
 )
 from rest_framework_simplejwt.views import TokenRefreshView
 from rest_framework.permissions import AllowAny
@@ -31,6 +32,8 @@ router.register(r'mis-notificaciones', MisNotificacionesViewSet, basename='mis-n
 urlpatterns = [
 
     path('', include(router.urls)),
+    # --- Notificaciones en tiempo real (SSE, requiere ASGI) ---
+    path('notificaciones/stream/', stream_notificaciones, name='notificaciones_stream'),
     # --- Endpoints de Autenticación (Login/Logout/Refresh) ---
     path('auth/login/', LoginView.as_view(), name='login'),
     path('auth/logout/', LogoutView.as_view(), name='logout'),
@@ -7,6 +7,6 @@ from .gestion_academica_views import *
 
 from .gestion_academica_views import *
 from .designaciones_docentes_views import *
-from .gestion_usuarios_views import RolViewSet, UsuarioViewSet, CoordinadorViewSet, MisNotificacionesViewSet
+from .gestion_usuarios_views import RolViewSet, UsuarioViewSet, CoordinadorViewSet, MisNotificacionesViewSet, stream_notificaciones
 from .estadisticas_reportes_views import *
 
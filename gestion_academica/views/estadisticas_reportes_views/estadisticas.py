@@ -1,20 +1,42 @@
 # gestion_academica/views/estadisticas_reportes_views/estadisticas.py
 
-from django.db.models import Count
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.exceptions import PermissionDenied
+from rest_framework.pagination import CursorPagination
 from django.shortcuts import get_object_or_404
+from django.utils.dateparse import parse_date
 
 from gestion_academica.models import (
-    Designacion,
     Docente,
     ParametrosRegimen,
 )
+from gestion_academica.permissions import Alcance
 from gestion_academica.services.estadisticas_reportes.permisos import (
     obtener_carreras_para_estadisticas,
 )
+from gestion_academica.services.estadisticas_reportes.rollup import (
+    rebanar_rollup,
+    rollup_docentes_cacheado,
+)
+from gestion_academica.services.estadisticas_reportes.snapshots import obtener_tendencia
+from gestion_academica.services.estadisticas_reportes.designaciones_carrera import (
+    FiltroDesignacionInvalido,
+    designaciones_carrera_values,
+    formatear_designacion_carrera,
+)
+from gestion_academica.services.estadisticas_reportes.historial import (
+    construir_timeline,
+    expandir_filas,
+    filas_historial,
+)
+from gestion_academica.services.estadisticas_reportes.dashboard import obtener_dashboard
+from gestion_academica.services.estadisticas_reportes.cache_resultados import (
+    metricas_cache,
+    resultado_cacheado,
+)
+from gestion_academica.permissions.admin_permissions import EsAdministrador
 
 
 # ================================================================
@@ -27,15 +49,14 @@ class DocentesPorDedicacionAPIView(APIView):
         carreras_ids = obtener_carreras_para_estadisticas(
             request.user,
             carrera_id_param=request.query_params.get("carrera_id"),
+            alcance=Alcance.de_request(request),
         )
 
-        qs = Designacion.objects.filter(
-            fecha_fin__isnull=True,
-            comision__plan_asignatura__plan_de_estudio__carrera_id__in=carreras_ids,
-            docente__dedicacion__isnull=False,
-        ).select_related("docente__dedicacion")
+        # una sola consulta (GROUPING SETS, cacheada) y nos quedamos con la dimensión
+        rollup = rollup_docentes_cacheado(carreras_ids)
+        total_docentes, data = rebanar_rollup(rollup, "dedicacion")
 
-        if not qs.exists():
+        if not total_docentes:
             return Response(
                 {
                     "detail": "No hay docentes registrados con designaciones activas en esta carrera."
@@ -43,28 +64,6 @@ class DocentesPorDedicacionAPIView(APIView):
                 status=404,
             )
 
-        total_docentes = qs.values("docente_id").distinct().count()
-
-        agregados = (
-            qs.values("docente__dedicacion__nombre")
-            .annotate(cantidad=Count("docente", distinct=True))
-            .order_by("docente__dedicacion__nombre")
-        )
-
-        data = []
-        for item in agregados:
-            dedicacion = item["docente__dedicacion__nombre"]
-            cantidad = item["cantidad"]
-            porcentaje = round(cantidad * 100 / total_docentes, 2)
-
-            data.append(
-                {
-                    "dedicacion": dedicacion,
-                    "total_docentes": cantidad,
-                    "porcentaje": porcentaje,
-                }
-            )
-
         return Response({"total_docentes": total_docentes, "data": data})
 
 
@@ -78,15 +77,13 @@ class DocentesPorModalidadAPIView(APIView):
         carreras_ids = obtener_carreras_para_estadisticas(
             request.user,
             carrera_id_param=request.query_params.get("carrera_id"),
+            alcance=Alcance.de_request(request),
         )
 
-        qs = Designacion.objects.filter(
-            fecha_fin__isnull=True,
-            comision__plan_asignatura__plan_de_estudio__carrera_id__in=carreras_ids,
-            docente__modalidad__isnull=False,
-        ).select_related("docente__modalidad")
+        rollup = rollup_docentes_cacheado(carreras_ids)
+        total_docentes, data = rebanar_rollup(rollup, "modalidad")
 
-        if not qs.exists():
+        if not total_docentes:
             return Response(
                 {
                     "detail": "No hay docentes registrados con designaciones activas en esta carrera."
@@ -94,29 +91,49 @@ class DocentesPorModalidadAPIView(APIView):
                 status=404,
             )
 
-        total_docentes = qs.values("docente_id").distinct().count()
+        return Response({"total_docentes": total_docentes, "data": data})
+
 
-        agregados = (
-            qs.values("docente__modalidad__nombre")
-            .annotate(cantidad=Count("docente", distinct=True))
-            .order_by("docente__modalidad__nombre")
+# ================================================================
+# 5.2.1b — CRUCE DEDICACIÓN x MODALIDAD (x CARRERA)
+# ================================================================
+class DocentesCrosstabAPIView(APIView):
+    """
+    Devuelve en una sola consulta el total, los conteos por dedicación,
+    por modalidad, el cruce dedicación x modalidad y el detalle por carrera.
+    El frontend puede armar ambos gráficos con una única llamada.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        carreras_ids = obtener_carreras_para_estadisticas(
+            request.user,
+            carrera_id_param=request.query_params.get("carrera_id"),
+            alcance=Alcance.de_request(request),
         )
 
-        data = []
-        for item in agregados:
-            modalidad = item["docente__modalidad__nombre"]
-            cantidad = item["cantidad"]
-            porcentaje = round(cantidad * 100 / total_docentes, 2)
+        rollup = rollup_docentes_cacheado(carreras_ids)
 
-            data.append(
+        if not rollup["total_docentes"]:
+            return Response(
                 {
-                    "modalidad": modalidad,
-                    "total_docentes": cantidad,
-                    "porcentaje": porcentaje,
-                }
+                    "detail": "No hay docentes registrados con designaciones activas en esta carrera."
+                },
+                status=404,
             )
 
-        return Response({"total_docentes": total_docentes, "data": data})
+        _, por_dedicacion = rebanar_rollup(rollup, "dedicacion")
+        _, por_modalidad = rebanar_rollup(rollup, "modalidad")
+
+        return Response(
+            {
+                "total_docentes": rollup["total_docentes"],
+                "por_dedicacion": por_dedicacion,
+                "por_modalidad": por_modalidad,
+                "dedicacion_modalidad": rollup["dedicacion_modalidad"],
+                "detalle_carrera": rollup["detalle_carrera"],
+            }
+        )
 
 
 # ================================================================
@@ -131,8 +148,18 @@ class HorasPorDocenteAPIView(APIView):
         carreras_ids = obtener_carreras_para_estadisticas(
             request.user,
             carrera_id_param=request.query_params.get("carrera_id"),
+            alcance=Alcance.de_request(request),
         )
 
+        resultados, _ = resultado_cacheado(
+            "horas_docente",
+            carreras_ids,
+            request.query_params,
+            lambda: self.calcular_horas(request, carreras_ids),
+        )
+        return Response(resultados)
+
+    def calcular_horas(self, request, carreras_ids):
         filtros_extra = {}
         if request.query_params.get("dedicacion"):
             filtros_extra["dedicacion__nombre__iexact"] = request.query_params.get("dedicacion")
@@ -144,7 +171,7 @@ class HorasPorDocenteAPIView(APIView):
         docentes = (
             Docente.objects.filter(
                 designaciones__activo=True, # Designacion activa
-                designaciones__comision__plan_asignatura__plan_de_estudio__carrera_id__in=carreras_ids,
+                designaciones__carrera_id__in=carreras_ids,
                 **filtros_extra
             )
             .select_related("usuario", "modalidad", "dedicacion")
@@ -162,7 +189,7 @@ class HorasPorDocenteAPIView(APIView):
             # - Si seleccionaste 'Sistemas', sumará solo horas de Sistemas.
             designaciones_validas = doc.designaciones.filter(
                 activo=True,
-                comision__plan_asignatura__plan_de_estudio__carrera_id__in=carreras_ids
+                carrera_id__in=carreras_ids
             )
 
             # Si tras filtrar no queda nada (caso borde), saltamos
@@ -223,58 +250,59 @@ class HorasPorDocenteAPIView(APIView):
         # Ordenar por horas descendente para ver a los más cargados primero
         resultados.sort(key=lambda x: x["total_horas_frente_alumnos"], reverse=True)
 
-        return Response(resultados)
+        return resultados
 
 
 # ================================================================
 # 5.2.3 — DESIGNACIONES POR CARRERA
 # ================================================================
+class DesignacionesCursorPagination(CursorPagination):
+    """
+    Paginación por cursor (keyset): cada página es un rango sobre el
+    índice de fecha_inicio, sin OFFSET. Solo se permite ordenar por
+    columnas indexadas; el id desempata fechas iguales.
+    """
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
+    ordering = ("-fecha_inicio", "-id")
+    ordenamientos_permitidos = {
+        "fecha_inicio": ("fecha_inicio", "id"),
+        "-fecha_inicio": ("-fecha_inicio", "-id"),
+    }
+
+    def get_ordering(self, request, queryset, view):
+        return self.ordenamientos_permitidos.get(
+            request.query_params.get("ordering"), self.ordering
+        )
+
+
 class DesignacionesPorCarreraAPIView(APIView):
+    """
+    Parámetros: carrera_id, asignatura_id, tipo_duracion, anio, desde,
+    hasta (AAAA-MM-DD), estado (ACTIVA | INACTIVA), ordering
+    (fecha_inicio | -fecha_inicio), cursor y page_size.
+    """
     permission_classes = [IsAuthenticated]
+    pagination_class = DesignacionesCursorPagination
 
     def get(self, request):
         carreras_ids = obtener_carreras_para_estadisticas(
             request.user,
             carrera_id_param=request.query_params.get("carrera_id"),
+            alcance=Alcance.de_request(request),
         )
 
-        asignatura_id = request.query_params.get("asignatura_id")
-        tipo_duracion = request.query_params.get("tipo_duracion")
-        anio = request.query_params.get("anio")
-        estado_comision = request.query_params.get("estado")
-
-        qs = Designacion.objects.filter(
-            comision__plan_asignatura__plan_de_estudio__carrera_id__in=carreras_ids
-        ).select_related(
-            "docente__usuario",
-            "docente__modalidad",
-            "dedicacion",
-            "comision__plan_asignatura__asignatura",
-        )
-
-        if asignatura_id:
-            qs = qs.filter(comision__plan_asignatura__asignatura_id=asignatura_id)
-
-        if tipo_duracion:
-            qs = qs.filter(
-                comision__plan_asignatura__asignatura__tipo_duracion=tipo_duracion
-            )
-
-        if anio:
-            try:
-                qs = qs.filter(fecha_inicio__year=int(anio))
-            except ValueError:
-                return Response(
-                    {"detail": "El parámetro 'anio' debe ser numérico."}, status=400
-                )
+        try:
+            qs = designaciones_carrera_values(carreras_ids, request.query_params)
+        except FiltroDesignacionInvalido as e:
+            return Response({"detail": str(e)}, status=400)
 
-        if estado_comision:
-            if estado_comision.upper() == "ACTIVA":
-                qs = qs.filter(comision__activo=True)
-            elif estado_comision.upper() == "INACTIVA":
-                qs = qs.filter(comision__activo=False)
+        paginador = self.pagination_class()
+        pagina = paginador.paginate_queryset(qs, request, view=self)
 
-        if not qs.exists():
+        # primera página vacía: no hay designaciones (sin un exists() extra)
+        if not pagina and not request.query_params.get(paginador.cursor_query_param):
             return Response(
                 {
                     "detail": "No se encontraron designaciones registradas para esta carrera."
@@ -282,105 +310,156 @@ class DesignacionesPorCarreraAPIView(APIView):
                 status=404,
             )
 
-        data = []
-        for d in qs.order_by("-fecha_inicio"):
-            plan_asig = d.comision.plan_asignatura
-            asignatura = plan_asig.asignatura
-
-            data.append(
-                {
-                    "asignatura": asignatura.nombre,
-                    "docente": str(d.docente),
-                    "dedicacion": d.dedicacion.nombre if d.dedicacion else None,
-                    "modalidad": d.docente.modalidad.nombre
-                    if d.docente.modalidad
-                    else None,
-                    "periodo": asignatura.tipo_duracion,  # ANUAL / CUATRIMESTRAL
-                    "anio": d.fecha_inicio.year,
-                    "estado_comision": "ACTIVA" if d.comision.activo else "INACTIVA",
-                }
-            )
-
-        return Response(data)
+        return paginador.get_paginated_response(
+            [formatear_designacion_carrera(fila) for fila in pagina]
+        )
 
 
 # ================================================================
 # 5.2.4 — HISTORIAL DOCENTE
 # ================================================================
 class HistorialDocenteAPIView(APIView):
+    """
+    Línea de tiempo del docente: tramos que fusionan designaciones
+    contiguas o superpuestas de la misma (asignatura, cargo, dedicación),
+    con los nombres en tablas de lookup. Con ?expandir=1 se agregan además
+    las designaciones individuales.
+    """
     permission_classes = [IsAuthenticated]
 
     def get(self, request, docente_id):
         carreras_ids = obtener_carreras_para_estadisticas(
             request.user,
             carrera_id_param=request.query_params.get("carrera_id"),
+            alcance=Alcance.de_request(request),
         )
 
         ver_todas = request.query_params.get("ver_todas_carreras") == "1"
+        expandir = request.query_params.get("expandir") in ("1", "true")
 
-        docente = get_object_or_404(Docente, pk=docente_id)
+        docente = get_object_or_404(
+            Docente.objects.select_related("usuario", "modalidad"), pk=docente_id
+        )
 
-        tiene_relacion = Designacion.objects.filter(
-            docente=docente,
-            comision__plan_asignatura__plan_de_estudio__carrera_id__in=carreras_ids,
-        ).exists()
+        # una sola consulta: el chequeo de permisos y el filtro por carrera
+        # se resuelven sobre las mismas filas
+        filas = filas_historial(docente.pk)
+        carreras_permitidas = set(carreras_ids)
 
-        if not tiene_relacion:
+        if not any(f["carrera_id"] in carreras_permitidas for f in filas):
+            # solo el administrador distingue "sin designaciones" de "fuera de su alcance"
+            if not filas and Alcance.de_request(request).es_admin:
+                return Response(
+                    {"detail": "El docente seleccionado no posee designaciones registradas."},
+                    status=404,
+                )
             raise PermissionDenied(
                 "No tiene permisos para visualizar las designaciones de este docente."
             )
 
-        if ver_todas:
-            qs = Designacion.objects.filter(docente=docente).select_related(
-                "dedicacion",
-                "docente__modalidad",
-                "comision__plan_asignatura__asignatura",
-                "comision__plan_asignatura__plan_de_estudio__carrera",
-            )
-        else:
-            qs = Designacion.objects.filter(
-                docente=docente,
-                comision__plan_asignatura__plan_de_estudio__carrera_id__in=carreras_ids,
-            ).select_related(
-                "dedicacion",
-                "docente__modalidad",
-                "comision__plan_asignatura__asignatura",
-                "comision__plan_asignatura__plan_de_estudio__carrera",
-            )
+        if not ver_todas:
+            filas = [f for f in filas if f["carrera_id"] in carreras_permitidas]
+
+        tramos, tablas = construir_timeline(filas)
+
+        data = {
+            "docente": str(docente),
+            "modalidad": docente.modalidad.nombre if docente.modalidad else None,
+            "ver_todas_carreras": ver_todas,
+            "tramos": tramos,
+            "tablas": tablas,
+        }
+        if expandir:
+            data["designaciones"] = expandir_filas(filas)
+
+        return Response(data)
+
 
-        if not qs.exists():
+# ================================================================
+# 5.2.5 — TENDENCIAS HISTÓRICAS (SNAPSHOTS)
+# ================================================================
+class TendenciasEstadisticasAPIView(APIView):
+    """
+    Serie histórica por carrera (docentes por dedicación/modalidad, horas,
+    cobertura) leída de los snapshots precalculados, sin recorrer el
+    historial de designaciones.
+
+    Parámetros: carrera_id, granularidad (DIARIO | CUATRIMESTRAL, por
+    defecto CUATRIMESTRAL), desde y hasta (AAAA-MM-DD).
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        carreras_ids = obtener_carreras_para_estadisticas(
+            request.user,
+            carrera_id_param=request.query_params.get("carrera_id"),
+            alcance=Alcance.de_request(request),
+        )
+
+        granularidad = request.query_params.get("granularidad", "CUATRIMESTRAL").upper()
+        if granularidad not in ("DIARIO", "CUATRIMESTRAL"):
             return Response(
-                {"detail": "El docente seleccionado no posee designaciones registradas."},
-                status=404,
+                {"detail": "El parámetro 'granularidad' debe ser DIARIO o CUATRIMESTRAL."}, status=400
             )
 
-        data = []
-        for d in qs.order_by("fecha_inicio"):
-            plan_asig = d.comision.plan_asignatura
-            asignatura = plan_asig.asignatura
-            carrera = plan_asig.plan_de_estudio.carrera
+        fechas = {}
+        for nombre in ("desde", "hasta"):
+            valor = request.query_params.get(nombre)
+            if valor:
+                try:
+                    # None si no tiene el formato, ValueError si la fecha no existe (2024-02-30)
+                    fechas[nombre] = parse_date(valor)
+                except ValueError:
+                    fechas[nombre] = None
+                if fechas[nombre] is None:
+                    return Response(
+                        {"detail": f"El parámetro '{nombre}' debe tener el formato AAAA-MM-DD."}, status=400
+                    )
 
-            data.append(
-                {
-                    "carrera": carrera.nombre if carrera else None,
-                    "asignatura": asignatura.nombre,
-                    "periodo": asignatura.tipo_duracion,
-                    "anio": d.fecha_inicio.year,
-                    "dedicacion": d.dedicacion.nombre if d.dedicacion else None,
-                    "modalidad": d.docente.modalidad.nombre
-                    if d.docente.modalidad
-                    else None,
-                    "estado_comision": "ACTIVA" if d.comision.activo else "INACTIVA",
-                    "fecha_inicio": d.fecha_inicio,
-                    "fecha_fin": d.fecha_fin,
-                    "observaciones": d.observacion,
-                }
-            )
+        carreras = obtener_tendencia(carreras_ids, granularidad, **fechas)
+        return Response({"granularidad": granularidad, "carreras": carreras})
 
-        return Response(
-            {
-                "docente": str(docente),
-                "ver_todas_carreras": ver_todas,
-                "designaciones": data,
-            }
+
+# ================================================================
+# 5.2.6 — TABLERO DEL COORDINADOR (TODOS LOS WIDGETS)
+# ================================================================
+class DashboardEstadisticasAPIView(APIView):
+    """
+    Resumen, docentes por dedicación y por modalidad, horas por docente y
+    designaciones recientes en una sola consulta sobre el mismo conjunto
+    base de designaciones. El historial sigue siendo por docente (5.2.4).
+
+    Parámetros: carrera_id, dedicacion_id, modalidad_id, anio. La
+    respuesta se cachea por (carreras del alcance, filtros, versión de datos).
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        carreras_ids = obtener_carreras_para_estadisticas(
+            request.user,
+            carrera_id_param=request.query_params.get("carrera_id"),
+            alcance=Alcance.de_request(request),
         )
+
+        try:
+            data, desde_cache = obtener_dashboard(carreras_ids, request.query_params)
+        except ValueError:
+            return Response(
+                {"detail": "Los parámetros 'dedicacion_id', 'modalidad_id' y 'anio' deben ser numéricos."},
+                status=400,
+            )
+
+        response = Response(data)
+        response["X-Cache"] = "HIT" if desde_cache else "MISS"
+        return response
+
+
+# ================================================================
+# 5.2.7 — MÉTRICAS DEL CACHÉ DE ESTADÍSTICAS
+# ================================================================
+class MetricasCacheEstadisticasAPIView(APIView):
+    """Versión de datos vigente y aciertos/fallos del caché de resultados."""
+    permission_classes = [IsAuthenticated, EsAdministrador]
+
+    def get(self, request):
+        return Response(metricas_cache())
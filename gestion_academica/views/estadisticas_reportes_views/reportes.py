@@ -4,30 +4,58 @@ from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.exceptions import ValidationError
-from django.http import HttpResponse
+from django.http import FileResponse, HttpResponse
 
+from gestion_academica.permissions import Alcance
 from gestion_academica.services.estadisticas_reportes.permisos import (
     obtener_carreras_para_estadisticas,
 )
+from gestion_academica.services.estadisticas_reportes.rollup import (
+    rebanar_rollup,
+    rollup_docentes_cacheado,
+)
+from gestion_academica.services.estadisticas_reportes.designaciones_carrera import (
+    FiltroDesignacionInvalido,
+    designaciones_carrera_values,
+    formatear_designacion_carrera,
+)
+from gestion_academica.services.estadisticas_reportes.pdf_reportes import pdf_temporal
+from gestion_academica.services.estadisticas_reportes.reportes_exportacion import (
+    FORMATOS_STREAMING,
+    registrar_exportacion,
+    respuesta_lineas,
+    respuesta_streaming,
+)
+from gestion_academica.services.estadisticas_reportes.feed_cambios import (
+    lineas_feed,
+    marca_de_agua_actual,
+    parsear_marca,
+    parsear_modelos,
+)
+from gestion_academica.permissions.admin_permissions import EsAdministrador
 
 from .estadisticas import (
-    DocentesPorDedicacionAPIView,
-    DocentesPorModalidadAPIView,
     HorasPorDocenteAPIView,
-    DesignacionesPorCarreraAPIView,
 )
 
-import csv
-from io import StringIO, BytesIO
+from io import BytesIO
 from openpyxl import Workbook
 
-# PDF
-from reportlab.platypus import (
-    SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
-)
-from reportlab.lib.pagesizes import A4, landscape
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet
+
+TIPO_REPORTE_EXPORTACION = {
+    "DEDICACION": "DOCENTES_POR_DEDICACION",
+    "MODALIDAD": "DOCENTES_POR_MODALIDAD",
+    "DEDICACION_MODALIDAD": "DOCENTES_DEDICACION_MODALIDAD",
+    "HORAS": "HORAS_POR_DOCENTE",
+    "DESIGNACIONES": "DESIGNACIONES_CARRERA",
+}
+
+
+def _filas_designaciones_exportacion(qs):
+    for fila in qs.order_by("-fecha_inicio", "-id").iterator(chunk_size=2000):
+        d = formatear_designacion_carrera(fila)
+        d["estado_designacion"] = d.pop("estado_comision")
+        yield d
 
 
 class ExportarEstadisticasAPIView(APIView):
@@ -36,12 +64,15 @@ class ExportarEstadisticasAPIView(APIView):
     Tipo:
         - DEDICACION
         - MODALIDAD
+        - DEDICACION_MODALIDAD
         - HORAS
         - DESIGNACIONES
     Formato:
-        - csv
+        - csv, csv.gz, ndjson, ndjson.gz (en streaming, comprimidos al vuelo)
         - xlsx
         - pdf
+
+    Cada exportación queda registrada en ExportLog con filas y bytes.
     """
 
     permission_classes = [IsAuthenticated]
@@ -51,27 +82,42 @@ class ExportarEstadisticasAPIView(APIView):
         formato = request.query_params.get("formato")
         carrera_id = request.query_params.get("carrera_id")
 
-        if tipo not in ["DEDICACION", "MODALIDAD", "HORAS", "DESIGNACIONES"]:
+        if tipo not in ["DEDICACION", "MODALIDAD", "DEDICACION_MODALIDAD", "HORAS", "DESIGNACIONES"]:
             raise ValidationError("Tipo inválido.")
 
-        if formato not in ["csv", "xlsx", "pdf"]:
-            raise ValidationError("Formato inválido. Use csv, xlsx o pdf.")
+        if formato not in [*FORMATOS_STREAMING, "xlsx", "pdf"]:
+            raise ValidationError("Formato inválido. Use csv, csv.gz, ndjson, ndjson.gz, xlsx o pdf.")
+
+        tipo_reporte = TIPO_REPORTE_EXPORTACION[tipo]
+        filtros = {
+            k: v for k, v in request.query_params.items() if k not in ("tipo", "formato")
+        }
 
-        obtener_carreras_para_estadisticas(request.user, carrera_id_param=carrera_id)
+        carreras_ids = obtener_carreras_para_estadisticas(
+            request.user, carrera_id_param=carrera_id, alcance=Alcance.de_request(request))
 
         # ============================================================
         # OBTENER LOS DATOS SEGÚN TIPO
         # ============================================================
+        if tipo in ["DEDICACION", "MODALIDAD", "DEDICACION_MODALIDAD"]:
+            # los tres salen del mismo rollup (una sola consulta, cacheada)
+            rollup = rollup_docentes_cacheado(carreras_ids)
+
         if tipo == "DEDICACION":
-            data = DocentesPorDedicacionAPIView().get(request).data.get("data", [])
+            _, data = rebanar_rollup(rollup, "dedicacion")
             fieldnames = ["dedicacion", "total_docentes", "porcentaje"]
             nombre_archivo = "docentes_por_dedicacion"
 
         elif tipo == "MODALIDAD":
-            data = DocentesPorModalidadAPIView().get(request).data.get("data", [])
+            _, data = rebanar_rollup(rollup, "modalidad")
             fieldnames = ["modalidad", "total_docentes", "porcentaje"]
             nombre_archivo = "docentes_por_modalidad"
 
+        elif tipo == "DEDICACION_MODALIDAD":
+            data = rollup["dedicacion_modalidad"]
+            fieldnames = ["dedicacion", "modalidad", "total_docentes"]
+            nombre_archivo = "docentes_dedicacion_modalidad"
+
         elif tipo == "HORAS":
             data = HorasPorDocenteAPIView().get(request).data
             fieldnames = [
@@ -85,22 +131,14 @@ class ExportarEstadisticasAPIView(APIView):
             nombre_archivo = "horas_por_docente"
 
         else:  # DESIGNACIONES
-            raw = DesignacionesPorCarreraAPIView().get(request).data
-
-            # Convertimos datos para exportación
-            data = []
-            for d in raw:
-                data.append(
-                    {
-                        "asignatura": d["asignatura"],
-                        "docente": d["docente"],
-                        "dedicacion": d["dedicacion"],
-                        "modalidad": d["modalidad"],
-                        "periodo": d["periodo"],  
-                        "anio": d["anio"],
-                        "estado_designacion": d["estado_comision"],  # ahora será estado_designacion en API
-                    }
-                )
+            # misma consulta que el endpoint, sin paginar y sin instanciar modelos
+            try:
+                qs = designaciones_carrera_values(carreras_ids, request.query_params)
+            except FiltroDesignacionInvalido as e:
+                raise ValidationError(str(e))
+
+            # generador: cada formato recorre las filas una sola vez
+            data = _filas_designaciones_exportacion(qs)
 
             fieldnames = [
                 "asignatura",
@@ -114,33 +152,35 @@ class ExportarEstadisticasAPIView(APIView):
             nombre_archivo = "designaciones_carrera"
 
         # ============================================================
-        # EXPORTAR CSV
+        # EXPORTAR CSV / NDJSON (STREAMING, OPCIONALMENTE GZIP)
         # ============================================================
-        if formato == "csv":
-            buffer = StringIO()
-            writer = csv.DictWriter(buffer, fieldnames=fieldnames)
-            writer.writeheader()
-            for row in data:
-                writer.writerow({k: row.get(k, "") for k in fieldnames})
-
-            resp = HttpResponse(buffer.getvalue(), content_type="text/csv")
-            resp["Content-Disposition"] = f'attachment; filename=\"{nombre_archivo}.csv\"'
-            return resp
+        if formato in FORMATOS_STREAMING:
+            return respuesta_streaming(
+                formato, nombre_archivo, fieldnames, data, request.user, tipo_reporte, filtros)
 
         # ============================================================
         # EXPORTAR XLSX
         # ============================================================
         if formato == "xlsx":
-            wb = Workbook()
-            ws = wb.active
-            ws.append(fieldnames)
-            for row in data:
-                ws.append([row.get(k, "") for k in fieldnames])
-
-            output = BytesIO()
-            wb.save(output)
-            output.seek(0)
-
+            filas = 0
+            try:
+                wb = Workbook(write_only=True)
+                ws = wb.create_sheet()
+                ws.append(fieldnames)
+                for row in data:
+                    ws.append([row.get(k, "") for k in fieldnames])
+                    filas += 1
+
+                output = BytesIO()
+                wb.save(output)
+            except Exception as e:
+                registrar_exportacion(request.user, tipo_reporte, "XLSX", filtros, exito=False, mensaje_error=str(e))
+                raise
+
+            registrar_exportacion(
+                request.user, tipo_reporte, "XLSX", filtros,
+                filas=filas, bytes_enviados=output.tell(),
+            )
             resp = HttpResponse(
                 output.getvalue(),
                 content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
@@ -152,88 +192,57 @@ class ExportarEstadisticasAPIView(APIView):
         # EXPORTAR PDF
         # ============================================================
         if formato == "pdf":
-            buffer = BytesIO()
-
-            doc = SimpleDocTemplate(
-                buffer,
-                pagesize=landscape(A4),
-                leftMargin=40,
-                rightMargin=40,
-                topMargin=50,
-                bottomMargin=30,
-            )
-
-            styles = getSampleStyleSheet()
-            story = []
-
-            # Logo UNTDF
+            # por bloques de una página, escrito a un temporal y enviado por partes
             try:
-                logo_path = "gestion_academica/static/gestion_academica/logo_untdf.png"
-                logo = Image(logo_path, width=120, height=60)
-                story.append(logo)
-            except Exception:
-                pass
-
-            story.append(Spacer(1, 12))
-
-            # Título
-            titulo = f"<b>Reporte: {nombre_archivo.replace('_', ' ').title()}</b>"
-            story.append(Paragraph(titulo, styles["Title"]))
-            story.append(Spacer(1, 20))
-
-            pretty_headers = {
-                "asignatura": "Asignatura",
-                "docente": "Docente",
-                "dedicacion": "Dedicación",
-                "modalidad": "Modalidad",
-                "periodo": "Período",
-                "anio": "Año",
-                "estado_designacion": "Estado de la designación",
-                "total_docentes": "Total Docentes",
-                "porcentaje": "Porcentaje",
-                "total_horas_frente_alumnos": "Horas Frente Alumnos",
-                "asignaturas": "Asignaturas",
-                "estado_carga": "Estado de Carga",
-            }
-
-            # Tabla
-            table_data = [
-                [pretty_headers.get(col, col) for col in fieldnames]
-            ]
-
-            for row in data:
-                table_data.append(
-                    [Paragraph(str(row.get(k, "")), styles["BodyText"]) for k in fieldnames]
-                )
-
-            max_width = landscape(A4)[0] - 80
-            col_width = max_width / len(fieldnames)
-            col_widths = [col_width] * len(fieldnames)
-
-            table = Table(table_data, colWidths=col_widths, repeatRows=1)
-
-            table.setStyle(TableStyle([
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#5A5A5A")),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, 0), 9),
+                archivo = pdf_temporal(
+                    nombre_archivo.replace("_", " ").title(), fieldnames, data)
+            except Exception as e:
+                registrar_exportacion(request.user, tipo_reporte, "PDF", filtros, exito=False, mensaje_error=str(e))
+                raise
+
+            archivo.seek(0, 2)
+            registrar_exportacion(request.user, tipo_reporte, "PDF", filtros, bytes_enviados=archivo.tell())
+            archivo.seek(0)
+            return FileResponse(
+                archivo,
+                as_attachment=True,
+                filename=f"{nombre_archivo}.pdf",
+                content_type="application/pdf",
+            )
 
-                ("BACKGROUND", (0, 1), (-1, -1), colors.HexColor("#F1F1D4")),
-                ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-                ("FONTSIZE", (0, 1), (-1, -1), 8),
 
-                ("GRID", (0, 0), (-1, -1), 0.25, colors.black),
-                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-            ]))
+class FeedCambiosAPIView(APIView):
+    """
+    Feed de cambios incremental para BI (NDJSON en streaming).
 
-            story.append(table)
+    Parámetros:
+        - desde: marca de agua ISO 8601 (el "hasta" de la corrida anterior);
+          sin ella se emite una foto completa.
+        - modelos: lista separada por comas (carrera, asignatura,
+          plan_asignatura, docente, designacion); por defecto todos.
+        - formato: ndjson (por defecto) o ndjson.gz
 
-            doc.build(story)
+    La próxima marca de agua viaja en el header X-Marca-Agua y en la
+    última línea del archivo ({"op": "fin", "hasta": ...}).
+    """
 
-            pdf_value = buffer.getvalue()
-            buffer.close()
+    permission_classes = [IsAuthenticated, EsAdministrador]
 
-            response = HttpResponse(pdf_value, content_type="application/pdf")
-            response["Content-Disposition"] = f'attachment; filename=\"{nombre_archivo}.pdf\"'
-            return response
+    def get(self, request):
+        formato = request.query_params.get("formato", "ndjson").lower()
+        if formato not in ("ndjson", "ndjson.gz"):
+            raise ValidationError("Formato inválido. Use ndjson o ndjson.gz.")
+        try:
+            desde = parsear_marca(request.query_params.get("desde"))
+            modelos = parsear_modelos(request.query_params.get("modelos"))
+        except ValueError as e:
+            raise ValidationError(str(e))
+
+        hasta = marca_de_agua_actual()
+        filtros = {"desde": desde.isoformat() if desde else None, "hasta": hasta.isoformat(), "modelos": modelos}
+        resp = respuesta_lineas(
+            lineas_feed(modelos, desde, hasta), formato, "cambios",
+            request.user, "CAMBIOS", filtros, encabezados=1,
+        )
+        resp["X-Marca-Agua"] = hasta.isoformat()
+        return resp
@@ -0,0 +1,104 @@
+# gestion_academica/views/gestion_academica_views/busqueda.py
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from gestion_academica.services import busqueda, typeahead
+from gestion_academica.permissions.alcance import Alcance
+from gestion_academica.permissions.coordinador_permissions import EsCoordinadorDeCarrera
+
+
+class BusquedaView(APIView):
+    """Búsqueda de texto en asignaturas, carreras, planes de estudio y docentes"""
+
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        tags=["Gestión Académica - Búsqueda"],
+        operation_summary="Buscar en asignaturas, carreras, planes y docentes",
+        operation_description=(
+            "Búsqueda de texto completo (sin distinguir acentos ni mayúsculas, con raíces en "
+            "español y prefijos). Devuelve los resultados de todos los tipos ordenados por "
+            "relevancia, hasta 'limite' por tipo."
+        ),
+        manual_parameters=[
+            openapi.Parameter("q", openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True),
+            openapi.Parameter(
+                "tipos", openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                description=f"Separados por comas: {', '.join(busqueda.TIPOS_BUSQUEDA)} (por defecto, todos)"),
+            openapi.Parameter(
+                "limite", openapi.IN_QUERY, type=openapi.TYPE_INTEGER,
+                description=f"Resultados por tipo (por defecto {busqueda.LIMITE_BUSQUEDA}, "
+                            f"máximo {busqueda.LIMITE_MAXIMO_BUSQUEDA})"),
+        ],
+        responses={200: "Resultados ordenados por relevancia.", 400: "Parámetros inválidos."}
+    )
+    def get(self, request):
+        texto = request.query_params.get("q", "").strip()
+        if not texto:
+            return Response({"message": "Debe indicar el texto a buscar en 'q'."},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        tipos = [t.strip() for t in request.query_params.get("tipos", "").split(",") if t.strip()]
+        desconocidos = set(tipos) - set(busqueda.TIPOS_BUSQUEDA)
+        if desconocidos:
+            return Response({
+                "message": "Tipos de búsqueda inválidos.",
+                "errors": {"tipos": [f"Tipos desconocidos: {', '.join(sorted(desconocidos))}."]}
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            limite = int(request.query_params.get("limite", busqueda.LIMITE_BUSQUEDA))
+        except ValueError:
+            return Response({"message": "Parámetros inválidos.",
+                             "errors": {"limite": ["Debe ser un número entero."]}},
+                            status=status.HTTP_400_BAD_REQUEST)
+        limite = max(1, min(limite, busqueda.LIMITE_MAXIMO_BUSQUEDA))
+
+        resultados = busqueda.buscar(texto, tipos or busqueda.TIPOS_BUSQUEDA, limite)
+        return Response({"message": f"{len(resultados)} resultados.", "data": resultados},
+                        status=status.HTTP_200_OK)
+
+
+class TypeaheadView(APIView):
+    """Sugerencias {id, label} para los selectores de docente, asignatura y carrera"""
+
+    permission_classes = [EsCoordinadorDeCarrera]
+
+    @swagger_auto_schema(
+        tags=["Gestión Académica - Búsqueda"],
+        operation_summary="Typeahead de docentes, asignaturas o carreras",
+        operation_description=(
+            "Devuelve los primeros resultados {id, label} que contienen el texto (o se le "
+            "parecen, si la base tiene pg_trgm), empezando por los que comienzan con él. "
+            "El coordinador solo ve lo de sus carreras activas. Para 'docente' el id es el "
+            "del Docente (docente_id de la designación)."
+        ),
+        manual_parameters=[
+            openapi.Parameter("q", openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True),
+            openapi.Parameter("carrera_id", openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+            openapi.Parameter(
+                "limite", openapi.IN_QUERY, type=openapi.TYPE_INTEGER,
+                description=f"Por defecto {typeahead.LIMITE_TYPEAHEAD}, máximo {typeahead.LIMITE_MAXIMO_TYPEAHEAD}"),
+        ],
+        responses={200: "Lista de {id, label}.", 404: "Tipo desconocido."}
+    )
+    def get(self, request, tipo):
+        if tipo not in typeahead.TIPOS_TYPEAHEAD:
+            return Response({"message": f"Tipo desconocido. Use: {', '.join(typeahead.TIPOS_TYPEAHEAD)}."},
+                            status=status.HTTP_404_NOT_FOUND)
+        try:
+            limite = int(request.query_params.get("limite", typeahead.LIMITE_TYPEAHEAD))
+            carrera_id = request.query_params.get("carrera_id")
+            carrera_id = int(carrera_id) if carrera_id else None
+        except ValueError:
+            return Response({"message": "'limite' y 'carrera_id' deben ser números enteros."},
+                            status=status.HTTP_400_BAD_REQUEST)
+        limite = max(1, min(limite, typeahead.LIMITE_MAXIMO_TYPEAHEAD))
+
+        sugerencias = typeahead.sugerir(
+            tipo, request.query_params.get("q", ""), Alcance.de_request(request), limite, carrera_id)
+        return Response(sugerencias, status=status.HTTP_200_OK)
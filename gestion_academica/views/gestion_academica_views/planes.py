@@ -6,8 +6,8 @@ from rest_framework import status
 from rest_framework.permissions import AllowAny
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
-from gestion_academica.serializers import PlanDeEstudioSerializerList,PlanDeEstudioSerializerDetail,PlanDeEstudioCreateUpdateSerializer,PlanDeEstudioVigenciaSerializer,PlanAsignaturaSerializer,CorrelativaCreateSerializer,CorrelativaSerializer
-from gestion_academica.services import plan_de_estudio
+from gestion_academica.serializers import PlanDeEstudioSerializerList,PlanDeEstudioSerializerDetail,PlanDeEstudioCreateUpdateSerializer,PlanDeEstudioVigenciaSerializer,PlanDeEstudioClonarSerializer,PlanAsignaturaSerializer,CorrelativaCreateSerializer,CorrelativaSerializer
+from gestion_academica.services import plan_de_estudio, importacion_plan
 from gestion_academica.permissions import EsAdministrador
 
 
@@ -139,6 +139,93 @@ class PlanDeEstudioVigenciaView(APIView):
         }, status=status.HTTP_400_BAD_REQUEST)
              
 
+class PlanDeEstudioImportarView(APIView):
+    """Importar asignaturas, horas y correlativas de un plan desde una planilla"""
+
+    permission_classes = [EsAdministrador]
+
+    @swagger_auto_schema(
+        tags=["Gestión Académica - Planes de Estudio"],
+        operation_summary="Importar plan de estudio desde XLSX/CSV",
+        operation_description=(
+            "Recibe en 'archivo' una planilla con una fila por asignatura y las columnas "
+            "codigo, nombre, tipo_asignatura, tipo_duracion, cuatrimestre, anio, horas_teoria, "
+            "horas_practica, horas_semanales y correlativas (códigos separados por ',' o ';'). "
+            "Se valida todo el plan antes de escribir: si hay errores no se guarda nada "
+            "y se devuelve el detalle por fila."
+        ),
+        manual_parameters=[
+            openapi.Parameter("archivo", openapi.IN_FORM, type=openapi.TYPE_FILE, required=True)
+        ],
+        responses={
+            201: "Plan importado correctamente.",
+            400: "Errores de validación por fila.",
+            404: "Plan de estudio no encontrado."
+        }
+    )
+    def post(self, request, pk):
+        plan = plan_de_estudio.obtener_plan(pk)
+        archivo = request.FILES.get("archivo")
+        if archivo is None:
+            return Response({
+                "message": "Debe adjuntar la planilla en el campo 'archivo'."
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            registros = importacion_plan.leer_planilla(archivo, archivo.name)
+        except importacion_plan.ErrorImportacion as e:
+            return Response({"message": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        resultado = importacion_plan.importar_plan(plan, registros)
+        if not resultado.valido:
+            return Response({
+                "message": "La planilla tiene errores. No se importó ninguna fila.",
+                "errors": resultado.errores
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            "message": "Plan de estudio importado correctamente.",
+            "data": resultado.resumen()
+        }, status=status.HTTP_201_CREATED)
+
+
+class PlanDeEstudioClonarView(APIView):
+    """Crear una nueva versión de un plan copiando asignaturas, correlativas y comisiones"""
+
+    permission_classes = [EsAdministrador]
+
+    @swagger_auto_schema(
+        tags=["Gestión Académica - Planes de Estudio"],
+        operation_summary="Clonar Plan de Estudio",
+        operation_description=(
+            "Crea un plan para la misma carrera con las asignaturas (año y horas) y las "
+            "correlativas del plan indicado. Con incluir_comisiones=true copia también las "
+            "comisiones activas. Si el nuevo plan es vigente, los demás planes de la carrera "
+            "dejan de serlo."
+        ),
+        request_body=PlanDeEstudioClonarSerializer,
+        responses={
+            201: PlanDeEstudioSerializerList(),
+            400: "Error en los datos enviados.",
+            404: "Plan de estudio no encontrado."
+        }
+    )
+    def post(self, request, pk):
+        original = plan_de_estudio.obtener_plan(pk)
+        serializer = PlanDeEstudioClonarSerializer(original, data=request.data)
+        if not serializer.is_valid():
+            return Response({
+                "message": "Error al clonar el plan de estudio.",
+                "errors": serializer.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        plan, copiadas = plan_de_estudio.clonar_plan(pk, dict(serializer.validated_data), request.user)
+        return Response({
+            "message": "Plan de estudio clonado correctamente.",
+            "data": {**PlanDeEstudioSerializerList(plan).data, "copiadas": copiadas}
+        }, status=status.HTTP_201_CREATED)
+
+
 class ListarCorrelativasDeAsignaturaView(APIView):
     """Lista todas las correlativas de una asignatura dentro de un plan."""
     permission_classes = [EsAdministrador]
@@ -4,13 +4,17 @@ from rest_framework import status, viewsets
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.exceptions import PermissionDenied
+from rest_framework.decorators import action
 from django.db import transaction, IntegrityError
 from datetime import date, time, datetime, timezone
 from django.utils import timezone as dj_timezone
 
 from gestion_academica import models
+from gestion_academica.permissions.alcance import Alcance
 from gestion_academica.permissions.coordinador_permissions import EsCoordinadorDeCarrera
-from gestion_academica.serializers.M3_designaciones_docentes import DesignacionSerializer
+from gestion_academica.serializers.M3_designaciones_docentes import DesignacionSerializer, RenovacionDesignacionesSerializer
+from gestion_academica.services.designaciones_docentes.renovacion import renovar_designaciones
+from drf_yasg.utils import swagger_auto_schema
 
 
 class DesignacionViewSet(viewsets.ModelViewSet):
@@ -78,16 +82,6 @@ class DesignacionViewSet(viewsets.ModelViewSet):
             modalidad=modalidad, dedicacion=dedicacion, activo=True
         ).first()
 
-    def _coordinador_de_usuario(self, user):
-        """
-        Devuelve la instancia Coordinador asociada al `user`, o None si no existe.
-        Encapsula la consulta para usarla desde otras funciones.
-        """
-        try:
-            return models.Coordinador.objects.filter(usuario=user).first()
-        except Exception:
-            return None
-
     def get_queryset(self):
         """
         Filtra el queryset base.
@@ -102,38 +96,14 @@ class DesignacionViewSet(viewsets.ModelViewSet):
         if not user.is_authenticated:
             return models.Designacion.objects.none()
 
-        qs = models.Designacion.objects.all().order_by("id")
-
-        if user.is_superuser or user.roles.filter(nombre__iexact="Admin").exists():
-            return qs
-
-        if user.roles.filter(nombre__iexact="Coordinador").exists():
-            coord_perfil = self._coordinador_de_usuario(user)
-            if coord_perfil:
-                carreras_activas_qs = coord_perfil.carreras_coordinadas.filter(
-                    carreracoordinacion__coordinador=coord_perfil,
-                    carreracoordinacion__activo=True
-                )
-
-                # obtenemos sólo los ids (lista) para pasar al filtro __in
-                carreras_ids = list(carreras_activas_qs.values_list('id', flat=True))
-                
-                # --- AQUÍ ESTABA EL ERROR ---
-                # La ruta de tu DesignacionViewSet (de la consulta anterior)
-                # era incorrecta. Debe seguir tus nuevos modelos:
-                # Designacion -> Comision -> PlanAsignatura -> PlanDeEstudio -> Carrera
-                return qs.filter(
-                    comision__plan_asignatura__plan_de_estudio__carrera__in=carreras_ids
-                ).distinct()
-
-        return models.Designacion.objects.none()
+        # La carrera está copiada en la designación: el filtro es carrera_id IN (...)
+        return Alcance.de_request(self.request).filtrar(models.Designacion.objects.all().order_by("id"))
 
     def list(self, request, *args, **kwargs):
         """
         Lista las designaciones
         - Solo los coordinadores ven las designacioens cuyas asignaturas pertenecen a las carreras que coordinan
         """
-        user = request.user
         qs = self.get_queryset()
 
         activo_param = request.query_params.get("activo")
@@ -143,20 +113,6 @@ class DesignacionViewSet(viewsets.ModelViewSet):
             elif activo_param.lower() in ['false', '0', 'f', 'no']:
                 qs = qs.filter(activo=False)
 
-        # si es coordinador, limitar por sus carreras
-        if user.roles.filter(nombre__iexact="Coordinador").exists():
-            # obtener el objeto Coordinador asociado al usuario.
-            coord = self._coordinador_de_usuario(user)
-            if coord:
-                carreras_qs = coord.carreras_coordinadas.filter(
-                carreracoordinacion__coordinador=coord,
-                carreracoordinacion__activo=True
-                )
-                carreras_ids = list(carreras_qs.values_list('id', flat=True))
-                qs = qs.filter(
-                    comision__plan_asignatura__plan_de_estudio__carrera__in=carreras_ids
-                ).distinct()
-
         page = self.paginate_queryset(qs)
         if page is not None:
             serializer = self.get_serializer(page, many=True)
@@ -173,28 +129,19 @@ class DesignacionViewSet(viewsets.ModelViewSet):
         """        
         # Pasamos el 'context' para que el serializer
         # pueda acceder a 'request.user'
-        user = request.user
+        alcance = Alcance.de_request(request)
 
-        if not (user.is_superuser or user.roles.filter(nombre__iexact="Admin").exists()):
+        if not alcance.es_admin:
             try:
                 comision_id = request.data.get("comision_id")
                 if not comision_id:
                     raise PermissionDenied("Falta el ID de la comisión.")
                 
                 # Buscamos la comisión (asegurándonos de que exista)
-                comision = models.Comision.objects.select_related(
-                    'plan_asignatura__plan_de_estudio__carrera'
-                ).get(pk=comision_id)
-                
-                carrera_de_la_comision = comision.plan_asignatura.plan_de_estudio.carrera
-                coord_perfil = self._coordinador_de_usuario(user)
+                comision = models.Comision.objects.get(pk=comision_id)
                 
                 # Verificamos si el coordinador tiene esta carrera como activa
-                if not coord_perfil.carreras_coordinadas.filter(
-                        pk=carrera_de_la_comision.pk,
-                        carreracoordinacion__coordinador=coord_perfil,
-                        carreracoordinacion__activo=True
-                    ).exists():
+                if not alcance.permite(comision):
                     # Si no la tiene, denegamos el permiso
                     raise PermissionDenied("No tiene permiso para crear designaciones en esta carrera.")
 
@@ -218,6 +165,37 @@ class DesignacionViewSet(viewsets.ModelViewSet):
         # El serializer.data contendrá la 'advertencia' si se generó
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
+    @swagger_auto_schema(
+        request_body=RenovacionDesignacionesSerializer,
+        operation_summary="Renovar designaciones de una carrera",
+        operation_description=(
+            "Renueva para el nuevo período las designaciones activas de la carrera que vencieron "
+            "antes de fecha_inicio (las originales quedan inactivas). Valida el régimen y la carga "
+            "horaria de cada docente en conjunto y envía una notificación de resumen a cada "
+            "coordinador. Con simular=true devuelve el diff sin escribir."
+        ),
+    )
+    @action(detail=False, methods=["post"], url_path="renovar")
+    def renovar(self, request):
+        serializer = RenovacionDesignacionesSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        datos = serializer.validated_data
+        carrera = datos["carrera"]
+
+        user = request.user
+        if not Alcance.de_request(request).permite(carrera):
+            raise PermissionDenied("No tiene permiso para renovar designaciones en esta carrera.")
+
+        resultado = renovar_designaciones(
+            carrera, datos["fecha_inicio"], datos.get("fecha_fin"),
+            actor=user, confirmar=not datos["simular"])
+        if not resultado.valido:
+            return Response({"detail": "No se pudo renovar: hay designaciones con errores.",
+                             "errores": resultado.errores}, status=status.HTTP_400_BAD_REQUEST)
+
+        codigo = status.HTTP_200_OK if datos["simular"] else status.HTTP_201_CREATED
+        return Response(resultado.resumen(), status=codigo)
+
     # --- UPDATE ---
     def _handle_update(self, request, partial=False):
         """
@@ -274,22 +252,12 @@ class DesignacionViewSet(viewsets.ModelViewSet):
         estableciendo su fecha_fin = hoy() y activo = False.
         Si la designación ya está inactiva (activo=False), devuelve un error 400.
         """
-        user = request.user
+        # get_object() ya acota al alcance del usuario y comprueba el permiso sobre el objeto
         instance = self.get_object()
         if not instance.activo:
             return Response({"detail": "La designación ya está inactiva."},
                             status=status.HTTP_400_BAD_REQUEST)
 
-        if user.roles.filter(nombre__iexact="Coordinador").exists():
-            coord = self._coordinador_de_usuario(user)
-            if coord:
-                carreras_ids = list(coord.carreras_coordinadas.values_list('id', flat=True))
-                # safety: comprobar la existencia usando ids
-                if not instance.comision.plan_asignatura.planes_de_estudio.filter(
-                        carrera__in=carreras_ids, esta_vigente=True).exists():
-                    return Response({"detail": "No tiene permisos para finalizar esta designación."},
-                                    status=status.HTTP_403_FORBIDDEN)
-
         # verificar que al cerrar esta designación la asignatura mantenga al menos un cargo primario
         # if not self._asignatura_tiene_cargo_primary_si_excluyo(instance.comision, excluir_designacion_pk=instance.pk):
         #     return Response(
@@ -7,9 +7,24 @@ from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.decorators import action
 from django.db import IntegrityError, transaction
 from django.http import Http404
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
 
 from gestion_academica import models
+from gestion_academica.permissions import Alcance, EsAdministrador
 from gestion_academica.serializers.M2_gestion_docentes import DocenteSerializer, DocenteDetalleSerializer
+from gestion_academica.services.designaciones_docentes.detalle_docente import (
+    INCLUDES_DETALLE_DOCENTE,
+    INCLUDES_DETALLE_DOCENTE_DEFECTO,
+    MAXIMO_POR_PAGINA_HISTORICAS,
+    POR_PAGINA_HISTORICAS,
+)
+from gestion_academica.services.designaciones_docentes.docente_carrera import (
+    filtro_vigentes,
+    prefetch_carreras_vigentes,
+)
+from gestion_academica.services.gestion_academica.importacion_plan import ErrorImportacion, leer_planilla
+from gestion_academica.services.gestion_usuarios.alta_masiva import ALIAS_COLUMNAS_DOCENTE, alta_masiva_docentes
 
 
 class DocenteViewSet(viewsets.ModelViewSet):
@@ -21,6 +36,12 @@ class DocenteViewSet(viewsets.ModelViewSet):
     # para que /api/docentes/7/ funcione.
     lookup_field = 'usuario__id'
 
+    def get_queryset(self):
+        # usuario, catálogos, roles y carreras en consultas fijas para todo el listado
+        return super().get_queryset().select_related(
+            "usuario", "modalidad", "caracter", "dedicacion"
+        ).prefetch_related("usuario__roles", prefetch_carreras_vigentes())
+
     def _user_can_manage(self, user):
         return user.is_superuser or user.roles.filter(nombre__in=["Admin", "Coordinador"]).exists()
 
@@ -43,41 +64,32 @@ class DocenteViewSet(viewsets.ModelViewSet):
         Lista docentes relacionados con la carrera indicada.
         Ruta: GET /api/docentes/carrera/{carrera_id}/
         Comportamiento actual:
-          - Devuelve docentes que tienen alguna designación cuyo plan de estudio pertenece a la carrera.
-          - Filtra por plan vigente (esta_vigente=True) para evitar planes antiguos.
-          - Esto puede devolver el mismo docente para varias carreras si la misma asignatura
-            está presente en los planes de varias carreras.
-
-        Otra alternativa - SOLO designaciones activas:
-          - Si queremos devolver solo docentes con designaciones activas,
-            usar la query alternativa que aparece comentada más abajo.
+          - Devuelve docentes que tienen o tuvieron alguna designación en la carrera,
+            leyendo la pertenencia materializada DocenteCarrera (un docente por fila,
+            sin recorrer planes ni distinct()).
+          - Con ?vigentes=true, solo los que tienen designaciones activas y vigentes
+            en la carrera, para saber quién da clases actualmente.
+          - ?activo filtra por el estado del docente.
         """
         user = request.user
 
-        # base queryset: Docentes que tienen designaciones en asignaturas de la carrera
-        # filtra por plan vigente para evitar duplicados por planes antiguos
+        # si el user es Coordinador, limitar por sus carreras
+        alcance = Alcance.de_request(request)
+        if (not alcance.es_admin and user.roles.filter(nombre__iexact="Coordinador").exists()
+                and not alcance.incluye_carrera(int(carrera_id))):
+            return Response({"detail": "No tiene permisos para ver docentes de esa carrera."},
+                            status=status.HTTP_403_FORBIDDEN)
 
-        # 1. Obtenemos un queryset con los IDs de los planes de estudio que son válidos
-        #    para la carrera indicada y que están vigentes.
-        planes_vigentes_qs = models.PlanDeEstudio.objects.filter(
-            carrera__id=carrera_id,  # Filtro directo por ForeignKey a Carrera
-            esta_vigente=True        # Filtro por vigencia en PlanDeEstudio
-        )
+        pertenencias = models.DocenteCarrera.objects.filter(carrera_id=carrera_id)
+        vigentes_param = request.query_params.get("vigentes", "")
+        if vigentes_param.lower() in ['true', '1', 't', 'yes']:
+            pertenencias = pertenencias.filter(filtro_vigentes())
 
-         # 2. Ahora, usamos este queryset de planes_vigentes_qs para filtrar los Docentes.
-        #    La navegación de la relación M2M (Asignatura <-> PlanDeEstudio) se hace
-        #    utilizando el operador '__in' contra el campo 'planes_de_estudio'.
         qs = models.Docente.objects.filter(
-            designaciones__comision__plan_asignatura__asignatura__planes_de_estudio__in=planes_vigentes_qs
-        ).distinct().order_by("id")
-
-        # otra alternativa
-        # devolver solo docentes con designación actualmente activa, para saber quien actualmente da clases.
-        # qs = models.Docente.objects.filter(
-        #     designaciones__comision__asignatura__planes_de_estudio__carrera__id=carrera_id,
-        #     designaciones__comision__asignatura__planes_de_estudio__esta_vigente=True,
-        #     designaciones__fecha_fin__isnull=True,   # <-- solo activas
-        # ).distinct().order_by("id")
+            pk__in=pertenencias.values("docente_id")
+        ).select_related("usuario", "modalidad", "caracter", "dedicacion").prefetch_related(
+            prefetch_carreras_vigentes()
+        ).order_by("id")
 
         # filtra por query param activo si viene
         activo_param = request.query_params.get("activo")
@@ -87,15 +99,6 @@ class DocenteViewSet(viewsets.ModelViewSet):
             elif activo_param.lower() in ['false', '0', 'f', 'no']:
                 qs = qs.filter(activo=False)
 
-        # si el user es Coordinador, limitar por sus carreras
-        if user.roles.filter(nombre__iexact="Coordinador").exists():
-            coord = models.Coordinador.objects.filter(usuario=user).first()
-            if coord:
-                carreras_qs = coord.carreras_coordinadas.all()
-                if not carreras_qs.filter(pk=carrera_id).exists():
-                    return Response({"detail": "No tiene permisos para ver docentes de esa carrera."},
-                                    status=status.HTTP_403_FORBIDDEN)
-
         page = self.paginate_queryset(qs)
         serializer_class = DocenteSerializer
         if page is not None:
@@ -107,12 +110,59 @@ class DocenteViewSet(viewsets.ModelViewSet):
             qs, many=True, context={"request": request})
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    @swagger_auto_schema(
+        operation_summary="Alta masiva de docentes desde CSV/XLSX",
+        operation_description=(
+            "Recibe en 'archivo' una planilla con una fila por docente (legajo, nombre, apellido, "
+            "email y opcionalmente username, celular, fecha_nacimiento, modalidad, caracter, "
+            "dedicacion). Crea Usuario, rol Docente y Docente en una transacción. Los usuarios "
+            "quedan sin contraseña: la definen con el código de recuperación. Los legajos, emails "
+            "o usernames que ya existen se informan como duplicados y no se crean. "
+            "Con ?simular=true sólo valida."
+        ),
+        manual_parameters=[
+            openapi.Parameter("archivo", openapi.IN_FORM, type=openapi.TYPE_FILE, required=True),
+            openapi.Parameter("simular", openapi.IN_QUERY, type=openapi.TYPE_BOOLEAN),
+        ],
+        responses={201: "Docentes creados.", 400: "Errores de validación por fila."},
+    )
+    @action(detail=False, methods=["post"], url_path="alta-masiva", permission_classes=[EsAdministrador])
+    def alta_masiva(self, request):
+        archivo = request.FILES.get("archivo")
+        if archivo is None:
+            return Response({
+                "message": "Debe adjuntar la planilla en el campo 'archivo'."
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            registros = leer_planilla(archivo, archivo.name, requerida="legajo", alias=ALIAS_COLUMNAS_DOCENTE)
+        except ErrorImportacion as e:
+            return Response({"message": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        # no se hashean contraseñas dentro del request (PBKDF2 por fila);
+        # para eso está el comando alta_docentes
+        for _, datos in registros:
+            datos.pop("password", None)
+
+        simular = request.query_params.get("simular", "").lower() in ("1", "true")
+        resultado = alta_masiva_docentes(registros, confirmar=not simular)
+        if not resultado.valido:
+            return Response({
+                "message": "La planilla tiene errores. No se creó ningún docente.",
+                "errors": resultado.errores
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            "message": "Planilla validada." if simular else "Docentes creados correctamente.",
+            "data": resultado.resumen()
+        }, status=status.HTTP_200_OK if simular else status.HTTP_201_CREATED)
+
     def get_object(self):
         # pk es el usuario id --> /api/docentes/<usuario_id>
         pk = self.kwargs.get(self.lookup_field)
 
         try:
-            return models.Docente.objects.get(usuario__id=pk)
+            return self.get_queryset().get(usuario__id=pk)
         except models.Docente.DoesNotExist:
             raise Http404("No se encontro el Docente")
 
@@ -288,6 +338,25 @@ class DocenteViewSet(viewsets.ModelViewSet):
         return Response({"detail": f"Docente '{usuario_display}' deshabilitado correctamente."},
                         status=status.HTTP_200_OK)
 
+    @swagger_auto_schema(
+        operation_summary="Detalle de un docente",
+        operation_description=(
+            "designaciones = {actuales, historicas, tablas}. Cada designación trae ids "
+            "(comision, carrera, cargo, dedicacion) que se resuelven en 'tablas' (comisiones, "
+            "asignaturas, carreras, cargos, dedicaciones); ya no anida el DesignacionSerializer "
+            "completo. 'historicas' viene paginada como {count, page, page_size, results} "
+            "(page y page_size), las más recientes primero. Por defecto se incluyen 'historicas' "
+            "y 'tablas'; ?include= elige un subconjunto. Ej: ?include=tablas omite las históricas."
+        ),
+        manual_parameters=[
+            openapi.Parameter("include", openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                              description=f"Lista separada por comas de: {', '.join(INCLUDES_DETALLE_DOCENTE)}"),
+            openapi.Parameter("page", openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+            openapi.Parameter(
+                "page_size", openapi.IN_QUERY, type=openapi.TYPE_INTEGER,
+                description=f"Por defecto {POR_PAGINA_HISTORICAS}, máximo {MAXIMO_POR_PAGINA_HISTORICAS}"),
+        ],
+    )
     def retrieve(self, request, *args, **kwargs):
         '''
         Permite visualizar el detalle completo de un docente
@@ -296,6 +365,23 @@ class DocenteViewSet(viewsets.ModelViewSet):
 
         self._ensure_manage_permission(user)
 
+        include = request.query_params.get("include")
+        incluir = INCLUDES_DETALLE_DOCENTE_DEFECTO if include is None else tuple(
+            i.strip() for i in include.split(",") if i.strip())
+        desconocidos = set(incluir) - set(INCLUDES_DETALLE_DOCENTE)
+        if desconocidos:
+            return Response(
+                {"detail": f"include desconocido: {', '.join(sorted(desconocidos))}. "
+                           f"Use: {', '.join(INCLUDES_DETALLE_DOCENTE)}."},
+                status=status.HTTP_400_BAD_REQUEST)
+        try:
+            pagina = max(1, int(request.query_params.get("page", 1)))
+            por_pagina = int(request.query_params.get("page_size", POR_PAGINA_HISTORICAS))
+        except ValueError:
+            return Response({"detail": "'page' y 'page_size' deben ser números enteros."},
+                            status=status.HTTP_400_BAD_REQUEST)
+        por_pagina = max(1, min(por_pagina, MAXIMO_POR_PAGINA_HISTORICAS))
+
         instance = self.get_object()
 
         if not instance.activo:
@@ -304,5 +390,6 @@ class DocenteViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        serializer = DocenteDetalleSerializer(instance)
+        serializer = DocenteDetalleSerializer(instance, context={
+            "request": request, "incluir": incluir, "pagina": pagina, "por_pagina": por_pagina})
         return Response(serializer.data, status=status.HTTP_200_OK)
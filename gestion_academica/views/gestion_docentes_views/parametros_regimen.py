@@ -9,6 +9,7 @@ from django.shortcuts import get_object_or_404
 
 from gestion_academica import models
 from gestion_academica.serializers.M2_gestion_docentes import ParametrosRegimenSerializer
+from gestion_academica.services.estadisticas_reportes.cache_resultados import invalidar_estadisticas
 
 
 class ParametrosRegimenViewSet(viewsets.ModelViewSet):
@@ -45,6 +46,8 @@ class ParametrosRegimenViewSet(viewsets.ModelViewSet):
         models.ParametrosRegimen.objects.filter(
             modalidad_id=modalidad_id, dedicacion_id=dedicacion_id
         ).update(activo=False)
+        # update() no dispara señales
+        invalidar_estadisticas()
 
     def create(self, request, *args, **kwargs):
         """
@@ -1,4 +1,5 @@
 from .coordinador_viewset import CoordinadorViewSet
 from .rol_viewset import RolViewSet
 from .usuario_viewset import UsuarioViewSet
-from .notificaciones_viewset import MisNotificacionesViewSet
\ No newline at end of file
+from .notificaciones_viewset import MisNotificacionesViewSet
+from .notificaciones_stream import stream_notificaciones
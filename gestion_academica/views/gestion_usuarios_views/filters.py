@@ -1,5 +1,7 @@
 import django_filters
+from rest_framework.filters import SearchFilter
 from ...models import Usuario
+from ...services.gestion_academica.busqueda import filtrar_por_texto
 
 class UsuarioFilter(django_filters.FilterSet):
     """
@@ -18,4 +20,18 @@ class UsuarioFilter(django_filters.FilterSet):
     class Meta:
         model = Usuario
         # Lista los campos que Django Filter debe manejar
-        fields = ['is_active', 'username', 'email']
\ No newline at end of file
+        fields = ['is_active', 'username', 'email']
+
+
+class BusquedaTextoFilter(SearchFilter):
+    """
+    ?search= sobre la columna `busqueda` (tsvector con índice GIN) en lugar
+    de un ILIKE '%x%' por cada campo de search_fields. Encuentra por palabra
+    o prefijo, sin distinguir acentos, y ordena por relevancia.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terminos = self.get_search_terms(request)
+        if not terminos:
+            return queryset
+        return filtrar_por_texto(queryset, " ".join(terminos))
@@ -0,0 +1,74 @@
+# gestion_academica/views/gestion_usuarios_views/notificaciones_stream.py
+
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, AuthenticationFailed
+
+from gestion_academica.services.gestion_usuarios import notificaciones
+from gestion_academica.services.gestion_usuarios.tiempo_real import oyente_notificaciones
+
+
+INTERVALO_KEEPALIVE = 25  # segundos; por debajo del timeout típico de proxies
+
+
+def _autenticar(request):
+    """
+    JWT desde el header Authorization o desde ?token= (EventSource del
+    navegador no permite enviar headers propios).
+    """
+    autenticador = JWTAuthentication()
+    header = autenticador.get_header(request)
+    crudo = autenticador.get_raw_token(header) if header else request.GET.get("token")
+    if not crudo:
+        return None
+    try:
+        return autenticador.get_user(autenticador.get_validated_token(crudo))
+    except (InvalidToken, AuthenticationFailed):
+        return None
+
+
+def _evento_sse(nombre, datos):
+    return f"event: {nombre}\ndata: {json.dumps(datos)}\n\n"
+
+
+@require_GET
+async def stream_notificaciones(request):
+    """
+    Canal SSE con las notificaciones nuevas o reactivadas del usuario logueado.
+    Requiere servir el proyecto por ASGI (proyecto/asgi.py).
+    """
+    usuario = await sync_to_async(_autenticar)(request)
+    if usuario is None or not usuario.is_active:
+        return JsonResponse({"detail": "No autenticado."}, status=401)
+
+    contador = await sync_to_async(notificaciones.obtener_contador_notificaciones)(usuario)
+    usuario_id = usuario.pk
+
+    async def eventos():
+        cola = oyente_notificaciones.suscribir(usuario_id)
+        try:
+            # estado inicial: evita que el cliente tenga que consultar /resumen/
+            yield _evento_sse("resumen", {
+                "no_leidas": contador.sin_leer - contador.pospuestas,
+                "pospuestas": contador.pospuestas,
+                "version": contador.version,
+            })
+            while True:
+                try:
+                    evento = await asyncio.wait_for(cola.get(), timeout=INTERVALO_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield _evento_sse("notificacion", evento)
+        finally:
+            oyente_notificaciones.desuscribir(usuario_id, cola)
+
+    respuesta = StreamingHttpResponse(eventos(), content_type="text/event-stream")
+    respuesta["Cache-Control"] = "no-cache"
+    respuesta["X-Accel-Buffering"] = "no"
+    return respuesta
@@ -5,13 +5,13 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.pagination import PageNumberPagination
 from django.utils import timezone
 from django.db.models import Q
-from datetime import timedelta
 
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 from gestion_academica.models import UsuarioNotificacion
 from gestion_academica.serializers.user_serializers.notificaciones_serializer import UsuarioNotificacionSerializer
+from gestion_academica.services.gestion_usuarios import notificaciones
 
 class NotificacionesPagination(PageNumberPagination):
     page_size = 10
@@ -51,7 +51,9 @@ class MisNotificacionesViewSet(viewsets.GenericViewSet, mixins.ListModelMixin):
             eliminado=False,
         ).filter(
             Q(fecha_recordatorio__isnull=True) | Q(fecha_recordatorio__lte=ahora)
-        ).order_by('-notificacion__fecha_creacion')
+        ).select_related(
+            'notificacion__creado_por'
+        ).order_by('-fecha_emision', '-id')
 
         leida_param = self.request.query_params.get('leida', None)
         
@@ -76,10 +78,7 @@ class MisNotificacionesViewSet(viewsets.GenericViewSet, mixins.ListModelMixin):
     @action(detail=True, methods=['patch'])
     def leer(self, request, pk=None):
         usuario_notificacion = self.get_object()
-        if not usuario_notificacion.leida:
-            usuario_notificacion.leida = True
-            usuario_notificacion.fecha_leida = timezone.now()
-            usuario_notificacion.save()
+        notificaciones.marcar_notificacion_leida(usuario_notificacion)
         return Response({'status': 'leida'}, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(
@@ -90,8 +89,7 @@ class MisNotificacionesViewSet(viewsets.GenericViewSet, mixins.ListModelMixin):
     @action(detail=True, methods=['patch'])
     def posponer(self, request, pk=None):
         usuario_notificacion = self.get_object()
-        usuario_notificacion.fecha_recordatorio = timezone.now() + timedelta(days=7) 
-        usuario_notificacion.save()
+        notificaciones.posponer_notificacion(usuario_notificacion)
         return Response({'status': 'pospuesta'}, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(
@@ -102,6 +100,84 @@ class MisNotificacionesViewSet(viewsets.GenericViewSet, mixins.ListModelMixin):
     @action(detail=True, methods=['patch'])
     def archivar(self, request, pk=None):
         usuario_notificacion = self.get_object()
-        usuario_notificacion.eliminado = True
-        usuario_notificacion.save()
-        return Response({'status': 'archivada'}, status=status.HTTP_200_OK)
\ No newline at end of file
+        notificaciones.archivar_notificacion(usuario_notificacion)
+        return Response({'status': 'archivada'}, status=status.HTTP_200_OK)
+
+    # --- ACCIONES MASIVAS (un único UPDATE cada una)
+
+    @swagger_auto_schema(
+        operation_summary="Marcar todas como leídas",
+        request_body=openapi.Schema(type=openapi.TYPE_OBJECT),
+        responses={200: "OK"}
+    )
+    @action(detail=False, methods=['patch'], url_path='leer-todas')
+    def leer_todas(self, request):
+        actualizadas = notificaciones.marcar_todas_leidas(request.user)
+        return Response({'status': 'leidas', 'actualizadas': actualizadas}, status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        operation_summary="Archivar todas",
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                'solo_leidas': openapi.Schema(type=openapi.TYPE_BOOLEAN, description="Archivar solo las ya leídas"),
+            }
+        ),
+        responses={200: "OK"}
+    )
+    @action(detail=False, methods=['patch'], url_path='archivar-todas')
+    def archivar_todas(self, request):
+        solo_leidas = str(request.data.get('solo_leidas', '')).strip().lower() == 'true'
+        actualizadas = notificaciones.archivar_todas(request.user, solo_leidas=solo_leidas)
+        return Response({'status': 'archivadas', 'actualizadas': actualizadas}, status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        operation_summary="Posponer varias 7 días",
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            required=['ids'],
+            properties={
+                'ids': openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_INTEGER)),
+            }
+        ),
+        responses={200: "OK", 400: "ids inválidos"}
+    )
+    @action(detail=False, methods=['patch'], url_path='posponer-varias')
+    def posponer_varias(self, request):
+        ids = request.data.get('ids')
+        try:
+            if not isinstance(ids, list):
+                raise TypeError
+            ids = [int(i) for i in ids]
+        except (TypeError, ValueError):
+            return Response({'detail': "Se espera 'ids' como lista de enteros."}, status=status.HTTP_400_BAD_REQUEST)
+        actualizadas = notificaciones.posponer_varias(request.user, ids)
+        return Response({'status': 'pospuestas', 'actualizadas': actualizadas}, status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        operation_summary="Resumen de la bandeja (badge)",
+        operation_description=(
+            "Devuelve los contadores de notificaciones del usuario sin recorrer la bandeja. "
+            "Soporta ETag: si el cliente envía If-None-Match con el último ETag "
+            "y no hubo cambios, responde 304 sin cuerpo."
+        ),
+        responses={200: "OK", 304: "Sin cambios"}
+    )
+    @action(detail=False, methods=['get'])
+    def resumen(self, request):
+        contador = notificaciones.obtener_contador_notificaciones(request.user)
+        etag = f'"{contador.usuario_id}-{contador.version}"'
+
+        etags_cliente = [e.strip() for e in request.headers.get('If-None-Match', '').split(',')]
+        if etag in etags_cliente:
+            respuesta = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            respuesta = Response({
+                'no_leidas': contador.sin_leer - contador.pospuestas,
+                'pospuestas': contador.pospuestas,
+                'version': contador.version,
+            }, status=status.HTTP_200_OK)
+
+        respuesta['ETag'] = etag
+        respuesta['Cache-Control'] = 'private, no-cache'
+        return respuesta
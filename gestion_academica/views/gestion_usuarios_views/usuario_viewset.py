@@ -16,10 +16,9 @@ from ...serializers.user_serializers.usuario_serializer import UsuarioSerializer
 from ...serializers.user_serializers.leer_usuario_serializer import LeerUsuarioSerializer
 from ...serializers.user_serializers.editar_usuario_serializer import EditarUsuarioSerializer
 # Importaciones para realizar el filtrado de usuarios deshabilitados
-from rest_framework.filters import SearchFilter
 from rest_framework.permissions import AllowAny
 from django_filters.rest_framework import DjangoFilterBackend
-from .filters import UsuarioFilter
+from .filters import UsuarioFilter, BusquedaTextoFilter
 # Swagger
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
@@ -75,11 +74,12 @@ class UsuarioViewSet(mixins.ListModelMixin,
     permission_classes = [UsuarioViewSetPermission]
 
     ''' Lógica para filtrado de usuarios deshabilitados '''
-    filter_backends = [DjangoFilterBackend, SearchFilter]
+    filter_backends = [DjangoFilterBackend, BusquedaTextoFilter]
     # (Paso 1) Permite filtrar por estado (y otros campos)
     filterset_class = UsuarioFilter
-    # (Paso 1) Permite buscar por nombre y apellido
-    search_fields = ['first_name', 'last_name', 'username']
+    # (Paso 1) Permite buscar por nombre, apellido, username, legajo y email
+    # (texto completo sobre Usuario.busqueda; ver BusquedaTextoFilter)
+    search_fields = ['first_name', 'last_name', 'username', 'legajo', 'email']
 
     # --- SOBREESCRIBE EL MÉTODO 'list' PARA DECORARLO ---
     @swagger_auto_schema(manual_parameters=user_list_params)
@@ -3,6 +3,11 @@ ASGI config for proyecto project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+El canal SSE de notificaciones (/api/notificaciones/stream/) es una vista
+async con respuesta infinita: solo funciona servido por ASGI, por ejemplo
+    uvicorn proyecto.asgi:application --host 0.0.0.0 --port 8000
+Cada proceso abre una única conexión LISTEN a PostgreSQL para todos sus clientes.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
 """
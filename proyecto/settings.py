@@ -42,6 +42,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',  # búsqueda de texto (SearchVectorField, GinIndex)
 
     "gestion_academica.apps.GestionAcademicaConfig",
 